@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+'''Расход памяти на список облачных серверов: модели `VDS`, сырой JSON и `VDSFleet`.
+
+Запуск: `python benchmarks/fleet_memory.py [--servers 50000] [--json]`.'''
+import sys
+import json
+import argparse
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from timeweb.schemas.servers.cloud import VDSArray, VDSFleet  # noqa: E402
+
+from parse_modes import vds  # noqa: E402
+
+
+def measure(build: Callable[[], Any]) -> tuple[int, Any]:
+    '''Память, занятая результатом `build`, в байтах.'''
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return size, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--servers', type=int, default=50000)
+    parser.add_argument('--json', action='store_true', help='Вывести результат в JSON')
+    args = parser.parse_args()
+    payload = json.dumps({
+        'servers': [vds(i) for i in range(args.servers)],
+        'meta': {'total': args.servers}
+    })
+    raw_size, raw = measure(lambda: json.loads(payload))
+    models_size, models = measure(lambda: VDSArray(**raw))
+    fleet_size, _ = measure(lambda: VDSFleet.from_models(models.servers))
+    results = {
+        'servers': args.servers,
+        'models': models_size,
+        'raw': raw_size,
+        'fleet': fleet_size,
+    }
+    if args.json:
+        print(json.dumps(results))
+        return
+    print(f'{args.servers} servers')
+    for name in ('models', 'raw', 'fleet'):
+        size = results[name]
+        print(f'  {name:7} {size / 2 ** 20:9.1f} MiB  {size / args.servers:8.0f} B/server')
+
+
+if __name__ == '__main__':
+    main()
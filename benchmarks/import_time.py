@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+'''Время импорта и создания клиента в свежем процессе.
+
+Запуск: `python benchmarks/import_time.py [--runs 10] [--json]`.'''
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+
+SRC = Path(__file__).resolve().parent.parent / 'src'
+ALL_APIS = (
+    'account', 'tokens', 'ssh_keys', 'images', 's3', 'dbs', 'servers.dedics',
+    'servers.cloud', 'balancers', 'k8s', 'domains', 'mail', 'projects'
+)
+SCENARIOS = {
+    'import timeweb': 'import timeweb',
+    'Timeweb()': "import timeweb; timeweb.Timeweb('token')",
+    'Timeweb().servers.cloud': "import timeweb; timeweb.Timeweb('token').servers.cloud",
+    'Timeweb() + all APIs': (
+        "import timeweb; tw = timeweb.Timeweb('token'); "
+        + '; '.join(f'tw.{api}' for api in ALL_APIS)
+    ),
+    'AsyncTimeweb().servers.cloud': "import timeweb; timeweb.AsyncTimeweb('token').servers.cloud",
+}
+PROBE = '''
+import sys, time, json
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    'seconds': elapsed,
+    'modules': sum(1 for name in sys.modules if name.startswith('timeweb')),
+}}))
+'''
+
+
+def measure(code: str, runs: int) -> dict:
+    samples = []
+    modules = 0
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-c', PROBE.format(code=code)],
+            capture_output=True, text=True, check=True,
+            env={'PYTHONPATH': str(SRC)}
+        )
+        data = json.loads(result.stdout)
+        samples.append(data['seconds'] * 1000)
+        modules = data['modules']
+    return {
+        'median_ms': round(statistics.median(samples), 2),
+        'min_ms': round(min(samples), 2),
+        'timeweb_modules': modules,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--json', action='store_true', help='Вывод в JSON.')
+    args = parser.parse_args()
+    results = {name: measure(code, args.runs) for name, code in SCENARIOS.items()}
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for name, data in results.items():
+        print(
+            f'{name:<30} {data["median_ms"]:>8.2f} ms (min {data["min_ms"]:.2f}), '
+            f'{data["timeweb_modules"]} timeweb modules'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,358 @@
+# -*- coding: utf-8 -*-
+'''Нагрузочный тест `Timeweb` и `AsyncTimeweb` против локальной имитации API.
+
+Имитация (`tests/fake_api.py`) запускается в отдельном процессе за HTTP/1.1
+сервером на asyncio, поэтому клиент работает с настоящими TCP соединениями,
+а процессорное время клиента не смешивается с временем сервера. Сервер умеет
+добавлять задержку ответа и отвечать `429` с заданной вероятностью.
+
+Выводятся запросы в секунду, p50/p95/p99 задержки по операциям, количество
+открытых сервером соединений (всего и одновременно) и процессорное время
+клиента на запрос. Режимы транспорта (повторы, лимитер частоты, адаптивный
+лимит, объединение запросов, пул соединений, режимы разбора) включаются флагами.
+
+Запуск: `python benchmarks/load.py [--client async|sync|both] [--concurrency 32]
+[--requests 2000] [--mix list=60,get=30,create=5,action=5] [--latency 0.02]
+[--rate-429 0.05] [--max-connections 10] [--json]`.'''
+import sys
+import json
+import time
+import random
+import asyncio
+import logging
+import argparse
+import threading
+import multiprocessing
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src'))
+sys.path.insert(0, str(ROOT / 'tests'))
+
+import httpx  # noqa: E402
+
+from timeweb import (  # noqa: E402
+    Timeweb, AsyncTimeweb, Transport, AsyncTransport, RetryPolicy,
+    RateLimiter, AIMDLimiter, SingleFlight, AsyncSingleFlight
+)
+
+
+TOKEN = 'load-test-token'
+OPERATIONS = ('list', 'get', 'create', 'action')
+
+
+# Сервер
+
+class Server:
+    '''HTTP/1.1 сервер с keep-alive поверх `FakeAPI`.'''
+
+    def __init__(self, latency: float, rate_429: float, servers: int, seed: int):
+        from fake_api import FakeAPI
+
+        self.fake = FakeAPI(
+            token=TOKEN, latency=latency,
+            faults={429: rate_429} if rate_429 else None, seed=seed
+        )
+        # Запросы не нужны, а за долгий тест их набирается много.
+        self.fake.requests = deque(maxlen=100)  # type: ignore[assignment]
+        self.fake.seed('/servers', servers)
+        self.stats = {'connections': 0, 'open': 0, 'peak_open': 0, 'requests': 0}
+
+    def reset(self) -> dict[str, int]:
+        stats = dict(self.stats)
+        # Открыто только соединение этого запроса, клиенты теста уже закрыты.
+        self.stats.update(connections=0, peak_open=0, requests=0)
+        return stats
+
+    async def respond(self, method: str, target: str, headers: dict[str, str], body: bytes) -> httpx.Response:
+        if target == '/__stats':
+            return httpx.Response(200, json=self.reset())
+        self.stats['requests'] += 1
+        request = httpx.Request(method, f'http://stand-in{target}', headers=headers, content=body)
+        delay = self.fake._delay(request)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self.fake.handle(request)
+
+    async def connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.stats['connections'] += 1
+        self.stats['open'] += 1
+        self.stats['peak_open'] = max(self.stats['peak_open'], self.stats['open'])
+        try:
+            while True:
+                head = await reader.readuntil(b'\r\n\r\n')
+                lines = head.decode('latin-1').split('\r\n')
+                method, target, _ = lines[0].split(' ', 2)
+                headers = dict(
+                    line.split(': ', 1) for line in lines[1:] if line
+                )
+                headers = {k.lower(): v for k, v in headers.items()}
+                length = int(headers.get('content-length', 0))
+                body = await reader.readexactly(length) if length else b''
+                response = await self.respond(method, target, headers, body)
+                content = response.content
+                out = [f'HTTP/1.1 {response.status_code} {response.reason_phrase}']
+                for name, value in response.headers.items():
+                    if name not in ('content-length', 'transfer-encoding', 'connection'):
+                        out.append(f'{name}: {value}')
+                out.append(f'content-length: {len(content)}')
+                writer.write(('\r\n'.join(out) + '\r\n\r\n').encode('latin-1') + content)
+                await writer.drain()
+                if headers.get('connection', '').lower() == 'close':
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.stats['open'] -= 1
+            writer.close()
+
+    async def serve(self, ready: Any) -> None:
+        server = await asyncio.start_server(self.connection, '127.0.0.1', 0, backlog=1024)
+        ready.send(server.sockets[0].getsockname()[1])
+        async with server:
+            await server.serve_forever()
+
+
+def _serve(ready: Any, latency: float, rate_429: float, servers: int, seed: int) -> None:
+    asyncio.run(Server(latency, rate_429, servers, seed).serve(ready))
+
+
+def start_server(args: argparse.Namespace) -> tuple[multiprocessing.Process, str]:
+    '''Запускает сервер в отдельном процессе, возвращает процесс и базовый URL.'''
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_serve, args=(sender, args.latency, args.rate_429, args.servers, args.seed),
+        daemon=True
+    )
+    process.start()
+    port = receiver.recv()
+    return process, f'http://127.0.0.1:{port}'
+
+
+def server_stats(base_url: str) -> dict[str, int]:
+    '''Счётчики сервера с прошлого вызова.'''
+    return httpx.get(f'{base_url}/__stats').json()
+
+
+# Клиент
+
+def parse_mix(text: str) -> dict[str, float]:
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f'Неизвестная операция: {name}! Доступны: {", ".join(OPERATIONS)}')
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def transport_options(args: argparse.Namespace, is_async: bool) -> dict[str, Any]:
+    options: dict[str, Any] = {
+        'limits': httpx.Limits(
+            max_connections=args.max_connections,
+            max_keepalive_connections=args.max_connections
+        ),
+        'retry': RetryPolicy(backoff_factor=0.05) if args.retry else RetryPolicy.disabled(),
+        'validate': not args.no_validate,
+        'lazy': args.lazy,
+    }
+    if args.rate_limit:
+        options['rate_limiter'] = RateLimiter(args.rate_limit)
+    if args.singleflight:
+        options['singleflight'] = AsyncSingleFlight() if is_async else SingleFlight()
+    if args.adaptive and is_async:
+        options['concurrency'] = AIMDLimiter(
+            initial_limit=min(10, args.concurrency), max_limit=args.concurrency
+        )
+    return options
+
+
+def operations(tw: Any, servers: int) -> dict[str, Callable[[random.Random], Any]]:
+    '''Операции нагрузки. Для асинхронного клиента возвращают корутины.'''
+    return {
+        'list': lambda rnd: tw.servers.cloud.get_all(limit=100, offset=rnd.randrange(servers)),
+        'get': lambda rnd: tw.servers.cloud.get(rnd.randint(1, servers)),
+        'create': lambda rnd: tw.ssh_keys.create(f'key-{rnd.random()}', 'ssh-ed25519 AAAA', False),
+        'action': lambda rnd: tw.servers.cloud.make_action(rnd.randint(1, servers), 'reboot'),
+    }
+
+
+def schedule(args: argparse.Namespace) -> list[str]:
+    rnd = random.Random(args.seed)
+    names = list(args.mix)
+    return rnd.choices(names, weights=[args.mix[n] for n in names], k=args.requests)
+
+
+class Recorder:
+    '''Задержки и ошибки по операциям.'''
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = {}
+        self.errors: dict[str, dict[str, int]] = {}
+
+    def add(self, name: str, started: float, error: Exception | None) -> None:
+        elapsed = time.perf_counter() - started
+        if error is None:
+            self.latencies.setdefault(name, []).append(elapsed)
+        else:
+            errors = self.errors.setdefault(name, {})
+            errors[type(error).__name__] = errors.get(type(error).__name__, 0) + 1
+
+
+def run_sync(args: argparse.Namespace, base_url: str) -> Recorder:
+    transport = Transport(TOKEN, **transport_options(args, False))
+    transport.BASE_URL = f'{base_url}/api/v1/'
+    recorder = Recorder()
+    plan = schedule(args)
+    with Timeweb(TOKEN, transport=transport) as tw:
+        ops = operations(tw, args.servers)
+        local = threading.local()
+
+        def call(index: int) -> None:
+            if not hasattr(local, 'random'):
+                local.random = random.Random(args.seed + index)
+            name = plan[index]
+            started = time.perf_counter()
+            try:
+                ops[name](local.random)
+            except httpx.HTTPError as error:
+                recorder.add(name, started, error)
+            else:
+                recorder.add(name, started, None)
+
+        with ThreadPoolExecutor(args.concurrency) as pool:
+            list(pool.map(call, range(len(plan))))
+    return recorder
+
+
+async def run_async(args: argparse.Namespace, base_url: str) -> Recorder:
+    transport = AsyncTransport(TOKEN, **transport_options(args, True))
+    transport.BASE_URL = f'{base_url}/api/v1/'
+    recorder = Recorder()
+    plan = schedule(args)
+    queue = iter(range(len(plan)))
+    async with AsyncTimeweb(TOKEN, transport=transport) as tw:
+        ops = operations(tw, args.servers)
+
+        async def worker(number: int) -> None:
+            rnd = random.Random(args.seed + number)
+            for index in queue:
+                name = plan[index]
+                started = time.perf_counter()
+                try:
+                    await ops[name](rnd)
+                except httpx.HTTPError as error:
+                    recorder.add(name, started, error)
+                else:
+                    recorder.add(name, started, None)
+
+        await asyncio.gather(*(worker(i) for i in range(args.concurrency)))
+    return recorder
+
+
+# Отчёт
+
+def percentile(values: list[float], q: float) -> float:
+    '''Перцентиль `q` (0-100) отсортированного списка, в миллисекундах.'''
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, round(q / 100 * len(values)) - 1))
+    return round(values[index] * 1000, 3)
+
+
+def summarize(latencies: list[float], errors: int, seconds: float) -> dict[str, Any]:
+    latencies = sorted(latencies)
+    return {
+        'ok': len(latencies),
+        'errors': errors,
+        'rps': round(len(latencies) / seconds, 1) if seconds else 0.0,
+        'p50_ms': percentile(latencies, 50),
+        'p95_ms': percentile(latencies, 95),
+        'p99_ms': percentile(latencies, 99),
+        'max_ms': percentile(latencies, 100),
+    }
+
+
+def measure(args: argparse.Namespace, base_url: str, client: str) -> dict[str, Any]:
+    server_stats(base_url)
+    wall, cpu = time.perf_counter(), time.process_time()
+    if client == 'async':
+        recorder = asyncio.run(run_async(args, base_url))
+    else:
+        recorder = run_sync(args, base_url)
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    stats = server_stats(base_url)
+    all_latencies = [v for values in recorder.latencies.values() for v in values]
+    error_count = sum(sum(e.values()) for e in recorder.errors.values())
+    total = summarize(all_latencies, error_count, wall)
+    total.update(
+        seconds=round(wall, 3),
+        server_requests=stats['requests'],
+        connections=stats['connections'],
+        peak_connections=stats['peak_open'],
+        cpu_us_per_request=round(cpu / max(1, len(all_latencies) + error_count) * 1e6, 1),
+    )
+    return {
+        'total': total,
+        'operations': {
+            name: summarize(
+                recorder.latencies.get(name, []),
+                sum(recorder.errors.get(name, {}).values()), wall
+            ) for name in args.mix
+        },
+        'errors': recorder.errors,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--client', choices=('async', 'sync', 'both'), default='both')
+    parser.add_argument('--concurrency', type=int, default=32, help='Задачи asyncio или потоки.')
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix('list=60,get=30,create=5,action=5'))
+    parser.add_argument('--servers', type=int, default=500, help='Серверов в имитации.')
+    parser.add_argument('--latency', type=float, default=0.02, help='Задержка ответа сервера в секундах.')
+    parser.add_argument('--rate-429', type=float, default=0.0, help='Доля ответов 429.')
+    parser.add_argument('--max-connections', type=int, default=100, help='Размер пула соединений.')
+    parser.add_argument('--no-retry', dest='retry', action='store_false', help='Без повторных запросов.')
+    parser.add_argument('--rate-limit', type=float, help='Лимит запросов в секунду (`RateLimiter`).')
+    parser.add_argument('--adaptive', action='store_true', help='`AIMDLimiter` для асинхронного клиента.')
+    parser.add_argument('--singleflight', action='store_true', help='Объединение одинаковых GET запросов.')
+    parser.add_argument('--no-validate', action='store_true', help='Разбор без валидации.')
+    parser.add_argument('--lazy', action='store_true', help='Ленивое создание моделей.')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', action='store_true', help='Вывести результат в JSON.')
+    args = parser.parse_args()
+    # Повторы после 429 - ожидаемая часть нагрузки, они видны в счётчиках.
+    logging.getLogger('timeweb').setLevel(logging.ERROR)
+
+    process, base_url = start_server(args)
+    try:
+        clients = ('async', 'sync') if args.client == 'both' else (args.client,)
+        results = {client: measure(args, base_url, client) for client in clients}
+    finally:
+        process.terminate()
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for client, data in results.items():
+        total = data['total']
+        print(
+            f'{client}: {total["rps"]:.0f} req/s, {total["ok"]} ok, {total["errors"]} errors, '
+            f'{total["server_requests"]} server requests, {total["connections"]} connections '
+            f'(peak {total["peak_connections"]}), {total["cpu_us_per_request"]:.0f} us CPU/request'
+        )
+        for name, op in [('total', total), *data['operations'].items()]:
+            print(
+                f'  {name:<7} {op["ok"]:>6} ok {op["errors"]:>5} err  p50 {op["p50_ms"]:8.2f}  '
+                f'p95 {op["p95_ms"]:8.2f}  p99 {op["p99_ms"]:8.2f}  max {op["max_ms"]:8.2f} ms'
+            )
+        for name, errors in data['errors'].items():
+            print(f'  {name} errors: {errors}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+'''Сравнение разбора ответов с валидацией и без неё (`validate=False`).
+
+Запуск: `python benchmarks/parse_modes.py [--servers 10000] [--repeat 5]`.'''
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from timeweb.utils.construct import construct  # noqa: E402
+from timeweb.schemas.servers.cloud import VDSArray  # noqa: E402
+
+
+def vds(server_id: int) -> dict:
+    return {
+        'id': server_id, 'name': f'server-{server_id}', 'comment': '',
+        'os': {'id': 47, 'name': 'ubuntu', 'version': '22.04'},
+        'location': 'ru-1', 'boot_mode': 'std', 'status': 'on',
+        'is_ddos_guard': False, 'cpu': 2, 'cpu_frequency': '3.3', 'ram': 2048,
+        'networks': [{
+            'type': 'public', 'ips': [
+                {'type': 'ipv4', 'ip': f'10.{server_id // 65536 % 256}.{server_id // 256 % 256}.{server_id % 256}', 'is_main': True},
+                {'type': 'ipv6', 'ip': f'2a03:6f00::{server_id:x}', 'is_main': False}
+            ]
+        }],
+        'disks': [{
+            'id': server_id, 'size': 15360, 'used': 1024, 'type': 'nvme',
+            'is_mounted': True, 'is_system': True, 'system_name': 'vda',
+            'status': 'done'
+        }],
+        'created_at': '2023-03-01T10:00:00.000Z'
+    }
+
+
+def best_of(repeat: int, fn) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--servers', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    data = {
+        'servers': [vds(i) for i in range(args.servers)],
+        'meta': {'total': args.servers}
+    }
+    validated = best_of(args.repeat, lambda: VDSArray(**data))
+    constructed = best_of(args.repeat, lambda: construct(VDSArray, data))
+    print(f'VDSArray, {args.servers} servers')
+    print(f'  validate=True   {validated * 1000:9.1f} ms')
+    print(f'  validate=False  {constructed * 1000:9.1f} ms  (x{validated / constructed:.1f})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+'''Декодирование и разбор всех моделей ответов `timeweb.schemas` на синтетических данных.
+
+Для каждой модели ответа (наследника `BaseResponse`) генерируется JSON по её полям.
+Большие списки собраны в `WORKLOADS`: 10k `VDS` с сетями и дисками, 100k `DNSRecord`,
+50k `Object` S3 и `ResourcesResponse` со всеми типами ресурсов. Остальные модели
+получают списки по `--items` элементов. Для каждой модели замеряется время
+декодирования JSON, время разбора в режимах `validate`, `construct` (`validate=False`)
+и `lazy`, а также пиковая память на декодирование и разбор.
+
+Запуск: `python benchmarks/schema_parsing.py [--scale 0.1] [--models VDSArray,ObjectsArray]
+[--output results.json] [--compare baseline.json --threshold 1.25]`.'''
+import sys
+import enum
+import json
+import time
+import types
+import typing
+import argparse
+import platform
+import importlib
+import pkgutil
+import tracemalloc
+from uuid import UUID
+from decimal import Decimal
+from datetime import date, datetime
+from ipaddress import IPv4Address, IPv6Address
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import pydantic  # noqa: E402
+from pydantic import BaseModel  # noqa: E402
+
+from timeweb import schemas  # noqa: E402
+from timeweb.schemas.base import BaseResponse, ResponseWithMeta  # noqa: E402
+from timeweb.schemas.time_utils import Period  # noqa: E402
+from timeweb.utils.construct import construct  # noqa: E402
+from timeweb.utils.decoder import get_decoder  # noqa: E402
+from timeweb.utils.lazy import lazy_construct  # noqa: E402
+
+from parse_modes import vds  # noqa: E402
+
+
+MODES: dict[str, Callable[[type[BaseModel], Any], Any]] = {
+    'validate': lambda model, data: model(**data),
+    'construct': construct,
+    'lazy': lambda model, data: lazy_construct(model, data, True),
+}
+#: Модели с большими списками: поле со списком, количество элементов и генератор элемента.
+WORKLOADS: dict[str, dict[str, tuple[int, Callable[[int], Any] | None]]] = {
+    'VDSArray': {'servers': (10000, vds)},
+    'DNSRecordsResponse': {'dns_records': (100000, lambda i: {
+        'id': i, 'type': ('A', 'AAAA', 'CNAME', 'MX', 'TXT')[i % 5],
+        'data': {
+            'value': f'10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}',
+            'priority': 10 if i % 5 == 3 else None,
+            'subdomain': f'host-{i}.example.com' if i % 2 else None,
+        },
+    })},
+    'ObjectsArray': {'files': (50000, lambda i: {
+        'key': f'logs/2023/{i // 1000:03}/{i}.json.gz',
+        'last_modified': '2023-03-01T10:00:00.000Z',
+        'etag': f'"{i:032x}"', 'size': 1024 + i, 'storage_class': 'STANDARD',
+        'checksum_algorithm': None,
+        'owner': {'id': 'owner', 'display_name': 'owner'},
+        'type': 'file' if i % 10 else 'directory',
+    })},
+    'ResourcesResponse': {
+        'servers': (5000, vds), 'balancers': (1000, None), 'buckets': (1000, None),
+        'clusters': (500, None), 'databases': (2000, None), 'dedicated_servers': (500, None),
+    },
+}
+_NONE = type(None)
+
+
+def response_models() -> dict[str, type[BaseModel]]:
+    '''Все модели ответов из `timeweb.schemas` по имени `модуль.Класс`.'''
+    found = {}
+    for info in pkgutil.walk_packages(schemas.__path__, schemas.__name__ + '.'):
+        module = importlib.import_module(info.name)
+        for value in vars(module).values():
+            if (
+                isinstance(value, type) and issubclass(value, BaseResponse)
+                and value.__module__ == module.__name__
+                and value not in (BaseResponse, ResponseWithMeta)
+            ):
+                short = module.__name__.removeprefix(schemas.__name__ + '.')
+                found[f'{short}.{value.__name__}'] = value
+    return dict(sorted(found.items()))
+
+
+def synthesize(tp: Any, index: int, items: int) -> Any:
+    '''Синтетическое JSON значение для аннотации типа `tp`.'''
+    origin = typing.get_origin(tp)
+    if origin in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(tp) if arg is not _NONE]
+        return synthesize(args[0], index, items)
+    if origin is typing.Literal:
+        return typing.get_args(tp)[0]
+    if origin in (list, set, tuple, frozenset):
+        args = typing.get_args(tp) or (Any,)
+        return [synthesize(args[0], index * items + i, 2) for i in range(items)]
+    if origin is dict:
+        return {'key': synthesize(typing.get_args(tp)[1], index, 2)}
+    if not isinstance(tp, type):
+        return index
+    if issubclass(tp, BaseModel):
+        return payload(tp, index, items)
+    if issubclass(tp, enum.Enum):
+        # Значения, которые не восстанавливаются из JSON (например, `Period`), пропускаются.
+        values = [m.value for m in tp if _enum_roundtrip(tp, m)]
+        return values[index % len(values)]
+    if issubclass(tp, Period):
+        return 'P1M'
+    if issubclass(tp, bool):
+        return bool(index % 2)
+    if issubclass(tp, (int, float, Decimal)):
+        return index
+    if issubclass(tp, datetime):
+        return '2023-03-01T10:00:00.000Z'
+    if issubclass(tp, date):
+        return '2023-03-01'
+    if issubclass(tp, UUID):
+        return str(UUID(int=index))
+    if issubclass(tp, IPv4Address):
+        return str(IPv4Address(0x0A000000 + index % 0xFFFFFF))
+    if issubclass(tp, IPv6Address):
+        return f'2a03:6f00::{index:x}'
+    if issubclass(tp, str):
+        return f'value-{index}'
+    return index
+
+
+def _enum_roundtrip(tp: type[enum.Enum], member: enum.Enum) -> bool:
+    try:
+        return tp(json.loads(json.dumps(member.value))) is member
+    except (TypeError, ValueError):
+        return False
+
+
+def payload(
+    model: type[BaseModel], index: int = 0, items: int = 2, scale: float = 1.0
+) -> dict[str, Any]:
+    '''Синтетический JSON объект модели `model`.
+
+    Списки из `WORKLOADS` получают заданное там количество элементов, умноженное
+    на `scale`, остальные списки - по `items` элементов.'''
+    workload = WORKLOADS.get(model.__name__, {})
+    data = {}
+    for name, field in model.__fields__.items():
+        if name == 'response_id':
+            data[field.alias] = str(UUID(int=index))
+        elif name in workload:
+            count, item = workload[name]
+            count = max(1, round(count * scale))
+            if item is None:
+                data[field.alias] = synthesize(field.outer_type_, index, count)
+            else:
+                data[field.alias] = [item(i) for i in range(count)]
+        elif name == 'meta':
+            data[field.alias] = {'total': index}
+        else:
+            data[field.alias] = synthesize(field.outer_type_, index, items)
+    return data
+
+
+def best_of(repeat: int, fn: Callable[[], Any]) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def peak_memory(fn: Callable[[], Any]) -> int:
+    '''Пиковая память при выполнении `fn`, в байтах.'''
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    result = fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return peak
+
+
+def bench(
+    model: type[BaseModel], scale: float, items: int, repeat: int,
+    modes: list[str], decode: Callable[[bytes], Any]
+) -> dict[str, Any]:
+    '''Замеры одной модели.'''
+    body = json.dumps(payload(model, 1, max(1, round(items * scale)), scale)).encode()
+    data = decode(body)
+    model(**data)  # синтетические данные должны проходить валидацию
+    result: dict[str, Any] = {
+        'bytes': len(body),
+        'decode_ms': round(best_of(repeat, lambda: decode(body)) * 1000, 3),
+        'decode_peak_bytes': peak_memory(lambda: decode(body)),
+        'modes': {},
+    }
+    for mode in modes:
+        parse = MODES[mode]
+        result['modes'][mode] = {
+            'ms': round(best_of(repeat, lambda: parse(model, data)) * 1000, 3),
+            'peak_bytes': peak_memory(lambda: parse(model, decode(body))),
+        }
+    return result
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    '''Замедления относительно `baseline` больше чем в `threshold` раз.'''
+    regressions = []
+    for name, current in results['models'].items():
+        previous = baseline['models'].get(name)
+        if previous is None:
+            continue
+        pairs = [('decode', current['decode_ms'], previous['decode_ms'])]
+        pairs += [
+            (mode, data['ms'], previous['modes'][mode]['ms'])
+            for mode, data in current['modes'].items() if mode in previous['modes']
+        ]
+        for mode, now, before in pairs:
+            # Доли миллисекунды слишком шумные для сравнения.
+            if now > 0.5 and now > before * threshold:
+                regressions.append(f'{name} {mode}: {before:.2f} -> {now:.2f} ms (x{now / before:.2f})')
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=float, default=1.0, help='Множитель размеров списков.')
+    parser.add_argument('--items', type=int, default=100, help='Элементов в списках остальных моделей.')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--models', help='Модели через запятую, по имени класса или `модуль.Класс`.')
+    parser.add_argument('--modes', default=','.join(MODES), help='Режимы разбора через запятую.')
+    parser.add_argument('--decoder', choices=('orjson', 'ujson', 'json'), help='JSON декодер.')
+    parser.add_argument('--json', action='store_true', help='Вывести результат в JSON.')
+    parser.add_argument('--output', type=Path, help='Сохранить результат в JSON файл.')
+    parser.add_argument('--compare', type=Path, help='JSON файл с прошлыми результатами.')
+    parser.add_argument('--threshold', type=float, default=1.25, help='Допустимое замедление.')
+    args = parser.parse_args()
+
+    models = response_models()
+    if args.models:
+        wanted = set(args.models.split(','))
+        models = {
+            name: model for name, model in models.items()
+            if name in wanted or model.__name__ in wanted
+        }
+    modes = args.modes.split(',')
+    decode = get_decoder(args.decoder)
+    results: dict[str, Any] = {
+        'python': platform.python_version(),
+        'pydantic': pydantic.VERSION,
+        'decoder': getattr(decode, '__module__', None),
+        'scale': args.scale,
+        'items': args.items,
+        'models': {},
+    }
+    for name, model in models.items():
+        data = results['models'][name] = bench(
+            model, args.scale, args.items, args.repeat, modes, decode
+        )
+        if not args.json:
+            line = f'{name:<48} {data["bytes"] / 1024:9.1f} KiB  decode {data["decode_ms"]:9.2f} ms'
+            for mode, measured in data['modes'].items():
+                line += f'  {mode} {measured["ms"]:9.2f} ms {measured["peak_bytes"] / 2 ** 20:7.1f} MiB'
+            print(line, flush=True)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    if args.compare:
+        regressions = compare(results, json.loads(args.compare.read_text()), args.threshold)
+        for line in regressions:
+            print(f'REGRESSION {line}', file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
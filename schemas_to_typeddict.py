@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+'''Генерация TypedDict для ответов API из pydantic моделей `timeweb.schemas`.
+
+Результат записывается в `src/timeweb/typed`: каждому пакету `timeweb.schemas.X`
+соответствует модуль `timeweb.typed.X`.'''
+import sys
+import enum
+import types
+import typing
+import keyword
+import inspect
+import pkgutil
+import argparse
+import importlib
+from uuid import UUID
+from pathlib import Path
+from decimal import Decimal
+from datetime import date, datetime
+from collections import defaultdict
+from ipaddress import IPv4Address, IPv6Address
+
+
+ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT / 'src'))
+
+from pydantic import BaseModel  # noqa: E402
+
+import timeweb.schemas  # noqa: E402
+
+
+argparser = argparse.ArgumentParser(
+    description='Генерация TypedDict из моделей timeweb.schemas.'
+)
+argparser.add_argument(
+    '--output', type=Path, default=ROOT / 'src' / 'timeweb' / 'typed',
+    help='Каталог для модулей'
+)
+argparser.add_argument(
+    '--check', action='store_true',
+    help='Только проверить, что сгенерированные модули актуальны'
+)
+
+HEADER = '''# -*- coding: utf-8 -*-
+# flake8: noqa
+# Сгенерировано schemas_to_typeddict.py, не редактируйте вручную.
+\'\'\'{doc}\'\'\'
+from __future__ import annotations
+
+from typing import Any, Literal, TypedDict
+'''
+AS_STR = (UUID, datetime, date, IPv4Address, IPv6Address)
+
+
+def target_module(schema_module: str) -> str:
+    '''Модуль `timeweb.typed` для модуля схем.'''
+    parts = schema_module.split('.')[2:]
+    if parts[0] in ('base', 'errors', 'time_utils'):
+        return 'base'
+    if parts[0] == 'servers':
+        return '.'.join(parts[:2])
+    return parts[0]
+
+
+def signature(model: type[BaseModel]) -> list[tuple[str, str]]:
+    '''Поля модели для сравнения одноимённых моделей.'''
+    return [(f.alias, str(f.outer_type_)) for f in model.__fields__.values()]
+
+
+def collect() -> dict[str, dict[str, type[BaseModel]]]:
+    '''Модели, сгруппированные по модулям `timeweb.typed`.'''
+    modules: dict[str, dict[str, type[BaseModel]]] = defaultdict(dict)
+    for info in pkgutil.walk_packages(timeweb.schemas.__path__, 'timeweb.schemas.'):
+        module = importlib.import_module(info.name)
+        for name, cls in inspect.getmembers(module, inspect.isclass):
+            if not issubclass(cls, BaseModel) or cls.__module__ != info.name:
+                continue
+            target = modules[target_module(info.name)]
+            if name in target:
+                # Одинаковые модели в разных модулях пакета объединяются.
+                if signature(target[name]) != signature(cls):
+                    raise ValueError(f'Дублирующееся имя модели: {name} ({info.name})')
+                continue
+            target[name] = cls
+    return modules
+
+
+class Renderer:
+    def __init__(self, module: str, owners: dict[type[BaseModel], str]):
+        self.module = module
+        self.owners = owners
+        self.imports: dict[str, set[str]] = defaultdict(set)
+
+    def render(self, tp: typing.Any) -> str:
+        origin = typing.get_origin(tp)
+        args = typing.get_args(tp)
+        if tp is type(None) or tp is None:
+            return 'None'
+        if tp is typing.Any:
+            return 'Any'
+        if origin in (typing.Union, types.UnionType):
+            rendered: list[str] = []
+            for arg in args:
+                item = self.render(arg)
+                if item not in rendered:
+                    rendered.append(item)
+            return ' | '.join(rendered)
+        if origin is typing.Literal:
+            return f'Literal[{", ".join(repr(arg) for arg in args)}]'
+        if origin in (list, set, frozenset, tuple, typing.Sequence):
+            return f'list[{self.render(args[0]) if args else "Any"}]'
+        if origin is dict:
+            return f'dict[str, {self.render(args[1]) if args else "Any"}]'
+        if isinstance(tp, type):
+            if issubclass(tp, BaseModel):
+                owner = self.owners.get(tp) or target_module(tp.__module__)
+                if owner != self.module:
+                    self.imports[owner].add(tp.__name__)
+                return tp.__name__
+            if issubclass(tp, enum.Enum):
+                values = (
+                    str.__str__(item.value) if isinstance(item.value, str) else item.value
+                    for item in tp
+                )
+                return f'Literal[{", ".join(repr(value) for value in values)}]'
+            if issubclass(tp, bool):
+                return 'bool'
+            if issubclass(tp, str) or issubclass(tp, AS_STR):
+                return 'str'
+            if issubclass(tp, int):
+                return 'int'
+            if issubclass(tp, (float, Decimal)):
+                return 'float'
+        return 'Any'
+
+    def typeddict(self, name: str, model: type[BaseModel]) -> str:
+        hints = typing.get_type_hints(model)
+        fields = [
+            (field.alias, self.render(hints.get(field.name, typing.Any)))
+            for field in model.__fields__.values()
+        ]
+        doc = (model.__doc__ or name).strip().splitlines()[0]
+        if any(keyword.iskeyword(key) or not key.isidentifier() for key, _ in fields):
+            items = ''.join(f'    {key!r}: {tp!r},\n' for key, tp in fields)
+            return f'{name} = TypedDict({name!r}, {{\n{items}}}, total=False)\n'
+        body = ''.join(f'    {key}: {tp}\n' for key, tp in fields) or '    pass\n'
+        return f'class {name}(TypedDict, total=False):\n    \'\'\'{doc}\'\'\'\n{body}'
+
+
+def generate() -> dict[Path, str]:
+    modules = collect()
+    owners = {cls: module for module, models in modules.items() for cls in models.values()}
+    files: dict[Path, str] = {}
+    for module, models in sorted(modules.items()):
+        renderer = Renderer(module, owners)
+        bodies = [renderer.typeddict(name, cls) for name, cls in models.items()]
+        depth = module.count('.')
+        imports = ''.join(
+            f'from {"." * (depth + 1)}{owner} import {", ".join(sorted(names))}\n'
+            for owner, names in sorted(renderer.imports.items())
+        )
+        doc = f'TypedDict для ответов `timeweb.schemas.{module}` в режиме `raw`.'
+        source = HEADER.format(doc=doc) + (f'\n{imports}' if imports else '')
+        source += '\n\n' + '\n\n'.join(bodies)
+        files[Path(*module.split('.')).with_suffix('.py')] = source
+    files[Path('__init__.py')] = HEADER.format(
+        doc='TypedDict для ответов API в режиме `raw`.'
+    ).split('from __future__')[0]
+    files[Path('servers') / '__init__.py'] = files[Path('__init__.py')]
+    return files
+
+
+def main():
+    args = argparser.parse_args()
+    stale = []
+    for path, source in generate().items():
+        path = args.output / path
+        if args.check:
+            if not path.exists() or path.read_text(encoding='utf-8') != source:
+                stale.append(str(path))
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source, encoding='utf-8')
+    if stale:
+        print('Устаревшие модули:', *stale, sep='\n  ')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
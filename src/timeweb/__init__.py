@@ -1,14 +1,75 @@
 # -*- coding: utf-8 -*-
 # flake8: noqa
-'''Timeweb Cloud API client'''
+'''Timeweb Cloud API client
+
+Клиенты, транспорты и инструменты импортируются лениво, при первом обращении,
+поэтому `import timeweb` не загружает httpx, pydantic и схемы API.'''
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .__meta import __version__, __author__
-from .sync_api.api import Timeweb
-from .async_api.api import AsyncTimeweb
 
+if TYPE_CHECKING:
+    from .sync_api.api import Timeweb
+    from .async_api.api import AsyncTimeweb
+    from .sync_api.transport import Transport
+    from .async_api.transport import AsyncTransport
+    from .async_api.concurrency import AIMDLimiter
+    from .utils import (
+        RetryPolicy, RateLimiter, TTLCache, SQLiteCache, ConditionalCache,
+        SingleFlight, AsyncSingleFlight, Cassette, Metrics, RecordingTracer,
+        request_options
+    )
+
+
+_LAZY = {
+    'Timeweb': '.sync_api.api',
+    'AsyncTimeweb': '.async_api.api',
+    'Transport': '.sync_api.transport',
+    'AsyncTransport': '.async_api.transport',
+    'AIMDLimiter': '.async_api.concurrency',
+    'RetryPolicy': '.utils.retry',
+    'RateLimiter': '.utils.ratelimit',
+    'TTLCache': '.utils.cache',
+    'SQLiteCache': '.utils.cache',
+    'ConditionalCache': '.utils.conditional',
+    'SingleFlight': '.utils.singleflight',
+    'AsyncSingleFlight': '.utils.singleflight',
+    'Cassette': '.utils.cassette',
+    'Metrics': '.utils.metrics',
+    'RecordingTracer': '.utils.tracing',
+    'request_options': '.utils.options',
+}
 
 __all__ = [
     'Timeweb',
     'AsyncTimeweb',
+    'Transport',
+    'AsyncTransport',
+    'AIMDLimiter',
+    'RetryPolicy',
+    'RateLimiter',
+    'TTLCache',
+    'SQLiteCache',
+    'ConditionalCache',
+    'SingleFlight',
+    'AsyncSingleFlight',
+    'Cassette',
+    'Metrics',
+    'RecordingTracer',
+    'request_options',
     '__version__',
     '__author__',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -12,19 +12,25 @@ from ipaddress import IPv4Address
 from httpx import AsyncClient
 
 from .base import BaseAsyncClient
+from .transport import AsyncTransport
+from ..utils.cache import cached
 from ..schemas import account as schemas
 
 
 class AccountAPI(BaseAsyncClient):
     '''Клиент для работы с API аккаунта Timeweb Cloud'''
 
-    def __init__(self, token: str, client: AsyncClient | None = None):
+    def __init__(
+        self, token: str, client: AsyncClient | None = None,
+        transport: AsyncTransport | None = None
+    ):
         '''Инициализация клиента.
         Args:
             token (str): API токен.
             client (AsyncClient | None, optional): HTTPX клиент. Defaults to None.
+            transport (AsyncTransport | None, optional): Общий транспорт клиента. Defaults to None.
         '''
-        super().__init__(token, client)
+        super().__init__(token, client, transport)
         self.log = logging.getLogger('timeweb')
 
     async def get_finances(self) -> schemas.AccountFinances:
@@ -36,7 +42,7 @@ class AccountAPI(BaseAsyncClient):
         method = 'GET'
         url = '/account/finances'
         data = await self._request(method, url)
-        return schemas.AccountFinances(**data.json())
+        return self._parse(data, schemas.AccountFinances)
 
     async def get_status(self) -> schemas.AccountStatus:
         '''Получение информации о статусе аккаунта.
@@ -47,7 +53,7 @@ class AccountAPI(BaseAsyncClient):
         method = 'GET'
         url = '/account/status'
         data = await self._request(method, url)
-        return schemas.AccountStatus(**data.json())
+        return self._parse(data, schemas.AccountStatus)
 
     async def get_access_restrictions(self) -> schemas.AccountAccess:
         '''Получение информации об ограничениях авторизации пользователя.
@@ -58,7 +64,7 @@ class AccountAPI(BaseAsyncClient):
         method = 'GET'
         url = '/auth/access'
         data = await self._request(method, url)
-        return schemas.AccountAccess(**data.json())
+        return self._parse(data, schemas.AccountAccess)
 
     async def turn_countries_restrictions(self, enabled: bool) -> bool:
         '''Включение/отключение ограничений по странам.
@@ -74,6 +80,7 @@ class AccountAPI(BaseAsyncClient):
         await self._request(method, url, json={'is_enabled': enabled})
         return True
 
+    @cached
     async def get_countries(self) -> schemas.AccessCountries:
         '''Получение списка стран.
 
@@ -83,7 +90,7 @@ class AccountAPI(BaseAsyncClient):
         method = 'GET'
         url = '/auth/access/countries'
         data = await self._request(method, url)
-        return schemas.AccessCountries(**data.json())
+        return self._parse(data, schemas.AccessCountries)
 
     async def add_allowed_countries(self, countries: list[str]) -> schemas.AddAccessCountries:
         '''Добавление разрешенных стран.
@@ -97,7 +104,7 @@ class AccountAPI(BaseAsyncClient):
         method = 'POST'
         url = '/auth/access/countries'
         data = await self._request(method, url, json={'countries': countries})
-        return schemas.AddAccessCountries(**data.json())
+        return self._parse(data, schemas.AddAccessCountries)
 
     async def remove_allowed_countries(self, countries: list[str]) -> schemas.RemoveAccessCountries:
         '''Удаление разрешенных стран.
@@ -111,7 +118,7 @@ class AccountAPI(BaseAsyncClient):
         method = 'DELETE'
         url = '/auth/access/countries'
         data = await self._request(method, url, json={'countries': countries})
-        return schemas.RemoveAccessCountries(**data.json())
+        return self._parse(data, schemas.RemoveAccessCountries)
 
     async def turn_ips_restrictions(self, enabled: bool) -> bool:
         '''Включение/отключение ограничений по IP.
@@ -139,7 +146,7 @@ class AccountAPI(BaseAsyncClient):
         method = 'POST'
         url = '/auth/access/ips'
         data = await self._request(method, url, json={'ips': ips})
-        return schemas.AddIP(**data.json())
+        return self._parse(data, schemas.AddIP)
 
     async def remove_allowed_ips(self, ips: list[str | IPv4Address]) -> schemas.RemoveIP:
         '''Удаление разрешенных IP.
@@ -153,4 +160,4 @@ class AccountAPI(BaseAsyncClient):
         method = 'DELETE'
         url = '/auth/access/ips'
         data = await self._request(method, url, json={'ips': ips})
-        return schemas.RemoveIP(**data.json())
+        return self._parse(data, schemas.RemoveIP)
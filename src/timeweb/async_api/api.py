@@ -1,22 +1,28 @@
 # -*- coding: utf-8 -*-
-'''Асинхронный клиент для Timeweb Cloud API'''
+'''Асинхронный клиент для Timeweb Cloud API
+
+API создаются при первом обращении к ним, вместе с модулями и схемами.'''
 import logging
+from functools import cached_property
+from typing import Any, TYPE_CHECKING
 
-from httpx import AsyncClient
+from .transport import AsyncTransport
 
-from .vds import VDSAPI
-from .mail import MailAPI
-from .s3 import BucketsAPI
-from .dbs import DatabasesAPI
-from .tokens import TokensAPI
-from .images import ImagesAPI
-from .dedics import DedicsAPI
-from .k8s import KubernetesAPI
-from .domains import DomainsAPI
-from .account import AccountAPI
-from .ssh_keys import SSHKeysAPI
-from .projects import ProjectsAPI
-from .balancers import BalancersAPI
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from .vds import VDSAPI
+    from .mail import MailAPI
+    from .s3 import BucketsAPI
+    from .tokens import TokensAPI
+    from .images import ImagesAPI
+    from .dbs import DatabasesAPI
+    from .dedics import DedicsAPI
+    from .k8s import KubernetesAPI
+    from .account import AccountAPI
+    from .domains import DomainsAPI
+    from .ssh_keys import SSHKeysAPI
+    from .projects import ProjectsAPI
+    from .balancers import BalancersAPI
 
 
 class Servers:
@@ -27,16 +33,32 @@ class Servers:
         cloud (VDSAPI): API для работы с облачными серверами.
     '''
 
-    def __init__(self, token: str, client: AsyncClient | None = None):
+    def __init__(
+        self, token: str, client: 'AsyncClient | None' = None,
+        transport: AsyncTransport | None = None
+    ):
         '''Инициализация API.
 
         Args:
             token (str): API токен.
             client (AsyncClient | None, optional): HTTPX клиент. Defaults to None.
+            transport (AsyncTransport | None, optional): Общий транспорт клиента. Defaults to None.
         '''
         self.log = logging.getLogger('timeweb')
-        self.dedics = DedicsAPI(token, client)
-        self.cloud = VDSAPI(token, client)
+        self.token = token
+        self.transport = transport or AsyncTransport(token, client)
+
+    @cached_property
+    def dedics(self) -> 'DedicsAPI':
+        '''API для работы с выделенными серверами.'''
+        from .dedics import DedicsAPI
+        return DedicsAPI(self.token, transport=self.transport)
+
+    @cached_property
+    def cloud(self) -> 'VDSAPI':
+        '''API для работы с облачными серверами.'''
+        from .vds import VDSAPI
+        return VDSAPI(self.token, transport=self.transport)
 
 
 class AsyncTimeweb:
@@ -55,25 +77,110 @@ class AsyncTimeweb:
         domains (DomainsAPI): API для работы с доменами.
         mail (MailAPI): API для работы с почтой.
         projects (ProjectsAPI): API для работы с проектами.
+        transport (AsyncTransport): Общий транспорт, которым пользуются все API клиента.
     '''
 
-    def __init__(self, token: str, client: AsyncClient | None = None):
+    def __init__(
+        self, token: str, client: 'AsyncClient | None' = None,
+        transport: AsyncTransport | None = None
+    ):
         '''Инициализация клиента.
 
         Args:
             token (str): API токен.
             client (AsyncClient | None, optional): HTTPX клиент. Defaults to None.
+            transport (AsyncTransport | None, optional): Общий транспорт клиента. Defaults to None.
         '''
         self.log = logging.getLogger('timeweb')
-        self.account = AccountAPI(token, client)
-        self.tokens = TokensAPI(token, client)
-        self.ssh_keys = SSHKeysAPI(token, client)
-        self.images = ImagesAPI(token, client)
-        self.s3 = BucketsAPI(token, client)
-        self.dbs = DatabasesAPI(token, client)
-        self.servers = Servers(token, client)
-        self.balancers = BalancersAPI(token, client)
-        self.k8s = KubernetesAPI(token, client)
-        self.domains = DomainsAPI(token, client)
-        self.mail = MailAPI(token, client)
-        self.projects = ProjectsAPI(token, client)
+        self.token = token
+        self.transport = transport or AsyncTransport(token, client)
+
+    @cached_property
+    def account(self) -> 'AccountAPI':
+        '''API для работы с аккаунтом.'''
+        from .account import AccountAPI
+        return AccountAPI(self.token, transport=self.transport)
+
+    @cached_property
+    def tokens(self) -> 'TokensAPI':
+        '''API для работы с токенами.'''
+        from .tokens import TokensAPI
+        return TokensAPI(self.token, transport=self.transport)
+
+    @cached_property
+    def ssh_keys(self) -> 'SSHKeysAPI':
+        '''API для работы с SSH ключами.'''
+        from .ssh_keys import SSHKeysAPI
+        return SSHKeysAPI(self.token, transport=self.transport)
+
+    @cached_property
+    def images(self) -> 'ImagesAPI':
+        '''API для работы с образами.'''
+        from .images import ImagesAPI
+        return ImagesAPI(self.token, transport=self.transport)
+
+    @cached_property
+    def s3(self) -> 'BucketsAPI':
+        '''API для работы с S3-хранилищами.'''
+        from .s3 import BucketsAPI
+        return BucketsAPI(self.token, transport=self.transport)
+
+    @cached_property
+    def dbs(self) -> 'DatabasesAPI':
+        '''API для работы с базами данных.'''
+        from .dbs import DatabasesAPI
+        return DatabasesAPI(self.token, transport=self.transport)
+
+    @cached_property
+    def servers(self) -> Servers:
+        '''API для работы с серверами.'''
+        return Servers(self.token, transport=self.transport)
+
+    @cached_property
+    def balancers(self) -> 'BalancersAPI':
+        '''API для работы с балансировщиками.'''
+        from .balancers import BalancersAPI
+        return BalancersAPI(self.token, transport=self.transport)
+
+    @cached_property
+    def k8s(self) -> 'KubernetesAPI':
+        '''API для работы с Kubernetes.'''
+        from .k8s import KubernetesAPI
+        return KubernetesAPI(self.token, transport=self.transport)
+
+    @cached_property
+    def domains(self) -> 'DomainsAPI':
+        '''API для работы с доменами.'''
+        from .domains import DomainsAPI
+        return DomainsAPI(self.token, transport=self.transport)
+
+    @cached_property
+    def mail(self) -> 'MailAPI':
+        '''API для работы с почтой.'''
+        from .mail import MailAPI
+        return MailAPI(self.token, transport=self.transport)
+
+    @cached_property
+    def projects(self) -> 'ProjectsAPI':
+        '''API для работы с проектами.'''
+        from .projects import ProjectsAPI
+        return ProjectsAPI(self.token, transport=self.transport)
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        '''Метрики запросов клиента по эндпоинтам, см. `timeweb.utils.metrics.Metrics.snapshot`.
+
+        Returns:
+            dict[str, dict[str, Any]]: Метрики по ключам вида `GET /servers/{id}`. Пустой словарь, если метрики отключены в транспорте.
+        '''
+        metrics = self.transport.metrics
+        return metrics.snapshot() if metrics is not None else {}
+
+    async def aclose(self) -> None:
+        '''Закрывает общий пул соединений.'''
+        await self.transport.aclose()
+
+    async def __aenter__(self) -> 'AsyncTimeweb':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
@@ -12,19 +12,25 @@ from ipaddress import IPv4Address, IPv6Address
 from httpx import AsyncClient
 
 from .base import BaseAsyncClient
+from .transport import AsyncTransport
+from ..utils.cache import cached
 from ..schemas import balancers as schemas
 
 
 class BalancersAPI(BaseAsyncClient):
     '''Клиент для работы с API балансировщиками Timeweb Cloud'''
 
-    def __init__(self, token: str, client: AsyncClient | None = None):
+    def __init__(
+        self, token: str, client: AsyncClient | None = None,
+        transport: AsyncTransport | None = None
+    ):
         '''Инициализация клиента.
         Args:
             token (str): API токен.
             client (AsyncClient | None, optional): HTTPX клиент. Defaults to None.
+            transport (AsyncTransport | None, optional): Общий транспорт клиента. Defaults to None.
         '''
-        super().__init__(token, client)
+        super().__init__(token, client, transport)
         self.log = logging.getLogger('timeweb')
 
     async def get_balancers(self) -> schemas.BalancersResponse:
@@ -36,7 +42,7 @@ class BalancersAPI(BaseAsyncClient):
         balancers = await self._request(
             'GET', '/balancers'
         )
-        return schemas.BalancersResponse(**balancers.json())
+        return self._parse(balancers, schemas.BalancersResponse)
 
     async def create(
         self, name: str, algo: schemas.BalancerAlgorithm | str, is_sticky: bool,
@@ -90,7 +96,7 @@ class BalancersAPI(BaseAsyncClient):
         balancer = await self._request(
             'POST', '/balancers', json=data
         )
-        return schemas.BalancerResponse(**balancer.json())
+        return self._parse(balancer, schemas.BalancerResponse)
 
     async def get(self, balancer_id: int) -> schemas.BalancerResponse:
         '''Получить балансировщик.
@@ -104,7 +110,7 @@ class BalancersAPI(BaseAsyncClient):
         balancer = await self._request(
             'GET', f'/balancers/{balancer_id}'
         )
-        return schemas.BalancerResponse(**balancer.json())
+        return self._parse(balancer, schemas.BalancerResponse)
 
     async def update(
         self, balancer_id: int, name: str | None = None,
@@ -176,7 +182,7 @@ class BalancersAPI(BaseAsyncClient):
         balancer = await self._request(
             'PATCH', f'/balancers/{balancer_id}', json=data
         )
-        return schemas.BalancerResponse(**balancer.json())
+        return self._parse(balancer, schemas.BalancerResponse)
 
     async def delete(self, balancer_id: int) -> bool | schemas.BalancerDelete:
         '''Удалить балансировщик.
@@ -193,7 +199,7 @@ class BalancersAPI(BaseAsyncClient):
         if status.status_code == 204:
             return True
         elif status.status_code == 200:
-            return schemas.BalancerDelete(**status.json())
+            return self._parse(status, schemas.BalancerDelete)
         else:
             return False
 
@@ -231,7 +237,7 @@ class BalancersAPI(BaseAsyncClient):
         balancer_ips = await self._request(
             'GET', f'/balancers/{balancer_id}/ips'
         )
-        return schemas.BalancerIPsResponse(**balancer_ips.json())
+        return self._parse(balancer_ips, schemas.BalancerIPsResponse)
 
     async def add_balancer_ips(
         self, balancer_id: int, ips: list[str | IPv4Address | IPv6Address]
@@ -279,7 +285,7 @@ class BalancersAPI(BaseAsyncClient):
         balancer_rules = await self._request(
             'GET', f'/balancers/{balancer_id}/rules'
         )
-        return schemas.BalancerRulesResponse(**balancer_rules.json())
+        return self._parse(balancer_rules, schemas.BalancerRulesResponse)
 
     async def add_balancer_rule(
         self, balancer_id: int, balancer_proto: schemas.Protocol | str,
@@ -312,7 +318,7 @@ class BalancersAPI(BaseAsyncClient):
         balancer_rule = await self._request(
             'POST', f'/balancers/{balancer_id}/rules', json=data
         )
-        return schemas.BalancerRuleResponse(**balancer_rule.json())
+        return self._parse(balancer_rule, schemas.BalancerRuleResponse)
 
     async def update_balancer_rule(
         self, balancer_id: int, rule_id: int,
@@ -346,7 +352,7 @@ class BalancersAPI(BaseAsyncClient):
         balancer_rule = await self._request(
             'PATCH', f'/balancers/{balancer_id}/rules/{rule_id}', json=data
         )
-        return schemas.BalancerRuleResponse(**balancer_rule.json())
+        return self._parse(balancer_rule, schemas.BalancerRuleResponse)
 
     async def delete_balancer_rule(self, balancer_id: int, rule_id: int) -> bool:
         '''Удалить правило балансировщика.
@@ -363,6 +369,7 @@ class BalancersAPI(BaseAsyncClient):
         )
         return resp.is_success
 
+    @cached
     async def get_presets(self) -> schemas.BalancerPresetsResponse:
         '''Получить список тарифов балансировщиков.
 
@@ -370,4 +377,4 @@ class BalancersAPI(BaseAsyncClient):
             BalancerPresetsResponse: Список тарифов.
         '''
         balancer_presets = await self._request('GET', '/presets/balancers')
-        return schemas.BalancerPresetsResponse(**balancer_presets.json())
+        return self._parse(balancer_presets, schemas.BalancerPresetsResponse)
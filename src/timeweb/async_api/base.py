@@ -1,50 +1,88 @@
 # -*- coding: utf-8 -*-
-import sys
+import time
+import asyncio
 import logging
+from itertools import islice
+from collections import deque
+from weakref import WeakKeyDictionary
+from typing import Any, Callable, TypeVar, AsyncIterator
 
-from httpx import AsyncClient, Response, HTTPStatusError, Timeout
+from httpx import AsyncClient, Request, Response, HTTPStatusError, TransportError, QueryParams
+from pydantic import BaseModel
 
+from .transport import AsyncTransport
 from ..errors import exc
-from ..__meta import __version__
+from ..utils.retry import RetryPolicy
+from ..utils.options import get_option
+from ..utils.construct import construct
+from ..utils.lazy import lazy_construct
+from ..utils.stream import JSONArrayStream
+from ..utils.metrics import endpoint_template
+from ..utils.tracing import Span, trace_public_methods
 from ..schemas.errors import BaseError
 
 
+T = TypeVar('T', bound=BaseModel)
+#: Модели, разобранные из ответов. Сохранённый для `304 Not Modified` ответ
+#: переиспользуется, поэтому его модель не собирается заново.
+_models: 'WeakKeyDictionary[Response, tuple[Any, bool, bool, Any]]' = WeakKeyDictionary()
+
+
+def _page_items(page: Any, field: str) -> list[Any]:
+    '''Элементы страницы коллекции из модели или сырого JSON (режим `raw`).'''
+    items = page.get(field) if isinstance(page, dict) else getattr(page, field)
+    return items or []
+
+
+def _page_total(page: Any) -> int | None:
+    '''`meta.total` страницы коллекции из модели или сырого JSON (режим `raw`).'''
+    if isinstance(page, dict):
+        return (page.get('meta') or {}).get('total')
+    return page.meta.total if page.meta else None
+
+
 class BaseAsyncClient:
     '''Базовый клиент для асинхронной работы с Timeweb Cloud API.'''
-    BASE_URL = 'https://api.timeweb.cloud/api/v1/'
+    BASE_URL = AsyncTransport.BASE_URL
+
+    def __init_subclass__(cls, **kwargs):
+        '''Публичные методы API выполняются в спанах трассировщика транспорта, если он задан.'''
+        super().__init_subclass__(**kwargs)
+        trace_public_methods(cls)
 
     def __init__(
-        self, token: str, client: AsyncClient | None = None
+        self, token: str, client: AsyncClient | None = None,
+        transport: AsyncTransport | None = None
     ):
         '''Инициализация клиента.
 
         Args:
             token (str): API токен.
             client (AsyncClient | None, optional): HTTPX клиент. Defaults to None.
+            transport (AsyncTransport | None, optional): Общий транспорт клиента. Defaults to None.
         '''
         self.log = logging.getLogger('timeweb')
         self.token = token
-        ua = f'timeweb-cloud/{__version__} (Python {sys.version}) '
-        ua += 'https://github.com/LulzLoL231/timeweb-cloud'
-        default_client = AsyncClient(
-            headers={
-                'User-Agent': f'timeweb-cloud/{__version__}',
-                'Authorization': f'Bearer {self.token}',
-                'Accept': 'application/json'
-            },
-            base_url=self.BASE_URL,
-            timeout=Timeout(30)
-        )
-        self.client = client or default_client
+        self.transport = transport or AsyncTransport(token, client)
+        self.client = self.transport.client
 
     async def _request(
-        self, method: str, url: str, **kwargs
+        self, method: str, url: str,
+        retry: RetryPolicy | None = None, **kwargs
     ) -> Response:
         '''Отправка запроса к API.
 
+        Перед каждой попыткой запрос ожидает своей очереди в `RateLimiter` транспорта, если он задан.
+        Запросы, завершившиеся ошибкой соединения или статусом из `RetryPolicy.statuses`, повторяются согласно политике повторов.
+        Если в транспорте задан `ConditionalCache`, то GET запросы отправляются с валидаторами прошлого ответа,
+        а на `304 Not Modified` возвращается сохранённый ответ.
+        Если в транспорте задан `SingleFlight`, то одинаковые одновременные GET запросы выполняются один раз
+        и получают общий ответ.
+
         Args:
             method (str): HTTP метод.
             url (str): URL запроса.
+            retry (RetryPolicy | None, optional): Политика повторов для этого вызова. По умолчанию берётся из `request_options` или транспорта. Defaults to None.
 
         Raises:
             exc.BadRequestError: Был отправлен неверный запрос, например, в нем отсутствуют обязательные параметры и т. д. Тело ответа будет содержать дополнительную информацию об ошибке.
@@ -61,14 +99,193 @@ class BaseAsyncClient:
         Returns:
             Response: Httpx response.
         '''
-        self.log.debug(f'Called with args: ({method}, {url})')
-        response = await self.client.request(method, url, **kwargs)
-        self.log.debug(f'Response: {response.text}')
+        flight = self.transport.singleflight
+        if flight is not None and method == 'GET' and kwargs.keys() <= {'params'}:
+            params = kwargs.get('params')
+            key = (self.transport.token, method, url, str(QueryParams(params)) if params else '')
+            return await flight.do(key, lambda: self._execute(method, url, retry, **kwargs))
+        return await self._execute(method, url, retry, **kwargs)
+
+    async def _execute(
+        self, method: str, url: str,
+        retry: RetryPolicy | None = None, stream: bool = False, **kwargs
+    ) -> Response:
+        '''Выполнение запроса к API с повторами, подробнее в `_request`.
+
+        Args:
+            method (str): HTTP метод.
+            url (str): URL запроса.
+            retry (RetryPolicy | None, optional): Политика повторов для этого вызова. Defaults to None.
+            stream (bool, optional): Не читать тело успешного ответа, его нужно прочитать и закрыть вызывающему. Условные запросы в этом режиме не используются. Defaults to False.
+
+        Returns:
+            Response: Httpx response.
+        '''
+        policy = retry or get_option('retry') or self.transport.retry
+        conditional = self.transport.conditional
+        headers = kwargs.get('headers')
+        key = None
+        validators: dict[str, str] = {}
+        if (
+            conditional is not None and not stream and method == 'GET'
+            and get_option('cache', True) is not False
+        ):
+            key = conditional.make_key(self.transport.token, url, kwargs.get('params'))
+            validators = conditional.headers(key)
+            if validators:
+                kwargs['headers'] = {**validators, **(headers or {})}
+        attempt = 1
+        while True:
+            if self.transport.rate_limiter is not None:
+                wait = self.transport.rate_limiter.reserve(
+                    self.transport.token, method, url
+                )
+                if wait > 0:
+                    self.log.debug(f'Rate limit: {method} {url} waits {wait:.2f}s')
+                    await asyncio.sleep(wait)
+            self.log.debug(f'Called with args: ({method}, {url})')
+            started = time.perf_counter()
+            try:
+                response = await self._send(method, url, stream, **kwargs)
+            except TransportError as e:
+                self._observe(method, url, None, started, attempt)
+                if not policy.should_retry_exception(method, e, attempt):
+                    raise
+                delay = policy.get_delay(attempt)
+                self.log.warning(
+                    f'{method} {url}: {e!r}, retry {attempt}/{policy.max_attempts - 1} in {delay:.2f}s'
+                )
+            else:
+                if stream and response.is_error:
+                    await response.aread()
+                self._observe(method, url, response, started, attempt)
+                if response.is_stream_consumed and self.log.isEnabledFor(logging.DEBUG):
+                    self.log.debug(f'Response: {response.text}')
+                if not policy.should_retry_response(method, response, attempt):
+                    if key is not None and conditional is not None:
+                        response = conditional.update(key, response)
+                        if response.status_code == 304 and validators:
+                            # Сохранённый ответ вытеснен или удалён после отправки валидаторов,
+                            # поэтому запрос повторяется без них.
+                            self.log.debug(f'{method} {url}: 304 without stored response, resending')
+                            validators = {}
+                            kwargs['headers'] = headers
+                            continue
+                    return self._check_response(response)
+                delay = policy.get_delay(attempt, response)
+                self.log.warning(
+                    f'{method} {url}: {response.status_code}, retry {attempt}/{policy.max_attempts - 1} in {delay:.2f}s'
+                )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _observe(
+        self, method: str, url: str, response: Response | None,
+        started: float, attempt: int
+    ) -> None:
+        '''Учёт попытки запроса в метриках транспорта.
+
+        Для прочитанного ответа время сети берётся из `Response.elapsed`, поэтому ожидание
+        в лимитерах в него не входит. Для потокового ответа - время до получения заголовков,
+        а размер тела не учитывается.
+
+        Args:
+            method (str): HTTP метод.
+            url (str): URL запроса.
+            response (Response | None): Ответ, None при ошибке соединения.
+            started (float): Начало попытки по `time.perf_counter`.
+            attempt (int): Номер попытки.
+        '''
+        metrics = self.transport.metrics
+        if metrics is None:
+            return
+        if response is None:
+            metrics.observe_request(method, url, None, time.perf_counter() - started, retry=attempt > 1)
+            return
+        try:
+            seconds = response.elapsed.total_seconds()
+        except RuntimeError:  # тело ещё не прочитано или ответ создан транспортом готовым
+            seconds = time.perf_counter() - started
+        metrics.observe_request(
+            method, url, response.status_code, seconds,
+            int(response.request.headers.get('content-length', 0)),
+            len(response.content) if response.is_stream_consumed else 0, attempt > 1
+        )
+
+    async def _send(self, method: str, url: str, stream: bool = False, **kwargs) -> Response:
+        '''Отправка одной попытки запроса.
+
+        Если транспорт использует `AIMDLimiter`, запрос ожидает свободного места и сообщает ему результат.
+        Для `stream` запрос занимает место в лимите до получения заголовков ответа.
+
+        Args:
+            method (str): HTTP метод.
+            url (str): URL запроса.
+            stream (bool, optional): Не читать тело ответа. Defaults to False.
+
+        Returns:
+            Response: Httpx response.
+        '''
+        limiter = self.transport.concurrency
+        if limiter is None:
+            return await self._send_request(method, url, stream, **kwargs)
+        started = await limiter.acquire()
+        status_code = None
+        try:
+            response = await self._send_request(method, url, stream, **kwargs)
+            status_code = response.status_code
+            return response
+        finally:
+            limiter.release(started, status_code)
+
+    async def _send_request(self, method: str, url: str, stream: bool, **kwargs) -> Response:
+        tracer = self.transport.tracer
+        if tracer is None:
+            return await self.client.send(self.client.build_request(method, url, **kwargs), stream=stream)
+        attributes = {'http.method': method, 'http.url': url, 'http.route': endpoint_template(url)}
+        with tracer.start_as_current_span(f'{method} {attributes["http.route"]}', attributes=attributes) as span:
+            request = self._build_request(span, method, url, **kwargs)
+            response = await self.client.send(request, stream=stream)
+            span.set_attribute('http.status_code', response.status_code)
+            if 'content-length' in response.headers:
+                span.set_attribute('http.response_content_length', int(response.headers['content-length']))
+            return response
+
+    def _build_request(self, span: Span, method: str, url: str, **kwargs) -> Request:
+        '''Сборка запроса со временем сериализации тела и его размером в спане попытки.
+
+        Args:
+            span (Span): Спан попытки запроса.
+            method (str): HTTP метод.
+            url (str): URL запроса.
+
+        Returns:
+            Request: Httpx request.
+        '''
+        started = time.perf_counter()
+        request = self.client.build_request(method, url, **kwargs)
+        span.set_attribute('timeweb.serialize_seconds', time.perf_counter() - started)
+        if 'content-length' in request.headers:
+            span.set_attribute('http.request_content_length', int(request.headers['content-length']))
+        return request
+
+    def _check_response(self, response: Response) -> Response:
+        '''Проверка ответа API на ошибки.
+
+        Args:
+            response (Response): Httpx response.
+
+        Raises:
+            exc.TimewebError: Ошибка API, подробнее в `_request`.
+
+        Returns:
+            Response: Httpx response.
+        '''
         try:
             response.raise_for_status()
         except HTTPStatusError as e:
             try:
-                error = BaseError(**e.response.json())
+                error = BaseError(**self._decode(e.response))
             except Exception as json_err:
                 self.log.error(f'Malformed error response: {e.response.text}', exc_info=json_err)
                 raise exc.ResponseMalformedError(e.request, e.response)
@@ -138,3 +355,248 @@ class BaseAsyncClient:
                     )
         else:
             return response
+
+    def _decode(self, response: Response) -> Any:
+        '''Декодирование JSON ответа декодером транспорта.
+
+        Args:
+            response (Response): Httpx response.
+
+        Returns:
+            Any: Декодированный JSON.
+        '''
+        return self.transport.json_loads(response.content)
+
+    def _parse(self, response: Response, model: type[T]) -> T:
+        '''Разбор ответа API в модель.
+
+        Модель запоминается в ответе, поэтому сохранённый для `304 Not Modified` ответ не валидируется заново.
+        Если валидация отключена в транспорте или через `request_options(validate=False)`,
+        то модель собирается без проверки типов через `construct`.
+        В режиме `raw` (транспорт или `request_options(raw=True)`) возвращается декодированный JSON,
+        его структура описана в `timeweb.typed`.
+        В режиме `lazy` (транспорт или `request_options(lazy=True)`) списки моделей в ответе
+        заменяются на `LazyList`, элементы которого создаются при обращении к ним.
+        Время разбора учитывается в метриках транспорта, если они включены.
+        Если в транспорте задан трассировщик, то разбор выполняется в спане `parse <Модель>`
+        со временем декодирования и валидации.
+
+        Args:
+            response (Response): Httpx response.
+            model (type[T]): Модель ответа.
+
+        Returns:
+            T: Модель ответа.
+        '''
+        tracer = self.transport.tracer
+        if tracer is None:
+            return self._build(response, model)
+        with tracer.start_as_current_span(
+            f'parse {model.__name__}', attributes={'timeweb.model': model.__name__}
+        ) as span:
+            return self._build(response, model, span)
+
+    def _build(self, response: Response, model: type[T], span: Span | None = None) -> T:
+        '''Разбор ответа API в модель, подробнее в `_parse`.
+
+        Args:
+            response (Response): Httpx response.
+            model (type[T]): Модель ответа.
+            span (Span | None, optional): Спан разбора для атрибутов с режимом и временем. Defaults to None.
+
+        Returns:
+            T: Модель ответа.
+        '''
+        started = time.perf_counter()
+        if get_option('raw', self.transport.raw):
+            data = self._decode(response)
+            self._observe_parse(response, started)
+            if span is not None:
+                span.set_attribute('timeweb.parse_mode', 'raw')
+                span.set_attribute('timeweb.decode_seconds', time.perf_counter() - started)
+            return data
+        validate = get_option('validate', self.transport.validate)
+        lazy = get_option('lazy', self.transport.lazy)
+        memo = _models.get(response)
+        if memo is not None and memo[:3] == (model, validate, lazy):
+            if span is not None:
+                span.set_attribute('timeweb.parse_mode', 'cached')
+            return memo[3]
+        data = self._decode(response)
+        decoded = time.perf_counter()
+        parsed = self._build_model(data, model, validate, lazy)
+        _models[response] = (model, validate, lazy, parsed)
+        self._observe_parse(response, started)
+        if span is not None:
+            span.set_attribute('timeweb.parse_mode', 'lazy' if lazy else 'validate' if validate else 'construct')
+            span.set_attribute('timeweb.decode_seconds', decoded - started)
+            span.set_attribute('timeweb.validate_seconds', time.perf_counter() - decoded)
+        return parsed
+
+    def _build_model(self, data: Any, model: type[T], validate: bool, lazy: bool) -> T:
+        '''Сборка модели из декодированного JSON, подробнее в `_parse`.
+
+        Так же собираются модели из записей `SQLiteCache`.
+
+        Args:
+            data (Any): Декодированный JSON.
+            model (type[T]): Модель ответа.
+            validate (bool): Валидировать данные.
+            lazy (bool): Создавать элементы списков моделей при обращении к ним.
+
+        Returns:
+            T: Модель ответа.
+        '''
+        if lazy:
+            return lazy_construct(model, data, validate)
+        if validate:
+            return model(**data)
+        return construct(model, data)
+
+    def _observe_parse(self, response: Response, started: float) -> None:
+        '''Учёт времени разбора ответа в метриках транспорта.
+
+        Args:
+            response (Response): Httpx response.
+            started (float): Начало разбора по `time.perf_counter`.
+        '''
+        if self.transport.metrics is not None:
+            self.transport.metrics.observe_parse(
+                response.request.method, response.request.url.path,
+                time.perf_counter() - started
+            )
+
+    def _parse_item(self, data: bytes, model: type[T]) -> T:
+        '''Разбор элемента списка из потокового ответа.
+
+        Учитывает режимы `raw` и `validate` так же, как `_parse`.
+
+        Args:
+            data (bytes): JSON элемента.
+            model (type[T]): Модель элемента.
+
+        Returns:
+            T: Модель элемента.
+        '''
+        item = self.transport.json_loads(data)
+        if get_option('raw', self.transport.raw):
+            return item
+        if get_option('validate', self.transport.validate):
+            return model(**item)
+        return construct(model, item)
+
+    async def _stream(
+        self, url: str, field: str, model: type[T], **kwargs
+    ) -> AsyncIterator[T]:
+        '''Потоковый перебор элементов списка из ответа GET запроса.
+
+        Тело ответа читается частями и разбирается `JSONArrayStream`, а каждый элемент
+        отдаётся сразу после получения. Поэтому первый элемент доступен до загрузки всего
+        ответа, а в памяти находится лишь часть тела. Кэши, условные запросы и объединение
+        запросов не используются, повторы возможны только до начала чтения тела.
+
+        Args:
+            url (str): URL запроса.
+            field (str): Поле ответа со списком элементов.
+            model (type[T]): Модель элемента.
+            **kwargs: Параметры запроса, например `params`.
+
+        Yields:
+            T: Элемент списка.
+        '''
+        response = await self._execute('GET', url, stream=True, **kwargs)
+        parser = JSONArrayStream(field)
+        try:
+            async for chunk in response.aiter_bytes():
+                for item in parser.feed(chunk):
+                    yield self._parse_item(item, model)
+                if parser.done:
+                    break
+        finally:
+            await response.aclose()
+
+    async def _paginate(
+        self, fetch: Callable[..., Any], field: str,
+        page_size: int = 100, max_items: int | None = None,
+        prefetch: int = 0, **kwargs
+    ) -> AsyncIterator[Any]:
+        '''Постраничный перебор элементов коллекции.
+
+        Страницы запрашиваются по мере перебора, поэтому в памяти находится не больше одной страницы.
+        Если указан `prefetch`, то после первой страницы остальные смещения известны из `meta.total`
+        и следующие `prefetch` страниц загружаются параллельно, а элементы отдаются по порядку.
+
+        Args:
+            fetch (Callable[..., Any]): Метод API, принимающий `limit` и `offset`.
+            field (str): Поле ответа со списком элементов.
+            page_size (int, optional): Кол-во элементов на странице. Defaults to 100.
+            max_items (int | None, optional): Максимальное кол-во элементов. Defaults to None.
+            prefetch (int, optional): Кол-во страниц, загружаемых параллельно. Defaults to 0.
+            **kwargs: Остальные аргументы метода API.
+
+        Yields:
+            Any: Элемент коллекции.
+        '''
+        if page_size < 1:
+            raise ValueError('page_size должен быть больше 0!')
+        offset = 0
+        while max_items is None or offset < max_items:
+            limit = page_size if max_items is None else min(page_size, max_items - offset)
+            page = await fetch(limit=limit, offset=offset, **kwargs)
+            items = _page_items(page, field)[:limit]
+            for item in items:
+                yield item
+            offset += len(items)
+            total = _page_total(page)
+            if len(items) < limit or (total is not None and offset >= total):
+                return
+            if prefetch > 0 and total is not None:
+                end = total if max_items is None else min(total, max_items)
+                async for item in self._prefetch_pages(
+                    fetch, field, page_size, offset, end, prefetch, **kwargs
+                ):
+                    yield item
+                return
+
+    async def _prefetch_pages(
+        self, fetch: Callable[..., Any], field: str, page_size: int,
+        start: int, end: int, prefetch: int, **kwargs
+    ) -> AsyncIterator[Any]:
+        '''Параллельная загрузка страниц в интервале `[start, end)`.
+
+        Одновременно загружается не больше `prefetch` страниц, кол-во HTTP запросов
+        дополнительно ограничивается пулом соединений и `AIMDLimiter` транспорта.
+
+        Args:
+            fetch (Callable[..., Any]): Метод API, принимающий `limit` и `offset`.
+            field (str): Поле ответа со списком элементов.
+            page_size (int): Кол-во элементов на странице.
+            start (int): Смещение первой страницы.
+            end (int): Смещение после последнего элемента.
+            prefetch (int): Кол-во страниц, загружаемых параллельно.
+            **kwargs: Остальные аргументы метода API.
+
+        Yields:
+            Any: Элемент коллекции.
+        '''
+        offsets = iter(range(start, end, page_size))
+        pending: deque[asyncio.Task] = deque()
+
+        def schedule(offset: int) -> None:
+            pending.append(asyncio.ensure_future(fetch(
+                limit=min(page_size, end - offset), offset=offset, **kwargs
+            )))
+
+        try:
+            for offset in islice(offsets, prefetch):
+                schedule(offset)
+            while pending:
+                page = await pending.popleft()
+                following = next(offsets, None)
+                if following is not None:
+                    schedule(following)
+                for item in _page_items(page, field):
+                    yield item
+        finally:
+            for task in pending:
+                task.cancel()
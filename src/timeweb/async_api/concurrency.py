@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+'''Адаптивное ограничение кол-ва одновременных запросов (AIMD).
+
+Лимит растёт аддитивно, пока ответы приходят без `429` и задержка в норме,
+и уменьшается мультипликативно при `429` или росте p95 задержки.'''
+import time
+import asyncio
+from collections import deque
+
+
+class AIMDLimiter:
+    '''Адаптивный ограничитель одновременных запросов.
+
+    Attributes:
+        min_limit (int): Минимальный лимит.
+        max_limit (int): Максимальный лимит.
+        increase (float): На сколько увеличивается лимит за каждые `limit` успешных запросов.
+        decrease_factor (float): Множитель лимита при перегрузке.
+        latency_target (float | None): Допустимая p95 задержка в секундах.
+        latency_tolerance (float): Во сколько раз p95 может превысить лучшее значение, если `latency_target` не задан.
+        requests (int): Кол-во завершённых запросов.
+        throttled (int): Кол-во ответов `429`.
+        errors (int): Кол-во ошибок соединения и ответов `5xx`.
+        increases (int): Кол-во увеличений лимита.
+        decreases (int): Кол-во уменьшений лимита.
+    '''
+
+    def __init__(
+        self, initial_limit: int = 10, min_limit: int = 1,
+        max_limit: int = 100, increase: float = 1,
+        decrease_factor: float = 0.5, latency_target: float | None = None,
+        latency_tolerance: float = 2, window: int = 100
+    ):
+        '''Инициализация ограничителя.
+
+        Args:
+            initial_limit (int, optional): Начальный лимит. Defaults to 10.
+            min_limit (int, optional): Минимальный лимит. Defaults to 1.
+            max_limit (int, optional): Максимальный лимит. Defaults to 100.
+            increase (float, optional): На сколько увеличивается лимит за каждые `limit` успешных запросов. Defaults to 1.
+            decrease_factor (float, optional): Множитель лимита при перегрузке. Defaults to 0.5.
+            latency_target (float | None, optional): Допустимая p95 задержка в секундах. Defaults to None.
+            latency_tolerance (float, optional): Во сколько раз p95 может превысить лучшее значение, если `latency_target` не задан. Defaults to 2.
+            window (int, optional): Кол-во последних запросов для расчёта p95. Defaults to 100.
+        '''
+        if not 0 < decrease_factor < 1:
+            raise ValueError('decrease_factor должен быть в интервале (0, 1)!')
+        if not min_limit <= initial_limit <= max_limit:
+            raise ValueError('initial_limit должен быть между min_limit и max_limit!')
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_target = latency_target
+        self.latency_tolerance = latency_tolerance
+        self.requests = 0
+        self.throttled = 0
+        self.errors = 0
+        self.increases = 0
+        self.decreases = 0
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._p95: float | None = None
+        self._best_p95: float | None = None
+        self._last_decrease = 0.0
+
+    def __repr__(self) -> str:
+        return f'AIMDLimiter(limit={self.limit}, in_flight={self.in_flight})'
+
+    @property
+    def limit(self) -> int:
+        '''Текущий лимит одновременных запросов.'''
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        '''Кол-во выполняющихся запросов.'''
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        '''Кол-во запросов в очереди.'''
+        return len(self._waiters)
+
+    @property
+    def p95(self) -> float | None:
+        '''p95 задержка последних запросов в секундах.'''
+        return self._p95
+
+    def stats(self) -> dict[str, int | float | None]:
+        '''Текущее состояние и счётчики ограничителя.
+
+        Returns:
+            dict[str, int | float | None]: Лимит, очередь и счётчики.
+        '''
+        return {
+            'limit': self.limit,
+            'in_flight': self.in_flight,
+            'waiting': self.waiting,
+            'p95': self.p95,
+            'requests': self.requests,
+            'throttled': self.throttled,
+            'errors': self.errors,
+            'increases': self.increases,
+            'decreases': self.decreases,
+        }
+
+    async def acquire(self) -> float:
+        '''Ожидает свободного места для запроса.
+
+        Returns:
+            float: Время начала запроса, которое нужно передать в `release`.
+        '''
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return time.monotonic()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Место уже было передано отменённой задаче.
+                self._in_flight -= 1
+                self._wake()
+            else:
+                self._waiters.remove(waiter)
+            raise
+        return time.monotonic()
+
+    def release(self, started: float, status_code: int | None = None) -> None:
+        '''Освобождает место и подстраивает лимит.
+
+        Args:
+            started (float): Время начала запроса из `acquire`.
+            status_code (int | None, optional): HTTP статус ответа или None при ошибке соединения. Defaults to None.
+        '''
+        self._in_flight -= 1
+        self.requests += 1
+        latency = time.monotonic() - started
+        self._latencies.append(latency)
+        if len(self._latencies) >= 10 and self.requests % 10 == 0:
+            self._update_p95()
+        if status_code == 429:
+            self.throttled += 1
+            self._decrease(started)
+        elif status_code is None or status_code >= 500:
+            self.errors += 1
+        elif self._latency_exceeded():
+            self._decrease(started)
+        elif self._in_flight + len(self._waiters) + 1 >= self.limit:
+            # Лимит увеличивается, только если он действительно использовался.
+            previous = self.limit
+            self._limit = min(
+                float(self.max_limit), self._limit + self.increase / self._limit
+            )
+            if self.limit > previous:
+                self.increases += 1
+        self._wake()
+
+    def _update_p95(self) -> None:
+        latencies = sorted(self._latencies)
+        self._p95 = latencies[int(len(latencies) * 0.95) - 1]
+        if self._best_p95 is None or self._p95 < self._best_p95:
+            self._best_p95 = self._p95
+
+    def _latency_exceeded(self) -> bool:
+        if self._p95 is None:
+            return False
+        if self.latency_target is not None:
+            return self._p95 > self.latency_target
+        assert self._best_p95 is not None
+        return self._p95 > self._best_p95 * self.latency_tolerance
+
+    def _decrease(self, started: float) -> None:
+        # Запросы, начатые до предыдущего уменьшения, видели старый лимит.
+        if started < self._last_decrease:
+            return
+        self._last_decrease = time.monotonic()
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        self._latencies.clear()
+        self._p95 = None
+        self.decreases += 1
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
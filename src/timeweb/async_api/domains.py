@@ -6,10 +6,13 @@
 Документация: https://timeweb.cloud/api-docs#tag/Domeny'''
 import logging
 from ipaddress import IPv4Address, IPv6Address
+from typing import AsyncIterator
 
 from httpx import AsyncClient
 
 from .base import BaseAsyncClient
+from .transport import AsyncTransport
+from ..utils.cache import cached
 from ..schemas.time_utils import Period
 from ..schemas import domains as schemas
 
@@ -20,13 +23,17 @@ IPAddress = IPv4Address | IPv6Address
 class DomainsAPI(BaseAsyncClient):
     '''Клиент для работы с API доменов'''
 
-    def __init__(self, token: str, client: AsyncClient | None = None):
+    def __init__(
+        self, token: str, client: AsyncClient | None = None,
+        transport: AsyncTransport | None = None
+    ):
         '''Инициализация клиента.
         Args:
             token (str): API токен.
             client (AsyncClient | None, optional): HTTPX клиент. Defaults to None.
+            transport (AsyncTransport | None, optional): Общий транспорт клиента. Defaults to None.
         '''
-        super().__init__(token, client)
+        super().__init__(token, client, transport)
         self.log = logging.getLogger('timeweb')
 
     async def get_domains(
@@ -50,7 +57,32 @@ class DomainsAPI(BaseAsyncClient):
         domains = await self._request(
             'GET', '/domains', params=params
         )
-        return schemas.DomainsResponse(**domains.json())
+        return self._parse(domains, schemas.DomainsResponse)
+
+    def iter_domains(
+        self, idn_name: str | None = None, sort: str | None = None,
+        linked_ip: IPAddress | str | None = None,
+        order: str | None = None, page_size: int = 100,
+        max_items: int | None = None, prefetch: int = 0
+    ) -> AsyncIterator[schemas.domains.Domain]:
+        '''Перебирает все домены аккаунта постранично.
+
+        Args:
+            idn_name (str | None, optional): Название домена в IDN формате. Defaults to None.
+            sort (str | None, optional): Поле сортировки. Defaults to None.
+            linked_ip (IPAddress | str | None, optional): Привязанный к домену IP-адрес. Defaults to None.
+            order (str | None, optional): Порядок сортировки. Defaults to None.
+            page_size (int, optional): Кол-во элементов на странице. Defaults to 100.
+            max_items (int | None, optional): Максимальное кол-во элементов. Defaults to None.
+            prefetch (int, optional): Кол-во страниц, загружаемых параллельно после первой. Defaults to 0.
+
+        Yields:
+            schemas.domains.Domain: Домен.
+        '''
+        return self._paginate(
+            self.get_domains, 'domains', page_size, max_items, prefetch,
+            idn_name=idn_name, sort=sort, linked_ip=linked_ip, order=order
+        )
 
     async def get_domain(self, fqdn: str) -> schemas.DomainResponse:
         '''Получить информацию о домене.
@@ -64,7 +96,7 @@ class DomainsAPI(BaseAsyncClient):
         domain = await self._request(
             'GET', f'/domains/{fqdn}'
         )
-        return schemas.DomainResponse(**domain.json())
+        return self._parse(domain, schemas.DomainResponse)
 
     async def turn_domain_autoprolong(
         self, fqdn: str, linked_ip: IPAddress | str | None = None,
@@ -88,7 +120,7 @@ class DomainsAPI(BaseAsyncClient):
         domain = await self._request(
             'PATCH', f'/domains/{fqdn}', json=data
         )
-        return schemas.DomainResponse(**domain.json())
+        return self._parse(domain, schemas.DomainResponse)
 
     async def delete_domain(self, fqdn: str) -> bool:
         '''Удалить домен.
@@ -124,7 +156,49 @@ class DomainsAPI(BaseAsyncClient):
         records = await self._request(
             'GET', f'/domains/{fqdn}/dns-records', params=params
         )
-        return schemas.DNSRecordsResponse(**records.json())
+        return self._parse(records, schemas.DNSRecordsResponse)
+
+    def iter_dns_records(
+        self, fqdn: str, page_size: int = 100,
+        max_items: int | None = None, prefetch: int = 0
+    ) -> AsyncIterator[schemas.dns.DNSRecord]:
+        '''Перебирает все пользовательские DNS-записи домена или поддомена постранично.
+
+        Args:
+            fqdn (str): FQDN домена или поддомена.
+            page_size (int, optional): Кол-во элементов на странице. Defaults to 100.
+            max_items (int | None, optional): Максимальное кол-во элементов. Defaults to None.
+            prefetch (int, optional): Кол-во страниц, загружаемых параллельно после первой. Defaults to 0.
+
+        Yields:
+            schemas.dns.DNSRecord: DNS-запись.
+        '''
+        return self._paginate(
+            self.get_dns_records, 'dns_records', page_size, max_items, prefetch,
+            fqdn=fqdn
+        )
+
+    def stream_dns_records(
+        self, fqdn: str, limit: int = 100, offset: int = 0
+    ) -> AsyncIterator[schemas.dns.DNSRecord]:
+        '''Перебирает пользовательские DNS-записи из одного ответа по мере его загрузки.
+
+        Args:
+            fqdn (str): FQDN домена или поддомена.
+            limit (int, optional): Сколько записей вернуть. Defaults to 100.
+            offset (int, optional): Сдвиг. Defaults to 0.
+
+        Yields:
+            schemas.dns.DNSRecord: DNS-запись.
+        '''
+        params = {
+            'limit': limit,
+            'offset': offset
+        }
+        return self._stream(
+            f'/domains/{fqdn}/dns-records', 'dns_records', schemas.dns.DNSRecord,
+            params=params
+        )
 
     async def add_dns_record(
         self, fqdn: str, type: str, value: str,
@@ -153,7 +227,7 @@ class DomainsAPI(BaseAsyncClient):
         record = await self._request(
             'POST', f'/domains/{fqdn}/dns-records', json=data
         )
-        return schemas.DNSRecordResponse(**record.json())
+        return self._parse(record, schemas.DNSRecordResponse)
 
     async def update_dns_record(
         self, fqdn: str, record_id: int, type: str, value: str,
@@ -183,7 +257,7 @@ class DomainsAPI(BaseAsyncClient):
         record = await self._request(
             'PATCH', f'/domains/{fqdn}/dns-records/{record_id}', json=data
         )
-        return schemas.DNSRecordResponse(**record.json())
+        return self._parse(record, schemas.DNSRecordResponse)
 
     async def delete_dns_record(self, fqdn: str, record_id: int) -> bool:
         '''Удалить информацию о DNS-записи для домена или поддомена.
@@ -220,7 +294,27 @@ class DomainsAPI(BaseAsyncClient):
         records = await self._request(
             'GET', f'/domains/{fqdn}/default-dns-records', params=params
         )
-        return schemas.DNSRecordsResponse(**records.json())
+        return self._parse(records, schemas.DNSRecordsResponse)
+
+    def iter_default_dns_records(
+        self, fqdn: str, page_size: int = 100,
+        max_items: int | None = None, prefetch: int = 0
+    ) -> AsyncIterator[schemas.dns.DNSRecord]:
+        '''Перебирает все DNS-записи домена по умолчанию постранично.
+
+        Args:
+            fqdn (str): FQDN домена или поддомена.
+            page_size (int, optional): Кол-во элементов на странице. Defaults to 100.
+            max_items (int | None, optional): Максимальное кол-во элементов. Defaults to None.
+            prefetch (int, optional): Кол-во страниц, загружаемых параллельно после первой. Defaults to 0.
+
+        Yields:
+            schemas.dns.DNSRecord: DNS-запись.
+        '''
+        return self._paginate(
+            self.get_default_dns_records, 'dns_records', page_size, max_items, prefetch,
+            fqdn=fqdn
+        )
 
     async def add_domain_subdomain(
         self, fqdn: str, subdomain_fqdn: str
@@ -237,7 +331,7 @@ class DomainsAPI(BaseAsyncClient):
         subdomain = await self._request(
             'POST', f'/domains/{fqdn}/subdomains/{subdomain_fqdn}'
         )
-        return schemas.SubdomainResponse(**subdomain.json())
+        return self._parse(subdomain, schemas.SubdomainResponse)
 
     async def delete_domain_subdomain(
         self, fqdn: str, subdomain_fqdn: str
@@ -268,7 +362,7 @@ class DomainsAPI(BaseAsyncClient):
         ns = await self._request(
             'GET', f'/domains/{fqdn}/name-servers'
         )
-        return schemas.NameServersResponse(**ns.json())
+        return self._parse(ns, schemas.NameServersResponse)
 
     async def update_domain_ns(
         self, fqdn: str, name_servers: list[dict[str, str | list[IPAddress | str]]]
@@ -303,7 +397,7 @@ class DomainsAPI(BaseAsyncClient):
         ns = await self._request(
             'PUT', f'/domains/{fqdn}/name-servers', json=data
         )
-        return schemas.NameServersResponse(**ns.json())
+        return self._parse(ns, schemas.NameServersResponse)
 
     async def get_domains_requests(
         self, person_id: int | None = None
@@ -322,7 +416,7 @@ class DomainsAPI(BaseAsyncClient):
         requests = await self._request(
             'GET', '/domains-requests', params=params
         )
-        return schemas.DomainsRequestsResponse(**requests.json())
+        return self._parse(requests, schemas.DomainsRequestsResponse)
 
     async def create_domain_register_request(
         self, fqdn: str, person_id: int, period: Period | str | None = None,
@@ -364,7 +458,7 @@ class DomainsAPI(BaseAsyncClient):
         request = await self._request(
             'POST', '/domains-requests', json=data
         )
-        return schemas.DomainRequestResponse(**request.json())
+        return self._parse(request, schemas.DomainRequestResponse)
 
     async def create_domain_transfer_request(
         self, fqdn: str, auth_code: str
@@ -386,7 +480,7 @@ class DomainsAPI(BaseAsyncClient):
         request = await self._request(
             'POST', '/domains-requests', json=data
         )
-        return schemas.DomainRequestResponse(**request.json())
+        return self._parse(request, schemas.DomainRequestResponse)
 
     async def create_domain_prolong_request(
         self, fqdn: str, is_antispam_enabled: bool | None = None,
@@ -427,7 +521,7 @@ class DomainsAPI(BaseAsyncClient):
         request = await self._request(
             'POST', '/domains-requests', json=data
         )
-        return schemas.DomainRequestResponse(**request.json())
+        return self._parse(request, schemas.DomainRequestResponse)
 
     async def get_domain_request(self, request_id: int) -> schemas.DomainRequestResponse:
         '''Получить информацию о заявке к домену.
@@ -441,7 +535,7 @@ class DomainsAPI(BaseAsyncClient):
         request = await self._request(
             'GET', f'/domains-requests/{request_id}'
         )
-        return schemas.DomainRequestResponse(**request.json())
+        return self._parse(request, schemas.DomainRequestResponse)
 
     async def pay_domain_request(
         self, request_id: int, money_source: str,
@@ -496,7 +590,7 @@ class DomainsAPI(BaseAsyncClient):
         request = await self._request(
             'PATCH', f'/domains-requests/{request_id}', json=data
         )
-        return schemas.DomainRequestResponse(**request.json())
+        return self._parse(request, schemas.DomainRequestResponse)
 
     async def update_domain_transfer_request(
         self, request_id: int, auth_code: str,
@@ -521,8 +615,9 @@ class DomainsAPI(BaseAsyncClient):
         request = await self._request(
             'PATCH', f'/domains-requests/{request_id}', json=data
         )
-        return schemas.DomainRequestResponse(**request.json())
+        return self._parse(request, schemas.DomainRequestResponse)
 
+    @cached
     async def get_tlds(
         self, is_published: bool | None = None,
         is_registered: bool | None = None
@@ -544,8 +639,9 @@ class DomainsAPI(BaseAsyncClient):
         tlds = await self._request(
             'GET', '/tlds', params=params
         )
-        return schemas.TLDomainsResponse(**tlds.json())
+        return self._parse(tlds, schemas.TLDomainsResponse)
 
+    @cached
     async def get_tld(self, tld_id: int) -> schemas.TLDomainResponse:
         '''Получить информацию о доменной зоне.
 
@@ -558,7 +654,7 @@ class DomainsAPI(BaseAsyncClient):
         tld = await self._request(
             'GET', f'/tlds/{tld_id}'
         )
-        return schemas.TLDomainResponse(**tld.json())
+        return self._parse(tld, schemas.TLDomainResponse)
 
     async def check_domain(self, fqdn: str) -> schemas.DomainAvailability:
         '''Проверить, доступен ли домен для регистрации.
@@ -572,7 +668,7 @@ class DomainsAPI(BaseAsyncClient):
         status = await self._request(
             'GET', f'/check-domain/{fqdn}'
         )
-        return schemas.DomainAvailability(**status.json())
+        return self._parse(status, schemas.DomainAvailability)
 
     async def add_domain(self, fqdn: str) -> bool:
         '''Добавить домен в аккаунт.
@@ -9,23 +9,29 @@
 import logging
 from uuid import UUID
 from datetime import datetime
+from typing import AsyncIterator
 
 from httpx import AsyncClient
 
 from .base import BaseAsyncClient
+from .transport import AsyncTransport
 from ..schemas import images as schemas
 
 
 class ImagesAPI(BaseAsyncClient):
     '''Клиент для работы с API образов Timeweb Cloud'''
 
-    def __init__(self, token: str, client: AsyncClient | None = None):
+    def __init__(
+        self, token: str, client: AsyncClient | None = None,
+        transport: AsyncTransport | None = None
+    ):
         '''Инициализация клиента.
         Args:
             token (str): API токен.
             client (AsyncClient | None, optional): HTTPX клиент. Defaults to None.
+            transport (AsyncTransport | None, optional): Общий транспорт клиента. Defaults to None.
         '''
-        super().__init__(token, client)
+        super().__init__(token, client, transport)
         self.log = logging.getLogger('timeweb')
 
     async def get_images(
@@ -47,7 +53,27 @@ class ImagesAPI(BaseAsyncClient):
                 'limit': limit, 'offset': offset, 'with_deleted': with_deleted
             }
         )
-        return schemas.ImagesArray(**images.json())
+        return self._parse(images, schemas.ImagesArray)
+
+    def iter_images(
+        self, with_deleted: bool = False, page_size: int = 100,
+        max_items: int | None = None, prefetch: int = 0
+    ) -> AsyncIterator[schemas.images.Image]:
+        '''Перебирает все образы постранично.
+
+        Args:
+            with_deleted (bool, optional): Перебирать в том числе и удалённые? Defaults to False.
+            page_size (int, optional): Кол-во элементов на странице. Defaults to 100.
+            max_items (int | None, optional): Максимальное кол-во элементов. Defaults to None.
+            prefetch (int, optional): Кол-во страниц, загружаемых параллельно после первой. Defaults to 0.
+
+        Yields:
+            schemas.images.Image: Образ.
+        '''
+        return self._paginate(
+            self.get_images, 'images', page_size, max_items, prefetch,
+            with_deleted=with_deleted
+        )
 
     async def create(
         self, name: str = '', description: str = '', disk_id: int | None = None
@@ -73,7 +99,7 @@ class ImagesAPI(BaseAsyncClient):
             'POST', 'images',
             json=data
         )
-        return schemas.ImageResponse(**image.json())
+        return self._parse(image, schemas.ImageResponse)
 
     async def get_image(self, image_id: UUID | str) -> schemas.ImageResponse:
         '''Получение информации об образе.
@@ -85,7 +111,7 @@ class ImagesAPI(BaseAsyncClient):
             ImageResponse: Информация об образе.
         '''
         image = await self._request('GET', f'images/{image_id}')
-        return schemas.ImageResponse(**image.json())
+        return self._parse(image, schemas.ImageResponse)
 
     async def delete(self, image_id: UUID | str) -> bool:
         '''Удаление образа.
@@ -113,7 +139,7 @@ class ImagesAPI(BaseAsyncClient):
             'PATCH', f'images/{image_id}',
             json={'description': description}
         )
-        return schemas.ImageResponse(**image.json())
+        return self._parse(image, schemas.ImageResponse)
 
     async def get_download_urls(
         self, image_id: UUID | str, limit: int = 100, offset: int = 0
@@ -132,7 +158,27 @@ class ImagesAPI(BaseAsyncClient):
             'GET', f'images/{image_id}/download-url',
             params={'limit': limit, 'offset': offset}
         )
-        return schemas.DownloadsArray(**downloads.json())
+        return self._parse(downloads, schemas.DownloadsArray)
+
+    def iter_download_urls(
+        self, image_id: UUID | str, page_size: int = 100,
+        max_items: int | None = None, prefetch: int = 0
+    ) -> AsyncIterator[schemas.images.Download]:
+        '''Перебирает все ссылки для скачивания образа постранично.
+
+        Args:
+            image_id (UUID | str): Идентификатор образа.
+            page_size (int, optional): Кол-во элементов на странице. Defaults to 100.
+            max_items (int | None, optional): Максимальное кол-во элементов. Defaults to None.
+            prefetch (int, optional): Кол-во страниц, загружаемых параллельно после первой. Defaults to 0.
+
+        Yields:
+            schemas.images.Download: Ссылка для скачивания образа.
+        '''
+        return self._paginate(
+            self.get_download_urls, 'downloads', page_size, max_items, prefetch,
+            image_id=image_id
+        )
 
     async def create_download_url(
         self, image_id: UUID | str, type: schemas.URLType | str,
@@ -176,7 +222,7 @@ class ImagesAPI(BaseAsyncClient):
             'POST', f'images/{image_id}/download-url',
             json=data
         )
-        return schemas.DownloadResponse(**download.json())
+        return self._parse(download, schemas.DownloadResponse)
 
     async def get_image_download_url(
         self, image_id: UUID | str, image_url_id: UUID | str
@@ -193,7 +239,7 @@ class ImagesAPI(BaseAsyncClient):
         download = await self._request(
             'GET', f'images/{image_id}/download-url/{image_url_id}'
         )
-        return schemas.DownloadResponse(**download.json())
+        return self._parse(download, schemas.DownloadResponse)
 
     async def delete_image_download_url(
         self, image_id: UUID | str, image_url_id: UUID | str
@@ -7,23 +7,30 @@ Kubernetes — программное обеспечение с открытым
 import logging
 import warnings
 from datetime import timedelta
+from typing import AsyncIterator
 
 from httpx import AsyncClient
 
 from .base import BaseAsyncClient
+from .transport import AsyncTransport
+from ..utils.cache import cached
 from ..schemas import kubernetes as schemas
 
 
 class KubernetesAPI(BaseAsyncClient):
     '''Клиент для работы с API Kubernetes'''
 
-    def __init__(self, token: str, client: AsyncClient | None = None):
+    def __init__(
+        self, token: str, client: AsyncClient | None = None,
+        transport: AsyncTransport | None = None
+    ):
         '''Инициализация клиента.
         Args:
             token (str): API токен.
             client (AsyncClient | None, optional): HTTPX клиент. Defaults to None.
+            transport (AsyncTransport | None, optional): Общий транспорт клиента. Defaults to None.
         '''
-        super().__init__(token, client)
+        super().__init__(token, client, transport)
         self.log = logging.getLogger('timeweb')
 
     async def get_clusters(
@@ -45,7 +52,25 @@ class KubernetesAPI(BaseAsyncClient):
         clusters = await self._request(
             'GET', '/k8s/clusters', params=params
         )
-        return schemas.ClustersResponse(**clusters.json())
+        return self._parse(clusters, schemas.ClustersResponse)
+
+    def iter_clusters(
+        self, page_size: int = 100, max_items: int | None = None,
+        prefetch: int = 0
+    ) -> AsyncIterator[schemas.kubernetes.Cluster]:
+        '''Перебирает все кластеры постранично.
+
+        Args:
+            page_size (int, optional): Кол-во элементов на странице. Defaults to 100.
+            max_items (int | None, optional): Максимальное кол-во элементов. Defaults to None.
+            prefetch (int, optional): Кол-во страниц, загружаемых параллельно после первой. Defaults to 0.
+
+        Yields:
+            schemas.kubernetes.Cluster: Кластер.
+        '''
+        return self._paginate(
+            self.get_clusters, 'clusters', page_size, max_items, prefetch
+        )
 
     async def create(
         self, name: str, ha: bool, k8s_version: str,
@@ -127,7 +152,7 @@ class KubernetesAPI(BaseAsyncClient):
         new_cluster = await self._request(
             'POST', '/k8s/clusters'
         )
-        return schemas.ClusterResponse(**new_cluster.json())
+        return self._parse(new_cluster, schemas.ClusterResponse)
 
     async def get_cluster(self, cluster_id: int) -> schemas.ClusterResponse:
         '''Получить информацию о кластере.
@@ -141,7 +166,7 @@ class KubernetesAPI(BaseAsyncClient):
         cluster = await self._request(
             'GET', f'/k8s/clusters/{cluster_id}'
         )
-        return schemas.ClusterResponse(**cluster.json())
+        return self._parse(cluster, schemas.ClusterResponse)
 
     async def cluster_delete(self, cluster_id: int) -> schemas.ClusterDelete | bool:
         '''Удалить кластер.
@@ -161,7 +186,7 @@ class KubernetesAPI(BaseAsyncClient):
         if delete.status_code == 204:
             return True
         elif delete.status_code == 200:
-            return schemas.ClusterDelete(**delete.json())
+            return self._parse(delete, schemas.ClusterDelete)
         else:
             return False
 
@@ -211,7 +236,7 @@ class KubernetesAPI(BaseAsyncClient):
             'PATCH', f'/k8s/clusters/{cluster_id}',
             json={'description': description}
         )
-        return schemas.ClusterResponse(**updated.json())
+        return self._parse(updated, schemas.ClusterResponse)
 
     async def get_cluster_resources(
         self, cluster_id: int
@@ -227,7 +252,7 @@ class KubernetesAPI(BaseAsyncClient):
         info = await self._request(
             'GET', f'/k8s/clusters/{cluster_id}/resources'
         )
-        return schemas.ClusterResourcesResponse(**info.json())
+        return self._parse(info, schemas.ClusterResourcesResponse)
 
     async def get_cluster_kubeconfig(self, cluster_id: int) -> str:
         '''Получить файл kubeconfig кластера.
@@ -255,7 +280,7 @@ class KubernetesAPI(BaseAsyncClient):
         groups = await self._request(
             'GET', f'/k8s/clusters/{cluster_id}/groups'
         )
-        return schemas.NodeGroupsResponse(**groups.json())
+        return self._parse(groups, schemas.NodeGroupsResponse)
 
     async def create_cluster_group(
         self, cluster_id: int, name: str, preset_id: int, node_count: int
@@ -285,7 +310,7 @@ class KubernetesAPI(BaseAsyncClient):
             'POST', f'/k8s/clusters/{cluster_id}/groups',
             json=data
         )
-        return schemas.NodeGroupResponse(**group.json())
+        return self._parse(group, schemas.NodeGroupResponse)
 
     async def get_cluster_group(
         self, cluster_id: int, group_id: int
@@ -302,7 +327,7 @@ class KubernetesAPI(BaseAsyncClient):
         group = await self._request(
             'GET', f'/k8s/clusters/{cluster_id}/groups/{group_id}'
         )
-        return schemas.NodeGroupResponse(**group.json())
+        return self._parse(group, schemas.NodeGroupResponse)
 
     async def delete_cluster_group(self, cluster_id: int, group_id: int) -> bool:
         '''Удалить группу нод кластера.
@@ -342,7 +367,28 @@ class KubernetesAPI(BaseAsyncClient):
             'GET', f'/k8s/clusters/{cluster_id}/groups/{group_id}/nodes',
             params=params
         )
-        return schemas.NodesResponse(**nodes.json())
+        return self._parse(nodes, schemas.NodesResponse)
+
+    def iter_cluster_group_nodes(
+        self, cluster_id: int, group_id: int, page_size: int = 100,
+        max_items: int | None = None, prefetch: int = 0
+    ) -> AsyncIterator[schemas.nodes.Node]:
+        '''Перебирает все ноды группы постранично.
+
+        Args:
+            cluster_id (int): UID кластера.
+            group_id (int): UID группы нод.
+            page_size (int, optional): Кол-во элементов на странице. Defaults to 100.
+            max_items (int | None, optional): Максимальное кол-во элементов. Defaults to None.
+            prefetch (int, optional): Кол-во страниц, загружаемых параллельно после первой. Defaults to 0.
+
+        Yields:
+            schemas.nodes.Node: Нода.
+        '''
+        return self._paginate(
+            self.get_cluster_group_nodes, 'nodes', page_size, max_items, prefetch,
+            cluster_id=cluster_id, group_id=group_id
+        )
 
     async def increase_cluster_group_nodes(
         self, cluster_id: int, group_id: int, count: int
@@ -366,7 +412,7 @@ class KubernetesAPI(BaseAsyncClient):
             'POST', f'/k8s/clusters/{cluster_id}/groups/{group_id}/nodes',
             json={'count': count}
         )
-        return schemas.NodesResponse(**nodes.json())
+        return self._parse(nodes, schemas.NodesResponse)
 
     async def decrease_cluster_group_nodes(
         self, cluster_id: int, group_id: int, count: int
@@ -404,7 +450,7 @@ class KubernetesAPI(BaseAsyncClient):
         nodes = await self._request(
             'GET', f'/k8s/clusters/{cluster_id}/nodes'
         )
-        return schemas.NodesResponse(**nodes.json())
+        return self._parse(nodes, schemas.NodesResponse)
 
     async def delete_cluster_node(self, cluster_id: int, node_id: int) -> bool:
         '''Удалить ноду кластера.
@@ -421,6 +467,7 @@ class KubernetesAPI(BaseAsyncClient):
         )
         return status.is_success
 
+    @cached
     async def get_k8s_versions(self) -> schemas.K8SVersionsResponse:
         '''Получить список версий Kubernetes.
 
@@ -430,8 +477,9 @@ class KubernetesAPI(BaseAsyncClient):
         info = await self._request(
             'GET', '/k8s/k8s_versions'
         )
-        return schemas.K8SVersionsResponse(**info.json())
+        return self._parse(info, schemas.K8SVersionsResponse)
 
+    @cached
     async def get_k8s_network_drivers(self) -> schemas.K8SNetworksResponse:
         '''Получить список сетевых драйверов kubernetes.
 
@@ -441,8 +489,9 @@ class KubernetesAPI(BaseAsyncClient):
         info = await self._request(
             'GET', '/k8s/network_drivers'
         )
-        return schemas.K8SNetworksResponse(**info.json())
+        return self._parse(info, schemas.K8SNetworksResponse)
 
+    @cached
     async def get_k8s_presets(self) -> schemas.K8SPresetsResponse:
         '''Получить список тарифов kubernetes.
 
@@ -452,4 +501,4 @@ class KubernetesAPI(BaseAsyncClient):
         info = await self._request(
             'GET', '/presets/k8s'
         )
-        return schemas.K8SPresetsResponse(**info.json())
+        return self._parse(info, schemas.K8SPresetsResponse)
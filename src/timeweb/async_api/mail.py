@@ -6,23 +6,29 @@
 
 Документация: https://timeweb.cloud/api-docs#tag/Pochta'''
 import logging
+from typing import AsyncIterator
 
 from httpx import AsyncClient
 
 from .base import BaseAsyncClient
+from .transport import AsyncTransport
 from ..schemas import mail as schemas
 
 
 class MailAPI(BaseAsyncClient):
     '''Клиент для работы с API почты'''
 
-    def __init__(self, token: str, client: AsyncClient | None = None):
+    def __init__(
+        self, token: str, client: AsyncClient | None = None,
+        transport: AsyncTransport | None = None
+    ):
         '''Инициализация клиента.
         Args:
             token (str): API токен.
             client (AsyncClient | None, optional): HTTPX клиент. Defaults to None.
+            transport (AsyncTransport | None, optional): Общий транспорт клиента. Defaults to None.
         '''
-        super().__init__(token, client)
+        super().__init__(token, client, transport)
         self.log = logging.getLogger('timeweb')
 
     async def get_mailboxes(
@@ -47,7 +53,27 @@ class MailAPI(BaseAsyncClient):
         mailboxes = await self._request(
             'GET', '/mail', params=params
         )
-        return schemas.MailboxesResponse(**mailboxes.json())
+        return self._parse(mailboxes, schemas.MailboxesResponse)
+
+    def iter_mailboxes(
+        self, search: str | None = None, page_size: int = 100,
+        max_items: int | None = None, prefetch: int = 0
+    ) -> AsyncIterator[schemas.mail.Mailbox]:
+        '''Перебирает все почтовые ящики постранично.
+
+        Args:
+            search (str | None, optional): Поиск почтового ящика по названию. Defaults to None.
+            page_size (int, optional): Кол-во элементов на странице. Defaults to 100.
+            max_items (int | None, optional): Максимальное кол-во элементов. Defaults to None.
+            prefetch (int, optional): Кол-во страниц, загружаемых параллельно после первой. Defaults to 0.
+
+        Yields:
+            schemas.mail.Mailbox: Почтовый ящик.
+        '''
+        return self._paginate(
+            self.get_mailboxes, 'mailboxes', page_size, max_items, prefetch,
+            search=search
+        )
 
     async def get_quota(self) -> schemas.QuotaResponse:
         '''Получить квоту почты аккаунта.
@@ -58,7 +84,7 @@ class MailAPI(BaseAsyncClient):
         quota = await self._request(
             'GET', '/mail/quota'
         )
-        return schemas.QuotaResponse(**quota.json())
+        return self._parse(quota, schemas.QuotaResponse)
 
     async def change_quota(self, total: int | None = None) -> schemas.QuotaResponse:
         '''Изменить информацию о квоте почты аккаунта.
@@ -75,7 +101,7 @@ class MailAPI(BaseAsyncClient):
         updated = await self._request(
             'PATCH', '/mail/quota', json=data
         )
-        return schemas.QuotaResponse(**updated.json())
+        return self._parse(updated, schemas.QuotaResponse)
 
     async def get_domain_mailboxes(
         self, domain: str, limit: int = 100, offset: int = 0,
@@ -101,7 +127,29 @@ class MailAPI(BaseAsyncClient):
         mailboxes = await self._request(
             'GET', f'/mail/{domain}', params=params
         )
-        return schemas.MailboxesResponse(**mailboxes.json())
+        return self._parse(mailboxes, schemas.MailboxesResponse)
+
+    def iter_domain_mailboxes(
+        self, domain: str, search: str | None = None,
+        page_size: int = 100, max_items: int | None = None,
+        prefetch: int = 0
+    ) -> AsyncIterator[schemas.mail.Mailbox]:
+        '''Перебирает все почтовые ящики домена постранично.
+
+        Args:
+            domain (str): FQDN домена.
+            search (str | None, optional): Поиск почтового ящика по названию. Defaults to None.
+            page_size (int, optional): Кол-во элементов на странице. Defaults to 100.
+            max_items (int | None, optional): Максимальное кол-во элементов. Defaults to None.
+            prefetch (int, optional): Кол-во страниц, загружаемых параллельно после первой. Defaults to 0.
+
+        Yields:
+            schemas.mail.Mailbox: Почтовый ящик.
+        '''
+        return self._paginate(
+            self.get_domain_mailboxes, 'mailboxes', page_size, max_items, prefetch,
+            domain=domain, search=search
+        )
 
     async def create_mailbox(
         self, domain: str, mailbox: str, password: str,
@@ -128,7 +176,7 @@ class MailAPI(BaseAsyncClient):
             'POST', f'/mail/domains/{domain}',
             json=data
         )
-        return schemas.MailboxResponse(**new.json())
+        return self._parse(new, schemas.MailboxResponse)
 
     async def get_domain_info(self, domain: str) -> schemas.DomainInfoResponse:
         '''получение почтовой информации о домене.
@@ -142,7 +190,7 @@ class MailAPI(BaseAsyncClient):
         info = await self._request(
             'GET', f'/mail/domains/{domain}/info'
         )
-        return schemas.DomainInfoResponse(**info.json())
+        return self._parse(info, schemas.DomainInfoResponse)
 
     async def change_domain_info(
         self, domain: str, email: str | None = None
@@ -163,7 +211,7 @@ class MailAPI(BaseAsyncClient):
             'PATCH', f'/mail/domains/{domain}/info',
             json=data
         )
-        return schemas.DomainInfoResponse(**updated.json())
+        return self._parse(updated, schemas.DomainInfoResponse)
 
     async def get_mailbox(
         self, domain: str, mailbox: str
@@ -180,7 +228,7 @@ class MailAPI(BaseAsyncClient):
         box = await self._request(
             'GET', f'/mail/domains/{domain}/mailboxes/{mailbox}'
         )
-        return schemas.MailboxResponse(**box.json())
+        return self._parse(box, schemas.MailboxResponse)
 
     async def change_mailbox(
         self, domain: str, mailbox: str,
@@ -225,7 +273,7 @@ class MailAPI(BaseAsyncClient):
             'PATCH', f'/mail/domains/{domain}/mailboxes/{mailbox}',
             json=data
         )
-        return schemas.MailboxResponse(**updated.json())
+        return self._parse(updated, schemas.MailboxResponse)
 
     async def delete_mailbox(self, domain: str, mailbox: str) -> bool:
         '''Удалить почтовый ящик.
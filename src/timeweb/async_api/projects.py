@@ -9,6 +9,7 @@ import logging
 from httpx import AsyncClient
 
 from .base import BaseAsyncClient
+from .transport import AsyncTransport
 from ..schemas import projects as schemas
 from ..schemas.servers.cloud import VDSArray
 from ..schemas.balancers import BalancersResponse
@@ -21,13 +22,17 @@ from ..schemas.servers.dedics import DedicatedServers
 class ProjectsAPI(BaseAsyncClient):
     '''Клиент для работы с API проектов'''
 
-    def __init__(self, token: str, client: AsyncClient | None = None):
+    def __init__(
+        self, token: str, client: AsyncClient | None = None,
+        transport: AsyncTransport | None = None
+    ):
         '''Инициализация клиента.
         Args:
             token (str): API токен.
             client (AsyncClient | None, optional): HTTPX клиент. Defaults to None.
+            transport (AsyncTransport | None, optional): Общий транспорт клиента. Defaults to None.
         '''
-        super().__init__(token, client)
+        super().__init__(token, client, transport)
         self.log = logging.getLogger('timeweb')
 
     async def get_projects(self) -> schemas.ProjectsResponse:
@@ -39,7 +44,7 @@ class ProjectsAPI(BaseAsyncClient):
         projects = await self._request(
             'GET', '/projects'
         )
-        return schemas.ProjectsResponse(**projects.json())
+        return self._parse(projects, schemas.ProjectsResponse)
 
     async def create_project(
         self, name: str, description: str | None = None,
@@ -74,7 +79,7 @@ class ProjectsAPI(BaseAsyncClient):
         new = await self._request(
             'POST', '/projects', json=data
         )
-        return schemas.ProjectResponse(**new.json())
+        return self._parse(new, schemas.ProjectResponse)
 
     async def get_project(self, project_id: int) -> schemas.ProjectResponse:
         '''Получить проект.
@@ -88,7 +93,7 @@ class ProjectsAPI(BaseAsyncClient):
         proj = await self._request(
             'GET', f'/projects/{project_id}'
         )
-        return schemas.ProjectResponse(**proj.json())
+        return self._parse(proj, schemas.ProjectResponse)
 
     async def delete_project(self, project_id: int) -> bool:
         '''Удалить проект.
@@ -138,7 +143,7 @@ class ProjectsAPI(BaseAsyncClient):
         new = await self._request(
             'PATCH', f'/projects/{project_id}', json=data
         )
-        return schemas.ProjectResponse(**new.json())
+        return self._parse(new, schemas.ProjectResponse)
 
     async def get_project_balancers(self, project_id: int) -> BalancersResponse:
         '''Получить список балансировщиков проекта.
@@ -152,7 +157,7 @@ class ProjectsAPI(BaseAsyncClient):
         array = await self._request(
             'GET', f'/projects/{project_id}/resources/balancers'
         )
-        return BalancersResponse(**array.json())
+        return self._parse(array, BalancersResponse)
 
     async def add_project_balancer(
         self, project_id: int, resource_id: int
@@ -170,7 +175,7 @@ class ProjectsAPI(BaseAsyncClient):
             'POST', f'/projects/{project_id}/resources/balancers',
             json={'resource_id': resource_id}
         )
-        return schemas.ResourceResponse(**res.json())
+        return self._parse(res, schemas.ResourceResponse)
 
     async def get_project_buckets(self, project_id: int) -> BucketArray:
         '''Получить список хранилищ проекта.
@@ -184,7 +189,7 @@ class ProjectsAPI(BaseAsyncClient):
         array = await self._request(
             'GET', f'/projects/{project_id}/resources/buckets'
         )
-        return BucketArray(**array.json())
+        return self._parse(array, BucketArray)
 
     async def add_project_bucket(
         self, project_id: int, resource_id: int
@@ -202,7 +207,7 @@ class ProjectsAPI(BaseAsyncClient):
             'POST', f'/projects/{project_id}/resources/buckets',
             json={'resource_id': resource_id}
         )
-        return schemas.ResourceResponse(**res.json())
+        return self._parse(res, schemas.ResourceResponse)
 
     async def get_project_clusters(self, project_id: int) -> ClustersResponse:
         '''Получить список кластеров проекта.
@@ -216,7 +221,7 @@ class ProjectsAPI(BaseAsyncClient):
         array = await self._request(
             'GET', f'/projects/{project_id}/resources/clusters'
         )
-        return ClustersResponse(**array.json())
+        return self._parse(array, ClustersResponse)
 
     async def add_project_cluster(
         self, project_id: int, resource_id: int
@@ -234,7 +239,7 @@ class ProjectsAPI(BaseAsyncClient):
             'POST', f'/projects/{project_id}/resources/clusters',
             json={'resource_id': resource_id}
         )
-        return schemas.ResourceResponse(**res.json())
+        return self._parse(res, schemas.ResourceResponse)
 
     async def get_project_servers(self, project_id: int) -> VDSArray:
         '''Получить список облачных серверов проекта.
@@ -248,7 +253,7 @@ class ProjectsAPI(BaseAsyncClient):
         array = await self._request(
             'GET', f'/projects/{project_id}/resources/servers'
         )
-        return VDSArray(**array.json())
+        return self._parse(array, VDSArray)
 
     async def add_project_server(
         self, project_id: int, resource_id: int
@@ -266,7 +271,7 @@ class ProjectsAPI(BaseAsyncClient):
             'POST', f'/projects/{project_id}/resources/servers',
             json={'resource_id': resource_id}
         )
-        return schemas.ResourceResponse(**res.json())
+        return self._parse(res, schemas.ResourceResponse)
 
     async def get_project_dbs(self, project_id: int) -> DBArray:
         '''Получить список баз данных проекта.
@@ -280,7 +285,7 @@ class ProjectsAPI(BaseAsyncClient):
         array = await self._request(
             'GET', f'/projects/{project_id}/resources/databases'
         )
-        return DBArray(**array.json())
+        return self._parse(array, DBArray)
 
     async def add_project_db(
         self, project_id: int, resource_id: int
@@ -298,7 +303,7 @@ class ProjectsAPI(BaseAsyncClient):
             'POST', f'/projects/{project_id}/resources/databases',
             json={'resource_id': resource_id}
         )
-        return schemas.ResourceResponse(**res.json())
+        return self._parse(res, schemas.ResourceResponse)
 
     async def get_project_dedics(self, project_id: int) -> DedicatedServers:
         '''Получить список выделенных серверов проекта.
@@ -312,7 +317,7 @@ class ProjectsAPI(BaseAsyncClient):
         array = await self._request(
             'GET', f'/projects/{project_id}/resources/dedicated'
         )
-        return DedicatedServers(**array.json())
+        return self._parse(array, DedicatedServers)
 
     async def add_project_dedic(
         self, project_id: int, resource_id: int
@@ -330,7 +335,7 @@ class ProjectsAPI(BaseAsyncClient):
             'POST', f'/projects/{project_id}/resources/dedicated',
             json={'resource_id': resource_id}
         )
-        return schemas.ResourceResponse(**res.json())
+        return self._parse(res, schemas.ResourceResponse)
 
     async def get_project_resources(self, project_id: int) -> schemas.ResourcesResponse:
         '''Получить ресурсы проекта.
@@ -344,7 +349,7 @@ class ProjectsAPI(BaseAsyncClient):
         res = await self._request(
             'GET', f'/projects/{project_id}/resources'
         )
-        return schemas.ResourcesResponse(**res.json())
+        return self._parse(res, schemas.ResourcesResponse)
 
     async def get_account_balancers(self) -> BalancersResponse:
         '''Получить список балансировщиков аккаунта.
@@ -355,7 +360,7 @@ class ProjectsAPI(BaseAsyncClient):
         array = await self._request(
             'GET', '/projects/resources/balancers'
         )
-        return BalancersResponse(**array.json())
+        return self._parse(array, BalancersResponse)
 
     async def get_account_servers(self) -> VDSArray:
         '''Получить список облачных серверов аккаунта.
@@ -366,7 +371,7 @@ class ProjectsAPI(BaseAsyncClient):
         array = await self._request(
             'GET', '/projects/resources/servers'
         )
-        return VDSArray(**array.json())
+        return self._parse(array, VDSArray)
 
     async def get_account_buckets(self) -> BucketArray:
         '''Получить список хранилищ аккаунта.
@@ -377,7 +382,7 @@ class ProjectsAPI(BaseAsyncClient):
         array = await self._request(
             'GET', '/projects/resources/buckets'
         )
-        return BucketArray(**array.json())
+        return self._parse(array, BucketArray)
 
     async def get_account_clusters(self) -> ClustersResponse:
         '''Получить список кластеров аккаунта.
@@ -388,7 +393,7 @@ class ProjectsAPI(BaseAsyncClient):
         array = await self._request(
             'GET', '/projects/resources/clusters'
         )
-        return ClustersResponse(**array.json())
+        return self._parse(array, ClustersResponse)
 
     async def get_account_dbs(self) -> DBArray:
         '''Получить список баз данных аккаунта.
@@ -399,7 +404,7 @@ class ProjectsAPI(BaseAsyncClient):
         array = await self._request(
             'GET', '/projects/resources/databases'
         )
-        return DBArray(**array.json())
+        return self._parse(array, DBArray)
 
     async def get_account_dedics(self) -> DedicatedServers:
         '''Получить список выделенных серверов аккаунта.
@@ -410,7 +415,7 @@ class ProjectsAPI(BaseAsyncClient):
         array = await self._request(
             'GET', '/projects/resources/dedicated'
         )
-        return DedicatedServers(**array.json())
+        return self._parse(array, DedicatedServers)
 
     async def move_resource(
         self, project_id: int, to_project: int, resource_id: int,
@@ -439,4 +444,4 @@ class ProjectsAPI(BaseAsyncClient):
             'PUT', f'/projects/{project_id}/resources/transfer',
             json=data
         )
-        return schemas.ResourceResponse(**res.json())
+        return self._parse(res, schemas.ResourceResponse)
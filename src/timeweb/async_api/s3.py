@@ -8,29 +8,36 @@ S3-хранилище — это универсальное объектное 
 import logging
 import warnings
 from datetime import timedelta
+from typing import AsyncIterator
 
 from httpx import AsyncClient
 
 from .base import BaseAsyncClient
+from .transport import AsyncTransport
+from ..utils.cache import cached
 from ..schemas import s3 as schemas
 
 
 class BucketsAPI(BaseAsyncClient):
     '''Клиент для работы с API S3-хранилищ Timeweb Cloud'''
 
-    def __init__(self, token: str, client: AsyncClient | None = None):
+    def __init__(
+        self, token: str, client: AsyncClient | None = None,
+        transport: AsyncTransport | None = None
+    ):
         '''Инициализация клиента.
         Args:
             token (str): API токен.
             client (AsyncClient | None, optional): HTTPX клиент. Defaults to None.
+            transport (AsyncTransport | None, optional): Общий транспорт клиента. Defaults to None.
         '''
-        super().__init__(token, client)
+        super().__init__(token, client, transport)
         self.log = logging.getLogger('timeweb')
 
     async def get_buckets(self) -> schemas.BucketArray:
         '''Получение списка S3-хранилищ'''
         buckets = await self._request('GET', '/storages/buckets')
-        return schemas.BucketArray(**buckets.json())
+        return self._parse(buckets, schemas.BucketArray)
 
     async def create(
         self, name: str, type: schemas.BucketType | str,
@@ -51,7 +58,7 @@ class BucketsAPI(BaseAsyncClient):
                 'preset_id': preset_id
             }
         )
-        return schemas.BucketResponse(**bucket.json())
+        return self._parse(bucket, schemas.BucketResponse)
 
     async def delete(self, bucket_id: int) -> bool | schemas.BucketDelete:
         '''Удалить S3-хранилище.
@@ -68,7 +75,7 @@ class BucketsAPI(BaseAsyncClient):
         if status.status_code == 204:
             return True
         elif status.status_code == 200:
-            return schemas.BucketDelete(**status.json())
+            return self._parse(status, schemas.BucketDelete)
         else:
             return False
 
@@ -122,17 +129,18 @@ class BucketsAPI(BaseAsyncClient):
             f'/storages/buckets/{bucket_id}',
             json=data
         )
-        return schemas.BucketResponse(**bucket.json())
+        return self._parse(bucket, schemas.BucketResponse)
 
+    @cached
     async def get_storages_preset(self) -> schemas.StoragePresets:
         '''Получение списка пресетов хранилищ'''
         presets = await self._request('GET', '/presets/storages')
-        return schemas.StoragePresets(**presets.json())
+        return self._parse(presets, schemas.StoragePresets)
 
     async def get_storages_users(self) -> schemas.StorageUsers:
         '''Получение списка пользователей хранилищ'''
         users = await self._request('GET', '/storages/users')
-        return schemas.StorageUsers(**users.json())
+        return self._parse(users, schemas.StorageUsers)
 
     async def set_user_secret_key(
         self, user_id: int, secret_key: str
@@ -142,7 +150,7 @@ class BucketsAPI(BaseAsyncClient):
             f'/storages/users/{user_id}',
             json={'secret_key': secret_key}
         )
-        return schemas.UserResponse(**user.json())
+        return self._parse(user, schemas.UserResponse)
 
     async def get_transfer_status(
         self, bucket_id: int
@@ -159,7 +167,7 @@ class BucketsAPI(BaseAsyncClient):
             'GET',
             f'/storages/buckets/{bucket_id}/transfer-status'
         )
-        return schemas.TransferResponse(**transfer.json())
+        return self._parse(transfer, schemas.TransferResponse)
 
     async def transfer(
         self, access_key: str, secret_key: str, location: str,
@@ -208,7 +216,7 @@ class BucketsAPI(BaseAsyncClient):
             'GET',
             f'/storages/buckets/{bucket_id}/subdomains'
         )
-        return schemas.DomainsArray(**domains.json())
+        return self._parse(domains, schemas.DomainsArray)
 
     async def add_subdomains(
         self, bucket_id: int, subdomains: list[str]
@@ -227,7 +235,7 @@ class BucketsAPI(BaseAsyncClient):
             f'/storages/buckets/{bucket_id}/subdomains',
             json={'subdomains': subdomains}
         )
-        return schemas.DomainsAddArray(**domains.json())
+        return self._parse(domains, schemas.DomainsAddArray)
 
     async def delete_subdomains(
         self, bucket_id: int, subdomains: list[str]
@@ -246,7 +254,7 @@ class BucketsAPI(BaseAsyncClient):
             f'/storages/buckets/{bucket_id}/subdomains',
             json={'subdomains': subdomains}
         )
-        return schemas.DomainsAddArray(**domains.json())
+        return self._parse(domains, schemas.DomainsAddArray)
 
     async def get_objects_by_prefix(
         self, bucket_id: int, prefix: str | None = None,
@@ -275,7 +283,35 @@ class BucketsAPI(BaseAsyncClient):
             f'/storages/buckets/{bucket_id}/object-manager/list',
             params=params
         )
-        return schemas.ObjectsArray(**objects.json())
+        return self._parse(objects, schemas.ObjectsArray)
+
+    def stream_objects_by_prefix(
+        self, bucket_id: int, prefix: str | None = None,
+        is_multipart: bool | None = None
+    ) -> AsyncIterator[schemas.objects.Object]:
+        '''Перебирает объекты хранилища по префиксу по мере загрузки ответа.
+
+        Args:
+            bucket_id (int): ID хранилища.
+            prefix (str | None): Префикс для поиска файла.
+            is_multipart (bool | None): Обозначения multipart загрузки
+
+        Example:
+            >>> for obj in tw.s3.stream_objects_by_prefix(1, prefix='logs/'):
+            ...     print(obj.key)
+
+        Yields:
+            schemas.objects.Object: Объект.
+        '''
+        params = {}
+        if prefix is not None:
+            params['prefix'] = prefix
+        if is_multipart is not None:
+            params['is_multipart'] = str(is_multipart).lower()
+        return self._stream(
+            f'/storages/buckets/{bucket_id}/object-manager/list', 'files',
+            schemas.objects.Object, params=params
+        )
 
     async def rename_object(
         self, bucket_id: int, old_filename: str, new_filename: str
@@ -10,19 +10,24 @@ import logging
 from httpx import AsyncClient
 
 from .base import BaseAsyncClient
+from .transport import AsyncTransport
 from ..schemas import ssh_keys as schemas
 
 
 class SSHKeysAPI(BaseAsyncClient):
     '''Клиент для работы с API ssh-ключей Timeweb Cloud'''
 
-    def __init__(self, token: str, client: AsyncClient | None = None):
+    def __init__(
+        self, token: str, client: AsyncClient | None = None,
+        transport: AsyncTransport | None = None
+    ):
         '''Инициализация клиента.
         Args:
             token (str): API токен.
             client (AsyncClient | None, optional): HTTPX клиент. Defaults to None.
+            transport (AsyncTransport | None, optional): Общий транспорт клиента. Defaults to None.
         '''
-        super().__init__(token, client)
+        super().__init__(token, client, transport)
         self.log = logging.getLogger('timeweb')
 
     async def get_keys(self) -> schemas.SSHKeysArray:
@@ -32,7 +37,7 @@ class SSHKeysAPI(BaseAsyncClient):
             schemas.SSHKeysArray: Список SSH-ключей.
         '''
         keys = await self._request('GET', '/ssh-keys')
-        return schemas.SSHKeysArray(**keys.json())
+        return self._parse(keys, schemas.SSHKeysArray)
 
     async def create(
         self, name: str, body: str, is_default: bool
@@ -56,7 +61,7 @@ class SSHKeysAPI(BaseAsyncClient):
                 'is_default': is_default,
             },
         )
-        return schemas.CreateSSHKeyResponse(**key.json())
+        return self._parse(key, schemas.CreateSSHKeyResponse)
 
     async def get(self, ssh_key_id: int) -> schemas.SSHKeyResponse:
         '''Получение SSH-ключа.
@@ -68,7 +73,7 @@ class SSHKeysAPI(BaseAsyncClient):
             schemas.SSHKeyResponse: SSH-ключ.
         '''
         key = await self._request('GET', f'/ssh-keys/{ssh_key_id}')
-        return schemas.SSHKeyResponse(**key.json())
+        return self._parse(key, schemas.SSHKeyResponse)
 
     async def update(
         self,
@@ -100,7 +105,7 @@ class SSHKeysAPI(BaseAsyncClient):
             f'/ssh-keys/{ssh_key_id}',
             json=data
         )
-        return schemas.SSHKeyResponse(**key.json())
+        return self._parse(key, schemas.SSHKeyResponse)
 
     async def delete(self, ssh_key_id: int) -> bool:
         '''Удаление SSH-ключа.
@@ -12,19 +12,24 @@ from datetime import datetime
 from httpx import AsyncClient
 
 from .base import BaseAsyncClient
+from .transport import AsyncTransport
 from ..schemas import tokens as schemas
 
 
 class TokensAPI(BaseAsyncClient):
     '''Клиент для работы с API токенами Timeweb Cloud'''
 
-    def __init__(self, token: str, client: AsyncClient | None = None):
+    def __init__(
+        self, token: str, client: AsyncClient | None = None,
+        transport: AsyncTransport | None = None
+    ):
         '''Инициализация клиента.
         Args:
             token (str): API токен.
             client (AsyncClient | None, optional): HTTPX клиент. Defaults to None.
+            transport (AsyncTransport | None, optional): Общий транспорт клиента. Defaults to None.
         '''
-        super().__init__(token, client)
+        super().__init__(token, client, transport)
         self.log = logging.getLogger('timeweb')
 
     async def get_tokens(self) -> schemas.APIKeysResponse:
@@ -34,7 +39,7 @@ class TokensAPI(BaseAsyncClient):
             schemas.APIKeysResponse: Список API токенов.
         '''
         keys = await self._request('GET', '/auth/api-keys')
-        return schemas.APIKeysResponse(**keys.json())
+        return self._parse(keys, schemas.APIKeysResponse)
 
     async def create(self, name: str, expire: datetime | str) -> schemas.CreateAPIKeyResponse:
         '''Создание API токена.
@@ -54,7 +59,7 @@ class TokensAPI(BaseAsyncClient):
         else:
             data['expire'] = expire
         key = await self._request('POST', '/auth/api-keys', json=data)
-        return schemas.CreateAPIKeyResponse(**key.json())
+        return self._parse(key, schemas.CreateAPIKeyResponse)
 
     async def rename(self, token_id: UUID | str, name: str) -> schemas.APIKeyResponse:
         '''Переименование API токена.
@@ -69,7 +74,7 @@ class TokensAPI(BaseAsyncClient):
         key = await self._request('PATCH', f'/auth/api-keys/{token_id}', json={
             'name': name,
         })
-        return schemas.APIKeyResponse(**key.json())
+        return self._parse(key, schemas.APIKeyResponse)
 
     async def reissue(
         self, token_id: UUID | str, expire: datetime | str | None = None
@@ -90,7 +95,7 @@ class TokensAPI(BaseAsyncClient):
             else:
                 data['expire'] = expire
         key = await self._request('PUT', f'/auth/api-keys/{token_id}', json=data)
-        return schemas.CreateAPIKeyResponse(**key.json())
+        return self._parse(key, schemas.CreateAPIKeyResponse)
 
     async def delete(self, token_id: UUID | str) -> Literal[True]:
         '''Удаление API токена.
@@ -31,3 +31,6 @@ from .backup import (
 from .logs import (
     ServerLogsResponse
 )
+from .compact import (
+    CompactVDS, VDSFleet
+)
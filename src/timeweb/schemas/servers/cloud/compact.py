@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+'''Компактное представление больших списков облачных серверов.
+
+Модели `VDS` со вложенными `VDSOS`, `VDSNetwork`, `NetworkIPs` и `VDSDisk`
+занимают много памяти. `VDSFleet` хранит скалярные поля серверов в колонках
+(`array` для чисел, списки интернированных строк для повторяющихся значений),
+а весь сервер - в виде компактного JSON, из которого полная модель создаётся
+по требованию. Замерить расход памяти можно через `python benchmarks/fleet_memory.py`.'''
+import sys
+import json
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Iterable, Iterator, overload
+
+from .cloud import VDS
+from ....utils.construct import construct
+
+
+def _timestamp(value: datetime | str) -> float:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return value.timestamp()
+
+
+def _dumps(data: dict[str, Any]) -> bytes:
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode()
+
+
+@dataclass(frozen=True, slots=True)
+class CompactVDS:
+    '''Компактная запись облачного сервера.
+
+    Attributes:
+        id (int): UID сервера.
+        name (str): Имя сервера.
+        status (str): Статус сервера.
+        location (str): Локация сервера.
+        cpu (int): Кол-во ядер у CPU.
+        ram (int): Размер RAM в Мб.
+        os (str): Тип ОС.
+        created_at (datetime): Дата создания сервера.
+        payload (bytes): Сервер целиком в виде JSON.
+    '''
+    id: int
+    name: str
+    status: str
+    location: str
+    cpu: int
+    ram: int
+    os: str
+    created_at: datetime
+    payload: bytes = field(repr=False, compare=False)
+
+    @classmethod
+    def from_model(cls, server: VDS) -> 'CompactVDS':
+        '''Создаёт запись из модели сервера.
+
+        Args:
+            server (VDS): Модель сервера.
+
+        Returns:
+            CompactVDS: Компактная запись.
+        '''
+        return cls(
+            server.id, server.name, sys.intern(str(server.status)),
+            sys.intern(server.location), server.cpu, server.ram,
+            sys.intern(str(server.os.name)),
+            datetime.fromtimestamp(_timestamp(server.created_at), timezone.utc),
+            server.json(by_alias=True).encode()
+        )
+
+    @classmethod
+    def from_raw(cls, server: dict[str, Any]) -> 'CompactVDS':
+        '''Создаёт запись из декодированного JSON сервера (режим `raw`).
+
+        Args:
+            server (dict[str, Any]): Сервер из ответа API.
+
+        Returns:
+            CompactVDS: Компактная запись.
+        '''
+        return cls(
+            server['id'], server['name'], sys.intern(server['status']),
+            sys.intern(server['location']), server['cpu'], server['ram'],
+            sys.intern(server['os']['name']),
+            datetime.fromtimestamp(_timestamp(server['created_at']), timezone.utc),
+            _dumps(server)
+        )
+
+    def to_model(self, validate: bool = True) -> VDS:
+        '''Создаёт полную модель сервера.
+
+        Args:
+            validate (bool, optional): Валидировать модель. Defaults to True.
+
+        Returns:
+            VDS: Модель сервера.
+        '''
+        if validate:
+            return VDS.parse_raw(self.payload)
+        return construct(VDS, json.loads(self.payload))
+
+
+class VDSFleet:
+    '''Колоночное хранилище большого кол-ва облачных серверов.
+
+    Обращение по индексу возвращает `CompactVDS`, а `model()` - полную модель `VDS`.
+    '''
+    COLUMNS = ('id', 'name', 'status', 'location', 'cpu', 'ram', 'os', 'created_at')
+
+    def __init__(self):
+        self._id = array('q')
+        self._cpu = array('i')
+        self._ram = array('q')
+        self._created_at = array('d')
+        self._name: list[str] = []
+        self._status: list[str] = []
+        self._location: list[str] = []
+        self._os: list[str] = []
+        self._payload: list[bytes] = []
+
+    @classmethod
+    def from_models(cls, servers: Iterable[VDS]) -> 'VDSFleet':
+        '''Создаёт хранилище из моделей серверов.
+
+        Args:
+            servers (Iterable[VDS]): Модели серверов, например `VDSArray.servers`.
+
+        Returns:
+            VDSFleet: Хранилище серверов.
+        '''
+        fleet = cls()
+        for server in servers:
+            fleet.append(CompactVDS.from_model(server))
+        return fleet
+
+    @classmethod
+    def from_raw(cls, servers: Iterable[dict[str, Any]]) -> 'VDSFleet':
+        '''Создаёт хранилище из декодированного JSON, минуя модели.
+
+        Args:
+            servers (Iterable[dict[str, Any]]): Серверы из ответа API в режиме `raw`.
+
+        Returns:
+            VDSFleet: Хранилище серверов.
+        '''
+        fleet = cls()
+        for server in servers:
+            fleet.append(CompactVDS.from_raw(server))
+        return fleet
+
+    def append(self, server: CompactVDS) -> None:
+        '''Добавляет сервер в хранилище.
+
+        Args:
+            server (CompactVDS): Компактная запись сервера.
+        '''
+        self._id.append(server.id)
+        self._cpu.append(server.cpu)
+        self._ram.append(server.ram)
+        self._created_at.append(server.created_at.timestamp())
+        self._name.append(server.name)
+        self._status.append(sys.intern(server.status))
+        self._location.append(sys.intern(server.location))
+        self._os.append(sys.intern(server.os))
+        self._payload.append(server.payload)
+
+    def __len__(self) -> int:
+        return len(self._id)
+
+    def _record(self, index: int) -> CompactVDS:
+        return CompactVDS(
+            self._id[index], self._name[index], self._status[index],
+            self._location[index], self._cpu[index], self._ram[index],
+            self._os[index],
+            datetime.fromtimestamp(self._created_at[index], timezone.utc),
+            self._payload[index]
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> CompactVDS: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[CompactVDS]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._record(i) for i in range(*index.indices(len(self)))]
+        return self._record(index)
+
+    def __iter__(self) -> Iterator[CompactVDS]:
+        for index in range(len(self)):
+            yield self._record(index)
+
+    def __repr__(self) -> str:
+        return f'VDSFleet(len={len(self)})'
+
+    def column(self, name: str) -> array | list[Any]:
+        '''Возвращает колонку скалярного поля.
+
+        Колонка `created_at` содержит UNIX время в секундах.
+
+        Args:
+            name (str): Имя поля из `VDSFleet.COLUMNS`.
+
+        Raises:
+            KeyError: Неизвестное поле.
+
+        Returns:
+            array | list[Any]: Значения поля для всех серверов.
+        '''
+        if name not in self.COLUMNS:
+            raise KeyError(name)
+        return getattr(self, f'_{name}')
+
+    def model(self, index: int, validate: bool = True) -> VDS:
+        '''Создаёт полную модель сервера.
+
+        Args:
+            index (int): Индекс сервера.
+            validate (bool, optional): Валидировать модель. Defaults to True.
+
+        Returns:
+            VDS: Модель сервера.
+        '''
+        return self._record(index).to_model(validate)
+
+    def to_models(self, validate: bool = True) -> list[VDS]:
+        '''Создаёт полные модели всех серверов.
+
+        Args:
+            validate (bool, optional): Валидировать модели. Defaults to True.
+
+        Returns:
+            list[VDS]: Модели серверов.
+        '''
+        return [self.model(index, validate) for index in range(len(self))]
@@ -12,19 +12,25 @@ from ipaddress import IPv4Address
 from httpx import Client
 
 from .base import BaseClient
+from .transport import Transport
+from ..utils.cache import cached
 from ..schemas import account as schemas
 
 
 class AccountAPI(BaseClient):
     '''Клиент для работы с API аккаунта Timeweb Cloud'''
 
-    def __init__(self, token: str, client: Client | None = None):
+    def __init__(
+        self, token: str, client: Client | None = None,
+        transport: Transport | None = None
+    ):
         '''Инициализация клиента.
         Args:
             token (str): API токен.
             client (Client | None, optional): HTTPX клиент. Defaults to None.
+            transport (Transport | None, optional): Общий транспорт клиента. Defaults to None.
         '''
-        super().__init__(token, client)
+        super().__init__(token, client, transport)
         self.log = logging.getLogger('timeweb')
 
     def get_finances(self) -> schemas.AccountFinances:
@@ -36,7 +42,7 @@ class AccountAPI(BaseClient):
         method = 'GET'
         url = '/account/finances'
         data = self._request(method, url)
-        return schemas.AccountFinances(**data.json())
+        return self._parse(data, schemas.AccountFinances)
 
     def get_status(self) -> schemas.AccountStatus:
         '''Получение информации о статусе аккаунта.
@@ -47,7 +53,7 @@ class AccountAPI(BaseClient):
         method = 'GET'
         url = '/account/status'
         data = self._request(method, url)
-        return schemas.AccountStatus(**data.json())
+        return self._parse(data, schemas.AccountStatus)
 
     def get_access_restrictions(self) -> schemas.AccountAccess:
         '''Получение информации об ограничениях авторизации пользователя.
@@ -58,7 +64,7 @@ class AccountAPI(BaseClient):
         method = 'GET'
         url = '/auth/access'
         data = self._request(method, url)
-        return schemas.AccountAccess(**data.json())
+        return self._parse(data, schemas.AccountAccess)
 
     def turn_countries_restrictions(self, enabled: bool) -> bool:
         '''Включение/отключение ограничений по странам.
@@ -74,6 +80,7 @@ class AccountAPI(BaseClient):
         self._request(method, url, json={'is_enabled': enabled})
         return True
 
+    @cached
     def get_countries(self) -> schemas.AccessCountries:
         '''Получение списка стран.
 
@@ -83,7 +90,7 @@ class AccountAPI(BaseClient):
         method = 'GET'
         url = '/auth/access/countries'
         data = self._request(method, url)
-        return schemas.AccessCountries(**data.json())
+        return self._parse(data, schemas.AccessCountries)
 
     def add_allowed_countries(self, countries: list[str]) -> schemas.AddAccessCountries:
         '''Добавление разрешенных стран.
@@ -97,7 +104,7 @@ class AccountAPI(BaseClient):
         method = 'POST'
         url = '/auth/access/countries'
         data = self._request(method, url, json={'countries': countries})
-        return schemas.AddAccessCountries(**data.json())
+        return self._parse(data, schemas.AddAccessCountries)
 
     def remove_allowed_countries(self, countries: list[str]) -> schemas.RemoveAccessCountries:
         '''Удаление разрешенных стран.
@@ -111,7 +118,7 @@ class AccountAPI(BaseClient):
         method = 'DELETE'
         url = '/auth/access/countries'
         data = self._request(method, url, json={'countries': countries})
-        return schemas.RemoveAccessCountries(**data.json())
+        return self._parse(data, schemas.RemoveAccessCountries)
 
     def turn_ips_restrictions(self, enabled: bool) -> bool:
         '''Включение/отключение ограничений по IP.
@@ -139,7 +146,7 @@ class AccountAPI(BaseClient):
         method = 'POST'
         url = '/auth/access/ips'
         data = self._request(method, url, json={'ips': ips})
-        return schemas.AddIP(**data.json())
+        return self._parse(data, schemas.AddIP)
 
     def remove_allowed_ips(self, ips: list[str | IPv4Address]) -> schemas.RemoveIP:
         '''Удаление разрешенных IP.
@@ -153,4 +160,4 @@ class AccountAPI(BaseClient):
         method = 'DELETE'
         url = '/auth/access/ips'
         data = self._request(method, url, json={'ips': ips})
-        return schemas.RemoveIP(**data.json())
+        return self._parse(data, schemas.RemoveIP)
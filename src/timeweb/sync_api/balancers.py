@@ -12,19 +12,25 @@ from ipaddress import IPv4Address, IPv6Address
 from httpx import Client
 
 from .base import BaseClient
+from .transport import Transport
+from ..utils.cache import cached
 from ..schemas import balancers as schemas
 
 
 class BalancersAPI(BaseClient):
     '''Клиент для работы с API балансировщиками Timeweb Cloud'''
 
-    def __init__(self, token: str, client: Client | None = None):
+    def __init__(
+        self, token: str, client: Client | None = None,
+        transport: Transport | None = None
+    ):
         '''Инициализация клиента.
         Args:
             token (str): API токен.
             client (Client | None, optional): HTTPX клиент. Defaults to None.
+            transport (Transport | None, optional): Общий транспорт клиента. Defaults to None.
         '''
-        super().__init__(token, client)
+        super().__init__(token, client, transport)
         self.log = logging.getLogger('timeweb')
 
     def get_balancers(self) -> schemas.BalancersResponse:
@@ -36,7 +42,7 @@ class BalancersAPI(BaseClient):
         balancers = self._request(
             'GET', '/balancers'
         )
-        return schemas.BalancersResponse(**balancers.json())
+        return self._parse(balancers, schemas.BalancersResponse)
 
     def create(
         self, name: str, algo: schemas.BalancerAlgorithm | str, is_sticky: bool,
@@ -90,7 +96,7 @@ class BalancersAPI(BaseClient):
         balancer = self._request(
             'POST', '/balancers', json=data
         )
-        return schemas.BalancerResponse(**balancer.json())
+        return self._parse(balancer, schemas.BalancerResponse)
 
     def get(self, balancer_id: int) -> schemas.BalancerResponse:
         '''Получить балансировщик.
@@ -104,7 +110,7 @@ class BalancersAPI(BaseClient):
         balancer = self._request(
             'GET', f'/balancers/{balancer_id}'
         )
-        return schemas.BalancerResponse(**balancer.json())
+        return self._parse(balancer, schemas.BalancerResponse)
 
     def update(
         self, balancer_id: int, name: str | None = None,
@@ -176,7 +182,7 @@ class BalancersAPI(BaseClient):
         balancer = self._request(
             'PATCH', f'/balancers/{balancer_id}', json=data
         )
-        return schemas.BalancerResponse(**balancer.json())
+        return self._parse(balancer, schemas.BalancerResponse)
 
     def delete(self, balancer_id: int) -> bool | schemas.BalancerDelete:
         '''Удалить балансировщик.
@@ -193,7 +199,7 @@ class BalancersAPI(BaseClient):
         if status.status_code == 204:
             return True
         elif status.status_code == 200:
-            return schemas.BalancerDelete(**status.json())
+            return self._parse(status, schemas.BalancerDelete)
         else:
             return False
 
@@ -241,7 +247,7 @@ class BalancersAPI(BaseClient):
         balancer_ips = self._request(
             'GET', f'/balancers/{balancer_id}/ips'
         )
-        return schemas.BalancerIPsResponse(**balancer_ips.json())
+        return self._parse(balancer_ips, schemas.BalancerIPsResponse)
 
     def add_balancer_ips(
         self, balancer_id: int, ips: list[str | IPv4Address | IPv6Address]
@@ -289,7 +295,7 @@ class BalancersAPI(BaseClient):
         balancer_rules = self._request(
             'GET', f'/balancers/{balancer_id}/rules'
         )
-        return schemas.BalancerRulesResponse(**balancer_rules.json())
+        return self._parse(balancer_rules, schemas.BalancerRulesResponse)
 
     def add_balancer_rule(
         self, balancer_id: int, balancer_proto: schemas.Protocol | str,
@@ -322,7 +328,7 @@ class BalancersAPI(BaseClient):
         balancer_rule = self._request(
             'POST', f'/balancers/{balancer_id}/rules', json=data
         )
-        return schemas.BalancerRuleResponse(**balancer_rule.json())
+        return self._parse(balancer_rule, schemas.BalancerRuleResponse)
 
     def update_balancer_rule(
         self, balancer_id: int, rule_id: int,
@@ -356,7 +362,7 @@ class BalancersAPI(BaseClient):
         balancer_rule = self._request(
             'PATCH', f'/balancers/{balancer_id}/rules/{rule_id}', json=data
         )
-        return schemas.BalancerRuleResponse(**balancer_rule.json())
+        return self._parse(balancer_rule, schemas.BalancerRuleResponse)
 
     def delete_balancer_rule(self, balancer_id: int, rule_id: int) -> bool:
         '''Удалить правило балансировщика.
@@ -373,6 +379,7 @@ class BalancersAPI(BaseClient):
         )
         return resp.is_success
 
+    @cached
     def get_presets(self) -> schemas.BalancerPresetsResponse:
         '''Получить список тарифов балансировщиков.
 
@@ -380,4 +387,4 @@ class BalancersAPI(BaseClient):
             BalancerPresetsResponse: Список тарифов.
         '''
         balancer_presets = self._request('GET', '/presets/balancers')
-        return schemas.BalancerPresetsResponse(**balancer_presets.json())
+        return self._parse(balancer_presets, schemas.BalancerPresetsResponse)
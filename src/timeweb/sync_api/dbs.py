@@ -10,23 +10,30 @@ DBaaS обеспечивает полностью автоматизирован
 import logging
 import warnings
 from datetime import timedelta
+from typing import Iterator
 
 from httpx import Client
 
 from .base import BaseClient
+from .transport import Transport
+from ..utils.cache import cached
 from ..schemas import dbs as schemas
 
 
 class DatabasesAPI(BaseClient):
     '''Клиент для работы с API базами данных Timeweb Cloud'''
 
-    def __init__(self, token: str, client: Client | None = None):
+    def __init__(
+        self, token: str, client: Client | None = None,
+        transport: Transport | None = None
+    ):
         '''Инициализация клиента.
         Args:
             token (str): API токен.
             client (Client | None, optional): HTTPX клиент. Defaults to None.
+            transport (Transport | None, optional): Общий транспорт клиента. Defaults to None.
         '''
-        super().__init__(token, client)
+        super().__init__(token, client, transport)
         self.log = logging.getLogger('timeweb')
 
     def get_databases(self) -> schemas.DBArray:
@@ -37,7 +44,7 @@ class DatabasesAPI(BaseClient):
         dbs = self._request(
             'GET', '/dbs'
         )
-        return schemas.DBArray(**dbs.json())
+        return self._parse(dbs, schemas.DBArray)
 
     def create(
         self,
@@ -82,7 +89,7 @@ class DatabasesAPI(BaseClient):
         db = self._request(
             'POST', '/dbs', json=data
         )
-        return schemas.DatabaseResponse(**db.json())
+        return self._parse(db, schemas.DatabaseResponse)
 
     def get(self, db_id: int) -> schemas.DatabaseResponse:
         '''Получить информацию о базе данных.
@@ -96,7 +103,7 @@ class DatabasesAPI(BaseClient):
         db = self._request(
             'GET', f'/dbs/{db_id}'
         )
-        return schemas.DatabaseResponse(**db.json())
+        return self._parse(db, schemas.DatabaseResponse)
 
     def update(
         self,
@@ -134,7 +141,7 @@ class DatabasesAPI(BaseClient):
         db = self._request(
             'PATCH', f'/dbs/{db_id}', json=data
         )
-        return schemas.DatabaseResponse(**db.json())
+        return self._parse(db, schemas.DatabaseResponse)
 
     def delete(self, db_id: int) -> bool | schemas.DatabaseDelete:
         '''Удалить БД.
@@ -151,7 +158,7 @@ class DatabasesAPI(BaseClient):
         if status.status_code == 204:
             return True
         elif status.status_code == 200:
-            return schemas.DatabaseDelete(**status.json())
+            return self._parse(status, schemas.DatabaseDelete)
         else:
             return False
 
@@ -204,7 +211,27 @@ class DatabasesAPI(BaseClient):
                 'offset': offset
             }
         )
-        return schemas.BackupArray(**backups.json())
+        return self._parse(backups, schemas.BackupArray)
+
+    def iter_backups(
+        self, db_id: int, page_size: int = 100,
+        max_items: int | None = None, prefetch: int = 0
+    ) -> Iterator[schemas.backups.Backup]:
+        '''Перебирает все бэкапы базы данных постранично.
+
+        Args:
+            db_id (int): ID базы данных.
+            page_size (int, optional): Кол-во элементов на странице. Defaults to 100.
+            max_items (int | None, optional): Максимальное кол-во элементов. Defaults to None.
+            prefetch (int, optional): Кол-во страниц, загружаемых параллельно после первой. Defaults to 0.
+
+        Yields:
+            schemas.backups.Backup: Бэкап базы данных.
+        '''
+        return self._paginate(
+            self.get_backups, 'backups', page_size, max_items, prefetch,
+            db_id=db_id
+        )
 
     def create_backup(self, db_id: int) -> schemas.BackupResponse:
         '''Создать бэкап базы данных.
@@ -218,7 +245,7 @@ class DatabasesAPI(BaseClient):
         backup = self._request(
             'POST', f'/dbs/{db_id}/backups'
         )
-        return schemas.BackupResponse(**backup.json())
+        return self._parse(backup, schemas.BackupResponse)
 
     def delete_backup(self, db_id: int, backup_id: int) -> bool:
         '''Удалить бэкап базы данных.
@@ -248,7 +275,7 @@ class DatabasesAPI(BaseClient):
         backup = self._request(
             'GET', f'/dbs/{db_id}/backups/{backup_id}'
         )
-        return schemas.BackupResponse(**backup.json())
+        return self._parse(backup, schemas.BackupResponse)
 
     def recover_from_backup(self, db_id: int, backup_id: int) -> bool:
         '''Восстановить базу данных из бэкапа.
@@ -265,6 +292,7 @@ class DatabasesAPI(BaseClient):
         )
         return True
 
+    @cached
     def get_presets(self) -> schemas.PresetArray:
         '''Получить список пресетов.
 
@@ -274,4 +302,4 @@ class DatabasesAPI(BaseClient):
         presets = self._request(
             'GET', '/presets/dbs'
         )
-        return schemas.PresetArray(**presets.json())
+        return self._parse(presets, schemas.PresetArray)
@@ -12,20 +12,26 @@ import logging
 from httpx import Client
 
 from .base import BaseClient
+from .transport import Transport
+from ..utils.cache import cached
 from ..schemas.servers import dedics as schemas
 
 
 class DedicsAPI(BaseClient):
     '''Клиент для работы с API выделенных серверов.'''
 
-    def __init__(self, token: str, client: Client | None = None):
+    def __init__(
+        self, token: str, client: Client | None = None,
+        transport: Transport | None = None
+    ):
         '''Инициализация клиента.
 
         Args:
             token (str): API токен.
             client (Client | None, optional): HTTPX клиент. Defaults to None.
+            transport (Transport | None, optional): Общий транспорт клиента. Defaults to None.
         '''
-        super().__init__(token, client)
+        super().__init__(token, client, transport)
         self.log = logging.getLogger('timeweb')
 
     def get_dedics(self) -> schemas.DedicatedServers:
@@ -37,7 +43,7 @@ class DedicsAPI(BaseClient):
         dedics = self._request(
             'GET', '/dedicated-servers'
         )
-        return schemas.DedicatedServers(**dedics.json())
+        return self._parse(dedics, schemas.DedicatedServers)
 
     def create(
         self, plan_id: int, preset_id: int, name: str,
@@ -93,7 +99,7 @@ class DedicsAPI(BaseClient):
             'POST', '/dedicated-servers', data=prepared_json,
             headers={'Content-Type': 'application/json'}
         )
-        return schemas.DedicatedServerResponse(**dedic.json())
+        return self._parse(dedic, schemas.DedicatedServerResponse)
 
     def get(self, dedicated_id: int) -> schemas.DedicatedServerResponse:
         '''Получение информации о выделенном сервере.
@@ -107,7 +113,7 @@ class DedicsAPI(BaseClient):
         dedic = self._request(
             'GET', f'/dedicated-servers/{dedicated_id}'
         )
-        return schemas.DedicatedServerResponse(**dedic.json())
+        return self._parse(dedic, schemas.DedicatedServerResponse)
 
     def update(
         self, dedicated_id: int, name: str | None = None,
@@ -138,7 +144,7 @@ class DedicsAPI(BaseClient):
         dedic = self._request(
             'PATCH', f'/dedicated-servers/{dedicated_id}', json=data
         )
-        return schemas.DedicatedServerResponse(**dedic.json())
+        return self._parse(dedic, schemas.DedicatedServerResponse)
 
     def delete(self, dedicated_id: int) -> bool:
         '''Удаление выделенного сервера.
@@ -154,6 +160,7 @@ class DedicsAPI(BaseClient):
         )
         return True
 
+    @cached
     def get_presets(self, location: str | None = None) -> schemas.DedicatedServerPresets:
         '''Получение списка тарифов выделенных серверов.
 
@@ -169,8 +176,9 @@ class DedicsAPI(BaseClient):
         presets = self._request(
             'GET', '/presets/dedicated-servers', params=params
         )
-        return schemas.DedicatedServerPresets(**presets.json())
+        return self._parse(presets, schemas.DedicatedServerPresets)
 
+    @cached
     def get_services(self, preset_id: int) -> schemas.DedicatedServerServices:
         '''Получение списка услуг выделенного сервера.
 
@@ -183,4 +191,4 @@ class DedicsAPI(BaseClient):
         services = self._request(
             'GET', f'/presets/dedicated-servers/{preset_id}/additional-services'
         )
-        return schemas.DedicatedServerServices(**services.json())
+        return self._parse(services, schemas.DedicatedServerServices)
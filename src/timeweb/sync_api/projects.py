@@ -9,6 +9,7 @@ import logging
 from httpx import Client
 
 from .base import BaseClient
+from .transport import Transport
 from ..schemas import projects as schemas
 from ..schemas.servers.cloud import VDSArray
 from ..schemas.balancers import BalancersResponse
@@ -21,13 +22,17 @@ from ..schemas.servers.dedics import DedicatedServers
 class ProjectsAPI(BaseClient):
     '''Клиент для работы с API проектов'''
 
-    def __init__(self, token: str, client: Client | None = None):
+    def __init__(
+        self, token: str, client: Client | None = None,
+        transport: Transport | None = None
+    ):
         '''Инициализация клиента.
         Args:
             token (str): API токен.
             client (Client | None, optional): HTTPX клиент. Defaults to None.
+            transport (Transport | None, optional): Общий транспорт клиента. Defaults to None.
         '''
-        super().__init__(token, client)
+        super().__init__(token, client, transport)
         self.log = logging.getLogger('timeweb')
 
     def get_projects(self) -> schemas.ProjectsResponse:
@@ -39,7 +44,7 @@ class ProjectsAPI(BaseClient):
         projects = self._request(
             'GET', '/projects'
         )
-        return schemas.ProjectsResponse(**projects.json())
+        return self._parse(projects, schemas.ProjectsResponse)
 
     def create_project(
         self, name: str, description: str | None = None,
@@ -74,7 +79,7 @@ class ProjectsAPI(BaseClient):
         new = self._request(
             'POST', '/projects', json=data
         )
-        return schemas.ProjectResponse(**new.json())
+        return self._parse(new, schemas.ProjectResponse)
 
     def get_project(self, project_id: int) -> schemas.ProjectResponse:
         '''Получить проект.
@@ -88,7 +93,7 @@ class ProjectsAPI(BaseClient):
         proj = self._request(
             'GET', f'/projects/{project_id}'
         )
-        return schemas.ProjectResponse(**proj.json())
+        return self._parse(proj, schemas.ProjectResponse)
 
     def delete_project(self, project_id: int) -> bool:
         '''Удалить проект.
@@ -138,7 +143,7 @@ class ProjectsAPI(BaseClient):
         new = self._request(
             'PATCH', f'/projects/{project_id}', json=data
         )
-        return schemas.ProjectResponse(**new.json())
+        return self._parse(new, schemas.ProjectResponse)
 
     def get_project_balancers(self, project_id: int) -> BalancersResponse:
         '''Получить список балансировщиков проекта.
@@ -152,7 +157,7 @@ class ProjectsAPI(BaseClient):
         array = self._request(
             'GET', f'/projects/{project_id}/resources/balancers'
         )
-        return BalancersResponse(**array.json())
+        return self._parse(array, BalancersResponse)
 
     def add_project_balancer(
         self, project_id: int, resource_id: int
@@ -170,7 +175,7 @@ class ProjectsAPI(BaseClient):
             'POST', f'/projects/{project_id}/resources/balancers',
             json={'resource_id': resource_id}
         )
-        return schemas.ResourceResponse(**res.json())
+        return self._parse(res, schemas.ResourceResponse)
 
     def get_project_buckets(self, project_id: int) -> BucketArray:
         '''Получить список хранилищ проекта.
@@ -184,7 +189,7 @@ class ProjectsAPI(BaseClient):
         array = self._request(
             'GET', f'/projects/{project_id}/resources/buckets'
         )
-        return BucketArray(**array.json())
+        return self._parse(array, BucketArray)
 
     def add_project_bucket(
         self, project_id: int, resource_id: int
@@ -202,7 +207,7 @@ class ProjectsAPI(BaseClient):
             'POST', f'/projects/{project_id}/resources/buckets',
             json={'resource_id': resource_id}
         )
-        return schemas.ResourceResponse(**res.json())
+        return self._parse(res, schemas.ResourceResponse)
 
     def get_project_clusters(self, project_id: int) -> ClustersResponse:
         '''Получить список кластеров проекта.
@@ -216,7 +221,7 @@ class ProjectsAPI(BaseClient):
         array = self._request(
             'GET', f'/projects/{project_id}/resources/clusters'
         )
-        return ClustersResponse(**array.json())
+        return self._parse(array, ClustersResponse)
 
     def add_project_cluster(
         self, project_id: int, resource_id: int
@@ -234,7 +239,7 @@ class ProjectsAPI(BaseClient):
             'POST', f'/projects/{project_id}/resources/clusters',
             json={'resource_id': resource_id}
         )
-        return schemas.ResourceResponse(**res.json())
+        return self._parse(res, schemas.ResourceResponse)
 
     def get_project_servers(self, project_id: int) -> VDSArray:
         '''Получить список облачных серверов проекта.
@@ -248,7 +253,7 @@ class ProjectsAPI(BaseClient):
         array = self._request(
             'GET', f'/projects/{project_id}/resources/servers'
         )
-        return VDSArray(**array.json())
+        return self._parse(array, VDSArray)
 
     def add_project_server(
         self, project_id: int, resource_id: int
@@ -266,7 +271,7 @@ class ProjectsAPI(BaseClient):
             'POST', f'/projects/{project_id}/resources/servers',
             json={'resource_id': resource_id}
         )
-        return schemas.ResourceResponse(**res.json())
+        return self._parse(res, schemas.ResourceResponse)
 
     def get_project_dbs(self, project_id: int) -> DBArray:
         '''Получить список баз данных проекта.
@@ -280,7 +285,7 @@ class ProjectsAPI(BaseClient):
         array = self._request(
             'GET', f'/projects/{project_id}/resources/databases'
         )
-        return DBArray(**array.json())
+        return self._parse(array, DBArray)
 
     def add_project_db(
         self, project_id: int, resource_id: int
@@ -298,7 +303,7 @@ class ProjectsAPI(BaseClient):
             'POST', f'/projects/{project_id}/resources/databases',
             json={'resource_id': resource_id}
         )
-        return schemas.ResourceResponse(**res.json())
+        return self._parse(res, schemas.ResourceResponse)
 
     def get_project_dedics(self, project_id: int) -> DedicatedServers:
         '''Получить список выделенных серверов проекта.
@@ -312,7 +317,7 @@ class ProjectsAPI(BaseClient):
         array = self._request(
             'GET', f'/projects/{project_id}/resources/dedicated'
         )
-        return DedicatedServers(**array.json())
+        return self._parse(array, DedicatedServers)
 
     def add_project_dedic(
         self, project_id: int, resource_id: int
@@ -330,7 +335,7 @@ class ProjectsAPI(BaseClient):
             'POST', f'/projects/{project_id}/resources/dedicated',
             json={'resource_id': resource_id}
         )
-        return schemas.ResourceResponse(**res.json())
+        return self._parse(res, schemas.ResourceResponse)
 
     def get_project_resources(self, project_id: int) -> schemas.ResourcesResponse:
         '''Получить ресурсы проекта.
@@ -344,7 +349,7 @@ class ProjectsAPI(BaseClient):
         res = self._request(
             'GET', f'/projects/{project_id}/resources'
         )
-        return schemas.ResourcesResponse(**res.json())
+        return self._parse(res, schemas.ResourcesResponse)
 
     def get_account_balancers(self) -> BalancersResponse:
         '''Получить список балансировщиков аккаунта.
@@ -355,7 +360,7 @@ class ProjectsAPI(BaseClient):
         array = self._request(
             'GET', '/projects/resources/balancers'
         )
-        return BalancersResponse(**array.json())
+        return self._parse(array, BalancersResponse)
 
     def get_account_servers(self) -> VDSArray:
         '''Получить список облачных серверов аккаунта.
@@ -366,7 +371,7 @@ class ProjectsAPI(BaseClient):
         array = self._request(
             'GET', '/projects/resources/servers'
         )
-        return VDSArray(**array.json())
+        return self._parse(array, VDSArray)
 
     def get_account_buckets(self) -> BucketArray:
         '''Получить список хранилищ аккаунта.
@@ -377,7 +382,7 @@ class ProjectsAPI(BaseClient):
         array = self._request(
             'GET', '/projects/resources/buckets'
         )
-        return BucketArray(**array.json())
+        return self._parse(array, BucketArray)
 
     def get_account_clusters(self) -> ClustersResponse:
         '''Получить список кластеров аккаунта.
@@ -388,7 +393,7 @@ class ProjectsAPI(BaseClient):
         array = self._request(
             'GET', '/projects/resources/clusters'
         )
-        return ClustersResponse(**array.json())
+        return self._parse(array, ClustersResponse)
 
     def get_account_dbs(self) -> DBArray:
         '''Получить список баз данных аккаунта.
@@ -399,7 +404,7 @@ class ProjectsAPI(BaseClient):
         array = self._request(
             'GET', '/projects/resources/databases'
         )
-        return DBArray(**array.json())
+        return self._parse(array, DBArray)
 
     def get_account_dedics(self) -> DedicatedServers:
         '''Получить список выделенных серверов аккаунта.
@@ -410,7 +415,7 @@ class ProjectsAPI(BaseClient):
         array = self._request(
             'GET', '/projects/resources/dedicated'
         )
-        return DedicatedServers(**array.json())
+        return self._parse(array, DedicatedServers)
 
     def move_resource(
         self, project_id: int, to_project: int, resource_id: int,
@@ -439,4 +444,4 @@ class ProjectsAPI(BaseClient):
             'PUT', f'/projects/{project_id}/resources/transfer',
             json=data
         )
-        return schemas.ResourceResponse(**res.json())
+        return self._parse(res, schemas.ResourceResponse)
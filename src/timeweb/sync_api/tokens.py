@@ -12,19 +12,24 @@ from datetime import datetime
 from httpx import Client
 
 from .base import BaseClient
+from .transport import Transport
 from ..schemas import tokens as schemas
 
 
 class TokensAPI(BaseClient):
     '''Клиент для работы с API токенами Timeweb Cloud'''
 
-    def __init__(self, token: str, client: Client | None = None):
+    def __init__(
+        self, token: str, client: Client | None = None,
+        transport: Transport | None = None
+    ):
         '''Инициализация клиента.
         Args:
             token (str): API токен.
             client (Client | None, optional): HTTPX клиент. Defaults to None.
+            transport (Transport | None, optional): Общий транспорт клиента. Defaults to None.
         '''
-        super().__init__(token, client)
+        super().__init__(token, client, transport)
         self.log = logging.getLogger('timeweb')
 
     def get_tokens(self) -> schemas.APIKeysResponse:
@@ -34,7 +39,7 @@ class TokensAPI(BaseClient):
             schemas.APIKeysResponse: Список API токенов.
         '''
         keys = self._request('GET', '/auth/api-keys')
-        return schemas.APIKeysResponse(**keys.json())
+        return self._parse(keys, schemas.APIKeysResponse)
 
     def create(self, name: str, expire: datetime | str) -> schemas.CreateAPIKeyResponse:
         '''Создание API токена.
@@ -54,7 +59,7 @@ class TokensAPI(BaseClient):
         else:
             data['expire'] = expire
         key = self._request('POST', '/auth/api-keys', json=data)
-        return schemas.CreateAPIKeyResponse(**key.json())
+        return self._parse(key, schemas.CreateAPIKeyResponse)
 
     def rename(self, token_id: UUID | str, name: str) -> schemas.APIKeyResponse:
         '''Переименование API токена.
@@ -69,7 +74,7 @@ class TokensAPI(BaseClient):
         key = self._request('PATCH', f'/auth/api-keys/{token_id}', json={
             'name': name,
         })
-        return schemas.APIKeyResponse(**key.json())
+        return self._parse(key, schemas.APIKeyResponse)
 
     def reissue(
         self, token_id: UUID | str, expire: datetime | str | None = None
@@ -90,7 +95,7 @@ class TokensAPI(BaseClient):
             else:
                 data['expire'] = expire
         key = self._request('PUT', f'/auth/api-keys/{token_id}', json=data)
-        return schemas.CreateAPIKeyResponse(**key.json())
+        return self._parse(key, schemas.CreateAPIKeyResponse)
 
     def delete(self, token_id: UUID | str) -> Literal[True]:
         '''Удаление API токена.
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+'''Общий транспорт для синхронной работы с Timeweb Cloud API.
+
+Транспорт владеет единственным пулом HTTP соединений, которым пользуются все `*API` одного клиента `Timeweb`.'''
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+from ..__meta import __version__
+
+if TYPE_CHECKING:
+    from httpx import Client, BaseTransport, Limits
+    from ..utils.retry import RetryPolicy
+    from ..utils.decoder import JSONDecoder
+    from ..utils.ratelimit import RateLimiter
+    from ..utils.cache import TTLCache, SQLiteCache
+    from ..utils.conditional import ConditionalCache
+    from ..utils.metrics import Metrics
+    from ..utils.tracing import Tracer
+    from ..utils.singleflight import SingleFlight
+
+
+#: Параметры `httpx.Limits` пула соединений по умолчанию.
+DEFAULT_LIMITS = {
+    'max_connections': 100,
+    'max_keepalive_connections': 20,
+    'keepalive_expiry': 30
+}
+
+
+class Transport:
+    '''Общий транспорт для синхронных клиентов Timeweb Cloud API.'''
+    BASE_URL = 'https://api.timeweb.cloud/api/v1/'
+
+    def __init__(
+        self, token: str, client: 'Client | None' = None,
+        limits: 'Limits | None' = None, http2: bool = False,
+        timeout: float = 30, retry: 'RetryPolicy | None' = None,
+        rate_limiter: 'RateLimiter | None' = None,
+        cache: 'TTLCache | None' = None,
+        disk_cache: 'SQLiteCache | None' = None,
+        conditional: 'ConditionalCache | None' = None,
+        singleflight: 'SingleFlight | None' = None,
+        json_loads: 'JSONDecoder | str | None' = None,
+        validate: bool = True, raw: bool = False,
+        lazy: bool = False, http_transport: 'BaseTransport | None' = None,
+        metrics: 'Metrics | bool' = True, tracer: 'Tracer | None' = None
+    ):
+        '''Инициализация транспорта.
+
+        Args:
+            token (str): API токен.
+            client (Client | None, optional): HTTPX клиент. Если указан, то транспорт не будет его закрывать. Defaults to None.
+            limits (Limits | None, optional): Лимиты пула соединений. Defaults to None.
+            http2 (bool, optional): Использовать HTTP/2, требует пакет `h2`. Defaults to False.
+            timeout (float, optional): Таймаут запросов в секундах. Defaults to 30.
+            retry (RetryPolicy | None, optional): Политика повторных запросов. Defaults to RetryPolicy().
+            rate_limiter (RateLimiter | None, optional): Ограничитель частоты запросов, общий для всех API клиента. Defaults to None.
+            cache (TTLCache | None, optional): Кэш ответов справочных эндпоинтов. Defaults to None.
+            disk_cache (SQLiteCache | None, optional): Постоянный кэш справочников на диске. Defaults to None.
+            conditional (ConditionalCache | None, optional): Хранилище валидаторов для условных GET запросов. Defaults to None.
+            singleflight (SingleFlight | None, optional): Объединение одинаковых одновременных GET запросов. Defaults to None.
+            json_loads (JSONDecoder | str | None, optional): Функция декодирования JSON из bytes или имя декодера (`orjson`, `ujson`, `json`). По умолчанию самый быстрый из установленных. Defaults to None.
+            validate (bool, optional): Валидировать ответы API. Если False, то модели собираются без проверки и приведения типов. Defaults to True.
+            raw (bool, optional): Возвращать декодированный JSON вместо моделей, см. `timeweb.typed`. Defaults to False.
+            lazy (bool, optional): Создавать элементы списков моделей в ответах только при обращении к ним, см. `timeweb.utils.lazy.LazyList`. Defaults to False.
+            http_transport (BaseTransport | None, optional): Транспорт HTTPX для создаваемого клиента, например `Cassette.recorder()` или `Cassette.player()`. Лимиты пула и HTTP/2 в этом случае задаются в нём. Defaults to None.
+            metrics (Metrics | bool, optional): Сборщик метрик запросов, см. `timeweb.utils.metrics`. True - собственный сборщик транспорта, False - без метрик. Defaults to True.
+            tracer (Tracer | None, optional): Трассировщик с API `opentelemetry.trace.Tracer`, например `trace.get_tracer('timeweb')` или `RecordingTracer`, см. `timeweb.utils.tracing`. Defaults to None.
+        '''
+        self.log = logging.getLogger('timeweb')
+        self.token = token
+        self._retry = retry
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.disk_cache = disk_cache
+        self.conditional = conditional
+        self.singleflight = singleflight
+        self._json_loads = json_loads
+        self.validate = validate
+        self.raw = raw
+        self.lazy = lazy
+        self._metrics = metrics
+        self.tracer = tracer
+        self._owns_client = client is None
+        self._client = client
+        self._limits = limits
+        self._http2 = http2
+        self._timeout = timeout
+        self._http_transport = http_transport
+        self._lock = threading.Lock()
+
+    @property
+    def retry(self) -> 'RetryPolicy':
+        '''Политика повторных запросов, политика по умолчанию создаётся при первом обращении.'''
+        if self._retry is None:
+            from ..utils.retry import RetryPolicy
+            self._retry = RetryPolicy()
+        return self._retry
+
+    @retry.setter
+    def retry(self, retry: 'RetryPolicy | None') -> None:
+        self._retry = retry
+
+    @property
+    def json_loads(self) -> 'JSONDecoder':
+        '''Функция декодирования JSON, выбирается при первом обращении.'''
+        if not callable(self._json_loads):
+            from ..utils.decoder import get_decoder
+            self._json_loads = get_decoder(self._json_loads)
+        return self._json_loads
+
+    @property
+    def metrics(self) -> 'Metrics | None':
+        '''Сборщик метрик запросов, собственный сборщик создаётся при первом обращении.'''
+        if self._metrics is True:
+            with self._lock:
+                if self._metrics is True:
+                    from ..utils.metrics import Metrics
+                    self._metrics = Metrics()
+        return self._metrics or None
+
+    @property
+    def client(self) -> 'Client':
+        '''HTTPX клиент, создаётся при первом обращении.'''
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    from httpx import Client, Limits, Timeout
+                    self._client = Client(
+                        headers={
+                            'User-Agent': f'timeweb-cloud/{__version__}',
+                            'Authorization': f'Bearer {self.token}',
+                            'Accept': 'application/json'
+                        },
+                        base_url=self.BASE_URL,
+                        timeout=Timeout(self._timeout),
+                        limits=self._limits or Limits(**DEFAULT_LIMITS),
+                        http2=self._http2,
+                        transport=self._http_transport
+                    )
+        return self._client
+
+    @property
+    def is_closed(self) -> bool:
+        '''Транспорт закрыт?'''
+        return self._client is not None and self._client.is_closed
+
+    def close(self) -> None:
+        '''Закрывает пул соединений, если транспорт его создал.'''
+        if self._owns_client and self._client is not None and not self._client.is_closed:
+            self.client.close()
+
+    def __enter__(self) -> 'Transport':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
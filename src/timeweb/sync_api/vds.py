@@ -11,10 +11,13 @@ import logging
 import warnings
 from datetime import datetime, date, timedelta
 from ipaddress import IPv4Address, IPv6Address
+from typing import Iterator
 
 from httpx import Client
 
 from .base import BaseClient
+from .transport import Transport
+from ..utils.cache import cached
 from ..schemas.servers import cloud as schemas
 
 
@@ -24,14 +27,18 @@ IPAddress = IPv4Address | IPv6Address
 class VDSAPI(BaseClient):
     '''Клиент для работы с API облачных серверов.'''
 
-    def __init__(self, token: str, client: Client | None = None):
+    def __init__(
+        self, token: str, client: Client | None = None,
+        transport: Transport | None = None
+    ):
         '''Инициализация клиента.
 
         Args:
             token (str): API токен.
             client (Client | None, optional): HTTPX клиент. Defaults to None.
+            transport (Transport | None, optional): Общий транспорт клиента. Defaults to None.
         '''
-        super().__init__(token, client)
+        super().__init__(token, client, transport)
         self.log = logging.getLogger('timeweb')
 
     def get_all(self, limit: int = 100, offset: int = 0) -> schemas.VDSArray:
@@ -44,11 +51,53 @@ class VDSAPI(BaseClient):
         Returns:
             schemas.VDSArray: Список облачных серверов.
         '''
+        params = {
+            'limit': limit,
+            'offset': offset
+        }
         vds = self._request(
-            'GET', '/servers'
+            'GET', '/servers', params=params
+        )
+        return self._parse(vds, schemas.VDSArray)
+
+    def iter_servers(
+        self, page_size: int = 100, max_items: int | None = None,
+        prefetch: int = 0
+    ) -> Iterator[schemas.VDS]:
+        '''Перебирает все облачные серверы постранично.
+
+        Args:
+            page_size (int, optional): Кол-во элементов на странице. Defaults to 100.
+            max_items (int | None, optional): Максимальное кол-во элементов. Defaults to None.
+            prefetch (int, optional): Кол-во страниц, загружаемых параллельно после первой. Defaults to 0.
+
+        Yields:
+            schemas.VDS: Облачный сервер.
+        '''
+        return self._paginate(
+            self.get_all, 'servers', page_size, max_items, prefetch
         )
-        vds.raise_for_status()
-        return schemas.VDSArray(**vds.json())
+
+    def stream_servers(
+        self, limit: int = 100, offset: int = 0
+    ) -> Iterator[schemas.VDS]:
+        '''Перебирает облачные серверы из одного ответа по мере его загрузки.
+
+        В отличие от `get_all` серверы отдаются до получения всего ответа,
+        поэтому имеет смысл указывать большой `limit`.
+
+        Args:
+            limit (int, optional): Лимит выдачи. Defaults to 100.
+            offset (int, optional): Смещение. Defaults to 0.
+
+        Yields:
+            schemas.VDS: Облачный сервер.
+        '''
+        params = {
+            'limit': limit,
+            'offset': offset
+        }
+        return self._stream('/servers', 'servers', schemas.VDS, params=params)
 
     def get(self, server_id: int) -> schemas.VDSResponse:
         '''Возвращает сервер.
@@ -62,7 +111,7 @@ class VDSAPI(BaseClient):
         vds = self._request(
             'GET', f'/servers/{server_id}'
         )
-        return schemas.VDSResponse(**vds.json())
+        return self._parse(vds, schemas.VDSResponse)
 
     def delete(self, server_id: int) -> bool | schemas.VDSDelete:
         '''Удалить облачный сервер.
@@ -79,7 +128,7 @@ class VDSAPI(BaseClient):
         if status.status_code == 204:
             return True
         elif status.status_code == 200:
-            return schemas.VDSDelete(**status.json())
+            return self._parse(status, schemas.VDSDelete)
         else:
             return False
 
@@ -193,7 +242,7 @@ class VDSAPI(BaseClient):
         created_vds = self._request(
             'POST', '/servers', json=server_param
         )
-        return schemas.VDSResponse(**created_vds.json())
+        return self._parse(created_vds, schemas.VDSResponse)
 
     def update(
         self, server_id: int, name: str | None = None,
@@ -262,7 +311,7 @@ class VDSAPI(BaseClient):
             'PATCH', f'/servers/{server_id}',
             json=server_param
         )
-        return schemas.VDSResponse(**updated_vds.json())
+        return self._parse(updated_vds, schemas.VDSResponse)
 
     def make_action(self, server_id: int, action: str) -> bool:
         '''Выполнить действие над сервером.
@@ -295,7 +344,7 @@ class VDSAPI(BaseClient):
         server = self._request(
             'POST', f'/servers/{server_id}/clone'
         )
-        return schemas.VDS(**server.json())
+        return self._parse(server, schemas.VDS)
 
     def get_statistics(
         self, server_id: int, date_from: datetime | str, date_to: datetime | str
@@ -321,8 +370,9 @@ class VDSAPI(BaseClient):
         stats = self._request(
             'GET', f'/servers/{server_id}/statistics'
         )
-        return schemas.StatsResponse(**stats.json())
+        return self._parse(stats, schemas.StatsResponse)
 
+    @cached
     def get_os_list(self) -> schemas.ServersOSResponse:
         '''Получить список всех операционных систем.
 
@@ -332,8 +382,9 @@ class VDSAPI(BaseClient):
         os_array = self._request(
             'GET', '/os/servers'
         )
-        return schemas.ServersOSResponse(**os_array.json())
+        return self._parse(os_array, schemas.ServersOSResponse)
 
+    @cached
     def get_presets(self) -> schemas.CloudPresetsResponse:
         '''Получить список всех тарифов.
 
@@ -343,8 +394,9 @@ class VDSAPI(BaseClient):
         presets = self._request(
             'GET', '/presets/servers'
         )
-        return schemas.CloudPresetsResponse(**presets.json())
+        return self._parse(presets, schemas.CloudPresetsResponse)
 
+    @cached
     def get_configurators(self) -> schemas.ServerConfiguratorsResponse:
         '''Получить список всеъ конфигураторов серверов.
 
@@ -354,8 +406,9 @@ class VDSAPI(BaseClient):
         confs = self._request(
             'GET', '/configurator/servers'
         )
-        return schemas.ServerConfiguratorsResponse(**confs.json())
+        return self._parse(confs, schemas.ServerConfiguratorsResponse)
 
+    @cached
     def get_softwares(self) -> schemas.ServersSoftwareResponse:
         '''Получить список ПО из маркетплейса.
 
@@ -365,7 +418,7 @@ class VDSAPI(BaseClient):
         softwares = self._request(
             'GET', '/software/servers'
         )
-        return schemas.ServersSoftwareResponse(**softwares.json())
+        return self._parse(softwares, schemas.ServersSoftwareResponse)
 
     def set_boot_mode(self, server_id: int, boot_mode: str) -> bool:
         '''Установка типа загрузки ОС сервера.
@@ -418,7 +471,7 @@ class VDSAPI(BaseClient):
         ips = self._request(
             'GET', f'/servers/{server_id}/ips'
         )
-        return schemas.ServerIPsResponse(**ips.json())
+        return self._parse(ips, schemas.ServerIPsResponse)
 
     def add_server_ip(self, server_id: int, type: str, ptr: str) -> schemas.ServerIPResponse:
         '''Добавление IP-адреса сервера.
@@ -435,7 +488,7 @@ class VDSAPI(BaseClient):
             'POST', f'/servers/{server_id}/ips',
             json={'type': type, 'ptr': ptr}
         )
-        return schemas.ServerIPResponse(**new_ip.json())
+        return self._parse(new_ip, schemas.ServerIPResponse)
 
     def delete_server_ip(self, server_id: int, ip: IPAddress | str) -> bool:
         '''Удаление IP-адреса сервера.
@@ -470,7 +523,7 @@ class VDSAPI(BaseClient):
             'PATCH', f'/servers/{server_id}/ips',
             json={'ip': ip, 'ptr': ptr}
         )
-        return schemas.ServerIPResponse(**updated_ip.json())
+        return self._parse(updated_ip, schemas.ServerIPResponse)
 
     def get_logs(
         self, server_id: int, limit: int = 100,
@@ -496,7 +549,28 @@ class VDSAPI(BaseClient):
             'GET', f'/servers/{server_id}/logs',
             params=params
         )
-        return schemas.ServerLogsResponse(**logs.json())
+        return self._parse(logs, schemas.ServerLogsResponse)
+
+    def iter_logs(
+        self, server_id: int, order: str = 'asc', page_size: int = 100,
+        max_items: int | None = None, prefetch: int = 0
+    ) -> Iterator[schemas.logs.ServerLog]:
+        '''Перебирает все логи сервера постранично.
+
+        Args:
+            server_id (int): UID сервера.
+            order (str, optional): Сортировка по дате. Defaults to asc.
+            page_size (int, optional): Кол-во элементов на странице. Defaults to 100.
+            max_items (int | None, optional): Максимальное кол-во элементов. Defaults to None.
+            prefetch (int, optional): Кол-во страниц, загружаемых параллельно после первой. Defaults to 0.
+
+        Yields:
+            schemas.logs.ServerLog: Запись лога.
+        '''
+        return self._paginate(
+            self.get_logs, 'server_logs', page_size, max_items, prefetch,
+            server_id=server_id, order=order
+        )
 
     def get_server_disks(self, server_id: int) -> schemas.ServerDisksResponse:
         '''Получить список дисков сервера.
@@ -510,7 +584,7 @@ class VDSAPI(BaseClient):
         disks = self._request(
             'GET', f'/servers/{server_id}/disks'
         )
-        return schemas.ServerDisksResponse(**disks.json())
+        return self._parse(disks, schemas.ServerDisksResponse)
 
     def create_server_disk(self, server_id: int, size: int) -> schemas.ServerDiskResponse:
         '''Создать диск сервера.
@@ -528,7 +602,7 @@ class VDSAPI(BaseClient):
             'POST', f'/servers/{server_id}/disks',
             json={'size': size}
         )
-        return schemas.ServerDiskResponse(**disk.json())
+        return self._parse(disk, schemas.ServerDiskResponse)
 
     def get_server_disk(self, server_id: int, disk_id: int) -> schemas.ServerDiskResponse:
         '''Получить диск сервера.
@@ -543,7 +617,7 @@ class VDSAPI(BaseClient):
         disk = self._request(
             'GET', f'/servers/{server_id}/disks/{disk_id}'
         )
-        return schemas.ServerDiskResponse(disk.json())
+        return self._parse(disk, schemas.ServerDiskResponse)
 
     def update_server_disk(
         self, server_id: int, disk_id: int, size: int
@@ -564,7 +638,7 @@ class VDSAPI(BaseClient):
             'PATCH', f'/servers/{server_id}/disks/{disk_id}',
             json={'size': size}
         )
-        return schemas.ServerDiskResponse(**disk.json())
+        return self._parse(disk, schemas.ServerDiskResponse)
 
     def delete_server_disk(self, server_id: int, disk_id: int) -> bool:
         '''Удалить сервер диска.
@@ -596,7 +670,7 @@ class VDSAPI(BaseClient):
         settings = self._request(
             'GET', f'/servers/{server_id}/disks/{disk_id}/auto-backups'
         )
-        return schemas.AutoBackupsResponse(**settings.json())
+        return self._parse(settings, schemas.AutoBackupsResponse)
 
     def change_autobackup_settings(
         self, server_id: int, disk_id: int, is_enabled: bool,
@@ -657,7 +731,7 @@ class VDSAPI(BaseClient):
             'PATCH', f'/servers/{server_id}/disks/{disk_id}/auto-backups',
             json=data
         )
-        return schemas.AutoBackupsResponse(**settings.json())
+        return self._parse(settings, schemas.AutoBackupsResponse)
 
     def make_server_disk_backup(
         self, server_id: int, disk_id: int, comment: str | None = None
@@ -676,7 +750,7 @@ class VDSAPI(BaseClient):
             'POST', f'/servers/{server_id}/disks/{disk_id}/backups',
             json={'comment': comment} if comment else {}
         )
-        return schemas.BackupResponse(**backup.json())
+        return self._parse(backup, schemas.BackupResponse)
 
     def get_server_disk_backups(
         self, server_id: int, disk_id: int
@@ -693,7 +767,7 @@ class VDSAPI(BaseClient):
         backups = self._request(
             'GET', f'/servers/{server_id}/disks/{disk_id}/backups'
         )
-        return schemas.BackupsResponse(**backups.json())
+        return self._parse(backups, schemas.BackupsResponse)
 
     def change_server_disk_backup(
         self, server_id: int, disk_id: int, backup_id: int, comment: str
@@ -713,7 +787,7 @@ class VDSAPI(BaseClient):
             'PATCH', f'/servers/{server_id}/disks/{disk_id}/backups/{backup_id}',
             json={'comment': comment}
         )
-        return schemas.BackupResponse(**backup.json)
+        return self._parse(backup, schemas.BackupResponse)
 
     def delete_server_disk_backup(
         self, server_id: int, disk_id: int, backup_id: int
@@ -749,7 +823,7 @@ class VDSAPI(BaseClient):
         backup = self._request(
             'GET', f'/servers/{server_id}/disks/{disk_id}/backups/{backup_id}'
         )
-        return schemas.BackupResponse(**backup.json())
+        return self._parse(backup, schemas.BackupResponse)
 
     def make_server_disk_backup_action(
         self, server_id: int, disk_id: int, backup_id: int, action: str
@@ -772,4 +846,4 @@ class VDSAPI(BaseClient):
             'POST', f'/servers/{server_id}/disks/{disk_id}/backups/{backup_id}',
             json={'action': action}
         )
-        return backup.json()
+        return self._decode(backup)
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+# Сгенерировано schemas_to_typeddict.py, не редактируйте вручную.
+'''TypedDict для ответов `timeweb.schemas.account` в режиме `raw`.'''
+from __future__ import annotations
+
+from typing import Any, Literal, TypedDict
+
+
+class AccountAccess(TypedDict, total=False):
+    '''Информация о ограничениях авторизации пользователя.'''
+    response_id: str | None
+    is_ip_restrictions_enabled: bool
+    is_country_restrictions_enabled: bool
+    white_list: WhiteList
+
+
+class WhiteList(TypedDict, total=False):
+    '''Список разрешенных IP адресов и стран.'''
+    ips: list[str]
+    countries: list[str]
+
+
+class AccessCountries(TypedDict, total=False):
+    '''Список доступных стран.'''
+    response_id: str | None
+    countries: dict[str, str]
+
+
+class AddAccessCountries(TypedDict, total=False):
+    '''Список добавленных стран.'''
+    response_id: str | None
+    countries: list[AddedCountries]
+
+
+class AddedCountries(TypedDict, total=False):
+    '''Статус добавленния страны.'''
+    value: str
+    status: Literal['success', 'conflict']
+
+
+class RemoveAccessCountries(TypedDict, total=False):
+    '''Список удаленных стран.'''
+    response_id: str | None
+    countries: list[RemovedCountries]
+
+
+class RemovedCountries(TypedDict, total=False):
+    '''Статус удаления страны.'''
+    value: str
+    status: Literal['success', 'conflict']
+
+
+class RestrictionsStatus(TypedDict, total=False):
+    '''RestrictionsStatus'''
+    is_enabled: bool
+
+
+class AccountFinances(TypedDict, total=False):
+    '''Платежная информация'''
+    response_id: str | None
+    finances: Finances
+
+
+class Finances(TypedDict, total=False):
+    '''Платежная информация'''
+    balance: float
+    currency: str
+    discount_end_date_at: str | None
+    discount_percent: int
+    hourly_cost: float
+    hourly_fee: float
+    monthly_cost: float
+    monthly_fee: float
+    total_paid: int
+    hours_left: int | None
+    autopay_card_info: str | None
+
+
+class AddIP(TypedDict, total=False):
+    '''Список добавленных IP адресов.'''
+    response_id: str | None
+    ips: list[AddedIP]
+
+
+class AddedIP(TypedDict, total=False):
+    '''Статус добавленного IP адреса.'''
+    value: str
+    status: Literal['success', 'conflict']
+
+
+class RemoveIP(TypedDict, total=False):
+    '''Список удаленных IP адресов.'''
+    response_id: str | None
+    ips: list[RemovedIP]
+
+
+class RemovedIP(TypedDict, total=False):
+    '''Статус удаленного IP адреса.'''
+    value: str
+    status: Literal['success', 'not_found']
+
+
+class AccountStatus(TypedDict, total=False):
+    '''Статус аккаунта.'''
+    response_id: str | None
+    status: Status
+
+
+class CompanyInfo(TypedDict, total=False):
+    '''Информация о компании.'''
+    id: int
+    name: str
+
+
+class Status(TypedDict, total=False):
+    '''Статус аккаунта.'''
+    is_blocked: bool
+    is_permanent_blocked: bool
+    is_send_bill_letters: bool
+    company_info: CompanyInfo
+    last_password_changed_at: str
+    ym_client_id: str | None
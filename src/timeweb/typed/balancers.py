@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+# Сгенерировано schemas_to_typeddict.py, не редактируйте вручную.
+'''TypedDict для ответов `timeweb.schemas.balancers` в режиме `raw`.'''
+from __future__ import annotations
+
+from typing import Any, Literal, TypedDict
+
+from .base import BaseDelete, BaseMeta
+
+
+class Balancer(TypedDict, total=False):
+    '''Балансировщик'''
+    id: int
+    algo: Literal['roundrobin', 'leastconn']
+    created_at: str
+    fall: int
+    inter: int
+    ip: str | None
+    local_ip: str | None
+    is_keepalive: bool
+    name: str
+    path: str
+    proto: Literal['http2', 'http', 'https', 'tcp']
+    rise: int
+    preset_id: int
+    is_ssl: bool
+    status: Literal['started', 'stoped', 'starting', 'no_paid']
+    is_sticky: bool
+    timeout: int
+    is_use_proxy: bool
+    ips: list[str]
+    rules: list[BalancerRule]
+
+
+class BalancerDelete(TypedDict, total=False):
+    '''Ответ с хэшом для подтверждения удаления балансировщика'''
+    response_id: str | None
+    balancer_delete: BaseDelete
+
+
+class BalancerIPsResponse(TypedDict, total=False):
+    '''Ответ со списком IP адресов балансировщика'''
+    response_id: str | None
+    meta: BaseMeta | None
+    ips: list[str]
+
+
+class BalancerResponse(TypedDict, total=False):
+    '''Ответ с балансировщиком'''
+    response_id: str | None
+    balancer: Balancer
+
+
+class BalancerRule(TypedDict, total=False):
+    '''Правило балансировщика'''
+    id: int
+    balancer_proto: Literal['http2', 'http', 'https', 'tcp']
+    balancer_port: int
+    server_proto: Literal['http2', 'http', 'https', 'tcp']
+    server_port: int
+
+
+class BalancerRuleResponse(TypedDict, total=False):
+    '''Ответ с правилом балансировщика'''
+    response_id: str | None
+    rule: BalancerRule
+
+
+class BalancerRulesResponse(TypedDict, total=False):
+    '''Ответ со списком правил балансировщика'''
+    response_id: str | None
+    meta: BaseMeta | None
+    rules: list[BalancerRule]
+
+
+class BalancersResponse(TypedDict, total=False):
+    '''Ответ со списком балансировщиков'''
+    response_id: str | None
+    meta: BaseMeta | None
+    balancers: list[Balancer]
+
+
+class BalancerPreset(TypedDict, total=False):
+    '''Тариф балансировщика'''
+    id: int
+    description: str
+    description_short: str
+    bandwidth: int
+    replica_count: int
+    request_per_second: str
+    price: float
+    location: str
+
+
+class BalancerPresetsResponse(TypedDict, total=False):
+    '''Список тарифов балансировщиков'''
+    response_id: str | None
+    meta: BaseMeta | None
+    balancers_presets: list[BalancerPreset]
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+# Сгенерировано schemas_to_typeddict.py, не редактируйте вручную.
+'''TypedDict для ответов `timeweb.schemas.base` в режиме `raw`.'''
+from __future__ import annotations
+
+from typing import Any, Literal, TypedDict
+
+
+class BaseData(TypedDict, total=False):
+    '''Базовая модель данных'''
+    pass
+
+
+class BaseDelete(TypedDict, total=False):
+    '''Модель с хэшом для удаления объекта.'''
+    hash: str
+
+
+class BaseMeta(TypedDict, total=False):
+    '''Базовая модель мета-данных.'''
+    total: int | None
+
+
+class BaseResponse(TypedDict, total=False):
+    '''Базовая модель ответа'''
+    response_id: str | None
+
+
+class ResponseWithMeta(TypedDict, total=False):
+    '''Модель ответа с мета-данными.'''
+    response_id: str | None
+    meta: BaseMeta | None
+
+
+class BaseError(TypedDict, total=False):
+    '''Базовая модель ошибки.'''
+    response_id: str | None
+    status_code: int
+    error_code: str
+    message: str | list[str] | None
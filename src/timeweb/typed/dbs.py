@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+# Сгенерировано schemas_to_typeddict.py, не редактируйте вручную.
+'''TypedDict для ответов `timeweb.schemas.dbs` в режиме `raw`.'''
+from __future__ import annotations
+
+from typing import Any, Literal, TypedDict
+
+from .base import BaseDelete, BaseMeta
+
+
+class Backup(TypedDict, total=False):
+    '''Бэкап базы данных'''
+    id: int
+    name: str
+    comment: str | None
+    created_at: str
+    status: Literal['precreate', 'delete', 'shutdown', 'recover', 'create', 'fail', 'done']
+    size: int
+    type: Literal['manual', 'auto']
+
+
+class BackupArray(TypedDict, total=False):
+    '''Массив бэкапов'''
+    response_id: str | None
+    meta: BaseMeta | None
+    backups: list[Backup]
+
+
+class BackupResponse(TypedDict, total=False):
+    '''Бэкап'''
+    response_id: str | None
+    backup: Backup
+
+
+class DBArray(TypedDict, total=False):
+    '''Ответ со списком баз данных.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    dbs: list[Database]
+
+
+class DBConfigParameters(TypedDict, total=False):
+    '''Параметры конфигурации Базы данных'''
+    auto_increment_increment: str | None
+    auto_increment_offset: str | None
+    innodb_io_capacity: str | None
+    innodb_read_io_threads: str | None
+    innodb_write_io_threads: str | None
+    join_buffer_size: str | None
+    max_allowed_packet: str | None
+    max_heap_table_size: str | None
+    autovacuum_analyze_scale_factor: str | None
+    bgwriter_delay: str | None
+    bgwriter_lru_maxpages: str | None
+    deadlock_timeout: str | None
+    gin_pending_list_limit: str | None
+    idle_in_transaction_session_timeout: str | None
+    idle_session_timeout: str | None
+    join_collapse_limit: str | None
+    lock_timeout: str | None
+    max_prepared_transactions: str | None
+
+
+class DBDiskStats(TypedDict, total=False):
+    '''Статистика диска'''
+    size: int
+    used: int
+
+
+class Database(TypedDict, total=False):
+    '''Модель базы данных'''
+    id: int
+    created_at: str
+    account_id: str
+    login: str
+    password: str
+    name: str
+    host: str
+    type: Literal['mysql', 'mysql5', 'postgresql', 'redis', 'mongodb']
+    hash_type: Literal['caching_sha2', 'mysql_native']
+    port: int
+    ip: str | None
+    local_ip: str | None
+    status: Literal['started', 'starting', 'stoped', 'no_paid']
+    preset_id: int
+    dist_stats: DBDiskStats | None
+    config_parameters: DBConfigParameters
+    is_only_local_ip_access: bool
+
+
+class DatabaseDelete(TypedDict, total=False):
+    '''Ответ с хэшом для подтверждения удаления БД'''
+    response_id: str | None
+    database_delete: BaseDelete
+
+
+class DatabaseResponse(TypedDict, total=False):
+    '''Ответ с базой данных.'''
+    response_id: str | None
+    db: Database
+
+
+class Preset(TypedDict, total=False):
+    '''Тариф базы данных'''
+    id: int
+    description: str
+    description_short: str
+    cpu: int
+    ram: int
+    disk: int
+    type: Literal['mysql', 'mysql5', 'postgresql', 'redis', 'mongodb']
+    price: float
+    location: str
+
+
+class PresetArray(TypedDict, total=False):
+    '''Массив тарифов'''
+    response_id: str | None
+    meta: BaseMeta | None
+    databases_presets: list[Preset]
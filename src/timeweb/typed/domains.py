@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+# Сгенерировано schemas_to_typeddict.py, не редактируйте вручную.
+'''TypedDict для ответов `timeweb.schemas.domains` в режиме `raw`.'''
+from __future__ import annotations
+
+from typing import Any, Literal, TypedDict
+
+from .base import BaseMeta
+
+
+class DNSData(TypedDict, total=False):
+    '''Модель DNS данных'''
+    value: str
+    priority: int | None
+    subdomain: str | None
+
+
+class DNSRecord(TypedDict, total=False):
+    '''Модель DNS записи'''
+    type: str
+    data: DNSData
+    id: int | None
+
+
+class DNSRecordResponse(TypedDict, total=False):
+    '''Ответ с DNS записью'''
+    response_id: str | None
+    dns_record: DNSRecord
+
+
+class DNSRecordsResponse(TypedDict, total=False):
+    '''Ответ со списком DNS записей'''
+    response_id: str | None
+    meta: BaseMeta | None
+    dns_records: list[DNSRecord]
+
+
+class Domain(TypedDict, total=False):
+    '''Модель данных домена.'''
+    days_left: int
+    allowed_buy_periods: list[DomainAllowedBuyPeriods]
+    domain_status: str
+    expiration: str
+    fqdn: str
+    id: int
+    is_autoprolong_enabled: bool | None
+    is_premium: bool
+    is_prolong_allowed: bool
+    is_technical: bool
+    is_whois_privacy_enabled: bool | None
+    linked_ip: str | None
+    paid_till: str | None
+    person_id: int | None
+    premium_prolong_cost: float | None
+    provider: str | None
+    request_status: str | None
+    tld_id: int | None
+    subdomains: list[Subdomain]
+
+
+class DomainAllowedBuyPeriods(TypedDict, total=False):
+    '''Модель допустимых периодов продления доменов.'''
+    period: str
+    price: float
+
+
+class DomainAvailability(TypedDict, total=False):
+    '''Ответ с информацией о доступности домена для регистрации.'''
+    response_id: str | None
+    is_domain_available: bool
+
+
+class DomainResponse(TypedDict, total=False):
+    '''Ответ с доменом.'''
+    response_id: str | None
+    domain: Domain
+
+
+class DomainsResponse(TypedDict, total=False):
+    '''Ответ со списком доменов.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    domains: list[Domain]
+
+
+class Subdomain(TypedDict, total=False):
+    '''Модель данных поддомена.'''
+    fqdn: str
+    id: int
+    linked_ip: str | None
+
+
+class SubdomainResponse(TypedDict, total=False):
+    '''Ответ с поддоменом.'''
+    response_id: str | None
+    subdomain: Subdomain
+
+
+class NameServer(TypedDict, total=False):
+    '''Модель данных Name-сервера.'''
+    is_delegation_allowed: bool
+    items: list[NameServerItems]
+    task_status: str
+
+
+class NameServerItems(TypedDict, total=False):
+    '''Список Name-серверов.'''
+    host: str
+    ips: list[str]
+
+
+class NameServersResponse(TypedDict, total=False):
+    '''Ответ со списком name-серверов.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    name_servers: list[NameServer]
+
+
+class DomainRequest(TypedDict, total=False):
+    '''Модель данных о заявки над доменом.'''
+    account_id: str
+    auth_code: str | None
+    date: str
+    domain_bundle_id: str | None
+    error_code_transfer: str | None
+    fqdn: str
+    group_id: int
+    id: int
+    is_antispam_enabled: bool
+    is_autoprolong_enabled: bool | None
+    is_whois_privacy_enabled: bool
+    message: str | None
+    money_source: str | None
+    period: str
+    person_id: int
+    prime: str | None
+    soon_expire: int
+    sort_order: int
+    type: str
+
+
+class DomainRequestResponse(TypedDict, total=False):
+    '''Ответ с заявкой к домену.'''
+    response_id: str | None
+    request: DomainRequest
+
+
+class DomainsRequestsResponse(TypedDict, total=False):
+    '''Ответ со списком заявок к доменам.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    requests: list[DomainRequest]
+
+
+class TLDAllowedBuyPeriods(TypedDict, total=False):
+    '''Модель допустимых периодов продления доменов.'''
+    period: str
+    price: float
+
+
+class TLDomain(TypedDict, total=False):
+    '''Модель данных доменной зоны.'''
+    allowed_buy_periods: list[TLDAllowedBuyPeriods]
+    early_renew_period: int | None
+    grace_period: int
+    id: int
+    is_published: bool
+    is_registered: bool
+    is_whois_privacy_default_enabled: bool
+    is_whois_privacy_enabled: bool
+    name: str
+    price: float
+    prolong_price: float
+    registrar: str
+    transfer: float
+    whois_privacy_price: float
+
+
+class TLDomainResponse(TypedDict, total=False):
+    '''Ответ с доменной зоной.'''
+    response_id: str | None
+    top_level_domain: TLDomain
+
+
+class TLDomainsResponse(TypedDict, total=False):
+    '''Ответ со списком доменных зон.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    top_level_domains: list[TLDomain]
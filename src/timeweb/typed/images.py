@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+# Сгенерировано schemas_to_typeddict.py, не редактируйте вручную.
+'''TypedDict для ответов `timeweb.schemas.images` в режиме `raw`.'''
+from __future__ import annotations
+
+from typing import Any, Literal, TypedDict
+
+from .base import BaseMeta
+
+
+class Download(TypedDict, total=False):
+    '''Модель ссылки на загрузку'''
+    id: str
+    created_at: str
+    image: str
+    type: Literal['timeweb', 'google_drive', 'yandex']
+    url: str
+    status: Literal['process', 'failed', 'finished', 'already_exists']
+    progress: int
+
+
+class DownloadResponse(TypedDict, total=False):
+    '''Модель ответа на создание ссылки на загрузку'''
+    response_id: str | None
+    download: Download
+
+
+class DownloadsArray(TypedDict, total=False):
+    '''Модель ответа ссылок на загрузку'''
+    response_id: str | None
+    meta: BaseMeta | None
+    downloads: list[Download]
+
+
+class Image(TypedDict, total=False):
+    '''Модель образа'''
+    id: str
+    status: Literal['new', 'created', 'failed', 'deleted']
+    created_at: str
+    deleted_at: str | None
+    size: int
+    name: str
+    description: str
+    disk_id: int
+    location: str | None
+    os: str
+    progress: int
+
+
+class ImageResponse(TypedDict, total=False):
+    '''Модель ответа на создание образа'''
+    response_id: str | None
+    image: Image
+
+
+class ImagesArray(TypedDict, total=False):
+    '''Модель ответа с массивом образов'''
+    response_id: str | None
+    meta: BaseMeta | None
+    images: list[Image]
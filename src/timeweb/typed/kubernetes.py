@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+# Сгенерировано schemas_to_typeddict.py, не редактируйте вручную.
+'''TypedDict для ответов `timeweb.schemas.kubernetes` в режиме `raw`.'''
+from __future__ import annotations
+
+from typing import Any, Literal, TypedDict
+
+from .base import BaseDelete, BaseMeta
+
+
+class Cluster(TypedDict, total=False):
+    '''Модель кластера Kubernetes.'''
+    id: int
+    name: str
+    created_at: str
+    status: str
+    description: str
+    ha: bool
+    k8s_version: str
+    network_driver: str
+    ingress: bool
+    preset_id: int
+    cpu: int | None
+    ram: int | None
+    disk: int | None
+
+
+class ClusterDelete(TypedDict, total=False):
+    '''Ответ с хэшом для подтверждения удаления кластера'''
+    response_id: str | None
+    cluster_delete: BaseDelete
+
+
+class ClusterResponse(TypedDict, total=False):
+    '''Ответ с кластером'''
+    response_id: str | None
+    cluster: Cluster
+
+
+class ClustersResponse(TypedDict, total=False):
+    '''Ответ со списком кластеров'''
+    response_id: str | None
+    meta: BaseMeta | None
+    clusters: list[Cluster]
+
+
+class K8SNetworksResponse(TypedDict, total=False):
+    '''Ответ со списком сетевых драйверов kubernetes'''
+    response_id: str | None
+    meta: BaseMeta | None
+    network_drivers: list[str]
+
+
+class K8SPreset(TypedDict, total=False):
+    '''Модель тарифа kubernetes'''
+    id: int
+    description: str
+    description_short: str
+    price: float
+    cpu: int
+    ram: int
+    disk: int
+    network: int
+    type: str | None
+
+
+class K8SPresetsResponse(TypedDict, total=False):
+    '''Ответ со списком тарифов для kubernetes.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    k8s_presets: list[K8SPreset]
+
+
+class K8SVersionsResponse(TypedDict, total=False):
+    '''Ответ со списком версий kubernetes'''
+    response_id: str | None
+    meta: BaseMeta | None
+    k8s_versions: list[str]
+
+
+class Node(TypedDict, total=False):
+    '''Модель ноды.'''
+    id: int
+    created_at: str
+    type: str
+    group_id: int
+    status: str
+    preset_id: int
+    cpu: int
+    ram: int
+    disk: int
+    network: int
+
+
+class NodeGroup(TypedDict, total=False):
+    '''Модель группы нод'''
+    id: int
+    name: str
+    created_at: str
+    preset_id: int
+    node_count: int
+
+
+class NodeGroupResponse(TypedDict, total=False):
+    '''Ответ с группой нод'''
+    response_id: str | None
+    node_group: NodeGroup
+
+
+class NodeGroupsResponse(TypedDict, total=False):
+    '''Ответ со списком групп нод'''
+    response_id: str | None
+    meta: BaseMeta | None
+    node_groups: list[NodeGroup]
+
+
+class NodesResponse(TypedDict, total=False):
+    '''Модель со списком нод'''
+    response_id: str | None
+    meta: BaseMeta | None
+    nodes: list[Node]
+
+
+class ClusterResources(TypedDict, total=False):
+    '''Ресурсы кластера.'''
+    nodes: int
+    cores: Resource
+    memory: Resource
+    pods: Resource
+
+
+class ClusterResourcesResponse(TypedDict, total=False):
+    '''Ответ с ресурсами кластера'''
+    response_id: str | None
+    resources: ClusterResources
+
+
+class Resource(TypedDict, total=False):
+    '''Информация о ресурсе кластера.'''
+    requested: int
+    allocatable: int
+    capacity: int
+    used: int
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+# Сгенерировано schemas_to_typeddict.py, не редактируйте вручную.
+'''TypedDict для ответов `timeweb.schemas.mail` в режиме `raw`.'''
+from __future__ import annotations
+
+from typing import Any, Literal, TypedDict
+
+from .base import BaseMeta
+
+
+class DomainInfo(TypedDict, total=False):
+    '''Модель почтовой информации о домене.'''
+    email: str
+    used: int
+
+
+class DomainInfoResponse(TypedDict, total=False):
+    '''Ответ с почтовой информацией о домене.'''
+    response_id: str | None
+    domain_info: DomainInfo
+
+
+class Mailbox(TypedDict, total=False):
+    '''Модель почтового ящика.'''
+    auto_reply: MailboxAutoReply
+    spam_filter: MailboxSpamFilter
+    forwarding_incoming: MailboxForwardingIncoming
+    forwarding_outgoing: MailboxForwardingOutgoing
+    comment: str
+    fqdn: str
+    mailbox: str
+    password: str
+    usage_space: int
+    is_webmail: bool
+    idn_name: str
+    is_dovecot: bool
+
+
+class MailboxAutoReply(TypedDict, total=False):
+    '''Модель автоответчика почтового ящика на входящие письма.'''
+    is_enabled: bool
+    message: str
+    subject: str
+
+
+class MailboxForwardingIncoming(TypedDict, total=False):
+    '''Модель пересылки входящих писем почтового ящика.'''
+    is_enabled: bool
+    is_delete_messages: bool
+    incoming_list: list[str]
+
+
+class MailboxForwardingOutgoing(TypedDict, total=False):
+    '''Модель пересылки исходящих писем почтового ящика.'''
+    is_enabled: bool
+    outgoing_to: str
+
+
+class MailboxResponse(TypedDict, total=False):
+    '''Ответ с почтовым ящиком.'''
+    response_id: str | None
+    mailbox: Mailbox
+
+
+class MailboxSpamFilter(TypedDict, total=False):
+    '''Модель спам-фильтра почтового ящика.'''
+    is_enabled: bool
+    action: str
+    forward_to: str
+    white_list: list[str]
+
+
+class MailboxesResponse(TypedDict, total=False):
+    '''Ответ со списком почтовых ящиков.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    mailboxes: list[Mailbox]
+
+
+class Quota(TypedDict, total=False):
+    '''Модель почтовой квоты.'''
+    total: int
+    used: int
+
+
+class QuotaResponse(TypedDict, total=False):
+    '''Ответ с почтовой квотой.'''
+    response_id: str | None
+    quota: Quota
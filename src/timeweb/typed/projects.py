@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+# Сгенерировано schemas_to_typeddict.py, не редактируйте вручную.
+'''TypedDict для ответов `timeweb.schemas.projects` в режиме `raw`.'''
+from __future__ import annotations
+
+from typing import Any, Literal, TypedDict
+
+from .balancers import Balancer
+from .base import BaseMeta
+from .dbs import Database
+from .kubernetes import Cluster
+from .s3 import Bucket
+from .servers.cloud import VDS
+from .servers.dedics import DedicatedServer
+
+
+class Project(TypedDict, total=False):
+    '''Модель проекта.'''
+    id: int
+    account_id: str
+    avatar_id: str | None
+    description: str
+    name: str
+    is_default: bool
+
+
+class Resource(TypedDict, total=False):
+    '''Модель ресурса проекта.'''
+    id: int
+    created_at: str
+    resource_id: int
+    project: Project
+    type: str
+
+
+class ProjectResponse(TypedDict, total=False):
+    '''Ответ с проектом.'''
+    response_id: str | None
+    project: Project
+
+
+class ProjectsResponse(TypedDict, total=False):
+    '''Ответ со списком проектов.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    projects: list[Project]
+
+
+class ResourceResponse(TypedDict, total=False):
+    '''Ответ с ресурсом проекта.'''
+    response_id: str | None
+    resource: Resource
+
+
+class ResourcesResponse(TypedDict, total=False):
+    '''Ответ с ресурсами проекта.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    servers: list[VDS]
+    balancers: list[Balancer]
+    buckets: list[Bucket]
+    clusters: list[Cluster]
+    databases: list[Database]
+    dedicated_servers: list[DedicatedServer]
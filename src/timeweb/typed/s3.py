@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+# Сгенерировано schemas_to_typeddict.py, не редактируйте вручную.
+'''TypedDict для ответов `timeweb.schemas.s3` в режиме `raw`.'''
+from __future__ import annotations
+
+from typing import Any, Literal, TypedDict
+
+from .base import BaseDelete, BaseMeta
+
+
+class Object(TypedDict, total=False):
+    '''Модель объекта.'''
+    key: str
+    last_modified: str
+    etag: str | None
+    size: int | None
+    storage_class: str | None
+    checksum_algorithm: str | None
+    owner: ObjectOwner | None
+    type: Literal['file', 'directory']
+
+
+class ObjectOwner(TypedDict, total=False):
+    '''Модель владельца объекта.'''
+    id: str
+    display_name: str
+
+
+class ObjectsArray(TypedDict, total=False):
+    '''Модель ответа списка объектов.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    files: list[Object]
+
+
+class Preset(TypedDict, total=False):
+    '''Модель тарифа S3-хранилища.'''
+    id: int
+    description: str
+    description_short: str
+    disk: int
+    price: int
+    location: str
+
+
+class StoragePresets(TypedDict, total=False):
+    '''Модель ответа со списком тарифов S3-хранилищ.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    storages_presets: list[Preset]
+
+
+class Bucket(TypedDict, total=False):
+    '''Модель S3-хранилища.'''
+    id: int
+    name: str
+    dist_stats: BucketDiskStats
+    type: Literal['private', 'public']
+    preset_id: int | None
+    status: Literal['no_paid', 'created', 'transfer']
+    object_amount: int
+    location: str
+    hostname: str
+    access_key: str
+    secret_key: str
+
+
+class BucketArray(TypedDict, total=False):
+    '''Модель ответа со списком S3-хранилищ.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    buckets: list[Bucket]
+
+
+class BucketDelete(TypedDict, total=False):
+    '''Ответ с хэшом для подтверждения удаления S3-хранилища.'''
+    response_id: str | None
+    bucket_delete: BaseDelete
+
+
+class BucketDiskStats(TypedDict, total=False):
+    '''Статистика диска S3-хранилища.'''
+    used: int
+    size: int
+
+
+class BucketResponse(TypedDict, total=False):
+    '''Модель ответа с S3-хранилищем.'''
+    response_id: str | None
+    bucket: Bucket
+
+
+class Domain(TypedDict, total=False):
+    '''Модель SSL поддомена.'''
+    id: int
+    subdomain: str
+    cert_released: str
+    tries: int
+    status: Literal['ssl_released', 'ssl_not_requested', 'ssl_re_release_error']
+
+
+class DomainAdd(TypedDict, total=False):
+    '''Модель добавления поддомена.'''
+    subdomain: str
+    status: Literal['success', 'empty_cname', 'duplicate', 'failed']
+
+
+class DomainsAddArray(TypedDict, total=False):
+    '''Модель ответа добавления поддоменов.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    subdomains: list[DomainAdd]
+
+
+class DomainsArray(TypedDict, total=False):
+    '''Модель ответа списка поддоменов.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    subdomains: list[Domain]
+
+
+class Transfer(TypedDict, total=False):
+    '''Модель трансфера.'''
+    status: Literal['started', 'suspended', 'failed']
+    tries: int
+    total_count: int
+    total_size: int
+    uploaded_count: int
+    uploaded_size: int
+    errors: list[TransferError] | None
+
+
+TransferError = TypedDict('TransferError', {
+    'value': 'str',
+    'try': 'int',
+}, total=False)
+
+
+class TransferResponse(TypedDict, total=False):
+    '''Модель ответа трансфера.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    transfer_status: Transfer
+
+
+class StorageUsers(TypedDict, total=False):
+    '''Модель ответа со списком пользователей S3-хранилищ.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    users: list[User]
+
+
+class User(TypedDict, total=False):
+    '''Модель пользователя S3-хранилища.'''
+    id: int
+    access_key: str
+    secret_key: str
+
+
+class UserResponse(TypedDict, total=False):
+    '''Модель ответа с пользователем S3-хранилища.'''
+    response_id: str | None
+    user: User
@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+# Сгенерировано schemas_to_typeddict.py, не редактируйте вручную.
+'''TypedDict для ответов `timeweb.schemas.servers.cloud` в режиме `raw`.'''
+from __future__ import annotations
+
+from typing import Any, Literal, TypedDict
+
+from ..base import BaseDelete, BaseMeta
+
+
+class AutoBackup(TypedDict, total=False):
+    '''Настройки авто-бэкапа сервера.'''
+    copy_count: int | None
+    creation_start_at: str | None
+    is_enabled: bool
+    interval: str | None
+    day_of_week: int | None
+
+
+class AutoBackupsResponse(TypedDict, total=False):
+    '''Ответ с настройками авто-бэкапов облачного сервера.'''
+    response_id: str | None
+    auto_backups_settings: AutoBackup
+
+
+class Backup(TypedDict, total=False):
+    '''Объект бэкапа.'''
+    id: int
+    name: str
+    comment: str | None
+    created_at: str
+    status: str
+    size: int
+    type: str
+
+
+class BackupResponse(TypedDict, total=False):
+    '''Ответ с бэкапом.'''
+    response_id: str | None
+    backup: Backup
+
+
+class BackupsResponse(TypedDict, total=False):
+    '''Ответ со списком бэкапов.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    backups: list[Backup]
+
+
+class NetworkIPs(TypedDict, total=False):
+    '''Список IP-адресов сети.'''
+    type: Literal['ipv4', 'ipv6']
+    ip: str
+    ptr: str | None
+    is_main: bool
+
+
+class Software(TypedDict, total=False):
+    '''ПО из маркетплейса'''
+    id: int
+    name: str
+
+
+class VDS(TypedDict, total=False):
+    '''Модель облачного сервера'''
+    id: int
+    name: str
+    comment: str
+    os: VDSOS
+    software: Software | None
+    preset_id: int | None
+    location: str
+    configurator_id: int | None
+    boot_mode: Literal['std', 'single', 'cd']
+    status: Literal['installing', 'software_install', 'reinstalling', 'on', 'off', 'turning_on', 'turning_off', 'hard_turning_off', 'rebooting', 'hard_rebooting', 'removing', 'removed', 'cloning', 'transfer', 'blocked', 'configuring', 'no_paid', 'permanent_blocked']
+    start_at: str | None
+    is_ddos_guard: bool
+    cpu: int
+    cpu_frequency: str
+    ram: int
+    avatar_id: str | None
+    vnc_pass: str
+    networks: list[VDSNetwork]
+    disks: list[VDSDisk]
+    created_at: str
+
+
+class VDSArray(TypedDict, total=False):
+    '''Ответ со списком серверов'''
+    response_id: str | None
+    meta: BaseMeta | None
+    servers: list[VDS]
+
+
+class VDSDelete(TypedDict, total=False):
+    '''Ответ с хэшом для подтверждения удаления облачного сервера.'''
+    response_id: str | None
+    server_delete: BaseDelete
+
+
+class VDSDisk(TypedDict, total=False):
+    '''Список дисков сервера.'''
+    id: int
+    size: int
+    used: int
+    type: str
+    is_mounted: bool
+    is_system: bool
+    system_name: str
+    status: str
+
+
+class VDSNetwork(TypedDict, total=False):
+    '''Список сетей сервера.'''
+    type: Literal['public', 'local']
+    nat_mode: Literal['dnat_and_snat', 'snat', 'no_nat'] | None
+    bandwidth: int | None
+    ips: list[NetworkIPs] | None
+    is_ddos_guard: bool | None
+
+
+class VDSOS(TypedDict, total=False):
+    '''Модель ОС сервера'''
+    id: int
+    name: Literal['bitrix', 'brainycp', 'centos', 'debian', 'fedora', 'freebsd', 'gentoo', 'routeros', 'ubuntu', 'windows']
+    version: str | None
+
+
+class VDSResponse(TypedDict, total=False):
+    '''Ответ с сервером'''
+    response_id: str | None
+    server: VDS
+
+
+class ConfiguratorRequirements(TypedDict, total=False):
+    '''Требования для конфигуратора сервера.'''
+    cpu_min: int
+    cpu_step: int
+    cpu_max: int
+    ram_min: int
+    ram_step: int
+    ram_max: int
+    disk_min: int
+    disk_step: int
+    disk_max: int
+    network_bandwidth_min: int
+    network_bandwidth_step: int
+    network_bandwidth_max: int
+
+
+class ServerConfigurator(TypedDict, total=False):
+    '''Конфигуратор сервера.'''
+    id: int
+    location: str
+    disk_type: str
+    is_allowed_local_network: bool
+    cpu_frequency: str
+    requirements: ConfiguratorRequirements
+
+
+class ServerConfiguratorsResponse(TypedDict, total=False):
+    '''Ответ со списком конфигураторов сервера.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    server_configurators: list[ServerConfigurator]
+
+
+class ServerDisk(TypedDict, total=False):
+    '''Диск облачного сервера.'''
+    id: int
+    size: int
+    used: int
+    type: str
+    is_mounted: bool
+    is_system: bool
+    system_name: str
+    status: str
+
+
+class ServerDiskResponse(TypedDict, total=False):
+    '''Ответ с диском сервера.'''
+    response_id: str | None
+    server_disk: ServerDisk
+
+
+class ServerDisksResponse(TypedDict, total=False):
+    '''Ответ со списком дисков сервера.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    server_disks: list[ServerDisk]
+
+
+class ServerIP(TypedDict, total=False):
+    '''IP-адрес облачного сервера.'''
+    type: Literal['ipv4', 'ipv6']
+    ip: str
+    ptr: str
+    is_main: bool
+
+
+class ServerIPResponse(TypedDict, total=False):
+    '''Ответ с IP-адресом облачного сервера.'''
+    response_id: str | None
+    server_ip: ServerIP
+
+
+class ServerIPsResponse(TypedDict, total=False):
+    '''Ответ со списком IP-адресов облачного сервера.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    server_ips: list[ServerIP]
+
+
+class ServerLog(TypedDict, total=False):
+    '''Событие сервера.'''
+    id: int
+    logged_at: str
+    event: str
+
+
+class ServerLogsResponse(TypedDict, total=False):
+    '''Ответ со списком событий серверов.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    server_logs: list[ServerLog]
+
+
+class CloudPreset(TypedDict, total=False):
+    '''Тариф облачного сервера.'''
+    id: int
+    location: str
+    price: float
+    cpu: int
+    cpu_frequency: str
+    ram: int
+    disk: int
+    disk_type: str
+    bandwidth: int
+    description: str
+    description_short: str
+    is_allowed_local_network: bool
+    tags: list[str]
+
+
+class CloudPresetsResponse(TypedDict, total=False):
+    '''Ответ со списком тарифов облачного сервера.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    server_presets: list[CloudPreset]
+
+
+class OSRequirements(TypedDict, total=False):
+    '''Требования для устнановки ОС.'''
+    cpu_min: int
+    disk_min: int
+    ram_min: int
+    bandwidth_min: int
+
+
+class ServerOS(TypedDict, total=False):
+    '''ОС для облачного сервера.'''
+    id: int
+    family: str
+    name: str
+    version: str
+    version_codename: str
+    description: str
+    requirements: OSRequirements
+
+
+class ServersOSResponse(TypedDict, total=False):
+    '''Ответ со списком ОС доступных для установки на облачных серверах.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    servers_os: list[ServerOS]
+
+
+class ServersSoftware(TypedDict, total=False):
+    '''ПО из маркетплейса для сервера.'''
+    id: int
+    name: str
+    os_ids: list[int]
+    description: str
+    requirements: SoftwareRequirements
+
+
+class ServersSoftwareResponse(TypedDict, total=False):
+    '''Ответ со списком ПО из маркетплейса.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    servers_software: list[ServersSoftware]
+
+
+class SoftwareRequirements(TypedDict, total=False):
+    '''Требования для устнановки ПО.'''
+    cpu_min: int
+    disk_min: int
+    ram_min: int
+    bandwidth_min: int
+
+
+class BaseStats(TypedDict, total=False):
+    '''Базовая модель статистики облачного сервера.'''
+    logged_at: str
+
+
+class CPUStats(TypedDict, total=False):
+    '''Статистика ЦП облачного сервера.'''
+    logged_at: str
+    load: float
+
+
+class DiskStats(TypedDict, total=False):
+    '''Статистика основного диска.'''
+    logged_at: str
+    write: float
+    read: float
+
+
+class RAMStats(TypedDict, total=False):
+    '''Статистика ОЗУ облачного сервера.'''
+    logged_at: str
+    total: int
+    used: int
+    used_cached: int
+    available: int
+
+
+class StatsResponse(TypedDict, total=False):
+    '''Ответ со статистикой облачного сервера.'''
+    response_id: str | None
+    cpu: CPUStats
+    network_traffic: TrafficStats
+    disk: DiskStats
+    ram: RAMStats
+
+
+class TrafficStats(TypedDict, total=False):
+    '''Статистика интернет трафика облачного сервера'''
+    logged_at: str
+    incoming: float
+    outgoung: float
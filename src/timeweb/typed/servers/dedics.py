@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+# Сгенерировано schemas_to_typeddict.py, не редактируйте вручную.
+'''TypedDict для ответов `timeweb.schemas.servers.dedics` в режиме `raw`.'''
+from __future__ import annotations
+
+from typing import Any, Literal, TypedDict
+
+from ..base import BaseMeta
+
+
+class DedicatedServer(TypedDict, total=False):
+    '''Выделенный сервер.'''
+    id: int
+    cpu_description: str
+    hdd_description: str
+    ram_description: str
+    created_at: str
+    ip: str | None
+    ipmi_ip: str | None
+    ipmi_login: str | None
+    ipmi_password: str | None
+    ipv6: str | None
+    mode_id: int | None
+    name: str
+    comment: str
+    vnc_pass: str | None
+    status: Literal['installing', 'installed', 'on', 'off']
+    os_id: int | None
+    cp_id: int | None
+    bandwidth_id: int | None
+    network_drive_id: list[int] | None
+    additional_ip_addr_id: list[int] | None
+    plan_id: int | None
+    price: int
+    location: str
+    autoinstall_ready: int
+
+
+class DedicatedServerResponse(TypedDict, total=False):
+    '''Ответ с выделенным сервером.'''
+    response_id: str | None
+    dedicated_server: DedicatedServer
+
+
+class DedicatedServers(TypedDict, total=False):
+    '''Ответ со списком выделенных серверов.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    dedicated_servers: list[DedicatedServer]
+
+
+class DedicatedCPU(TypedDict, total=False):
+    '''CPU выделенного сервера.'''
+    description: str
+    description_short: str
+    count: int
+
+
+class DedicatedDisk(TypedDict, total=False):
+    '''Диск выделенного сервера.'''
+    description: str
+    count: int
+
+
+class DedicatedMemory(TypedDict, total=False):
+    '''Память выделенного сервера.'''
+    description: str
+    count: int
+    size: int
+
+
+class DedicatedServerPreset(TypedDict, total=False):
+    '''Тариф выделенного сервера.'''
+    id: int
+    description: str
+    is_ipmi_enabled: bool
+    price: int | None
+    location: str
+    memory: DedicatedMemory
+    disk: DedicatedDisk
+    cpu: DedicatedCPU
+
+
+class DedicatedServerPresets(TypedDict, total=False):
+    '''Массив тарифов выделенных серверов.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    dedicated_servers_presets: list[DedicatedServerPreset]
+
+
+class DedicatedServerService(TypedDict, total=False):
+    '''Доп. услуга выделенного сервера.'''
+    id: int
+    price: int
+    period: Literal['P1D', 'P1M', 'P3M', 'P6M', 'P1Y', 'forever']
+    description: str
+    short_description: str
+    name: str
+
+
+class DedicatedServerServices(TypedDict, total=False):
+    '''Массив доп. услуг выделенных серверов.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    dedicated_server_additional_services: list[DedicatedServerService]
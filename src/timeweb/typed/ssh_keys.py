@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+# Сгенерировано schemas_to_typeddict.py, не редактируйте вручную.
+'''TypedDict для ответов `timeweb.schemas.ssh_keys` в режиме `raw`.'''
+from __future__ import annotations
+
+from typing import Any, Literal, TypedDict
+
+from .base import BaseMeta
+
+
+class CreateSSHKeyResponse(TypedDict, total=False):
+    '''Модель ответа созданного SSH ключа.'''
+    response_id: str | None
+    ssh_key: SSHKey
+
+
+class SSHKey(TypedDict, total=False):
+    '''Модель SSH ключа.'''
+    id: int
+    name: str
+    body: str
+    created_at: str
+    used_by: list[Server]
+    is_default: bool
+
+
+class SSHKeyResponse(TypedDict, total=False):
+    '''Модель ответа SSH ключа.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    ssh_key: SSHKey
+
+
+class SSHKeysArray(TypedDict, total=False):
+    '''Модель ответа SSH ключей.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    ssh_keys: list[SSHKey]
+
+
+class Server(TypedDict, total=False):
+    '''Модель сервера.'''
+    id: int
+    name: str
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+# Сгенерировано schemas_to_typeddict.py, не редактируйте вручную.
+'''TypedDict для ответов `timeweb.schemas.tokens` в режиме `raw`.'''
+from __future__ import annotations
+
+from typing import Any, Literal, TypedDict
+
+from .base import BaseMeta
+
+
+class APIKey(TypedDict, total=False):
+    '''Модель API токена.'''
+    id: str
+    created_at: str
+    name: str
+    expired_at: str | None
+
+
+class APIKeyResponse(TypedDict, total=False):
+    '''Модель ответа API токена.'''
+    response_id: str | None
+    api_key: APIKey
+
+
+class APIKeysResponse(TypedDict, total=False):
+    '''Модель ответа API токенов.'''
+    response_id: str | None
+    meta: BaseMeta | None
+    api_keys: list[APIKey] | None
+
+
+class CreateAPIKeyResponse(TypedDict, total=False):
+    '''Модель ответа созданного API токена.'''
+    response_id: str | None
+    api_key: CreatedAPIKey
+
+
+class CreatedAPIKey(TypedDict, total=False):
+    '''Модель созданного API токена.'''
+    id: str
+    created_at: str
+    name: str
+    expired_at: str | None
+    token: str
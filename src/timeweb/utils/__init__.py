@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+'''Общие инструменты для синхронного и асинхронного клиентов.
+
+Инструменты импортируются лениво, при первом обращении.'''
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .retry import RetryPolicy
+    from .ratelimit import RateLimiter, TokenBucket
+    from .options import request_options
+    from .cache import TTLCache, SQLiteCache
+    from .conditional import ConditionalCache
+    from .singleflight import SingleFlight, AsyncSingleFlight
+    from .lazy import LazyList
+    from .columnar import to_numpy, to_arrow, ato_numpy, ato_arrow
+    from .cassette import Cassette
+    from .metrics import Metrics
+    from .tracing import RecordingTracer
+
+
+_LAZY = {
+    'RetryPolicy': '.retry',
+    'RateLimiter': '.ratelimit',
+    'TokenBucket': '.ratelimit',
+    'request_options': '.options',
+    'TTLCache': '.cache',
+    'SQLiteCache': '.cache',
+    'ConditionalCache': '.conditional',
+    'SingleFlight': '.singleflight',
+    'AsyncSingleFlight': '.singleflight',
+    'LazyList': '.lazy',
+    'to_numpy': '.columnar',
+    'to_arrow': '.columnar',
+    'ato_numpy': '.columnar',
+    'ato_arrow': '.columnar',
+    'Cassette': '.cassette',
+    'Metrics': '.metrics',
+    'RecordingTracer': '.tracing',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,441 @@
+# -*- coding: utf-8 -*-
+'''Кэш ответов справочных эндпоинтов.
+
+Тарифы, списки ОС, конфигураторы, доменные зоны и т.п. меняются редко,
+поэтому их можно не запрашивать заново при каждом вызове.
+
+`TTLCache` хранит ответы в памяти процесса, `SQLiteCache` - на диске между запусками.'''
+import os
+import time
+import typing
+import asyncio
+import hashlib
+import inspect
+import logging
+import sqlite3
+import threading
+import contextvars
+from pathlib import Path
+from functools import wraps
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, TypeVar
+
+from pydantic import BaseModel
+
+from .options import get_option
+
+
+F = TypeVar('F', bound=Callable[..., Any])
+_MISSING = object()
+
+
+class TTLCache:
+    '''Потокобезопасный LRU кэш с временем жизни записей.
+
+    Attributes:
+        maxsize (int): Максимальное кол-во записей.
+        ttl (float): Время жизни записи по умолчанию в секундах.
+        ttls (dict[str, float]): Время жизни записей отдельных эндпоинтов, например `{'VDSAPI.get_presets': 60}`.
+        hits (int): Кол-во попаданий.
+        misses (int): Кол-во промахов.
+        evictions (int): Кол-во записей, вытесненных из-за размера.
+        expirations (int): Кол-во устаревших записей.
+    '''
+
+    def __init__(
+        self, maxsize: int = 256, ttl: float = 600,
+        ttls: dict[str, float] | None = None
+    ):
+        '''Инициализация кэша.
+
+        Args:
+            maxsize (int, optional): Максимальное кол-во записей. Defaults to 256.
+            ttl (float, optional): Время жизни записи по умолчанию в секундах. Defaults to 600.
+            ttls (dict[str, float] | None, optional): Время жизни записей отдельных эндпоинтов. Defaults to None.
+        '''
+        if maxsize < 1:
+            raise ValueError('maxsize должен быть больше 0!')
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._data: OrderedDict[Hashable, tuple[float, str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'TTLCache(size={len(self)}, maxsize={self.maxsize})'
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        '''Возвращает значение из кэша.
+
+        Args:
+            key (Hashable): Ключ.
+            default (Any, optional): Значение при промахе. Defaults to None.
+
+        Returns:
+            Any: Значение из кэша или `default`.
+        '''
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            expires, _, value = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, endpoint: str = '') -> None:
+        '''Сохраняет значение в кэш.
+
+        Args:
+            key (Hashable): Ключ.
+            value (Any): Значение.
+            endpoint (str, optional): Имя эндпоинта для выбора времени жизни и инвалидации. Defaults to ''.
+        '''
+        expires = time.monotonic() + self.ttls.get(endpoint, self.ttl)
+        with self._lock:
+            self._data[key] = (expires, endpoint, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, endpoint: str | None = None) -> int:
+        '''Удаляет записи эндпоинта или весь кэш.
+
+        Args:
+            endpoint (str | None, optional): Имя эндпоинта, например `VDSAPI.get_presets`. Defaults to None.
+
+        Returns:
+            int: Кол-во удалённых записей.
+        '''
+        with self._lock:
+            if endpoint is None:
+                count = len(self._data)
+                self._data.clear()
+                return count
+            keys = [k for k, entry in self._data.items() if entry[1] == endpoint]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        '''Очищает кэш.'''
+        self.invalidate()
+
+    def stats(self) -> dict[str, int]:
+        '''Счётчики кэша.
+
+        Returns:
+            dict[str, int]: Размер кэша, попадания, промахи и вытеснения.
+        '''
+        return {
+            'size': len(self),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+        }
+
+
+class SQLiteCache:
+    '''Постоянный кэш справочников в SQLite.
+
+    Записи хранятся по хэшу токена, эндпоинту и параметрам вызова. Свежая запись
+    отдаётся сразу, устаревшая тоже отдаётся сразу, но при этом в фоне запускается
+    её обновление (stale-while-revalidate).
+
+    Attributes:
+        path (Path): Путь к файлу базы.
+        ttl (float): Время, в течение которого запись считается свежей, в секундах.
+        ttls (dict[str, float]): Время свежести записей отдельных эндпоинтов.
+        max_stale (float | None): Сколько секунд после устаревания запись ещё можно отдавать. None - без ограничения.
+        hits (int): Кол-во попаданий в свежие записи.
+        stale_hits (int): Кол-во попаданий в устаревшие записи.
+        misses (int): Кол-во промахов.
+        refreshes (int): Кол-во фоновых обновлений.
+    '''
+
+    def __init__(
+        self, path: str | os.PathLike | None = None, ttl: float = 3600,
+        ttls: dict[str, float] | None = None,
+        max_stale: float | None = 7 * 24 * 3600
+    ):
+        '''Инициализация кэша.
+
+        Args:
+            path (str | os.PathLike | None, optional): Путь к файлу базы. Defaults to `$XDG_CACHE_HOME/timeweb/catalog.sqlite3`.
+            ttl (float, optional): Время, в течение которого запись считается свежей, в секундах. Defaults to 3600.
+            ttls (dict[str, float] | None, optional): Время свежести записей отдельных эндпоинтов. Defaults to None.
+            max_stale (float | None, optional): Сколько секунд после устаревания запись ещё можно отдавать. Defaults to 7 days.
+        '''
+        if path is None:
+            base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+            path = Path(base) / 'timeweb' / 'catalog.sqlite3'
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.max_stale = max_stale
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self._lock = threading.Lock()
+        self._refreshing: set[Hashable] = set()
+        self._tasks: set[asyncio.Future] = set()
+        self._db = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS catalog ('
+                'token TEXT, endpoint TEXT, params TEXT, data TEXT, stored_at REAL, '
+                'PRIMARY KEY (token, endpoint, params))'
+            )
+
+    def __repr__(self) -> str:
+        return f'SQLiteCache(path={str(self.path)!r})'
+
+    @staticmethod
+    def _token_hash(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str, endpoint: str, params: str = '') -> tuple[str, bool] | None:
+        '''Возвращает запись из кэша.
+
+        Args:
+            token (str): API токен.
+            endpoint (str): Имя эндпоинта, например `VDSAPI.get_presets`.
+            params (str, optional): Параметры вызова. Defaults to ''.
+
+        Returns:
+            tuple[str, bool] | None: JSON ответа и признак устаревания или None.
+        '''
+        with self._lock:
+            row = self._db.execute(
+                'SELECT data, stored_at FROM catalog '
+                'WHERE token = ? AND endpoint = ? AND params = ?',
+                (self._token_hash(token), endpoint, params)
+            ).fetchone()
+            age = time.time() - row[1] if row else 0
+            ttl = self.ttls.get(endpoint, self.ttl)
+            if row is None or (
+                self.max_stale is not None and age > ttl + self.max_stale
+            ):
+                self.misses += 1
+                return None
+            stale = age > ttl
+            if stale:
+                self.stale_hits += 1
+            else:
+                self.hits += 1
+            return row[0], stale
+
+    def set(self, token: str, endpoint: str, params: str, data: str) -> None:
+        '''Сохраняет запись в кэш.
+
+        Args:
+            token (str): API токен.
+            endpoint (str): Имя эндпоинта.
+            params (str): Параметры вызова.
+            data (str): JSON ответа.
+        '''
+        with self._lock, self._db:
+            self._db.execute(
+                'INSERT OR REPLACE INTO catalog VALUES (?, ?, ?, ?, ?)',
+                (self._token_hash(token), endpoint, params, data, time.time())
+            )
+
+    def invalidate(self, endpoint: str | None = None) -> int:
+        '''Удаляет записи эндпоинта или весь кэш.
+
+        Args:
+            endpoint (str | None, optional): Имя эндпоинта. Defaults to None.
+
+        Returns:
+            int: Кол-во удалённых записей.
+        '''
+        with self._lock, self._db:
+            if endpoint is None:
+                cursor = self._db.execute('DELETE FROM catalog')
+            else:
+                cursor = self._db.execute(
+                    'DELETE FROM catalog WHERE endpoint = ?', (endpoint,)
+                )
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        '''Очищает кэш.'''
+        self.invalidate()
+
+    def close(self) -> None:
+        '''Закрывает базу.'''
+        with self._lock:
+            self._db.close()
+
+    def stats(self) -> dict[str, int]:
+        '''Счётчики кэша.
+
+        Returns:
+            dict[str, int]: Размер кэша, попадания, промахи и фоновые обновления.
+        '''
+        with self._lock:
+            size = self._db.execute('SELECT COUNT(*) FROM catalog').fetchone()[0]
+        return {
+            'size': size,
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'refreshes': self.refreshes,
+        }
+
+    def _begin_refresh(self, key: Hashable) -> bool:
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self.refreshes += 1
+            return True
+
+    def _end_refresh(self, key: Hashable) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+
+def _cache_key(api: Any, endpoint: str, args: tuple, kwargs: dict) -> tuple:
+    # Режим разбора входит в ключ: сырой JSON, модели без валидации и с `LazyList`
+    # не должны попасть к другим вызовам.
+    raw = bool(get_option('raw', api.transport.raw))
+    validate = bool(get_option('validate', api.transport.validate))
+    lazy = bool(get_option('lazy', api.transport.lazy))
+    return (
+        api.transport.token, endpoint, args, tuple(sorted(kwargs.items())),
+        raw, validate, lazy
+    )
+
+
+def _load(api: Any, func: Callable, data: str, raw: bool, validate: bool, lazy: bool) -> Any:
+    # Запись декодируется декодером транспорта и собирается так же, как ответ API.
+    decoded = api.transport.json_loads(data.encode())
+    if raw:
+        return decoded
+    return api._build_model(decoded, _return_model(func), validate, lazy)
+
+
+def _return_model(func: Callable) -> type[BaseModel]:
+    return typing.get_type_hints(func)['return']
+
+
+def _lookup(api: Any, func: Callable, endpoint: str, key: tuple) -> tuple[Any, bool]:
+    memory: TTLCache | None = api.transport.cache
+    disk: SQLiteCache | None = api.transport.disk_cache
+    if memory is not None:
+        value = memory.get(key, _MISSING)
+        if value is not _MISSING:
+            return value, False
+    if disk is not None:
+        entry = disk.get(key[0], endpoint, repr(key[2:4]))
+        if entry is not None:
+            data, stale = entry
+            value = _load(api, func, data, *key[4:])
+            # Устаревшая запись не попадает в память, чтобы следующий вызов увидел обновление.
+            if memory is not None and not stale:
+                memory.set(key, value, endpoint)
+            return value, stale
+    return _MISSING, False
+
+
+def _store(api: Any, endpoint: str, key: tuple, value: Any) -> None:
+    memory: TTLCache | None = api.transport.cache
+    disk: SQLiteCache | None = api.transport.disk_cache
+    if memory is not None:
+        memory.set(key, value, endpoint)
+    raw, validate, lazy = key[4:]
+    if disk is not None and not raw and validate and not lazy and isinstance(value, BaseModel):
+        disk.set(key[0], endpoint, repr(key[2:4]), value.json(by_alias=True))
+
+
+def _enabled(api: Any) -> bool:
+    return get_option('cache', True) is not False and (
+        api.transport.cache is not None or api.transport.disk_cache is not None
+    )
+
+
+def cached(func: F) -> F:
+    '''Кэширует результат метода API в кэшах транспорта.
+
+    Сначала проверяется `TTLCache` в памяти, затем `SQLiteCache` на диске. Устаревшая
+    запись с диска возвращается сразу, а обновление выполняется в фоне. Обойти кэш
+    для отдельного вызова можно через `request_options(cache=False)`.
+
+    Args:
+        func (F): Метод API.
+
+    Returns:
+        F: Обёрнутый метод.
+    '''
+    endpoint = func.__qualname__
+    log = logging.getLogger('timeweb')
+
+    if inspect.iscoroutinefunction(func):
+        async def async_refresh(self, key: tuple, args: tuple, kwargs: dict) -> None:
+            try:
+                _store(self, endpoint, key, await func(self, *args, **kwargs))
+            except Exception as e:
+                log.warning(f'Background refresh of {endpoint} failed: {e!r}')
+            finally:
+                self.transport.disk_cache._end_refresh(key)
+
+        @wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            if not _enabled(self):
+                return await func(self, *args, **kwargs)
+            key = _cache_key(self, endpoint, args, kwargs)
+            value, stale = _lookup(self, func, endpoint, key)
+            if value is _MISSING:
+                value = await func(self, *args, **kwargs)
+                _store(self, endpoint, key, value)
+            elif stale and self.transport.disk_cache._begin_refresh(key):
+                tasks = self.transport.disk_cache._tasks
+                task = asyncio.ensure_future(async_refresh(self, key, args, kwargs))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            return value
+        return async_wrapper  # type: ignore
+
+    def refresh(self, key: tuple, args: tuple, kwargs: dict) -> None:
+        try:
+            _store(self, endpoint, key, func(self, *args, **kwargs))
+        except Exception as e:
+            log.warning(f'Background refresh of {endpoint} failed: {e!r}')
+        finally:
+            self.transport.disk_cache._end_refresh(key)
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not _enabled(self):
+            return func(self, *args, **kwargs)
+        key = _cache_key(self, endpoint, args, kwargs)
+        value, stale = _lookup(self, func, endpoint, key)
+        if value is _MISSING:
+            value = func(self, *args, **kwargs)
+            _store(self, endpoint, key, value)
+        elif stale and self.transport.disk_cache._begin_refresh(key):
+            threading.Thread(
+                target=contextvars.copy_context().run,
+                args=(refresh, self, key, args, kwargs), daemon=True
+            ).start()
+        return value
+    return wrapper  # type: ignore
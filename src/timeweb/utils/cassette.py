@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+'''Запись и воспроизведение HTTP обмена с API.
+
+`Cassette` хранит пары запрос/ответ вместе с временем их выполнения. Записанный
+сеанс (например, ночной обход всех ресурсов) можно воспроизвести без обращения к
+API с исходными или масштабированными задержками и сравнить время работы клиента.
+Файлы кассет - JSON Lines в gzip. Заголовок `Authorization` не сохраняется, а
+токен заменяется на `<TOKEN>` в URL и телах.
+
+    cassette = Cassette()
+    tw = Timeweb('token', transport=Transport('token', http_transport=cassette.recorder(token='token')))
+    ...
+    cassette.save('sweep.jsonl.gz')
+
+    cassette = Cassette.load('sweep.jsonl.gz')
+    tw = Timeweb('token', transport=Transport('token', http_transport=cassette.player(latency_scale=0.5)))'''
+import gzip
+import json
+import time
+import base64
+import asyncio
+import threading
+from pathlib import Path
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Iterable
+
+import httpx
+
+
+VERSION = 1
+REDACTED = '<TOKEN>'
+#: Заголовки ответа, которые сохраняются в кассете.
+HEADERS = (
+    'content-type', 'etag', 'last-modified', 'retry-after', 'x-ratelimit-limit',
+    'x-ratelimit-remaining', 'x-ratelimit-reset'
+)
+
+
+@dataclass
+class Interaction:
+    '''Записанный обмен.
+
+    Attributes:
+        method (str): HTTP метод.
+        url (str): Путь и параметры запроса.
+        body (str): Тело запроса.
+        status (int): Статус ответа.
+        headers (dict[str, str]): Сохранённые заголовки ответа.
+        content (str): Тело ответа, текст или base64.
+        binary (bool): Тело ответа в base64.
+        start (float): Начало запроса в секундах от начала записи.
+        duration (float): Время выполнения запроса в секундах.
+    '''
+    method: str
+    url: str
+    body: str
+    status: int
+    headers: dict[str, str]
+    content: str
+    binary: bool
+    start: float
+    duration: float
+
+    @property
+    def key(self) -> tuple[str, str, str]:
+        return self.method, self.url, self.body
+
+    def response(self) -> httpx.Response:
+        '''Создаёт ответ HTTPX.'''
+        content = base64.b64decode(self.content) if self.binary else self.content.encode()
+        return httpx.Response(self.status, headers=self.headers, content=content)
+
+
+class Cassette:
+    '''Набор записанных обменов с API.
+
+    Attributes:
+        interactions (list[Interaction]): Обмены в порядке завершения.
+    '''
+
+    def __init__(self, interactions: Iterable[Interaction] = ()):
+        '''Инициализация кассеты.
+
+        Args:
+            interactions (Iterable[Interaction], optional): Записанные обмены. Defaults to ().
+        '''
+        self.interactions = list(interactions)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    @classmethod
+    def load(cls, path: str | Path) -> 'Cassette':
+        '''Загружает кассету из файла.
+
+        Args:
+            path (str | Path): Путь к файлу.
+
+        Raises:
+            ValueError: Неподдерживаемая версия файла.
+
+        Returns:
+            Cassette: Кассета.
+        '''
+        with gzip.open(path, 'rt', encoding='utf-8') as file:
+            header = json.loads(file.readline())
+            if header.get('version') != VERSION:
+                raise ValueError(f'Неподдерживаемая версия кассеты: {header.get("version")}')
+            return cls(Interaction(**json.loads(line)) for line in file if line.strip())
+
+    def save(self, path: str | Path) -> None:
+        '''Сохраняет кассету в файл.
+
+        Args:
+            path (str | Path): Путь к файлу.
+        '''
+        with gzip.open(path, 'wt', encoding='utf-8') as file:
+            file.write(json.dumps({'version': VERSION}) + '\n')
+            for interaction in self.interactions:
+                file.write(json.dumps(asdict(interaction), ensure_ascii=False, separators=(',', ':')) + '\n')
+
+    def recorder(
+        self, inner: httpx.BaseTransport | httpx.AsyncBaseTransport | None = None,
+        token: str | None = None, redact: Iterable[str] = ()
+    ) -> 'RecordTransport':
+        '''Создаёт транспорт HTTPX, записывающий обмены в эту кассету.
+
+        Args:
+            inner (httpx.BaseTransport | httpx.AsyncBaseTransport | None, optional): Транспорт, выполняющий запросы. По умолчанию `HTTPTransport`/`AsyncHTTPTransport`. Defaults to None.
+            token (str | None, optional): API токен, который нужно скрыть. Defaults to None.
+            redact (Iterable[str], optional): Другие строки, которые нужно скрыть. Defaults to ().
+
+        Returns:
+            RecordTransport: Транспорт HTTPX.
+        '''
+        return RecordTransport(self, inner, token, redact)
+
+    def player(
+        self, latency_scale: float = 1.0, strict: bool = False,
+        token: str | None = None, redact: Iterable[str] = ()
+    ) -> 'ReplayTransport':
+        '''Создаёт транспорт HTTPX, воспроизводящий обмены из этой кассеты.
+
+        Args:
+            latency_scale (float, optional): Множитель записанных задержек, 0 - без задержек. Defaults to 1.0.
+            strict (bool, optional): Ошибка, если записанные ответы на запрос закончились. Иначе повторяется последний. Defaults to False.
+            token (str | None, optional): API токен, который был скрыт при записи. Defaults to None.
+            redact (Iterable[str], optional): Другие строки, скрытые при записи. Defaults to ().
+
+        Returns:
+            ReplayTransport: Транспорт HTTPX.
+        '''
+        return ReplayTransport(self, latency_scale, strict, token, redact)
+
+    def append(self, interaction: Interaction) -> None:
+        with self._lock:
+            self.interactions.append(interaction)
+
+
+def _target(request: httpx.Request) -> str:
+    return request.url.raw_path.decode('ascii')
+
+
+def _redact(text: str, secrets: list[str]) -> str:
+    for secret in secrets:
+        text = text.replace(secret, REDACTED)
+    return text
+
+
+class RecordTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    '''Транспорт HTTPX, записывающий обмены в `Cassette`.'''
+
+    def __init__(
+        self, cassette: Cassette,
+        inner: httpx.BaseTransport | httpx.AsyncBaseTransport | None = None,
+        token: str | None = None, redact: Iterable[str] = ()
+    ):
+        self.cassette = cassette
+        self.inner = inner
+        self.secrets = [s for s in (token, *redact) if s]
+        self._origin: float | None = None
+
+    def _record(self, request: httpx.Request, response: httpx.Response, started: float) -> None:
+        finished = time.perf_counter()
+        if self._origin is None:
+            self._origin = started
+        try:
+            content, binary = _redact(response.content.decode('utf-8'), self.secrets), False
+        except UnicodeDecodeError:
+            content, binary = base64.b64encode(response.content).decode('ascii'), True
+        self.cassette.append(Interaction(
+            method=request.method,
+            url=_redact(_target(request), self.secrets),
+            body=_redact(request.content.decode('utf-8', 'replace'), self.secrets),
+            status=response.status_code,
+            headers={k: v for k, v in response.headers.items() if k in HEADERS},
+            content=content,
+            binary=binary,
+            start=round(started - self._origin, 6),
+            duration=round(finished - started, 6)
+        ))
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self.inner is None:
+            self.inner = httpx.HTTPTransport()
+        started = time.perf_counter()
+        response = self.inner.handle_request(request)  # type: ignore[union-attr]
+        response.read()
+        self._record(request, response, started)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.inner is None:
+            self.inner = httpx.AsyncHTTPTransport()
+        started = time.perf_counter()
+        response = await self.inner.handle_async_request(request)  # type: ignore[union-attr]
+        await response.aread()
+        self._record(request, response, started)
+        return response
+
+    def close(self) -> None:
+        if isinstance(self.inner, httpx.BaseTransport):
+            self.inner.close()
+
+    async def aclose(self) -> None:
+        if isinstance(self.inner, httpx.AsyncBaseTransport):
+            await self.inner.aclose()
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    '''Транспорт HTTPX, отвечающий записанными в `Cassette` ответами.
+
+    Ответы на одинаковые запросы (метод, путь с параметрами и тело) отдаются
+    в порядке записи. Токен в запросах скрывается так же, как при записи.
+
+    Attributes:
+        latency_scale (float): Множитель записанных задержек.
+        strict (bool): Ошибка, если записанные ответы на запрос закончились.
+    '''
+
+    def __init__(
+        self, cassette: Cassette, latency_scale: float = 1.0, strict: bool = False,
+        token: str | None = None, redact: Iterable[str] = ()
+    ):
+        self.latency_scale = latency_scale
+        self.strict = strict
+        self.secrets = [s for s in (token, *redact) if s]
+        self._queues: dict[tuple[str, str, str], deque[Interaction]] = {}
+        self._last: dict[tuple[str, str, str], Interaction] = {}
+        self._lock = threading.Lock()
+        for interaction in cassette.interactions:
+            self._queues.setdefault(interaction.key, deque()).append(interaction)
+
+    def _next(self, request: httpx.Request) -> Interaction:
+        key = (
+            request.method, _redact(_target(request), self.secrets),
+            _redact(request.content.decode('utf-8', 'replace'), self.secrets)
+        )
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue:
+                self._last[key] = queue.popleft()
+                return self._last[key]
+            if key in self._last and not self.strict:
+                return self._last[key]
+        raise LookupError(f'В кассете нет ответа на {key[0]} {key[1]}')
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        interaction = self._next(request)
+        if self.latency_scale > 0:
+            time.sleep(interaction.duration * self.latency_scale)
+        return interaction.response()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        interaction = self._next(request)
+        if self.latency_scale > 0:
+            await asyncio.sleep(interaction.duration * self.latency_scale)
+        return interaction.response()
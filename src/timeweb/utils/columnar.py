@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+'''Колоночный экспорт списков ресурсов в NumPy и Arrow.
+
+Поддерживаются облачные серверы (`VDSArray`), базы данных (`DBArray`),
+выделенные серверы (`DedicatedServers`) и кластеры Kubernetes (`ClustersResponse`).
+На вход принимаются ответы API, сырой JSON (режим `raw`) или итераторы `iter_*`.
+Для экспорта нужны `numpy` и/или `pyarrow`: `pip install timeweb-cloud[analytics]`.'''
+from datetime import datetime
+from typing import Any, AsyncIterable, Callable, Iterable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy
+    import pyarrow  # type: ignore[import]
+
+
+Getter = Callable[[Any], Any]
+#: Типы колонок: `int`, `int?` (может отсутствовать), `bool`, `str`, `category`, `datetime`.
+ColumnType = str
+
+KINDS = ('servers', 'dbs', 'dedicated_servers', 'clusters')
+_MODELS = {
+    'VDS': 'servers',
+    'Database': 'dbs',
+    'DedicatedServer': 'dedicated_servers',
+    'Cluster': 'clusters',
+}
+
+
+def _get(item: Any, *path: str) -> Any:
+    for name in path:
+        if item is None:
+            return None
+        if isinstance(item, dict):
+            item = item.get(name)
+        else:
+            item = getattr(item, name, None)
+    return item
+
+
+def _field(*path: str) -> Getter:
+    return lambda item: _get(item, *path)
+
+
+def _disks(name: str) -> Getter:
+    return lambda item: sum(_get(disk, name) or 0 for disk in _get(item, 'disks') or ())
+
+
+def _count(name: str) -> Getter:
+    return lambda item: len(_get(item, name) or ())
+
+
+COLUMNS: dict[str, tuple[tuple[str, Getter, ColumnType], ...]] = {
+    'servers': (
+        ('id', _field('id'), 'int'),
+        ('name', _field('name'), 'str'),
+        ('status', _field('status'), 'category'),
+        ('location', _field('location'), 'category'),
+        ('os', _field('os', 'name'), 'category'),
+        ('preset_id', _field('preset_id'), 'int?'),
+        ('cpu', _field('cpu'), 'int'),
+        ('ram', _field('ram'), 'int'),
+        ('disk_size', _disks('size'), 'int'),
+        ('disk_used', _disks('used'), 'int'),
+        ('disks', _count('disks'), 'int'),
+        ('is_ddos_guard', _field('is_ddos_guard'), 'bool'),
+        ('created_at', _field('created_at'), 'datetime'),
+    ),
+    'dbs': (
+        ('id', _field('id'), 'int'),
+        ('name', _field('name'), 'str'),
+        ('type', _field('type'), 'category'),
+        ('status', _field('status'), 'category'),
+        ('preset_id', _field('preset_id'), 'int'),
+        ('disk_size', _field('dist_stats', 'size'), 'int?'),
+        ('disk_used', _field('dist_stats', 'used'), 'int?'),
+        ('created_at', _field('created_at'), 'datetime'),
+    ),
+    'dedicated_servers': (
+        ('id', _field('id'), 'int'),
+        ('name', _field('name'), 'str'),
+        ('status', _field('status'), 'category'),
+        ('location', _field('location'), 'category'),
+        ('plan_id', _field('plan_id'), 'int?'),
+        ('price', _field('price'), 'int'),
+        ('cpu_description', _field('cpu_description'), 'category'),
+        ('ram_description', _field('ram_description'), 'category'),
+        ('hdd_description', _field('hdd_description'), 'category'),
+        ('created_at', _field('created_at'), 'datetime'),
+    ),
+    'clusters': (
+        ('id', _field('id'), 'int'),
+        ('name', _field('name'), 'str'),
+        ('status', _field('status'), 'category'),
+        ('k8s_version', _field('k8s_version'), 'category'),
+        ('preset_id', _field('preset_id'), 'int'),
+        ('cpu', _field('cpu'), 'int?'),
+        ('ram', _field('ram'), 'int?'),
+        ('disk', _field('disk'), 'int?'),
+        ('ha', _field('ha'), 'bool'),
+        ('created_at', _field('created_at'), 'datetime'),
+    ),
+}
+
+
+def _epoch_us(value: datetime | str | None) -> int | None:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return round(value.timestamp() * 1_000_000)
+
+
+def _items(data: Any, kind: str | None) -> tuple[str, Iterable[Any]]:
+    if isinstance(data, dict):
+        for name in KINDS:
+            if name in data:
+                return name, data[name]
+    else:
+        for name in KINDS:
+            items = getattr(data, name, None)
+            if isinstance(items, list):
+                return name, items
+    if kind is not None:
+        if kind not in COLUMNS:
+            raise ValueError(f'Неизвестный тип ресурсов: {kind}! Доступны: {", ".join(KINDS)}')
+        return kind, data
+    items = list(data)
+    if items and type(items[0]).__name__ in _MODELS:
+        return _MODELS[type(items[0]).__name__], items
+    raise ValueError(
+        f'Не удалось определить тип ресурсов, укажите kind: {", ".join(KINDS)}'
+    )
+
+
+def columns(data: Any, kind: str | None = None) -> dict[str, list[Any]]:
+    '''Собирает значения колонок в списки.
+
+    Args:
+        data (Any): Ответ API (`VDSArray`, `DBArray`, `DedicatedServers`, `ClustersResponse`), его сырой JSON или итерируемый объект с ресурсами.
+        kind (str | None, optional): Тип ресурсов из `KINDS`. Нужен только для итераторов из сырого JSON или пустых итераторов. Defaults to None.
+
+    Raises:
+        ValueError: Тип ресурсов неизвестен или не определён.
+
+    Returns:
+        dict[str, list[Any]]: Значения колонок. Даты - в микросекундах UNIX времени.
+    '''
+    kind, items = _items(data, kind)
+    spec = COLUMNS[kind]
+    result: dict[str, list[Any]] = {name: [] for name, _, _ in spec}
+    appends = [(result[name].append, getter, type_) for name, getter, type_ in spec]
+    for item in items:
+        for append, getter, type_ in appends:
+            value = getter(item)
+            append(_epoch_us(value) if type_ == 'datetime' else value)
+    return result
+
+
+def column_types(kind: str) -> dict[str, ColumnType]:
+    '''Возвращает типы колонок для типа ресурсов.
+
+    Args:
+        kind (str): Тип ресурсов из `KINDS`.
+
+    Returns:
+        dict[str, ColumnType]: Типы колонок.
+    '''
+    return {name: type_ for name, _, type_ in COLUMNS[kind]}
+
+
+def to_numpy(data: Any, kind: str | None = None) -> dict[str, 'numpy.ndarray']:
+    '''Экспортирует ресурсы в массивы NumPy.
+
+    Числа хранятся в `int64`, необязательные числа - в `float64` с `nan`,
+    даты - в `datetime64[us]` (UTC) с `NaT`, строки - в массивах `str`.
+
+    Args:
+        data (Any): Ответ API, его сырой JSON или итерируемый объект с ресурсами.
+        kind (str | None, optional): Тип ресурсов из `KINDS`. Defaults to None.
+
+    Raises:
+        ImportError: `numpy` не установлен.
+        ValueError: Тип ресурсов неизвестен или не определён.
+
+    Returns:
+        dict[str, numpy.ndarray]: Колонки.
+    '''
+    import numpy as np
+
+    kind, items = _items(data, kind)
+    types = column_types(kind)
+    result = {}
+    for name, values in columns(items, kind).items():
+        type_ = types[name]
+        if type_ == 'int':
+            result[name] = np.array(values, dtype=np.int64)
+        elif type_ == 'int?':
+            result[name] = np.array(
+                [np.nan if v is None else v for v in values], dtype=np.float64
+            )
+        elif type_ == 'bool':
+            result[name] = np.array(values, dtype=np.bool_)
+        elif type_ == 'datetime':
+            result[name] = np.array(
+                [np.iinfo(np.int64).min if v is None else v for v in values],
+                dtype=np.int64
+            ).view('datetime64[us]')
+        else:
+            result[name] = np.array(['' if v is None else v for v in values], dtype=str)
+    return result
+
+
+def to_arrow(data: Any, kind: str | None = None) -> 'pyarrow.Table':
+    '''Экспортирует ресурсы в таблицу Arrow.
+
+    Необязательные значения хранятся как null, даты - как `timestamp[us, UTC]`,
+    повторяющиеся строки (статусы, локации и т.п.) - как словарные колонки.
+
+    Args:
+        data (Any): Ответ API, его сырой JSON или итерируемый объект с ресурсами.
+        kind (str | None, optional): Тип ресурсов из `KINDS`. Defaults to None.
+
+    Raises:
+        ImportError: `pyarrow` не установлен.
+        ValueError: Тип ресурсов неизвестен или не определён.
+
+    Returns:
+        pyarrow.Table: Таблица.
+    '''
+    import pyarrow as pa
+
+    arrow_types = {
+        'int': pa.int64(), 'int?': pa.int64(),
+        'bool': pa.bool_(), 'str': pa.string(), 'category': pa.string(),
+        'datetime': pa.timestamp('us', tz='UTC'),
+    }
+    kind, items = _items(data, kind)
+    types = column_types(kind)
+    arrays = {}
+    for name, values in columns(items, kind).items():
+        array = pa.array(values, type=arrow_types[types[name]])
+        if types[name] == 'category':
+            array = array.dictionary_encode()
+        arrays[name] = array
+    return pa.table(arrays)
+
+
+async def _collect(data: AsyncIterable[Any]) -> list[Any]:
+    return [item async for item in data]
+
+
+async def ato_numpy(data: AsyncIterable[Any], kind: str | None = None) -> dict[str, 'numpy.ndarray']:
+    '''Экспортирует ресурсы из асинхронного итератора `iter_*` в массивы NumPy.
+
+    Args:
+        data (AsyncIterable[Any]): Асинхронный итератор с ресурсами.
+        kind (str | None, optional): Тип ресурсов из `KINDS`. Defaults to None.
+
+    Returns:
+        dict[str, numpy.ndarray]: Колонки.
+    '''
+    return to_numpy(await _collect(data), kind)
+
+
+async def ato_arrow(data: AsyncIterable[Any], kind: str | None = None) -> 'pyarrow.Table':
+    '''Экспортирует ресурсы из асинхронного итератора `iter_*` в таблицу Arrow.
+
+    Args:
+        data (AsyncIterable[Any]): Асинхронный итератор с ресурсами.
+        kind (str | None, optional): Тип ресурсов из `KINDS`. Defaults to None.
+
+    Returns:
+        pyarrow.Table: Таблица.
+    '''
+    return to_arrow(await _collect(data), kind)
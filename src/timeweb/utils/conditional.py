@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+'''Условные GET запросы (ETag / Last-Modified).
+
+Если API вернул валидаторы ответа, то следующий такой же запрос отправляется
+с `If-None-Match`/`If-Modified-Since`, а на `304 Not Modified` возвращается
+сохранённый ответ вместе с уже разобранной моделью.'''
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from httpx import Response, QueryParams
+
+
+class ConditionalCache:
+    '''LRU хранилище валидаторов и ответов для условных GET запросов.
+
+    Attributes:
+        maxsize (int): Максимальное кол-во сохранённых ответов.
+        not_modified (int): Кол-во ответов `304 Not Modified`.
+        stored (int): Кол-во сохранённых ответов.
+    '''
+
+    def __init__(self, maxsize: int = 256):
+        '''Инициализация хранилища.
+
+        Args:
+            maxsize (int, optional): Максимальное кол-во сохранённых ответов. Defaults to 256.
+        '''
+        if maxsize < 1:
+            raise ValueError('maxsize должен быть больше 0!')
+        self.maxsize = maxsize
+        self.not_modified = 0
+        self.stored = 0
+        self._data: OrderedDict[Hashable, Response] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'ConditionalCache(size={len(self)}, maxsize={self.maxsize})'
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @staticmethod
+    def make_key(token: str, url: str, params: Any = None) -> Hashable:
+        '''Ключ запроса из токена, URL и параметров.
+
+        Args:
+            token (str): API токен.
+            url (str): URL запроса.
+            params (Any, optional): Параметры запроса. Defaults to None.
+
+        Returns:
+            Hashable: Ключ.
+        '''
+        return (token, url, str(QueryParams(params)) if params else '')
+
+    def get(self, key: Hashable) -> Response | None:
+        '''Сохранённый ответ на запрос.
+
+        Args:
+            key (Hashable): Ключ из `make_key`.
+
+        Returns:
+            Response | None: Ответ или None.
+        '''
+        with self._lock:
+            response = self._data.get(key)
+            if response is not None:
+                self._data.move_to_end(key)
+            return response
+
+    def headers(self, key: Hashable) -> dict[str, str]:
+        '''Заголовки условного запроса.
+
+        Args:
+            key (Hashable): Ключ из `make_key`.
+
+        Returns:
+            dict[str, str]: `If-None-Match`/`If-Modified-Since` или пустой словарь.
+        '''
+        response = self.get(key)
+        if response is None:
+            return {}
+        headers = {}
+        if 'ETag' in response.headers:
+            headers['If-None-Match'] = response.headers['ETag']
+        if 'Last-Modified' in response.headers:
+            headers['If-Modified-Since'] = response.headers['Last-Modified']
+        return headers
+
+    def update(self, key: Hashable, response: Response) -> Response:
+        '''Обрабатывает ответ на запрос.
+
+        Args:
+            key (Hashable): Ключ из `make_key`.
+            response (Response): Ответ API.
+
+        Returns:
+            Response: Сохранённый ответ при `304 Not Modified`, иначе исходный. Если сохранённый ответ уже вытеснен, то возвращается сам `304`.
+        '''
+        if response.status_code == 304:
+            cached = self.get(key)
+            if cached is not None:
+                self.not_modified += 1
+                return cached
+            return response
+        if response.status_code == 200 and (
+            'ETag' in response.headers or 'Last-Modified' in response.headers
+        ):
+            with self._lock:
+                self._data[key] = response
+                self._data.move_to_end(key)
+                self.stored += 1
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+        return response
+
+    def clear(self) -> None:
+        '''Очищает хранилище.'''
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict[str, int]:
+        '''Счётчики хранилища.
+
+        Returns:
+            dict[str, int]: Размер, кол-во `304` и сохранённых ответов.
+        '''
+        return {
+            'size': len(self),
+            'maxsize': self.maxsize,
+            'not_modified': self.not_modified,
+            'stored': self.stored,
+        }
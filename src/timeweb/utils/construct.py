@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+'''Сборка моделей ответов без валидации.
+
+`construct` рекурсивно создаёт вложенные модели и списки моделей так же, как
+`BaseModel.construct`, не проверяя и не приводя типы значений. Подходит для
+доверенных ответов API, когда важна скорость: поля `datetime`, `IPv4Address`,
+`Decimal`, `UUID` и т.п. остаются в том виде, в котором пришли в JSON.'''
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+from pydantic.fields import (
+    ModelField, SHAPE_SINGLETON, SHAPE_LIST, SHAPE_SET, SHAPE_TUPLE_ELLIPSIS,
+    SHAPE_SEQUENCE, SHAPE_FROZENSET, SHAPE_ITERABLE, SHAPE_DEQUE, SHAPE_MAPPING,
+    SHAPE_DICT, SHAPE_DEFAULTDICT
+)
+
+
+M = TypeVar('M', bound=BaseModel)
+_SEQUENCE_SHAPES = {
+    SHAPE_LIST, SHAPE_SET, SHAPE_TUPLE_ELLIPSIS, SHAPE_SEQUENCE,
+    SHAPE_FROZENSET, SHAPE_ITERABLE, SHAPE_DEQUE
+}
+_MAPPING_SHAPES = {SHAPE_MAPPING, SHAPE_DICT, SHAPE_DEFAULTDICT}
+_IMMUTABLE = (type(None), bool, int, float, str, bytes, tuple, frozenset)
+
+
+class _Plan:
+    '''Заранее вычисленные сведения о полях модели.'''
+    __slots__ = ('aliases', 'defaults', 'factories', 'nested', 'private')
+
+    def __init__(self, model: type[BaseModel]):
+        self.aliases: list[tuple[str, str]] = []
+        self.defaults: list[tuple[str, Any]] = []
+        self.factories: list[tuple[str, ModelField]] = []
+        self.nested: list[tuple[str, type[BaseModel], int]] = []
+        self.private = bool(model.__private_attributes__)
+        field: ModelField
+        for name, field in model.__fields__.items():
+            if field.alias != name:
+                self.aliases.append((field.alias, name))
+            if not field.required:
+                if field.default_factory is None and isinstance(field.default, _IMMUTABLE):
+                    self.defaults.append((name, field.default))
+                else:
+                    self.factories.append((name, field))
+            nested = field.type_
+            if isinstance(nested, type) and issubclass(nested, BaseModel):
+                self.nested.append((name, nested, field.shape))
+
+
+_plans: dict[type[BaseModel], _Plan] = {}
+
+
+def _convert(nested: type[BaseModel], shape: int, value: Any) -> Any:
+    if value is None:
+        return None
+    if shape == SHAPE_SINGLETON:
+        return construct(nested, value) if isinstance(value, dict) else value
+    if shape in _SEQUENCE_SHAPES and isinstance(value, list):
+        return [construct(nested, v) if isinstance(v, dict) else v for v in value]
+    if shape in _MAPPING_SHAPES and isinstance(value, dict):
+        return {
+            k: construct(nested, v) if isinstance(v, dict) else v
+            for k, v in value.items()
+        }
+    return value
+
+
+def construct(model: type[M], data: dict[str, Any]) -> M:
+    '''Создаёт модель из данных ответа без валидации.
+
+    Args:
+        model (type[M]): Модель ответа.
+        data (dict[str, Any]): Декодированный JSON.
+
+    Returns:
+        M: Модель ответа.
+    '''
+    plan = _plans.get(model)
+    if plan is None:
+        plan = _plans[model] = _Plan(model)
+    values = dict(data)
+    for alias, name in plan.aliases:
+        if alias in values:
+            values[name] = values.pop(alias)
+    for name, nested, shape in plan.nested:
+        if name in values:
+            values[name] = _convert(nested, shape, values[name])
+    fields_set = set(values)
+    for name, default in plan.defaults:
+        if name not in values:
+            values[name] = default
+    for name, field in plan.factories:
+        if name not in values:
+            values[name] = field.get_default()
+    # То же, что делает `BaseModel.construct`, но без копирования неизменяемых значений по умолчанию.
+    instance = model.__new__(model)
+    object.__setattr__(instance, '__dict__', values)
+    object.__setattr__(instance, '__fields_set__', fields_set)
+    if plan.private:
+        instance._init_private_attributes()
+    return instance
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+'''Выбор JSON декодера для ответов API.
+
+Ответы декодируются сразу из `response.content` (bytes). Если установлен `orjson`
+или `ujson`, то используется он, иначе стандартный `json`.'''
+import json
+from importlib import import_module
+from typing import Any, Callable
+
+
+JSONDecoder = Callable[[bytes], Any]
+DECODERS = ('orjson', 'ujson', 'json')
+
+
+def get_decoder(name: str | None = None) -> JSONDecoder:
+    '''Возвращает функцию декодирования JSON.
+
+    Args:
+        name (str | None, optional): `orjson`, `ujson` или `json`. По умолчанию первый установленный из них. Defaults to None.
+
+    Raises:
+        ValueError: Неизвестный декодер.
+        ImportError: Указанный декодер не установлен.
+
+    Returns:
+        JSONDecoder: Функция, принимающая bytes и возвращающая объект.
+    '''
+    if name is None:
+        for candidate in DECODERS[:-1]:
+            try:
+                return import_module(candidate).loads
+            except ImportError:
+                continue
+        return json.loads
+    if name not in DECODERS:
+        raise ValueError(f'Неизвестный JSON декодер: {name}! Доступны: {", ".join(DECODERS)}')
+    return import_module(name).loads
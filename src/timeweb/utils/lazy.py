@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+'''Ленивое создание моделей для больших списков в ответах.
+
+`LazyList` хранит декодированные словари и создаёт модель элемента только при
+обращении к нему по индексу или при переборе. Созданные модели запоминаются.'''
+import sys
+from typing import Any, Generic, Iterator, SupportsIndex, TypeVar, overload
+
+from pydantic import BaseModel
+from pydantic.fields import ModelField, SHAPE_LIST
+
+from .construct import construct
+
+
+M = TypeVar('M', bound=BaseModel)
+_lazy_fields: dict[type[BaseModel], list[tuple[str, str, type[BaseModel]]]] = {}
+
+
+class LazyList(list, Generic[M]):
+    '''Неизменяемый список моделей, которые создаются при обращении к элементам.
+
+    Attributes:
+        model (type[M] | None): Модель элемента. None - обычный список без ленивого создания.
+        validate (bool): Валидировать элементы при создании.
+    '''
+
+    def __init__(
+        self, iterable: Any = (), model: type[M] | None = None,
+        validate: bool = True
+    ):
+        '''Инициализация списка.
+
+        Args:
+            iterable (Any, optional): Декодированные элементы. Defaults to ().
+            model (type[M] | None, optional): Модель элемента. Defaults to None.
+            validate (bool, optional): Валидировать элементы при создании. Defaults to True.
+        '''
+        super().__init__(iterable)
+        self.model = model
+        self.validate = validate
+        self._items: list[M | None] = [None] * len(self)
+
+    def __repr__(self) -> str:
+        name = self.model.__name__ if self.model else 'Any'
+        return f'LazyList[{name}](len={len(self)}, materialized={self.materialized})'
+
+    @property
+    def materialized(self) -> int:
+        '''Кол-во уже созданных моделей.'''
+        if self.model is None:
+            return len(self)
+        return sum(item is not None for item in self._items)
+
+    @property
+    def raw(self) -> list[Any]:
+        '''Декодированные элементы без создания моделей.'''
+        return list(list.__iter__(self))
+
+    def _get(self, index: int) -> M:
+        value = list.__getitem__(self, index)
+        if self.model is None:
+            return value
+        item = self._items[index]
+        if item is None:
+            if self.validate:
+                item = self.model(**value)
+            else:
+                item = construct(self.model, value)
+            self._items[index] = item
+        return item
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> M: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[M]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('list index out of range')
+        return self._get(index)
+
+    def __iter__(self) -> Iterator[M]:
+        for index in range(len(self)):
+            yield self._get(index)
+
+    def __reversed__(self) -> Iterator[M]:
+        for index in range(len(self) - 1, -1, -1):
+            yield self._get(index)
+
+    def __contains__(self, value: object) -> bool:
+        return any(item == value for item in self)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, list):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None  # type: ignore
+
+    def __add__(self, other: list) -> list:  # type: ignore
+        return [*self, *other]
+
+    def __reduce__(self):
+        return (LazyList, (self.raw, self.model, self.validate))
+
+    def index(self, value: Any, start: SupportsIndex = 0, stop: SupportsIndex = sys.maxsize) -> int:
+        for index in range(*slice(start, stop).indices(len(self))):
+            if self._get(index) == value:
+                return index
+        raise ValueError(f'{value!r} is not in list')
+
+    def count(self, value: Any) -> int:
+        return sum(item == value for item in self)
+
+    def copy(self) -> list[M]:  # type: ignore
+        return list(self)
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError('LazyList не поддерживает изменение')
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _immutable
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+
+
+def _list_fields(model: type[BaseModel]) -> list[tuple[str, str, type[BaseModel]]]:
+    fields = _lazy_fields.get(model)
+    if fields is None:
+        fields = []
+        field: ModelField
+        for name, field in model.__fields__.items():
+            nested = field.type_
+            if field.shape == SHAPE_LIST and isinstance(nested, type) and issubclass(nested, BaseModel):
+                fields.append((name, field.alias, nested))
+        _lazy_fields[model] = fields
+    return fields
+
+
+def lazy_construct(model: type[M], data: dict[str, Any], validate: bool = True) -> M:
+    '''Создаёт модель ответа, в которой списки моделей заменены на `LazyList`.
+
+    Поля верхнего уровня обрабатываются как обычно, а элементы списков моделей
+    создаются только при обращении к ним.
+
+    Args:
+        model (type[M]): Модель ответа.
+        data (dict[str, Any]): Декодированный JSON.
+        validate (bool, optional): Валидировать ответ и элементы списков. Defaults to True.
+
+    Returns:
+        M: Модель ответа.
+    '''
+    values = dict(data)
+    lazy: list[tuple[str, LazyList]] = []
+    for name, alias, nested in _list_fields(model):
+        key = alias if alias in values else name
+        items = values.get(key)
+        if isinstance(items, list):
+            lazy.append((name, LazyList(items, nested, validate)))
+            values[key] = []
+    instance = model(**values) if validate else construct(model, values)
+    for name, items in lazy:
+        instance.__dict__[name] = items
+    return instance
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+'''Метрики запросов к API по эндпоинтам.
+
+Транспорт по умолчанию собирает для каждого шаблона эндпоинта (например,
+`GET /servers/{id}`) кол-во попыток, статусы ответов, ошибки соединения, повторы,
+отправленные и полученные байты, а также гистограммы времени сети и разбора ответа.
+Метрики доступны через `tw.metrics()` и в текстовом формате Prometheus:
+
+    tw = Timeweb('token')
+    ...
+    for endpoint, data in tw.metrics().items():
+        print(endpoint, data['network']['sum'], data['parse']['sum'])
+    print(tw.transport.metrics.prometheus())'''
+import re
+import threading
+from functools import lru_cache
+from typing import Any, Callable
+
+
+#: Границы корзин гистограмм в секундах.
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10
+)
+API_PREFIX = '/api/v1'
+_ID = re.compile(
+    r'\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+)
+
+
+@lru_cache(maxsize=4096)
+def endpoint_template(url: str) -> str:
+    '''Шаблон эндпоинта из URL, например `/servers/{id}/disks/{id}` для `/servers/1/disks/2`.
+
+    Числа и UUID заменяются на `{id}`, домены, IP адреса и имена ящиков почты - на `{name}`.
+
+    Args:
+        url (str): URL или путь запроса.
+
+    Returns:
+        str: Шаблон пути без префикса `/api/v1`.
+    '''
+    path = url.split('?', 1)[0].removeprefix(API_PREFIX)
+    segments = path.strip('/').split('/')
+    for i, segment in enumerate(segments):
+        if _ID.fullmatch(segment):
+            segments[i] = '{id}'
+        elif any(c in segment for c in '.:@') or (i and segments[i - 1] == 'mailboxes'):
+            segments[i] = '{name}'
+    return '/' + '/'.join(segments)
+
+
+class Histogram:
+    '''Гистограмма с фиксированными корзинами, как в Prometheus.
+
+    Attributes:
+        buckets (tuple[float, ...]): Верхние границы корзин.
+        counts (list[int]): Кол-во значений в каждой корзине и последняя корзина `+Inf`.
+        sum (float): Сумма значений.
+        count (int): Кол-во значений.
+    '''
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        '''Добавляет значение.'''
+        index = 0
+        for bound in self.buckets:
+            if value <= bound:
+                break
+            index += 1
+        self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float | None:
+        '''Оценка квантиля `q` (0-1) по верхней границе корзины.
+
+        Returns:
+            float | None: Граница корзины, `inf` для последней корзины или None без значений.
+        '''
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip((*self.buckets, float('inf')), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float('inf')
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+            'buckets': dict(zip((*map(str, self.buckets), '+Inf'), self.cumulative())),
+        }
+
+    def cumulative(self) -> list[int]:
+        '''Кол-во значений не больше каждой границы, включая `+Inf`.'''
+        result, total = [], 0
+        for count in self.counts:
+            total += count
+            result.append(total)
+        return result
+
+
+class EndpointMetrics:
+    '''Метрики одного эндпоинта.
+
+    Attributes:
+        requests (int): Кол-во попыток запроса, включая повторы.
+        retries (int): Кол-во повторных попыток.
+        errors (int): Кол-во ошибок соединения.
+        statuses (dict[int, int]): Кол-во ответов по статусам.
+        bytes_out (int): Отправлено байт в телах запросов.
+        bytes_in (int): Получено байт в телах ответов.
+        network (Histogram): Время от отправки запроса до получения ответа в секундах.
+        parse (Histogram): Время декодирования и разбора ответа в секундах.
+    '''
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.requests = 0
+        self.retries = 0
+        self.errors = 0
+        self.statuses: dict[int, int] = {}
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.network = Histogram(buckets)
+        self.parse = Histogram(buckets)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'retries': self.retries,
+            'errors': self.errors,
+            'statuses': dict(sorted(self.statuses.items())),
+            'bytes_out': self.bytes_out,
+            'bytes_in': self.bytes_in,
+            'network': self.network.to_dict(),
+            'parse': self.parse.to_dict(),
+        }
+
+
+class Metrics:
+    '''Потокобезопасный сборщик метрик запросов, общий для всех API клиента.
+
+    Attributes:
+        buckets (tuple[float, ...]): Границы корзин гистограмм в секундах.
+        template (Callable[[str], str]): Функция получения шаблона эндпоинта из URL.
+    '''
+
+    def __init__(
+        self, buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        template: Callable[[str], str] = endpoint_template
+    ):
+        '''Инициализация сборщика.
+
+        Args:
+            buckets (tuple[float, ...], optional): Границы корзин гистограмм в секундах. Defaults to DEFAULT_BUCKETS.
+            template (Callable[[str], str], optional): Функция получения шаблона эндпоинта из URL. Defaults to endpoint_template.
+        '''
+        self.buckets = buckets
+        self.template = template
+        self._endpoints: dict[tuple[str, str], EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def _endpoint(self, method: str, url: str) -> EndpointMetrics:
+        key = (method, self.template(url))
+        endpoint = self._endpoints.get(key)
+        if endpoint is None:
+            endpoint = self._endpoints[key] = EndpointMetrics(self.buckets)
+        return endpoint
+
+    def observe_request(
+        self, method: str, url: str, status: int | None, seconds: float,
+        bytes_out: int = 0, bytes_in: int = 0, retry: bool = False
+    ) -> None:
+        '''Учитывает попытку запроса.
+
+        Args:
+            method (str): HTTP метод.
+            url (str): URL запроса.
+            status (int | None): Статус ответа, None при ошибке соединения.
+            seconds (float): Время сети в секундах.
+            bytes_out (int, optional): Размер тела запроса. Defaults to 0.
+            bytes_in (int, optional): Размер тела ответа. Defaults to 0.
+            retry (bool, optional): Попытка повторная. Defaults to False.
+        '''
+        with self._lock:
+            endpoint = self._endpoint(method, url)
+            endpoint.requests += 1
+            endpoint.retries += retry
+            if status is None:
+                endpoint.errors += 1
+            else:
+                endpoint.statuses[status] = endpoint.statuses.get(status, 0) + 1
+            endpoint.bytes_out += bytes_out
+            endpoint.bytes_in += bytes_in
+            endpoint.network.observe(seconds)
+
+    def observe_parse(self, method: str, url: str, seconds: float) -> None:
+        '''Учитывает разбор ответа.
+
+        Args:
+            method (str): HTTP метод.
+            url (str): URL запроса.
+            seconds (float): Время декодирования и разбора в секундах.
+        '''
+        with self._lock:
+            self._endpoint(method, url).parse.observe(seconds)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        '''Текущие метрики по эндпоинтам.
+
+        Returns:
+            dict[str, dict[str, Any]]: Метрики по ключам вида `GET /servers/{id}`, по убыванию общего времени сети и разбора.
+        '''
+        with self._lock:
+            items = sorted(
+                self._endpoints.items(),
+                key=lambda item: item[1].network.sum + item[1].parse.sum, reverse=True
+            )
+            return {f'{method} {path}': data.to_dict() for (method, path), data in items}
+
+    def reset(self) -> None:
+        '''Сбрасывает все метрики.'''
+        with self._lock:
+            self._endpoints.clear()
+
+    def prometheus(self, prefix: str = 'timeweb') -> str:
+        '''Метрики в текстовом формате Prometheus.
+
+        Args:
+            prefix (str, optional): Префикс имён метрик. Defaults to 'timeweb'.
+
+        Returns:
+            str: Метрики.
+        '''
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            lines: list[str] = []
+
+            def header(name: str, kind: str, help: str) -> None:
+                lines.append(f'# HELP {prefix}_{name} {help}')
+                lines.append(f'# TYPE {prefix}_{name} {kind}')
+
+            header('requests_total', 'counter', 'Попытки запросов к API по статусам ответа.')
+            for (method, path), data in endpoints:
+                labels = _labels(method, path)
+                for status, count in sorted(data.statuses.items()):
+                    lines.append(f'{prefix}_requests_total{{{labels},status="{status}"}} {count}')
+                if data.errors:
+                    lines.append(f'{prefix}_requests_total{{{labels},status="error"}} {data.errors}')
+            for name, attr, help in (
+                ('retries_total', 'retries', 'Повторные попытки запросов.'),
+                ('request_bytes_total', 'bytes_out', 'Отправлено байт в телах запросов.'),
+                ('response_bytes_total', 'bytes_in', 'Получено байт в телах ответов.'),
+            ):
+                header(name, 'counter', help)
+                for (method, path), data in endpoints:
+                    lines.append(f'{prefix}_{name}{{{_labels(method, path)}}} {getattr(data, attr)}')
+            for name, attr, help in (
+                ('network_seconds', 'network', 'Время от отправки запроса до получения ответа.'),
+                ('parse_seconds', 'parse', 'Время декодирования и разбора ответа.'),
+            ):
+                header(name, 'histogram', help)
+                for (method, path), data in endpoints:
+                    histogram: Histogram = getattr(data, attr)
+                    labels = _labels(method, path)
+                    bounds = (*map(str, histogram.buckets), '+Inf')
+                    for bound, count in zip(bounds, histogram.cumulative()):
+                        lines.append(f'{prefix}_{name}_bucket{{{labels},le="{bound}"}} {count}')
+                    lines.append(f'{prefix}_{name}_sum{{{labels}}} {histogram.sum}')
+                    lines.append(f'{prefix}_{name}_count{{{labels}}} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+
+def _labels(method: str, path: str) -> str:
+    path = path.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return f'method="{method}",endpoint="{path}"'
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+'''Переопределение параметров запросов для отдельного вызова.
+
+Параметры хранятся в `ContextVar`, поэтому действуют только внутри блока `with`
+текущего потока или asyncio задачи и не влияют на остальные вызовы.'''
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+
+_options: ContextVar[dict[str, Any]] = ContextVar('timeweb_options', default={})
+
+
+@contextmanager
+def request_options(**options: Any) -> Iterator[None]:
+    '''Переопределяет параметры запросов внутри блока `with`.
+
+    Args:
+        **options: Параметры запросов, например `retry`.
+
+    Example:
+        >>> with request_options(retry=RetryPolicy(max_attempts=10)):
+        ...     tw.servers.cloud.get_all()
+    '''
+    token = _options.set({**_options.get(), **options})
+    try:
+        yield
+    finally:
+        _options.reset(token)
+
+
+def get_option(name: str, default: Any = None) -> Any:
+    '''Возвращает переопределённый параметр запроса.
+
+    Args:
+        name (str): Имя параметра.
+        default (Any, optional): Значение по умолчанию. Defaults to None.
+
+    Returns:
+        Any: Значение параметра.
+    '''
+    return _options.get().get(name, default)
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+'''Ограничение частоты запросов на стороне клиента.
+
+Лимитер не ждёт сам, а только резервирует место в очереди и возвращает время ожидания,
+поэтому один и тот же объект можно использовать из потоков синхронного клиента
+и из корутин асинхронного.'''
+import time
+import threading
+from typing import Callable
+
+
+class TokenBucket:
+    '''Потокобезопасное ведро токенов.
+
+    Attributes:
+        rate (float): Кол-во токенов, добавляемых в секунду.
+        burst (float): Ёмкость ведра.
+    '''
+
+    def __init__(self, rate: float, burst: float | None = None):
+        '''Инициализация ведра.
+
+        Args:
+            rate (float): Кол-во запросов в секунду.
+            burst (float | None, optional): Кол-во запросов, которые можно выполнить без ожидания. Defaults to rate.
+        '''
+        if rate <= 0:
+            raise ValueError('rate должен быть больше 0!')
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'TokenBucket(rate={self.rate}, burst={self.burst})'
+
+    def reserve(self, tokens: float = 1) -> float:
+        '''Резервирует токены.
+
+        Args:
+            tokens (float, optional): Кол-во токенов. Defaults to 1.
+
+        Returns:
+            float: Сколько секунд нужно подождать перед запросом.
+        '''
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+def endpoint_group(url: str) -> str:
+    '''Группа эндпоинта - первый сегмент пути, например `servers` для `/servers/1/disks`.
+
+    Args:
+        url (str): URL запроса.
+
+    Returns:
+        str: Имя группы.
+    '''
+    return url.lstrip('/').split('/', 1)[0].split('?', 1)[0]
+
+
+class RateLimiter:
+    '''Ограничитель частоты запросов для токена и групп эндпоинтов.
+
+    Для каждого API токена создаётся собственное ведро, поэтому один лимитер можно
+    разделить между несколькими клиентами с разными токенами.
+    Собственный лимитер должен реализовывать метод `reserve(token, method, url) -> float`.
+
+    Attributes:
+        rate (float): Кол-во запросов в секунду на токен.
+        burst (float | None): Ёмкость ведра токена.
+        groups (dict[str, tuple[float, float | None]]): Лимиты групп эндпоинтов.
+    '''
+
+    def __init__(
+        self, rate: float, burst: float | None = None,
+        groups: dict[str, tuple[float, float | None]] | None = None,
+        group_key: Callable[[str], str] = endpoint_group
+    ):
+        '''Инициализация лимитера.
+
+        Args:
+            rate (float): Кол-во запросов в секунду на токен.
+            burst (float | None, optional): Кол-во запросов, которые можно выполнить без ожидания. Defaults to None.
+            groups (dict[str, tuple[float, float | None]] | None, optional): Дополнительные лимиты `(rate, burst)` для групп эндпоинтов. Defaults to None.
+            group_key (Callable[[str], str], optional): Функция получения группы из URL. Defaults to endpoint_group.
+
+        Example:
+            >>> RateLimiter(10, burst=20, groups={'domains': (2, 5)})
+        '''
+        self.rate = rate
+        self.burst = burst
+        self.groups = groups or {}
+        self.group_key = group_key
+        self._buckets: dict[tuple[str, str | None], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'RateLimiter(rate={self.rate}, burst={self.burst})'
+
+    def _bucket(self, token: str, group: str | None) -> TokenBucket:
+        key = (token, group)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    if group is None:
+                        bucket = TokenBucket(self.rate, self.burst)
+                    else:
+                        bucket = TokenBucket(*self.groups[group])
+                    self._buckets[key] = bucket
+        return bucket
+
+    def reserve(self, token: str, method: str, url: str) -> float:
+        '''Резервирует запрос.
+
+        Args:
+            token (str): API токен.
+            method (str): HTTP метод.
+            url (str): URL запроса.
+
+        Returns:
+            float: Сколько секунд нужно подождать перед запросом.
+        '''
+        delay = self._bucket(token, None).reserve()
+        if self.groups:
+            group = self.group_key(url)
+            if group in self.groups:
+                delay = max(delay, self._bucket(token, group).reserve())
+        return delay
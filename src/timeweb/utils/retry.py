@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+'''Политика повторных запросов.'''
+import time
+import random
+from email.utils import parsedate_to_datetime
+
+from httpx import Response, ConnectError, ConnectTimeout, PoolTimeout
+
+
+IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'))
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+# Ошибки, при которых запрос гарантированно не был отправлен.
+CONNECT_ERRORS = (ConnectError, ConnectTimeout, PoolTimeout)
+
+
+class RetryPolicy:
+    '''Политика повторных запросов с экспоненциальной задержкой.
+
+    Attributes:
+        max_attempts (int): Максимальное кол-во попыток, включая первую.
+        backoff_factor (float): Базовая задержка в секундах.
+        max_backoff (float): Максимальная задержка между попытками в секундах.
+        max_retry_after (float): Максимальное допустимое значение `Retry-After` в секундах.
+        jitter (bool): Случайная задержка в интервале `[0, backoff]`.
+        statuses (frozenset[int]): HTTP статусы, при которых выполняется повтор.
+        methods (frozenset[str]): HTTP методы, которые можно повторять.
+        retry_connect_errors (bool): Повторять запросы при ошибках соединения.
+    '''
+
+    def __init__(
+        self, max_attempts: int = 3, backoff_factor: float = 0.5,
+        max_backoff: float = 30, max_retry_after: float = 60,
+        jitter: bool = True, statuses: frozenset[int] = RETRY_STATUSES,
+        methods: frozenset[str] = IDEMPOTENT_METHODS,
+        retry_connect_errors: bool = True
+    ):
+        '''Инициализация политики.
+
+        Args:
+            max_attempts (int, optional): Максимальное кол-во попыток, включая первую. Defaults to 3.
+            backoff_factor (float, optional): Базовая задержка в секундах. Defaults to 0.5.
+            max_backoff (float, optional): Максимальная задержка между попытками в секундах. Defaults to 30.
+            max_retry_after (float, optional): Максимальное допустимое значение `Retry-After` в секундах, при большем значении повтор не выполняется. Defaults to 60.
+            jitter (bool, optional): Случайная задержка в интервале `[0, backoff]`. Defaults to True.
+            statuses (frozenset[int], optional): HTTP статусы, при которых выполняется повтор. Defaults to RETRY_STATUSES.
+            methods (frozenset[str], optional): HTTP методы, которые можно повторять. Defaults to IDEMPOTENT_METHODS.
+            retry_connect_errors (bool, optional): Повторять запросы любых методов при ошибках соединения. Defaults to True.
+        '''
+        if max_attempts < 1:
+            raise ValueError('max_attempts не может быть меньше 1!')
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(m.upper() for m in methods)
+        self.retry_connect_errors = retry_connect_errors
+
+    @classmethod
+    def disabled(cls) -> 'RetryPolicy':
+        '''Политика без повторных запросов.'''
+        return cls(max_attempts=1)
+
+    def __repr__(self) -> str:
+        return (f'RetryPolicy(max_attempts={self.max_attempts}, '
+                f'backoff_factor={self.backoff_factor})')
+
+    def should_retry_response(
+        self, method: str, response: Response, attempt: int
+    ) -> bool:
+        '''Нужно ли повторить запрос после получения ответа.
+
+        Args:
+            method (str): HTTP метод.
+            response (Response): Ответ API.
+            attempt (int): Номер текущей попытки, начиная с 1.
+
+        Returns:
+            bool: Нужно повторить запрос?
+        '''
+        if attempt >= self.max_attempts:
+            return False
+        if response.status_code not in self.statuses:
+            return False
+        if method.upper() not in self.methods:
+            return False
+        retry_after = self.get_retry_after(response)
+        return retry_after is None or retry_after <= self.max_retry_after
+
+    def should_retry_exception(
+        self, method: str, error: Exception, attempt: int
+    ) -> bool:
+        '''Нужно ли повторить запрос после ошибки соединения.
+
+        Args:
+            method (str): HTTP метод.
+            error (Exception): Ошибка.
+            attempt (int): Номер текущей попытки, начиная с 1.
+
+        Returns:
+            bool: Нужно повторить запрос?
+        '''
+        if attempt >= self.max_attempts:
+            return False
+        return self.retry_connect_errors and isinstance(error, CONNECT_ERRORS)
+
+    def get_retry_after(self, response: Response) -> float | None:
+        '''Возвращает задержку из заголовков `Retry-After` или `RateLimit-Reset`.
+
+        Args:
+            response (Response): Ответ API.
+
+        Returns:
+            float | None: Задержка в секундах или None, если заголовков нет.
+        '''
+        value = response.headers.get('Retry-After')
+        if value is not None:
+            try:
+                return max(float(value), 0.0)
+            except ValueError:
+                try:
+                    date = parsedate_to_datetime(value)
+                except (TypeError, ValueError):
+                    return None
+                return max(date.timestamp() - time.time(), 0.0)
+        value = response.headers.get(
+            'RateLimit-Reset', response.headers.get('X-RateLimit-Reset')
+        )
+        if value is not None:
+            try:
+                reset = float(value)
+            except ValueError:
+                return None
+            # Некоторые API отдают unix-время вместо кол-ва секунд.
+            if reset > 1_000_000_000:
+                reset -= time.time()
+            return max(reset, 0.0)
+        return None
+
+    def get_delay(self, attempt: int, response: Response | None = None) -> float:
+        '''Возвращает задержку перед следующей попыткой.
+
+        Args:
+            attempt (int): Номер неудачной попытки, начиная с 1.
+            response (Response | None, optional): Ответ API. Defaults to None.
+
+        Returns:
+            float: Задержка в секундах.
+        '''
+        if response is not None:
+            retry_after = self.get_retry_after(response)
+            if retry_after is not None:
+                return retry_after
+        backoff = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        if self.jitter:
+            return random.uniform(0, backoff)
+        return backoff
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+'''Объединение одинаковых одновременных запросов (singleflight).
+
+Пока запрос с ключом выполняется, остальные вызовы с тем же ключом не отправляют
+свой запрос, а ждут и получают результат первого.'''
+import asyncio
+import threading
+from functools import partial
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+
+T = TypeVar('T')
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    '''Потокобезопасное объединение одинаковых запросов для синхронного клиента.
+
+    Attributes:
+        calls (int): Кол-во выполненных вызовов.
+        shared (int): Кол-во вызовов, получивших результат другого вызова.
+    '''
+
+    def __init__(self):
+        '''Инициализация.'''
+        self.calls = 0
+        self.shared = 0
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'SingleFlight(in_flight={len(self._calls)})'
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        '''Выполняет `fn` или ждёт результата уже выполняющегося вызова с тем же ключом.
+
+        Args:
+            key (Hashable): Ключ запроса.
+            fn (Callable[[], T]): Функция запроса.
+
+        Returns:
+            T: Результат `fn`.
+        '''
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.shared += 1
+        assert call is not None
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    def stats(self) -> dict[str, int]:
+        '''Счётчики вызовов.
+
+        Returns:
+            dict[str, int]: Кол-во выполненных и объединённых вызовов.
+        '''
+        return {'calls': self.calls, 'shared': self.shared}
+
+
+class AsyncSingleFlight:
+    '''Объединение одинаковых запросов для асинхронного клиента.
+
+    Запрос выполняется в отдельной задаче, поэтому отмена одного из ожидающих
+    не отменяет запрос для остальных.
+
+    Attributes:
+        calls (int): Кол-во выполненных вызовов.
+        shared (int): Кол-во вызовов, получивших результат другого вызова.
+    '''
+
+    def __init__(self):
+        '''Инициализация.'''
+        self.calls = 0
+        self.shared = 0
+        self._tasks: dict[Hashable, asyncio.Future] = {}
+
+    def __repr__(self) -> str:
+        return f'AsyncSingleFlight(in_flight={len(self._tasks)})'
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        '''Выполняет `fn` или ждёт результата уже выполняющегося вызова с тем же ключом.
+
+        Args:
+            key (Hashable): Ключ запроса.
+            fn (Callable[[], Awaitable[T]]): Функция запроса.
+
+        Returns:
+            T: Результат `fn`.
+        '''
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._tasks[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(partial(self._done, key))
+            self.calls += 1
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Ошибка уже передана ожидающим, если они были.
+            task.exception()
+
+    def stats(self) -> dict[str, int]:
+        '''Счётчики вызовов.
+
+        Returns:
+            dict[str, int]: Кол-во выполненных и объединённых вызовов.
+        '''
+        return {'calls': self.calls, 'shared': self.shared}
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+'''Потоковый разбор списков в больших JSON ответах.
+
+`JSONArrayStream` получает тело ответа частями и отдаёт байты каждого элемента
+списка из поля верхнего уровня, как только элемент полностью получен. В памяти
+находится только текущая часть тела и недочитанный элемент, поэтому первый
+элемент доступен до загрузки всего ответа.'''
+import re
+
+
+_TOKEN = re.compile(rb'[\[\]{}"]')
+_STRING = re.compile(rb'"(?:[^"\\]|\\.)*"')
+# Всё до следующей скобки, включая завершённые строки.
+_SKIP = re.compile(rb'(?:[^"\[\]{}]|"(?:[^"\\]|\\.)*")*')
+
+
+class JSONArrayStream:
+    '''Инкрементальный разбор списка объектов из поля верхнего уровня JSON объекта.
+
+    Элементами списка должны быть объекты или списки, остальные значения пропускаются.
+    Разбор не проверяет корректность JSON вне элементов, сами элементы проверяет декодер.
+
+    Examples:
+        >>> stream = JSONArrayStream('servers')
+        >>> stream.feed(b'{"servers": [{"id": 1}, {"i')
+        [b'{"id": 1}']
+        >>> stream.feed(b'd": 2}], "meta": {"total": 2}}')
+        [b'{"id": 2}']
+
+    Attributes:
+        field (str): Поле со списком.
+        done (bool): Список полностью разобран.
+    '''
+
+    def __init__(self, field: str):
+        '''Инициализация разбора.
+
+        Args:
+            field (str): Поле верхнего уровня со списком.
+        '''
+        self.field = field
+        self.done = False
+        self._key = f'"{field}"'.encode()
+        self._buffer = b''
+        self._pos = 0
+        self._depth = 0
+        self._in_array = False
+        self._last_string: bytes | None = None
+        self._item_start: int | None = None
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        '''Добавляет часть тела ответа.
+
+        Args:
+            chunk (bytes): Очередная часть тела.
+
+        Returns:
+            list[bytes]: Элементы списка, полностью полученные с этой частью.
+        '''
+        if self.done:
+            return []
+        buffer = self._buffer = self._buffer + chunk
+        items: list[bytes] = []
+        pos = self._pos
+        size = len(buffer)
+        while pos < size:
+            if self._depth >= 2:
+                index = _SKIP.match(buffer, pos).end()  # type: ignore[union-attr]
+                if index >= size:
+                    pos = size
+                    break
+            else:
+                match = _TOKEN.search(buffer, pos)
+                if match is None:
+                    pos = size
+                    break
+                index = match.start()
+            token = buffer[index]
+            if token == 0x22:  # "
+                string = _STRING.match(buffer, index)
+                if string is None:  # строка ещё не получена целиком
+                    pos = index
+                    break
+                if self._depth == 1:
+                    self._last_string = string.group()
+                pos = string.end()
+                continue
+            pos = index + 1
+            if token in (0x7B, 0x5B):  # { [
+                self._depth += 1
+                if self._in_array and self._depth == 3:
+                    self._item_start = index
+                elif (
+                    not self._in_array and token == 0x5B and self._depth == 2
+                    and self._last_string == self._key
+                ):
+                    self._in_array = True
+            else:
+                self._depth -= 1
+                if self._in_array and self._depth == 2 and self._item_start is not None:
+                    items.append(buffer[self._item_start:pos])
+                    self._item_start = None
+                elif self._in_array and self._depth == 1:
+                    self.done = True
+                    self._buffer = b''
+                    return items
+        keep = pos
+        if self._item_start is not None:
+            keep = min(keep, self._item_start)
+            self._item_start -= keep
+        self._buffer = buffer[keep:]
+        self._pos = pos - keep
+        return items
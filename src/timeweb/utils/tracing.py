@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+'''Трассировка вызовов API, совместимая с OpenTelemetry.
+
+Если в транспорте задан `tracer`, то каждый публичный метод API (`VDSAPI.create`,
+`DomainsAPI.add_dns_record`, ...) выполняется в спане с идентификаторами ресурсов
+из аргументов и `response_id` ответа или ошибки. Внутри него каждая попытка HTTP
+запроса и разбор ответа получают дочерние спаны с шаблоном эндпоинта, статусом,
+временем сериализации тела запроса, декодирования и валидации ответа.
+
+Трассировщик должен поддерживать `start_as_current_span(name, attributes=...)`
+из API OpenTelemetry, поэтому подходит `opentelemetry.trace.get_tracer()` без
+обёрток (`pip install timeweb-cloud[tracing]`):
+
+    from opentelemetry import trace
+
+    tw = Timeweb('token', transport=Transport('token', tracer=trace.get_tracer('timeweb')))
+
+Без OpenTelemetry можно использовать `RecordingTracer`, который хранит спаны в памяти.'''
+import time
+import inspect
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, ContextManager, Iterator, Protocol, TypeVar
+
+from ..errors import exc
+
+
+F = TypeVar('F', bound=Callable[..., Any])
+#: Аргументы методов API, которые попадают в атрибуты спана как `timeweb.<имя>`.
+RESOURCE_ARGS = ('fqdn', 'subdomain_fqdn', 'domain', 'mailbox', 'ip', 'action')
+
+
+class Span(Protocol):
+    def set_attribute(self, key: str, value: Any) -> None:
+        ...
+
+
+class Tracer(Protocol):
+    def start_as_current_span(
+        self, name: str, attributes: dict[str, Any] | None = None
+    ) -> ContextManager[Span]:
+        ...
+
+
+@dataclass
+class RecordedSpan:
+    '''Спан `RecordingTracer`.
+
+    Attributes:
+        name (str): Имя спана.
+        attributes (dict[str, Any]): Атрибуты.
+        parent (RecordedSpan | None): Родительский спан.
+        start (float): Начало по `time.perf_counter`.
+        end (float | None): Окончание по `time.perf_counter`.
+        exception (BaseException | None): Исключение, завершившее спан.
+    '''
+    name: str
+    attributes: dict[str, Any]
+    parent: 'RecordedSpan | None' = None
+    start: float = field(default_factory=time.perf_counter)
+    end: float | None = None
+    exception: BaseException | None = None
+
+    @property
+    def duration(self) -> float | None:
+        '''Длительность в секундах.'''
+        return None if self.end is None else self.end - self.start
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+class RecordingTracer:
+    '''Трассировщик, который хранит спаны в памяти, например для тестов и отладки.
+
+    Attributes:
+        spans (list[RecordedSpan]): Завершённые спаны в порядке завершения.
+    '''
+
+    def __init__(self):
+        self.spans: list[RecordedSpan] = []
+        self._current: ContextVar[RecordedSpan | None] = ContextVar('timeweb_span', default=None)
+
+    @contextmanager
+    def start_as_current_span(
+        self, name: str, attributes: dict[str, Any] | None = None, **kwargs: Any
+    ) -> Iterator[RecordedSpan]:
+        span = RecordedSpan(name, dict(attributes or {}), self._current.get())
+        token = self._current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.exception = e
+            raise
+        finally:
+            span.end = time.perf_counter()
+            self._current.reset(token)
+            self.spans.append(span)
+
+    def find(self, name: str) -> list[RecordedSpan]:
+        '''Завершённые спаны с именем `name`.'''
+        return [span for span in self.spans if span.name == name]
+
+
+def _attribute(value: Any) -> Any:
+    return value if isinstance(value, (str, bool, int, float)) else str(value)
+
+
+def _response_id(result: Any) -> Any:
+    if isinstance(result, dict):
+        return result.get('response_id')
+    return getattr(result, 'response_id', None)
+
+
+def call_attributes(signature: inspect.Signature, args: tuple, kwargs: dict[str, Any]) -> dict[str, Any]:
+    '''Атрибуты спана из идентификаторов ресурсов в аргументах метода API.
+
+    Args:
+        signature (inspect.Signature): Сигнатура метода.
+        args (tuple): Позиционные аргументы, включая `self`.
+        kwargs (dict[str, Any]): Именованные аргументы.
+
+    Returns:
+        dict[str, Any]: Атрибуты вида `timeweb.server_id`.
+    '''
+    try:
+        bound = signature.bind(*args, **kwargs)
+    except TypeError:
+        return {}
+    return {
+        f'timeweb.{name}': _attribute(value)
+        for name, value in bound.arguments.items()
+        if value is not None and (name.endswith('_id') or name in RESOURCE_ARGS)
+    }
+
+
+def _finish(span: Span, result: Any) -> None:
+    response_id = _response_id(result)
+    if response_id is not None:
+        span.set_attribute('timeweb.response_id', str(response_id))
+
+
+def _fail(span: Span, error: exc.TimewebError) -> None:
+    span.set_attribute('http.status_code', error.response.status_code)
+    if error.response_id is not None:
+        span.set_attribute('timeweb.response_id', str(error.response_id))
+
+
+def traced(func: F) -> F:
+    '''Оборачивает метод API в спан трассировщика транспорта.
+
+    Без трассировщика метод вызывается напрямую.
+
+    Args:
+        func (F): Синхронный или асинхронный метод API.
+
+    Returns:
+        F: Обёрнутый метод.
+    '''
+    name = func.__qualname__
+    # Сигнатура нужна только при трассировке, поэтому не замедляет импорт API.
+    signature = functools.cache(lambda: inspect.signature(func))
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            tracer = self.transport.tracer
+            if tracer is None:
+                return await func(self, *args, **kwargs)
+            attributes = call_attributes(signature(), (self, *args), kwargs)
+            with tracer.start_as_current_span(name, attributes=attributes) as span:
+                try:
+                    result = await func(self, *args, **kwargs)
+                except exc.TimewebError as e:
+                    _fail(span, e)
+                    raise
+                _finish(span, result)
+                return result
+        return async_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        tracer = self.transport.tracer
+        if tracer is None:
+            return func(self, *args, **kwargs)
+        attributes = call_attributes(signature(), (self, *args), kwargs)
+        with tracer.start_as_current_span(name, attributes=attributes) as span:
+            try:
+                result = func(self, *args, **kwargs)
+            except exc.TimewebError as e:
+                _fail(span, e)
+                raise
+            _finish(span, result)
+            return result
+    return wrapper  # type: ignore[return-value]
+
+
+def trace_public_methods(cls: type) -> None:
+    '''Оборачивает публичные методы класса API в `traced`.
+
+    Генераторы `iter_*` и `stream_*` не оборачиваются: их страницы и запросы
+    попадают в трассировку через вызываемые методы и HTTP спаны.
+
+    Args:
+        cls (type): Класс API.
+    '''
+    for name, value in list(vars(cls).items()):
+        if (
+            name.startswith(('_', 'iter_', 'stream_')) or not inspect.isfunction(value)
+            or inspect.isgeneratorfunction(value) or inspect.isasyncgenfunction(value)
+        ):
+            continue
+        setattr(cls, name, traced(value))
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import re
 import argparse
 
 
@@ -19,15 +20,26 @@ def main():
             lines[i] = line.replace(b'from httpx import Client', b'from httpx import AsyncClient')
         elif line.startswith(b'from .base import BaseClient'):
             lines[i] = line.replace(b'from .base import BaseClient', b'from .base import BaseAsyncClient')
+        elif line.startswith(b'from .transport import Transport'):
+            lines[i] = line.replace(b'from .transport import Transport', b'from .transport import AsyncTransport')
         elif b'API(BaseClient)' in line:
             lines[i] = line.replace(b'API(BaseClient)', b'API(BaseAsyncClient)')
         elif line.startswith(b'    def __init__'):
             lines[i] = line.replace(b'client: Client', b'client: AsyncClient')
         elif line.startswith(b'            client (Client'):
             lines[i] = line.replace(b'            client (Client', b'            client (AsyncClient')
+        elif line.startswith(b'            transport (Transport'):
+            lines[i] = line.replace(b'            transport (Transport', b'            transport (AsyncTransport')
+        elif b'client: Client' in line or b'transport: Transport' in line:
+            lines[i] = line.replace(
+                b'client: Client', b'client: AsyncClient'
+            ).replace(b'transport: Transport', b'transport: AsyncTransport')
         elif line.startswith(b'    def'):
-            if not line.startswith(b'    def __init__'):
+            # iter_* и stream_* возвращают асинхронный генератор из `_paginate`/`_stream`.
+            if not line.startswith((b'    def __init__', b'    def iter_', b'    def stream_')):
                 lines[i] = line.replace(b'    def', b'    async def')
+        elif line.startswith(b'from typing import') or line.startswith(b'    ) -> Iterator['):
+            lines[i] = re.sub(rb'\bIterator\b', b'AsyncIterator', line)
         elif b'self._request' in line:
             lines[i] = line.replace(b'self._request', b'await self._request')
     with open(args.path, 'wb') as file:
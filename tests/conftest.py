@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
+from typing import Any, Callable, Iterator
+
 import httpx
 import pytest
 from pydantic import BaseSettings, Field
 
-from timeweb import Timeweb
+from timeweb import Timeweb, Transport, RetryPolicy
+
+from fake_api import FakeAPI
 
 
 IP_SERVICES = [
@@ -12,22 +16,35 @@ IP_SERVICES = [
 ]
 
 
+TEST_SSH_KEY = 'ssh-ed25519 AAAAC3NzaC1lZDI1NTE5AAAAIDS3jLcJ3sG2mlgA9n7lS2yNn1TkS2sBv1AcKq2PZq9v pytest'
+
+
 class Config(BaseSettings):
-    token: str = Field(..., env='TIMEWEB_TOKEN')
-    ssh_key: str = Field(..., env='TEST_SSH_KEY')
+    '''Без `TIMEWEB_TOKEN` тесты выполняются на `FakeAPI`.'''
+    token: str | None = Field(None, env='TIMEWEB_TOKEN')
+    ssh_key: str | None = Field(None, env='TEST_SSH_KEY')
 
     class Config:
         env_file = 'tests/.env'
 
 
+@pytest.fixture(scope='session')
+def fake_api() -> FakeAPI:
+    return FakeAPI()
+
+
 @pytest.fixture()
-def tw():
+def tw(fake_api: FakeAPI):
     cfg = Config()
+    if cfg.token is None:
+        return Timeweb('token', fake_api.client())
     return Timeweb(cfg.token)
 
 
 @pytest.fixture()
 def my_ip() -> str:
+    if Config().token is None:
+        return '192.0.2.1'
     for srv in IP_SERVICES:
         try:
             resp = httpx.get(srv)
@@ -41,4 +58,82 @@ def my_ip() -> str:
 
 @pytest.fixture()
 def test_ssh_key() -> str:
-    return Config().ssh_key
+    return Config().ssh_key or TEST_SSH_KEY
+
+
+def _vds(server_id: int) -> dict[str, Any]:
+    return {
+        'id': server_id, 'name': f'server-{server_id}', 'comment': '',
+        'os': {'id': 47, 'name': 'ubuntu', 'version': '22.04'},
+        'location': 'ru-1', 'boot_mode': 'std', 'status': 'on',
+        'is_ddos_guard': False, 'cpu': 1, 'cpu_frequency': '3.3', 'ram': 1024,
+        'networks': [{
+            'type': 'public', 'ips': [
+                {'type': 'ipv4', 'ip': '10.0.0.1', 'is_main': True}
+            ]
+        }],
+        'disks': [{
+            'id': server_id, 'size': 15360, 'used': 0, 'type': 'nvme',
+            'is_mounted': True, 'is_system': True, 'system_name': 'vda',
+            'status': 'done'
+        }],
+        'created_at': '2023-03-01T10:00:00.000Z'
+    }
+
+
+@pytest.fixture()
+def vds() -> Callable[[int], dict[str, Any]]:
+    '''Построитель JSON облачного сервера по его ID.'''
+    return _vds
+
+
+@pytest.fixture()
+def servers_handler() -> Callable[[int], Callable[[httpx.Request], httpx.Response]]:
+    '''Фабрика обработчиков `GET /servers`, отдающих `count` серверов.'''
+    def make(count: int = 1) -> Callable[[httpx.Request], httpx.Response]:
+        def handler(request: httpx.Request) -> httpx.Response:
+            servers = [_vds(i) for i in range(1, count + 1)]
+            return httpx.Response(200, json={'servers': servers, 'meta': {'total': count}})
+        return handler
+    return make
+
+
+@pytest.fixture()
+def mock_client() -> Iterator[Callable[..., httpx.Client]]:
+    '''Фабрика HTTPX клиентов, отвечающих через `handler(request)`.'''
+    clients: list[httpx.Client] = []
+
+    def make(handler: Callable[[httpx.Request], httpx.Response]) -> httpx.Client:
+        client = httpx.Client(base_url=Transport.BASE_URL, transport=httpx.MockTransport(handler))
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture()
+def fast_retry() -> RetryPolicy:
+    '''Политика повторов без задержек.'''
+    return RetryPolicy(max_attempts=3, backoff_factor=0, jitter=False)
+
+
+@pytest.fixture()
+def presets_handler() -> Callable[[list[httpx.Request]], Callable[[httpx.Request], httpx.Response]]:
+    '''Фабрика обработчиков тарифов серверов, записывающих запросы в `requests`.'''
+    def make(requests: list[httpx.Request]) -> Callable[[httpx.Request], httpx.Response]:
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={
+                'server_presets': [{
+                    'id': 1, 'location': 'ru-1', 'price': 165, 'cpu': 1,
+                    'cpu_frequency': '3.3', 'ram': 1024, 'disk': 15360,
+                    'disk_type': 'nvme', 'bandwidth': 200, 'description': '',
+                    'description_short': '', 'is_allowed_local_network': True,
+                    'tags': []
+                }],
+                'meta': {'total': 1}
+            })
+        return handler
+    return make
@@ -0,0 +1,506 @@
+# -*- coding: utf-8 -*-
+'''Локальная имитация Timeweb Cloud API для тестов и бенчмарков.
+
+Маршруты и ответы строятся по спецификации `.github/api_check/current_bundle.json`:
+примеры ответов собираются из схем, а эндпоинты со списками (`GET /servers`,
+`GET /domains/{fqdn}/dns-records`, ...) хранят состояние, поддерживают
+`limit`/`offset`, создание, изменение и удаление элементов. Задержку ответов и
+ошибки `429`/`500` можно внедрять для проверки повторов и лимитеров.
+
+    fake = FakeAPI(latency=0.01, faults={429: 0.05})
+    fake.seed('/servers', 1000)
+    tw = Timeweb('token', fake.client())
+'''
+import re
+import copy
+import json
+import time
+import uuid
+import random
+import asyncio
+import threading
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+import httpx
+
+
+BUNDLE = Path(__file__).resolve().parent.parent / '.github' / 'api_check' / 'current_bundle.json'
+BASE_URL = 'https://api.timeweb.cloud/api/v1/'
+PREFIX = '/api/v1'
+METHODS = ('get', 'post', 'put', 'patch', 'delete')
+ERROR_CODES = {
+    400: 'bad_request', 401: 'unauthorized', 403: 'forbidden',
+    404: 'not_found', 405: 'method_not_allowed', 409: 'conflict',
+    429: 'too_many_requests', 500: 'internal_server_error'
+}
+# Поля, названия которых в спецификации отличаются от ответов API.
+FIELD_NAMES = {'ssh-keys': 'ssh_keys', 'ssh-key': 'ssh_key', 'disk_stats': 'dist_stats'}
+# Примеры из спецификации, которые не проходят проверку моделями клиента: (схема, поле) -> значение.
+EXAMPLES = {
+    ('domain', 'paid_till'): '2023-01-27T00:00:00Z',
+    ('s3-object', 'checksum_algorithm'): 'CRC32',
+    ('auto-backup', 'creation_start_at'): '2023-02-02',
+    ('dedicated-server-additional-service', 'period'): 'forever',
+}
+Handler = Callable[['FakeAPI', httpx.Request, dict[str, str]], httpx.Response]
+_handlers: dict[tuple[str, str], Handler] = {}
+
+
+def handles(method: str, template: str) -> Callable[[Handler], Handler]:
+    '''Регистрирует обработчик эндпоинта вместо обработки по схеме.'''
+    def decorator(func: Handler) -> Handler:
+        _handlers[(method.upper(), template)] = func
+        return func
+    return decorator
+
+
+class Route:
+    '''Эндпоинт из спецификации.'''
+
+    def __init__(self, template: str, operations: dict[str, Any]):
+        self.template = template
+        self.operations = operations
+        self.params = re.findall(r'{(\w+)}', template)
+        self.pattern = re.compile(
+            '^' + re.sub(r'{(\w+)}', r'(?P<\1>[^/]+)', template) + '$'
+        )
+        self.field: str | None = None
+        self.item_schema: dict[str, Any] | None = None
+        self.parent: 'Route | None' = None
+
+    def __repr__(self) -> str:
+        return f'Route({self.template!r})'
+
+
+class FakeAPI:
+    '''Имитация Timeweb Cloud API на основе `httpx.MockTransport`.
+
+    Attributes:
+        token (str | None): Ожидаемый API токен, None - любой.
+        latency (float | Callable[[httpx.Request], float]): Задержка ответа в секундах.
+        faults (dict[int, float]): Вероятность ответа с указанным статусом, например `{429: 0.05, 500: 0.01}`.
+        retry_after (int): Значение `Retry-After` для внедрённых `429`.
+        requests (list[httpx.Request]): Полученные запросы.
+        collections (dict[str, list[dict]]): Состояние списков по пути коллекции, например `/servers`.
+    '''
+
+    def __init__(
+        self, bundle: Path | str = BUNDLE, token: str | None = None,
+        latency: float | Callable[[httpx.Request], float] = 0,
+        faults: dict[int, float] | None = None, retry_after: int = 0,
+        seed: int = 0
+    ):
+        with open(bundle, 'rb') as file:
+            self.spec = json.load(file)
+        for (name, field), value in EXAMPLES.items():
+            self.spec['components']['schemas'][name]['properties'][field] = {'example': value}
+        self.token = token
+        self.latency = latency
+        self.faults = faults or {}
+        self.retry_after = retry_after
+        self.requests: list[httpx.Request] = []
+        self.collections: dict[str, list[dict[str, Any]]] = {}
+        self.state: dict[str, Any] = {}
+        self._random = random.Random(seed)
+        self._queued: list[int] = []
+        self._ids = 0
+        self._lock = threading.Lock()
+        self.routes = self._load_routes()
+
+    # Схемы
+
+    def resolve(self, schema: dict[str, Any]) -> dict[str, Any]:
+        '''Раскрывает `$ref` и объединяет `allOf`.'''
+        while '$ref' in schema:
+            node: Any = self.spec
+            for part in schema['$ref'].lstrip('#/').split('/'):
+                node = node[part]
+            schema = node
+        if 'allOf' in schema and len(schema['allOf']) == 1:
+            return self.resolve(schema['allOf'][0])
+        if 'allOf' in schema:
+            merged: dict[str, Any] = {'type': 'object', 'properties': {}, 'required': []}
+            for part in schema['allOf']:
+                part = self.resolve(part)
+                merged['properties'].update({
+                    FIELD_NAMES.get(name, name): prop
+                    for name, prop in part.get('properties', {}).items()
+                })
+                merged['required'] += part.get('required', [])
+            return merged
+        for key in ('oneOf', 'anyOf'):
+            if key in schema:
+                return self.resolve(schema[key][0])
+        return schema
+
+    def example(self, schema: dict[str, Any]) -> Any:
+        '''Собирает пример значения по схеме.'''
+        schema = self.resolve(schema)
+        kind = schema.get('type')
+        if kind == 'object' or 'properties' in schema:
+            if isinstance(schema.get('example'), dict) and 'properties' not in schema:
+                return copy.deepcopy(schema['example'])
+            return {
+                FIELD_NAMES.get(name, name): self.example(prop)
+                for name, prop in schema.get('properties', {}).items()
+            }
+        if kind == 'array':
+            if isinstance(schema.get('example'), list):
+                return copy.deepcopy(schema['example'])
+            return [self.example(schema.get('items', {}))]
+        if 'example' in schema:
+            return copy.deepcopy(schema['example'])
+        if 'enum' in schema:
+            return schema['enum'][0]
+        if kind in ('number', 'integer'):
+            return 0
+        if kind == 'boolean':
+            return False
+        if kind == 'string':
+            return {
+                'date-time': '2023-03-01T10:00:00Z', 'uuid': str(uuid.UUID(int=0)),
+                'ipv4': '10.0.0.1', 'ipv6': '2a03:6f00::1', 'email': 'user@example.com'
+            }.get(schema.get('format', ''), 'string')
+        return None
+
+    def _response_schema(self, operation: dict[str, Any]) -> tuple[int, dict[str, Any] | None]:
+        for status, response in operation['responses'].items():
+            if status.startswith('2'):
+                response = self.resolve(response)
+                content = response.get('content', {}).get('application/json')
+                return int(status), self.resolve(content['schema']) if content else None
+        return 200, None
+
+    def _load_routes(self) -> list[Route]:
+        routes = {}
+        for path, item in self.spec['paths'].items():
+            operations = {m.upper(): op for m, op in item.items() if m in METHODS}
+            routes[path[len(PREFIX):]] = Route(path[len(PREFIX):], operations)
+        # Пути, которых нет в спецификации, но которые использует клиент.
+        for _, template in _handlers:
+            routes.setdefault(template, Route(template, {}))
+        for route in routes.values():
+            if 'GET' in route.operations:
+                _, schema = self._response_schema(route.operations['GET'])
+                arrays = [
+                    (name, self.resolve(prop)) for name, prop in (schema or {}).get('properties', {}).items()
+                    if self.resolve(prop).get('type') == 'array'
+                ]
+                if len(arrays) == 1 and 'items' in arrays[0][1]:
+                    route.field = FIELD_NAMES.get(arrays[0][0], arrays[0][0])
+                    route.item_schema = self.resolve(arrays[0][1]['items'])
+            parent = routes.get(route.template.rsplit('/', 1)[0])
+            if route.params and route.template.endswith('}') and parent is not None:
+                route.parent = parent
+        # Литеральные сегменты важнее параметров: `/servers/presets` раньше `/servers/{server_id}`.
+        return sorted(routes.values(), key=lambda r: (len(r.params), -len(r.template)))
+
+    # Состояние
+
+    def _id_field(self, route: Route) -> str:
+        param = route.params[-1]
+        properties = (route.parent.item_schema or {}).get('properties', {}) if route.parent else {}
+        if param in properties:
+            return param
+        return 'id'
+
+    def new_item(self, collection: str, **fields: Any) -> dict[str, Any]:
+        '''Создаёт элемент коллекции по схеме, не сохраняя его.'''
+        route, _ = self.match(collection)
+        if route is None or route.item_schema is None:
+            raise KeyError(f'{collection} не является коллекцией')
+        item = self.example(route.item_schema)
+        properties = route.item_schema.get('properties', {})
+        with self._lock:
+            self._ids += 1
+            number = self._ids
+        if 'id' in properties:
+            id_schema = self.resolve(properties['id'])
+            item['id'] = str(uuid.UUID(int=number)) if id_schema.get('type') == 'string' else number
+        if isinstance(item.get('name'), str):
+            item['name'] = f'{item["name"]}-{number}'
+        if 'created_at' in properties:
+            item['created_at'] = datetime.now(timezone.utc).isoformat()
+        item.update({k: v for k, v in fields.items()})
+        return item
+
+    def add(self, collection: str, **fields: Any) -> dict[str, Any]:
+        '''Добавляет элемент в коллекцию, например `fake.add('/ssh-keys', name='key')`.'''
+        item = self.new_item(collection, **fields)
+        self.collections.setdefault(collection, []).append(item)
+        return item
+
+    def seed(self, collection: str, count: int, **fields: Any) -> list[dict[str, Any]]:
+        '''Добавляет в коллекцию `count` элементов.'''
+        return [self.add(collection, **fields) for _ in range(count)]
+
+    def fail(self, status: int, times: int = 1) -> None:
+        '''Следующие `times` запросов получат ответ с ошибкой `status`.'''
+        self._queued.extend([status] * times)
+
+    # Обработка запросов
+
+    def match(self, path: str) -> tuple[Route | None, dict[str, str]]:
+        '''Находит эндпоинт по пути без префикса `/api/v1`.'''
+        for route in self.routes:
+            found = route.pattern.match(path)
+            if found:
+                return route, found.groupdict()
+        return None, {}
+
+    def error(self, status: int, message: str | None = None) -> httpx.Response:
+        '''Ответ с ошибкой в формате API.'''
+        headers = {'Retry-After': str(self.retry_after)} if status == 429 else None
+        return httpx.Response(status, headers=headers, json={
+            'status_code': status, 'error_code': ERROR_CODES.get(status, 'error'),
+            'message': message or ERROR_CODES.get(status, 'error'),
+            'response_id': str(uuid.uuid4())
+        })
+
+    def _delay(self, request: httpx.Request) -> float:
+        return self.latency(request) if callable(self.latency) else self.latency
+
+    def _fault(self) -> int | None:
+        with self._lock:
+            if self._queued:
+                return self._queued.pop(0)
+            roll = self._random.random()
+        for status, probability in self.faults.items():
+            if roll < probability:
+                return status
+            roll -= probability
+        return None
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        '''Обрабатывает запрос без задержки.'''
+        self.requests.append(request)
+        if self.token is not None and request.headers.get('Authorization') != f'Bearer {self.token}':
+            return self.error(401)
+        status = self._fault()
+        if status is not None:
+            return self.error(status)
+        path = request.url.path
+        if not path.startswith(PREFIX):
+            return self.error(404)
+        route, params = self.match(path[len(PREFIX):].rstrip('/'))
+        if route is None:
+            return self.error(404)
+        custom = _handlers.get((request.method, route.template))
+        if custom is not None:
+            return custom(self, request, params)
+        if request.method not in route.operations:
+            return self.error(405)
+        body = json.loads(request.content) if request.content else {}
+        if route.field is not None:
+            return self._collection(route, request, body)
+        if route.parent is not None and route.parent.field is not None:
+            return self._item(route, request, params, body)
+        return self._static(route.operations[request.method])
+
+    def _static(self, operation: dict[str, Any]) -> httpx.Response:
+        status, schema = self._response_schema(operation)
+        if schema is None or status == 204:
+            return httpx.Response(status)
+        return httpx.Response(status, json=self.example(schema))
+
+    def _wrap(self, operation: dict[str, Any], item: dict[str, Any]) -> httpx.Response:
+        '''Ответ с элементом под ключом из схемы ответа, например `{"server": {...}}`.'''
+        status, schema = self._response_schema(operation)
+        if schema is None or status == 204:
+            return httpx.Response(status)
+        data = self.example(schema)
+        for name, prop in schema.get('properties', {}).items():
+            prop = self.resolve(prop)
+            if (prop.get('type') == 'object' or 'properties' in prop) and name != 'meta':
+                data[FIELD_NAMES.get(name, name)] = item
+                break
+        return httpx.Response(status, json=data)
+
+    def _collection(self, route: Route, request: httpx.Request, body: dict[str, Any]) -> httpx.Response:
+        key = request.url.path[len(PREFIX):].rstrip('/')
+        items = self.collections.setdefault(key, [])
+        if request.method == 'GET':
+            offset = int(request.url.params.get('offset', 0))
+            limit = int(request.url.params.get('limit', 100))
+            _, schema = self._response_schema(route.operations['GET'])
+            data = {k: v for k, v in self.example(schema or {}).items() if k != route.field}
+            data[route.field] = items[offset:offset + limit]
+            data['meta'] = {'total': len(items)}
+            return httpx.Response(200, json=data)
+        if request.method == 'POST':
+            fields = {
+                k: v for k, v in body.items()
+                if k in (route.item_schema or {}).get('properties', {})
+            }
+            item = self.add(key, **fields)
+            return self._wrap(route.operations['POST'], item)
+        return self._static(route.operations[request.method])
+
+    def _item(
+        self, route: Route, request: httpx.Request, params: dict[str, str],
+        body: dict[str, Any]
+    ) -> httpx.Response:
+        assert route.parent is not None
+        collection = request.url.path[len(PREFIX):].rstrip('/').rsplit('/', 1)[0]
+        items = self.collections.get(collection, [])
+        id_field = self._id_field(route)
+        value = params[route.params[-1]]
+        found = next((i for i in items if str(i.get(id_field)) == value), None)
+        if found is None:
+            return self.error(404)
+        operation = route.operations[request.method]
+        if request.method == 'DELETE':
+            items.remove(found)
+            status, _ = self._response_schema(operation)
+            return httpx.Response(204 if status == 200 else status)
+        if request.method in ('PATCH', 'PUT'):
+            properties = (route.parent.item_schema or {}).get('properties', {})
+            found.update({k: v for k, v in body.items() if k in properties})
+        return self._wrap(operation, found)
+
+    # Транспорты
+
+    def transport(self) -> httpx.MockTransport:
+        '''Транспорт для `httpx.Client`, задержка - через `time.sleep`.'''
+        def handler(request: httpx.Request) -> httpx.Response:
+            delay = self._delay(request)
+            if delay > 0:
+                time.sleep(delay)
+            return self.handle(request)
+        return httpx.MockTransport(handler)
+
+    def async_transport(self) -> httpx.MockTransport:
+        '''Транспорт для `httpx.AsyncClient`, задержка - через `asyncio.sleep`.'''
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await request.aread()
+            delay = self._delay(request)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            return self.handle(request)
+        return httpx.MockTransport(handler)
+
+    def _headers(self, token: str | None) -> dict[str, str]:
+        token = token or self.token
+        return {'Authorization': f'Bearer {token}'} if token else {}
+
+    def client(self, token: str | None = None, **kwargs: Any) -> httpx.Client:
+        '''HTTPX клиент, отправляющий запросы в имитацию с токеном `token` (по умолчанию ожидаемым).'''
+        return httpx.Client(
+            base_url=BASE_URL, transport=self.transport(),
+            headers=self._headers(token), **kwargs
+        )
+
+    def async_client(self, token: str | None = None, **kwargs: Any) -> httpx.AsyncClient:
+        '''Асинхронный HTTPX клиент, отправляющий запросы в имитацию.'''
+        return httpx.AsyncClient(
+            base_url=BASE_URL, transport=self.async_transport(),
+            headers=self._headers(token), **kwargs
+        )
+
+
+# Эндпоинты, поведение которых не выводится из схемы.
+
+def _access(api: FakeAPI) -> dict[str, Any]:
+    if 'access' not in api.state:
+        api.state['access'] = {
+            'is_ip_restrictions_enabled': False,
+            'is_country_restrictions_enabled': False,
+            'white_list': {'ips': [], 'countries': []}
+        }
+    return api.state['access']
+
+
+@handles('GET', '/auth/access')
+def _get_access(api: FakeAPI, request: httpx.Request, params: dict[str, str]) -> httpx.Response:
+    return httpx.Response(200, json={**_access(api), 'response_id': str(uuid.uuid4())})
+
+
+@handles('GET', '/auth/access/countries')
+def _get_countries(api: FakeAPI, request: httpx.Request, params: dict[str, str]) -> httpx.Response:
+    return httpx.Response(200, json={'countries': {
+        'RU': 'Россия', 'KZ': 'Казахстан', 'BY': 'Беларусь', 'CZ': 'Чехия',
+        'DE': 'Германия', 'NL': 'Нидерланды', 'PL': 'Польша'
+    }, 'response_id': str(uuid.uuid4())})
+
+
+@handles('POST', '/auth/access/countries/enabled')
+@handles('POST', '/auth/access/ips/enabled')
+def _turn_access(api: FakeAPI, request: httpx.Request, params: dict[str, str]) -> httpx.Response:
+    kind = 'ip' if '/ips/' in request.url.path else 'country'
+    _access(api)[f'is_{kind}_restrictions_enabled'] = json.loads(request.content)['is_enabled']
+    return httpx.Response(204)
+
+
+@handles('POST', '/auth/access/countries')
+@handles('DELETE', '/auth/access/countries')
+@handles('POST', '/auth/access/ips')
+@handles('DELETE', '/auth/access/ips')
+def _change_white_list(api: FakeAPI, request: httpx.Request, params: dict[str, str]) -> httpx.Response:
+    field = request.url.path.rsplit('/', 1)[1]
+    values = json.loads(request.content)[field]
+    white_list = _access(api)['white_list'][field]
+    for value in values:
+        if request.method == 'POST' and value not in white_list:
+            white_list.append(value)
+        elif request.method == 'DELETE' and value in white_list:
+            white_list.remove(value)
+    return httpx.Response(201 if request.method == 'POST' else 200, json={
+        field: [{'value': value, 'status': 'success'} for value in values],
+        'response_id': str(uuid.uuid4())
+    })
+
+
+@handles('POST', '/auth/api-keys')
+def _create_api_key(api: FakeAPI, request: httpx.Request, params: dict[str, str]) -> httpx.Response:
+    body = json.loads(request.content)
+    item = api.add(
+        '/auth/api-keys', name=body['name'], expired_at=body.get('expire'),
+        token=uuid.uuid4().hex
+    )
+    return httpx.Response(201, json={'api_key': item, 'response_id': str(uuid.uuid4())})
+
+
+@handles('PUT', '/auth/api-keys/{token_id}')
+def _reissue_api_key(api: FakeAPI, request: httpx.Request, params: dict[str, str]) -> httpx.Response:
+    items = api.collections.get('/auth/api-keys', [])
+    found = next((i for i in items if str(i['id']) == params['token_id']), None)
+    if found is None:
+        return api.error(404)
+    found['expired_at'] = json.loads(request.content or b'{}').get('expire', found['expired_at'])
+    found['token'] = uuid.uuid4().hex
+    return httpx.Response(200, json={'api_key': found, 'response_id': str(uuid.uuid4())})
+
+
+# Эндпоинты, ответы которых в спецификации не совпадают с моделями клиента.
+
+@handles('GET', '/projects/resources/databases')
+@handles('GET', '/projects/{project_id}/resources/databases')
+def _get_project_dbs(api: FakeAPI, request: httpx.Request, params: dict[str, str]) -> httpx.Response:
+    route, _ = api.match(request.url.path[len(PREFIX):].rstrip('/'))
+    assert route is not None
+    data = api._collection(route, request, {}).json()
+    data['dbs'] = data.pop('databases')
+    return httpx.Response(200, json=data)
+
+
+@handles('GET', '/servers/{server_id}/statistics')
+def _get_statistics(api: FakeAPI, request: httpx.Request, params: dict[str, str]) -> httpx.Response:
+    route, _ = api.match(request.url.path[len(PREFIX):].rstrip('/'))
+    assert route is not None
+    _, schema = api._response_schema(route.operations['GET'])
+    data = api.example(schema or {})
+    # Модели ждут по одной записи вместо массивов и поле `outgoung`.
+    data = {k: v[0] if isinstance(v, list) else v for k, v in data.items()}
+    data['network_traffic']['outgoung'] = data['network_traffic']['outgoing']
+    return httpx.Response(200, json=data)
+
+
+@handles('GET', '/mail/{domain}')
+def _get_domain_mailboxes(api: FakeAPI, request: httpx.Request, params: dict[str, str]) -> httpx.Response:
+    # Клиент запрашивает ящики домена по пути без `/domains`.
+    path = f'/mail/domains/{params["domain"]}'
+    route, _ = api.match(path)
+    assert route is not None
+    return api._collection(route, httpx.Request('GET', request.url.copy_with(path=PREFIX + path)), {})
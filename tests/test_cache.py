@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+import time
+import asyncio
+
+import httpx
+import pytest
+
+from timeweb import (
+    Timeweb, AsyncTimeweb, Transport, AsyncTransport, TTLCache, SQLiteCache,
+    request_options
+)
+from timeweb.utils.lazy import LazyList
+
+
+@pytest.fixture()
+def make_timeweb(presets_handler):
+    def make(
+        requests: list[httpx.Request], cache: TTLCache | None = None,
+        disk_cache: SQLiteCache | None = None
+    ) -> Timeweb:
+        client = httpx.Client(
+            base_url=Transport.BASE_URL,
+            transport=httpx.MockTransport(presets_handler(requests))
+        )
+        transport = Transport('token', client, cache=cache, disk_cache=disk_cache)
+        return Timeweb('token', transport=transport)
+    return make
+
+
+def test_ttl_and_lru():
+    cache = TTLCache(maxsize=2, ttl=60, ttls={'short': 0.01})
+    cache.set('a', 1)
+    cache.set('b', 2, 'short')
+    assert cache.get('a') == 1
+    time.sleep(0.02)
+    assert cache.get('b') is None
+    cache.set('c', 3)
+    cache.set('d', 4)
+    assert cache.get('a') is None
+    assert cache.stats() == {
+        'size': 2, 'maxsize': 2, 'hits': 1, 'misses': 2,
+        'evictions': 1, 'expirations': 1
+    }
+
+
+def test_cached_endpoint(make_timeweb):
+    requests: list[httpx.Request] = []
+    cache = TTLCache()
+    tw = make_timeweb(requests, cache)
+    first = tw.servers.cloud.get_presets()
+    assert tw.servers.cloud.get_presets() is first
+    assert len(requests) == 1
+    with request_options(cache=False):
+        tw.servers.cloud.get_presets()
+    assert len(requests) == 2
+    assert cache.invalidate('VDSAPI.get_presets') == 1
+    tw.servers.cloud.get_presets()
+    assert len(requests) == 3
+    assert cache.hits == 1
+
+
+def test_cached_lazy_mode(tmp_path, make_timeweb):
+    requests: list[httpx.Request] = []
+    tw = make_timeweb(requests, TTLCache(), SQLiteCache(tmp_path / 'catalog.sqlite3'))
+    with request_options(lazy=True):
+        assert isinstance(tw.servers.cloud.get_presets().server_presets, LazyList)
+    assert type(tw.servers.cloud.get_presets().server_presets) is list
+    assert len(requests) == 2
+
+    # Запись на диске из обычного режима собирается лениво для `lazy` вызовов.
+    tw = make_timeweb(requests, disk_cache=SQLiteCache(tmp_path / 'catalog.sqlite3'))
+    with request_options(lazy=True):
+        presets = tw.servers.cloud.get_presets().server_presets
+    assert isinstance(presets, LazyList) and presets[0].id == 1
+    assert len(requests) == 2
+
+
+def test_disabled_by_default(presets_handler):
+    requests: list[httpx.Request] = []
+    client = httpx.Client(
+        base_url=Transport.BASE_URL,
+        transport=httpx.MockTransport(presets_handler(requests))
+    )
+    tw = Timeweb('token', client)
+    tw.servers.cloud.get_presets()
+    tw.servers.cloud.get_presets()
+    assert len(requests) == 2
+
+
+def test_async_cached_endpoint(presets_handler):
+    requests: list[httpx.Request] = []
+    cache = TTLCache()
+
+    async def run():
+        client = httpx.AsyncClient(
+            base_url=AsyncTransport.BASE_URL,
+            transport=httpx.MockTransport(presets_handler(requests))
+        )
+        transport = AsyncTransport('token', client, cache=cache)
+        async with AsyncTimeweb('token', transport=transport) as tw:
+            await tw.servers.cloud.get_presets()
+            await tw.servers.cloud.get_presets()
+        await client.aclose()
+
+    asyncio.run(run())
+    assert len(requests) == 1
+    assert cache.hits == 1
+
+
+def test_disk_cache_cold_start(tmp_path, make_timeweb):
+    requests: list[httpx.Request] = []
+    path = tmp_path / 'catalog.sqlite3'
+    make_timeweb(requests, disk_cache=SQLiteCache(path)).servers.cloud.get_presets()
+    assert len(requests) == 1
+
+    disk_cache = SQLiteCache(path)
+    tw = make_timeweb(requests, disk_cache=disk_cache)
+    presets = tw.servers.cloud.get_presets()
+    assert presets.server_presets[0].id == 1
+    assert len(requests) == 1
+    assert disk_cache.stats()['hits'] == 1
+    assert disk_cache.invalidate('VDSAPI.get_presets') == 1
+
+
+def test_disk_cache_stale_while_revalidate(tmp_path, make_timeweb):
+    requests: list[httpx.Request] = []
+    disk_cache = SQLiteCache(tmp_path / 'catalog.sqlite3', ttl=0)
+    tw = make_timeweb(requests, disk_cache=disk_cache)
+    tw.servers.cloud.get_presets()
+    assert tw.servers.cloud.get_presets().server_presets[0].id == 1
+    deadline = time.monotonic() + 2
+    while len(requests) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(requests) == 2
+    assert disk_cache.stale_hits == 1
+    assert disk_cache.refreshes == 1
+
+
+def test_disk_cache_token_isolation(tmp_path):
+    disk_cache = SQLiteCache(tmp_path / 'catalog.sqlite3')
+    disk_cache.set('token', 'VDSAPI.get_presets', '', '{}')
+    assert disk_cache.get('token', 'VDSAPI.get_presets') == ('{}', False)
+    assert disk_cache.get('other', 'VDSAPI.get_presets') is None
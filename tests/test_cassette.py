@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+import gzip
+import time
+import asyncio
+
+import pytest
+
+from timeweb import Timeweb, AsyncTimeweb, Transport, AsyncTransport, Cassette
+
+from fake_api import FakeAPI
+
+
+TOKEN = 'secret-token'
+
+
+def record(fake: FakeAPI) -> Cassette:
+    cassette = Cassette()
+    transport = Transport(TOKEN, http_transport=cassette.recorder(fake.transport(), token=TOKEN))
+    with Timeweb(TOKEN, transport=transport) as tw:
+        tw.servers.cloud.get_all(limit=10)
+        tw.ssh_keys.create('key', 'ssh-ed25519 AAAA ' + TOKEN, True)
+        tw.ssh_keys.get_keys()
+    return cassette
+
+
+def test_record_and_replay(tmp_path):
+    fake = FakeAPI(token=TOKEN, latency=0.02)
+    seeded = fake.seed('/servers', 5)
+    cassette = record(fake)
+    assert len(cassette) == 3
+    assert all(i.duration >= 0.02 for i in cassette.interactions)
+    path = tmp_path / 'sweep.jsonl.gz'
+    cassette.save(path)
+    assert TOKEN not in gzip.open(path, 'rt').read()
+
+    loaded = Cassette.load(path)
+    assert [i.key for i in loaded.interactions] == [i.key for i in cassette.interactions]
+    transport = Transport(TOKEN, http_transport=loaded.player(latency_scale=0, token=TOKEN))
+    started = time.perf_counter()
+    with Timeweb(TOKEN, transport=transport) as tw:
+        servers = tw.servers.cloud.get_all(limit=10).servers
+        key = tw.ssh_keys.create('key', 'ssh-ed25519 AAAA ' + TOKEN, True).ssh_key
+        keys = tw.ssh_keys.get_keys().ssh_keys
+    assert time.perf_counter() - started < 0.02
+    assert [s.id for s in servers] == [item['id'] for item in seeded]
+    assert key.body == 'ssh-ed25519 AAAA <TOKEN>'
+    assert keys[0].id == key.id
+    assert len(fake.requests) == 3
+
+
+def test_fifo_and_strict():
+    fake = FakeAPI(token=TOKEN)
+    cassette = Cassette()
+    transport = Transport(TOKEN, http_transport=cassette.recorder(fake.transport(), token=TOKEN))
+    with Timeweb(TOKEN, transport=transport) as tw:
+        assert tw.ssh_keys.get_keys().meta.total == 0
+        tw.ssh_keys.create('key', 'ssh-ed25519 AAAA', True)
+        assert tw.ssh_keys.get_keys().meta.total == 1
+
+    tw = Timeweb(TOKEN, transport=Transport(TOKEN, http_transport=cassette.player(latency_scale=0)))
+    assert tw.ssh_keys.get_keys().meta.total == 0
+    assert tw.ssh_keys.get_keys().meta.total == 1
+    assert tw.ssh_keys.get_keys().meta.total == 1
+
+    tw = Timeweb(TOKEN, transport=Transport(TOKEN, http_transport=cassette.player(strict=True)))
+    tw.ssh_keys.get_keys()
+    tw.ssh_keys.get_keys()
+    with pytest.raises(LookupError):
+        tw.ssh_keys.get_keys()
+    with pytest.raises(LookupError):
+        tw.servers.cloud.get_all()
+
+
+def test_async_replay_scaled_latency():
+    fake = FakeAPI(token=TOKEN, latency=0.05)
+    fake.seed('/servers', 3)
+    cassette = record(fake)
+
+    async def run(scale: float) -> float:
+        transport = AsyncTransport(TOKEN, http_transport=cassette.player(latency_scale=scale))
+        started = time.perf_counter()
+        async with AsyncTimeweb(TOKEN, transport=transport) as tw:
+            page = await tw.servers.cloud.get_all(limit=10)
+        assert len(page.servers) == 3
+        return time.perf_counter() - started
+
+    assert asyncio.run(run(0)) < 0.04
+    assert 0.08 <= asyncio.run(run(2)) < 0.5
+
+
+def test_async_record():
+    fake = FakeAPI(token=TOKEN)
+    fake.seed('/servers', 2)
+    cassette = Cassette()
+
+    async def run() -> None:
+        recorder = cassette.recorder(fake.async_transport(), token=TOKEN)
+        async with AsyncTimeweb(TOKEN, transport=AsyncTransport(TOKEN, http_transport=recorder)) as tw:
+            await tw.servers.cloud.get_all()
+
+    asyncio.run(run())
+    assert [(i.method, i.status) for i in cassette.interactions] == [('GET', 200)]
+    assert 'authorization' not in cassette.interactions[0].headers
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+
+from timeweb.utils import columnar
+from timeweb.schemas.servers.cloud import VDSArray
+from timeweb.schemas.kubernetes import ClustersResponse
+
+
+np = pytest.importorskip('numpy')
+
+
+@pytest.fixture()
+def servers(vds) -> dict:
+    return {'servers': [vds(i) for i in range(1, 4)], 'meta': {'total': 3}}
+
+
+def test_models_and_raw_match(servers):
+    raw = servers
+    raw['servers'][1]['preset_id'] = 7
+    from_models = columnar.to_numpy(VDSArray(**raw))
+    from_raw = columnar.to_numpy(raw)
+    from_items = columnar.to_numpy(iter(VDSArray(**raw).servers))
+    for name, values in from_models.items():
+        np.testing.assert_array_equal(values, from_raw[name])
+        np.testing.assert_array_equal(values, from_items[name])
+    assert from_models['id'].dtype == np.int64
+    assert from_models['ram'].sum() == 3 * 1024
+    assert from_models['disk_size'].tolist() == [15360] * 3
+    assert np.isnan(from_models['preset_id'][0]) and from_models['preset_id'][1] == 7
+    assert from_models['created_at'].dtype == np.dtype('datetime64[us]')
+    assert (from_models['status'] == 'on').all()
+
+
+def test_nullable_and_kind():
+    clusters = ClustersResponse(clusters=[{
+        'id': 1, 'name': 'k8s', 'created_at': '2023-03-01T10:00:00Z', 'status': 'started',
+        'description': '', 'ha': False, 'k8s_version': 'v1.25', 'network_driver': 'flannel',
+        'ingress': True, 'preset_id': 403, 'cpu': 4
+    }])
+    columns = columnar.to_numpy(clusters)
+    assert columns['cpu'][0] == 4 and np.isnan(columns['ram'][0])
+    assert columnar.to_numpy([], kind='dbs')['id'].shape == (0,)
+    with pytest.raises(ValueError):
+        columnar.to_numpy([])
+    with pytest.raises(ValueError):
+        columnar.to_numpy([], kind='balancers')
+
+
+def test_arrow(servers):
+    pa = pytest.importorskip('pyarrow')
+
+    async def items():
+        for server in VDSArray(**servers).servers:
+            yield server
+
+    table = asyncio.run(columnar.ato_arrow(items()))
+    assert table.num_rows == 3
+    assert table.schema.field('created_at').type == pa.timestamp('us', tz='UTC')
+    assert pa.types.is_dictionary(table.schema.field('location').type)
+    assert table.column('preset_id').null_count == 3
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+import sys
+from array import array
+
+import pytest
+
+from timeweb.schemas.servers.cloud import VDS, VDSArray, CompactVDS, VDSFleet
+
+
+def test_fleet_roundtrip(vds):
+    servers = VDSArray(servers=[vds(i) for i in range(1, 4)], meta={'total': 3}).servers
+    fleet = VDSFleet.from_models(servers)
+    assert len(fleet) == 3
+    assert isinstance(fleet.column('id'), array)
+    assert list(fleet.column('id')) == [1, 2, 3]
+    assert fleet.column('status') == ['on'] * 3
+    record = fleet[1]
+    assert isinstance(record, CompactVDS)
+    assert record.id == 2 and record.created_at.timestamp() == servers[1].created_at.timestamp()
+    with pytest.raises(AttributeError):
+        record.cpu = 4  # type: ignore
+    assert fleet.model(1) == servers[1]
+    assert [s.id for s in fleet.to_models(validate=False)] == [1, 2, 3]
+    assert [r.id for r in fleet[::2]] == [1, 3]
+    with pytest.raises(KeyError):
+        fleet.column('payload')
+
+
+def test_fleet_from_raw_interns_strings(vds):
+    fleet = VDSFleet.from_raw([vds(i) for i in range(1, 3)])
+    first, second = fleet
+    assert first.location is second.location
+    assert first.location is sys.intern('ru-1')
+    assert isinstance(first.to_model(), VDS)
+    assert first.to_model() == VDSFleet.from_models([first.to_model()]).model(0)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import httpx
+
+from timeweb import AsyncTimeweb, AsyncTransport, AIMDLimiter, RetryPolicy
+
+
+def run_load(limiter: AIMDLimiter, handler, requests: int = 200) -> None:
+    async def run():
+        client = httpx.AsyncClient(
+            base_url=AsyncTransport.BASE_URL,
+            transport=httpx.MockTransport(handler)
+        )
+        transport = AsyncTransport(
+            'token', client, concurrency=limiter,
+            retry=RetryPolicy(max_attempts=5, backoff_factor=0, jitter=False)
+        )
+        async with AsyncTimeweb('token', transport=transport) as tw:
+            await asyncio.gather(
+                *(tw.ssh_keys.get_keys() for _ in range(requests))
+            )
+        await client.aclose()
+
+    asyncio.run(run())
+
+
+def test_limit_grows_when_healthy():
+    limiter = AIMDLimiter(initial_limit=2, max_limit=20)
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal peak
+        peak = max(peak, limiter.in_flight)
+        await asyncio.sleep(0.001)
+        return httpx.Response(200, json={'ssh_keys': []})
+
+    run_load(limiter, handler)
+    assert limiter.limit > 2
+    assert limiter.increases > 0
+    assert 2 < peak <= 20
+    assert limiter.requests == 200
+    assert limiter.in_flight == 0
+
+
+def test_limit_shrinks_on_throttle():
+    limiter = AIMDLimiter(initial_limit=40)
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.001)
+        if calls % 10 == 0:
+            return httpx.Response(
+                429, json={'status_code': 429, 'error_code': 'too_many_requests'}
+            )
+        return httpx.Response(200, json={'ssh_keys': []})
+
+    run_load(limiter, handler)
+    stats = limiter.stats()
+    assert stats['throttled'] > 0
+    assert stats['decreases'] > 0
+    assert stats['limit'] < 40
+    assert stats['in_flight'] == 0
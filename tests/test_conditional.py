@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import httpx
+
+from timeweb import (
+    Timeweb, AsyncTimeweb, Transport, AsyncTransport, ConditionalCache,
+    request_options
+)
+
+
+def ssh_keys_handler(requests: list[httpx.Request]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get('If-None-Match') == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200, json={'ssh_keys': [], 'meta': {'total': 0}},
+            headers={'ETag': '"v1"'}
+        )
+    return handler
+
+
+def test_not_modified_returns_cached_model():
+    requests: list[httpx.Request] = []
+    conditional = ConditionalCache()
+    client = httpx.Client(
+        base_url=Transport.BASE_URL,
+        transport=httpx.MockTransport(ssh_keys_handler(requests))
+    )
+    tw = Timeweb(
+        'token', transport=Transport('token', client, conditional=conditional)
+    )
+    first = tw.ssh_keys.get_keys()
+    second = tw.ssh_keys.get_keys()
+    assert second is first
+    assert 'If-None-Match' not in requests[0].headers
+    assert requests[1].headers['If-None-Match'] == '"v1"'
+    assert conditional.stats()['not_modified'] == 1
+
+    with request_options(cache=False):
+        tw.ssh_keys.get_keys()
+    assert 'If-None-Match' not in requests[2].headers
+
+
+def test_not_modified_after_eviction():
+    requests: list[httpx.Request] = []
+    conditional = ConditionalCache()
+    handler = ssh_keys_handler(requests)
+
+    def evicting(request: httpx.Request) -> httpx.Response:
+        if 'If-None-Match' in request.headers:
+            conditional.clear()  # ответ вытеснен между `headers()` и `update()`
+        return handler(request)
+
+    client = httpx.Client(base_url=Transport.BASE_URL, transport=httpx.MockTransport(evicting))
+    tw = Timeweb('token', transport=Transport('token', client, conditional=conditional))
+    tw.ssh_keys.get_keys()
+    assert tw.ssh_keys.get_keys().ssh_keys == []
+    assert len(requests) == 3
+    assert requests[1].headers['If-None-Match'] == '"v1"'
+    assert 'If-None-Match' not in requests[2].headers
+    assert conditional.stats()['not_modified'] == 0 and len(conditional) == 1
+
+
+def test_params_are_part_of_key():
+    key = ConditionalCache.make_key('token', '/servers', {'limit': 10})
+    assert key != ConditionalCache.make_key('token', '/servers', {'limit': 20})
+    assert key != ConditionalCache.make_key('other', '/servers', {'limit': 10})
+
+
+def test_async_not_modified():
+    requests: list[httpx.Request] = []
+
+    async def run() -> bool:
+        client = httpx.AsyncClient(
+            base_url=AsyncTransport.BASE_URL,
+            transport=httpx.MockTransport(ssh_keys_handler(requests))
+        )
+        transport = AsyncTransport(
+            'token', client, conditional=ConditionalCache()
+        )
+        async with AsyncTimeweb('token', transport=transport) as tw:
+            first = await tw.ssh_keys.get_keys()
+            second = await tw.ssh_keys.get_keys()
+        await client.aclose()
+        return first is second
+
+    assert asyncio.run(run())
+    assert len(requests) == 2
+
+
+def test_async_not_modified_after_eviction():
+    requests: list[httpx.Request] = []
+    conditional = ConditionalCache(maxsize=1)
+    handler = ssh_keys_handler(requests)
+
+    def evicting(request: httpx.Request) -> httpx.Response:
+        if 'If-None-Match' in request.headers:
+            # ответ на другой запрос вытесняет сохранённый по LRU
+            conditional.update('other', httpx.Response(200, headers={'ETag': '"v2"'}))
+        return handler(request)
+
+    async def run() -> int:
+        client = httpx.AsyncClient(
+            base_url=AsyncTransport.BASE_URL, transport=httpx.MockTransport(evicting)
+        )
+        transport = AsyncTransport('token', client, conditional=conditional)
+        async with AsyncTimeweb('token', transport=transport) as tw:
+            await tw.ssh_keys.get_keys()
+            keys = await tw.ssh_keys.get_keys()
+        await client.aclose()
+        return keys.meta.total
+
+    assert asyncio.run(run()) == 0
+    assert len(requests) == 3
+    assert 'If-None-Match' not in requests[2].headers
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+from ipaddress import IPv4Address
+
+import httpx
+
+from timeweb import Timeweb, Transport, request_options
+from timeweb.utils.construct import construct
+from timeweb.schemas.s3.transfer import TransferError
+from timeweb.schemas.servers.cloud import VDSArray
+
+
+def test_construct_nested(vds):
+    data = {'servers': [vds(1), vds(2)], 'meta': {'total': 2}}
+    constructed = construct(VDSArray, data)
+    validated = VDSArray(**data)
+    assert type(constructed.meta) is type(validated.meta)
+    assert type(constructed.servers[0].networks[0].ips[0]) is type(
+        validated.servers[0].networks[0].ips[0]
+    )
+    assert constructed.servers[0].networks[0].ips[0].ip == '10.0.0.1'
+    assert validated.servers[0].networks[0].ips[0].ip == IPv4Address('10.0.0.1')
+    assert constructed.response_id is None
+    assert 'response_id' not in constructed.__fields_set__
+
+
+def test_construct_alias():
+    error = construct(TransferError, {'try': 3, 'value': 'fail'})
+    assert error.try_count == 3
+
+
+def test_validate_modes(servers_handler):
+    client = httpx.Client(
+        base_url=Transport.BASE_URL,
+        transport=httpx.MockTransport(servers_handler())
+    )
+    tw = Timeweb('token', transport=Transport('token', client, validate=False))
+    assert tw.servers.cloud.get_all().servers[0].created_at == '2023-03-01T10:00:00.000Z'
+    with request_options(validate=True):
+        assert tw.servers.cloud.get_all().servers[0].created_at.year == 2023
+
+    tw = Timeweb('token', client)
+    with request_options(validate=False):
+        assert isinstance(tw.servers.cloud.get_all().servers[0].created_at, str)
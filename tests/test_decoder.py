@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import json
+
+import httpx
+import pytest
+
+from timeweb import Timeweb, Transport, SQLiteCache
+from timeweb.utils.decoder import get_decoder
+
+
+def test_get_decoder():
+    assert get_decoder('json') is json.loads
+    assert get_decoder()(b'{"a": [1]}') == {'a': [1]}
+    with pytest.raises(ValueError):
+        get_decoder('yaml')
+
+
+def test_custom_decoder_is_used():
+    decoded: list[bytes] = []
+
+    def loads(content: bytes):
+        decoded.append(content)
+        return json.loads(content)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={'ssh_keys': []})
+
+    client = httpx.Client(
+        base_url=Transport.BASE_URL, transport=httpx.MockTransport(handler)
+    )
+    tw = Timeweb('token', transport=Transport('token', client, json_loads=loads))
+    assert tw.ssh_keys.get_keys().ssh_keys == []
+    assert decoded == [b'{"ssh_keys": []}']
+
+
+def test_disk_cache_uses_decoder(tmp_path, presets_handler):
+    requests: list[httpx.Request] = []
+    decoded: list[bytes] = []
+
+    def loads(content: bytes):
+        decoded.append(content)
+        return json.loads(content)
+
+    def make_timeweb() -> Timeweb:
+        client = httpx.Client(
+            base_url=Transport.BASE_URL, transport=httpx.MockTransport(presets_handler(requests))
+        )
+        disk_cache = SQLiteCache(tmp_path / 'catalog.sqlite3')
+        return Timeweb('token', transport=Transport('token', client, disk_cache=disk_cache, json_loads=loads))
+
+    make_timeweb().servers.cloud.get_presets()
+    presets = make_timeweb().servers.cloud.get_presets()
+    assert len(requests) == 1
+    assert len(decoded) == 2 and b'server_presets' in decoded[1]
+    assert presets.server_presets[0].price == 165
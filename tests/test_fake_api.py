@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+import time
+import uuid
+import asyncio
+import inspect
+from datetime import datetime
+
+import pytest
+
+from timeweb import Timeweb, AsyncTimeweb, Transport, AsyncTransport, RetryPolicy
+from timeweb.errors import exc
+
+from fake_api import FakeAPI, PREFIX
+
+
+# Значения обязательных аргументов GET методов по аннотации.
+GET_ARGS = {
+    int: 1, str: 'example.com', uuid.UUID | str: str(uuid.UUID(int=1)),
+    datetime | str: '2023-03-01'
+}
+
+
+def test_pagination_and_state():
+    fake = FakeAPI()
+    fake.seed('/servers', 250)
+    tw = Timeweb('token', fake.client())
+    page = tw.servers.cloud.get_all(limit=100, offset=200)
+    assert page.meta.total == 250 and len(page.servers) == 50
+    assert len(list(tw.servers.cloud.iter_servers(prefetch=2))) == 250
+    server_id = page.servers[0].id
+    assert tw.servers.cloud.get(server_id).server.id == server_id
+    record = tw.domains.add_dns_record('example.com', 'A', '10.0.0.2')
+    assert tw.domains.get_dns_records('example.com').dns_records[0].id == record.dns_record.id
+    assert tw.domains.get_dns_records('example.org').meta.total == 0
+    with pytest.raises(exc.NotFoundError):
+        tw.ssh_keys.get(1)
+
+
+def test_faults(fast_retry):
+    fake = FakeAPI(token='secret', seed=1)
+    tw = Timeweb('secret', transport=Transport('secret', fake.client(), retry=fast_retry))
+    fake.fail(429, 2)
+    tw.servers.cloud.get_all()
+    assert fake.requests[2].url.path == '/api/v1/servers'
+    fake.faults = {500: 0.5}
+    tw.transport.retry = RetryPolicy.disabled()
+    statuses = set()
+    for _ in range(20):
+        try:
+            tw.ssh_keys.get_keys()
+            statuses.add(200)
+        except exc.InternalServerError:
+            statuses.add(500)
+    assert statuses == {200, 500}
+    with pytest.raises(exc.UnauthorizedError):
+        Timeweb('wrong', fake.client('wrong')).account.get_status()
+
+
+def test_async_latency():
+    fake = FakeAPI(latency=0.05)
+    fake.seed('/servers', 10)
+
+    async def run() -> int:
+        async with AsyncTimeweb('token', transport=AsyncTransport('token', fake.async_client())) as tw:
+            pages = await asyncio.gather(*(
+                tw.servers.cloud.get_all(limit=1, offset=i) for i in range(10)
+            ))
+        return sum(len(page.servers) for page in pages)
+
+    started = time.perf_counter()
+    assert asyncio.run(run()) == 10
+    assert time.perf_counter() - started < 0.4
+
+
+def test_async_get_methods_validate():
+    fake = FakeAPI()
+    tw = AsyncTimeweb('token', fake.async_client())
+    apis = [
+        tw.account, tw.tokens, tw.ssh_keys, tw.images, tw.s3, tw.dbs, tw.servers.dedics,
+        tw.servers.cloud, tw.balancers, tw.k8s, tw.domains, tw.mail, tw.projects
+    ]
+
+    async def call(api, name: str) -> None:
+        method = getattr(api, name)
+        kwargs = {
+            param.name: GET_ARGS[param.annotation]
+            for param in inspect.signature(method).parameters.values()
+            if param.default is inspect.Parameter.empty
+        }
+        # Первый вызов находит путь, после чего коллекция или элемент заполняются из схемы.
+        try:
+            await method(**kwargs)
+        except exc.NotFoundError:
+            pass
+        path = fake.requests[-1].url.path[len(PREFIX):]
+        route, params = fake.match(path)
+        assert route is not None
+        if route.field is not None and 'properties' in (route.item_schema or {}):
+            fake.add(path)
+        elif route.parent is not None and route.parent.field is not None:
+            value = params[route.params[-1]]
+            fake.add(path.rsplit('/', 1)[0], **{fake._id_field(route): int(value) if value.isdigit() else value})
+        await method(**kwargs)
+
+    async def run() -> int:
+        names = [
+            (api, name) for api in apis for name in dir(api)
+            if name.startswith('get') or name == 'check_domain'
+        ]
+        for api, name in names:
+            await call(api, name)
+        await tw.aclose()
+        return len(names)
+
+    assert asyncio.run(run()) == 86
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+import sys
+import subprocess
+from pathlib import Path
+
+import httpx
+
+from timeweb import Timeweb, Transport
+
+
+SRC = Path(__file__).resolve().parent.parent / 'src'
+
+
+def test_import_is_lazy():
+    code = (
+        'import sys, timeweb; '
+        "assert 'httpx' not in sys.modules; "
+        "assert 'timeweb.schemas' not in sys.modules; "
+        "tw = timeweb.Timeweb('token'); "
+        "assert 'httpx' not in sys.modules and 'pydantic' not in sys.modules; "
+        "tw.servers.cloud; "
+        "assert 'timeweb.sync_api.vds' in sys.modules; "
+        "assert 'timeweb.sync_api.k8s' not in sys.modules; "
+        "assert 'timeweb.async_api.api' not in sys.modules"
+    )
+    subprocess.run(
+        [sys.executable, '-c', code], check=True, env={'PYTHONPATH': str(SRC)}
+    )
+
+
+def test_sub_apis_are_created_once():
+    client = httpx.Client(base_url=Transport.BASE_URL)
+    tw = Timeweb('token', client)
+    assert 'k8s' not in vars(tw)
+    assert tw.k8s is tw.k8s
+    assert tw.servers.cloud.transport is tw.transport
+    assert tw.k8s.client is client
+
+
+def test_transport_client_is_lazy():
+    transport = Transport('token')
+    assert transport._client is None
+    assert transport.retry is transport.retry and transport.metrics is transport.metrics
+    assert not transport.is_closed
+    transport.close()
+    assert transport.client.headers['Authorization'] == 'Bearer token'
+    transport.close()
+    assert transport.is_closed
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+import pickle
+
+import pytest
+
+from timeweb import Timeweb, Transport, request_options
+from timeweb.utils import LazyList
+from timeweb.schemas.servers.cloud import VDS, VDSArray
+
+
+def test_items_are_created_on_access(mock_client, servers_handler):
+    tw = Timeweb('token', transport=Transport('token', mock_client(servers_handler(5)), lazy=True))
+    result = tw.servers.cloud.get_all()
+    assert isinstance(result, VDSArray)
+    assert result.meta.total == 5
+    servers = result.servers
+    assert isinstance(servers, LazyList) and isinstance(servers, list)
+    assert len(servers) == 5 and servers.materialized == 0
+    assert isinstance(servers[-1], VDS) and servers[-1].id == 5
+    assert servers[-1] is servers[4]
+    assert servers.materialized == 1
+    assert [s.id for s in servers[1:3]] == [2, 3]
+    assert [s.id for s in servers if s.id > 3] == [4, 5]
+    assert servers.materialized == 5
+    with pytest.raises(IndexError):
+        servers[5]
+    with pytest.raises(TypeError):
+        servers.append(servers[0])
+
+
+def test_lazy_matches_eager(mock_client, servers_handler):
+    tw = Timeweb('token', mock_client(servers_handler(5)))
+    eager = tw.servers.cloud.get_all()
+    with request_options(lazy=True):
+        lazy = tw.servers.cloud.get_all()
+    assert lazy == eager
+    assert lazy.dict() == eager.dict()
+    assert lazy.json() == eager.json()
+    assert list(pickle.loads(pickle.dumps(lazy.servers))) == eager.servers
+
+
+def test_lazy_without_validation(mock_client, servers_handler):
+    tw = Timeweb('token', transport=Transport(
+        'token', mock_client(servers_handler(5)), lazy=True, validate=False
+    ))
+    server = tw.servers.cloud.get_all().servers[0]
+    assert server.networks[0].ips[0].ip == '10.0.0.1'
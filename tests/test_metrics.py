@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+
+from timeweb import Timeweb, AsyncTimeweb, Transport, AsyncTransport, Metrics
+from timeweb.errors import exc
+from timeweb.utils.metrics import Histogram, endpoint_template
+
+from fake_api import FakeAPI
+
+
+@pytest.mark.parametrize('url, template', [
+    ('/servers', '/servers'),
+    ('/servers/15/disks/7/backups', '/servers/{id}/disks/{id}/backups'),
+    ('/api/v1/servers/15?limit=10', '/servers/{id}'),
+    ('/auth/api-keys/0b2c4c3e-6b7f-4c1e-9d1a-8a5b7f1e2d3c', '/auth/api-keys/{id}'),
+    ('/domains/example.com/dns-records/3', '/domains/{name}/dns-records/{id}'),
+    ('/servers/1/ips/2a03:6f00::1', '/servers/{id}/ips/{name}'),
+    ('/mail/domains/example.com/mailboxes/info', '/mail/domains/{name}/mailboxes/{name}'),
+])
+def test_endpoint_template(url, template):
+    assert endpoint_template(url) == template
+
+
+def test_histogram():
+    histogram = Histogram((0.01, 0.1, 1))
+    for value in (0.005, 0.02, 0.05, 0.5, 5):
+        histogram.observe(value)
+    assert histogram.counts == [1, 2, 1, 1]
+    assert histogram.cumulative() == [1, 3, 4, 5]
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.99) == float('inf')
+    assert Histogram().quantile(0.5) is None
+
+
+def test_client_metrics(fast_retry):
+    fake = FakeAPI()
+    server_id = fake.seed('/servers', 3)[0]['id']
+    tw = Timeweb('token', transport=Transport('token', fake.client(), retry=fast_retry))
+    tw.servers.cloud.get_all()
+    fake.fail(429)
+    tw.servers.cloud.get(server_id)
+    tw.servers.cloud.get(server_id)
+    with pytest.raises(exc.NotFoundError):
+        tw.servers.cloud.get(10 ** 6)
+    tw.ssh_keys.create('key', 'ssh-ed25519 AAAA', False)
+
+    metrics = tw.metrics()
+    get = metrics['GET /servers/{id}']
+    assert get['requests'] == 4 and get['retries'] == 1 and get['errors'] == 0
+    assert get['statuses'] == {200: 2, 404: 1, 429: 1}
+    assert get['network']['count'] == 4 and get['parse']['count'] == 2
+    assert get['bytes_in'] > 0 and get['bytes_out'] == 0
+    assert metrics['GET /servers']['parse']['count'] == 1
+    assert metrics['POST /ssh-keys']['bytes_out'] > 0
+    assert list(metrics)[0] in ('GET /servers/{id}', 'GET /servers')
+
+    text = tw.transport.metrics.prometheus()
+    assert '# TYPE timeweb_network_seconds histogram' in text
+    assert 'timeweb_requests_total{method="GET",endpoint="/servers/{id}",status="429"} 1' in text
+    assert 'timeweb_retries_total{method="GET",endpoint="/servers/{id}"} 1' in text
+    assert 'timeweb_network_seconds_bucket{method="GET",endpoint="/servers/{id}",le="+Inf"} 4' in text
+    assert 'timeweb_parse_seconds_count{method="POST",endpoint="/ssh-keys"} 1' in text
+
+    tw.transport.metrics.reset()
+    assert tw.metrics() == {}
+
+
+def test_disabled_and_shared():
+    fake = FakeAPI()
+    tw = Timeweb('token', transport=Transport('token', fake.client(), metrics=False))
+    tw.ssh_keys.get_keys()
+    assert tw.transport.metrics is None and tw.metrics() == {}
+
+    shared = Metrics()
+    for _ in range(2):
+        Timeweb('token', transport=Transport('token', fake.client(), metrics=shared)).ssh_keys.get_keys()
+    assert shared.snapshot()['GET /ssh-keys']['requests'] == 2
+
+
+def test_async_metrics():
+    fake = FakeAPI()
+    fake.seed('/servers', 5)
+
+    async def run() -> dict:
+        async with AsyncTimeweb('token', transport=AsyncTransport('token', fake.async_client())) as tw:
+            await asyncio.gather(*(tw.servers.cloud.get(i) for i in range(1, 6)))
+            return tw.metrics()
+
+    metrics = asyncio.run(run())
+    assert metrics['GET /servers/{id}']['statuses'] == {200: 5}
+    assert metrics['GET /servers/{id}']['parse']['count'] == 5
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import httpx
+
+from timeweb import Timeweb, AsyncTimeweb, Transport, AsyncTransport, request_options
+
+
+TOTAL = 250
+
+
+def dns_records(requests: list[httpx.Request]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        limit = int(request.url.params['limit'])
+        offset = int(request.url.params['offset'])
+        records = [
+            {'id': i, 'type': 'A', 'data': {'value': f'10.0.{i // 256}.{i % 256}'}}
+            for i in range(offset, min(offset + limit, TOTAL))
+        ]
+        return httpx.Response(
+            200, json={'dns_records': records, 'meta': {'total': TOTAL}}
+        )
+    return handler
+
+
+def make_client(handler) -> httpx.Client:
+    return httpx.Client(
+        base_url=Transport.BASE_URL, transport=httpx.MockTransport(handler)
+    )
+
+
+def test_iter_all():
+    requests: list[httpx.Request] = []
+    tw = Timeweb('token', make_client(dns_records(requests)))
+    ids = [r.id for r in tw.domains.iter_dns_records('example.com', page_size=100)]
+    assert ids == list(range(TOTAL))
+    assert len(requests) == 3
+
+
+def test_iter_max_items():
+    requests: list[httpx.Request] = []
+    tw = Timeweb('token', make_client(dns_records(requests)))
+    records = list(tw.domains.iter_dns_records('example.com', max_items=120))
+    assert len(records) == 120
+    assert requests[-1].url.params['limit'] == '20'
+
+
+def test_iter_early_break():
+    requests: list[httpx.Request] = []
+    tw = Timeweb('token', make_client(dns_records(requests)))
+    for record in tw.domains.iter_dns_records('example.com', page_size=10):
+        if record.id == 5:
+            break
+    assert len(requests) == 1
+
+
+def test_async_iter():
+    requests: list[httpx.Request] = []
+
+    async def run() -> list[int]:
+        client = httpx.AsyncClient(
+            base_url=Transport.BASE_URL,
+            transport=httpx.MockTransport(dns_records(requests))
+        )
+        async with AsyncTimeweb('token', client) as tw:
+            ids = [
+                record.id async for record in
+                tw.domains.iter_dns_records('example.com', page_size=60)
+            ]
+        await client.aclose()
+        return ids
+
+    assert asyncio.run(run()) == list(range(TOTAL))
+    assert len(requests) == 5
+
+
+def test_iter_raw():
+    requests: list[httpx.Request] = []
+    tw = Timeweb('token', transport=Transport('token', make_client(dns_records(requests)), raw=True))
+    records = list(tw.domains.iter_dns_records('example.com', page_size=100))
+    assert [r['id'] for r in records] == list(range(TOTAL))
+    assert len(requests) == 3
+
+    with request_options(raw=True):
+        tw = Timeweb('token', make_client(dns_records(requests)))
+        records = list(tw.domains.iter_dns_records('example.com', page_size=50, prefetch=2))
+    assert [r['id'] for r in records] == list(range(TOTAL))
+
+
+def test_async_iter_raw():
+    requests: list[httpx.Request] = []
+
+    async def run(prefetch: int) -> list[int]:
+        client = httpx.AsyncClient(
+            base_url=Transport.BASE_URL,
+            transport=httpx.MockTransport(dns_records(requests))
+        )
+        async with AsyncTimeweb('token', transport=AsyncTransport('token', client, raw=True)) as tw:
+            ids = [
+                record['id'] async for record in
+                tw.domains.iter_dns_records('example.com', page_size=60, prefetch=prefetch)
+            ]
+        await client.aclose()
+        return ids
+
+    assert asyncio.run(run(0)) == list(range(TOTAL))
+    assert asyncio.run(run(3)) == list(range(TOTAL))
+    assert len(requests) == 10
+
+
+def test_prefetch_sync():
+    requests: list[httpx.Request] = []
+    tw = Timeweb('token', make_client(dns_records(requests)))
+    ids = [
+        record.id for record in
+        tw.domains.iter_dns_records('example.com', page_size=20, prefetch=4)
+    ]
+    assert ids == list(range(TOTAL))
+    assert len(requests) == 13
+
+
+def test_prefetch_request_options():
+    requests: list[httpx.Request] = []
+    handler = dns_records(requests)
+
+    def string_ids(request: httpx.Request) -> httpx.Response:
+        data = handler(request).json()
+        for record in data['dns_records']:
+            record['id'] = str(record['id'])
+        return httpx.Response(200, json=data)
+
+    tw = Timeweb('token', make_client(string_ids))
+    with request_options(validate=False):
+        ids = [
+            record.id for record in
+            tw.domains.iter_dns_records('example.com', page_size=50, prefetch=3)
+        ]
+    # Без валидации строки не приводятся к int, в том числе на страницах из потоков.
+    assert ids == [str(i) for i in range(TOTAL)]
+    assert len(requests) == 5
+
+
+def test_prefetch_async():
+    in_flight = peak = 0
+    sync_handler = dns_records([])
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Поздние страницы отвечают быстрее, порядок должен сохраниться.
+        await asyncio.sleep(0.01 / (1 + int(request.url.params['offset'])))
+        in_flight -= 1
+        return sync_handler(request)
+
+    async def run() -> list[int]:
+        client = httpx.AsyncClient(
+            base_url=Transport.BASE_URL, transport=httpx.MockTransport(handler)
+        )
+        async with AsyncTimeweb('token', client) as tw:
+            ids = [
+                record.id async for record in tw.domains.iter_dns_records(
+                    'example.com', page_size=20, max_items=200, prefetch=5
+                )
+            ]
+        await client.aclose()
+        return ids
+
+    assert asyncio.run(run()) == list(range(200))
+    assert peak == 5
+
+
+def test_iter_servers(vds):
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        limit = int(request.url.params['limit'])
+        offset = int(request.url.params['offset'])
+        servers = [vds(i) for i in range(offset, min(offset + limit, 45))]
+        return httpx.Response(
+            200, json={'servers': servers, 'meta': {'total': 45}}
+        )
+
+    tw = Timeweb('token', make_client(handler))
+    page = tw.servers.cloud.get_all(limit=10, offset=40)
+    assert [s.id for s in page.servers] == list(range(40, 45))
+    ids = [s.id for s in tw.servers.cloud.iter_servers(page_size=10, prefetch=2)]
+    assert ids == list(range(45))
+    assert len(requests) == 6
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+import time
+import asyncio
+import threading
+
+import httpx
+
+from timeweb import AsyncTimeweb, AsyncTransport, RateLimiter
+from timeweb.utils import TokenBucket
+
+
+def test_bucket_burst():
+    bucket = TokenBucket(10, burst=3)
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    assert 0.05 < bucket.reserve() <= 0.1
+
+
+def test_bucket_threads():
+    bucket = TokenBucket(1000, burst=1)
+    delays: list[float] = []
+
+    def worker():
+        for _ in range(50):
+            delays.append(bucket.reserve())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Резервирования не теряются: последний ждёт почти 200 токенов.
+    assert max(delays) > 0.15
+
+
+def test_limiter_groups():
+    limiter = RateLimiter(100, burst=100, groups={'domains': (1, 1)})
+    assert limiter.reserve('token', 'GET', '/domains') == 0
+    assert limiter.reserve('token', 'GET', '/domains/example.com') > 0.5
+    assert limiter.reserve('token', 'GET', '/servers') == 0
+    assert limiter.reserve('other', 'GET', '/domains') == 0
+
+
+def test_async_pacing():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={'ssh_keys': [], 'meta': {'total': 0}})
+
+    async def run() -> float:
+        client = httpx.AsyncClient(
+            base_url=AsyncTransport.BASE_URL,
+            transport=httpx.MockTransport(handler)
+        )
+        transport = AsyncTransport(
+            'token', client, rate_limiter=RateLimiter(50, burst=1)
+        )
+        async with AsyncTimeweb('token', transport=transport) as tw:
+            start = time.monotonic()
+            await asyncio.gather(*(tw.ssh_keys.get_keys() for _ in range(6)))
+            elapsed = time.monotonic() - start
+        await client.aclose()
+        return elapsed
+
+    assert asyncio.run(run()) >= 0.09
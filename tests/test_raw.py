@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+import sys
+import subprocess
+from pathlib import Path
+
+import httpx
+
+from timeweb import Timeweb, Transport, TTLCache, request_options
+from timeweb.schemas.servers.cloud import VDSArray
+from timeweb.typed.servers.cloud import VDSArray as RawVDSArray
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_raw_modes(mock_client, servers_handler):
+    tw = Timeweb('token', transport=Transport('token', mock_client(servers_handler()), raw=True))
+    servers: RawVDSArray = tw.servers.cloud.get_all()  # type: ignore
+    assert servers['servers'][0]['networks'][0]['ips'][0]['ip'] == '10.0.0.1'
+    with request_options(raw=False):
+        assert isinstance(tw.servers.cloud.get_all(), VDSArray)
+
+    tw = Timeweb('token', mock_client(servers_handler()))
+    with request_options(raw=True):
+        assert isinstance(tw.servers.cloud.get_all(), dict)
+
+
+def test_cache_keeps_modes_apart(mock_client, presets_handler):
+    requests: list[httpx.Request] = []
+    tw = Timeweb('token', transport=Transport(
+        'token', mock_client(presets_handler(requests)), cache=TTLCache()
+    ))
+    with request_options(raw=True):
+        assert isinstance(tw.servers.cloud.get_presets(), dict)
+    assert not isinstance(tw.servers.cloud.get_presets(), dict)
+    assert len(requests) == 2
+
+
+def test_typed_modules_are_fresh():
+    subprocess.run(
+        [sys.executable, str(ROOT / 'schemas_to_typeddict.py'), '--check'],
+        check=True
+    )
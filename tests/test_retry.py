@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import httpx
+import pytest
+
+from timeweb import (
+    Timeweb, AsyncTimeweb, Transport, RetryPolicy, request_options
+)
+from timeweb.errors import exc
+
+
+FAST = RetryPolicy(max_attempts=3, backoff_factor=0, jitter=False)
+KEYS = {'ssh_keys': [], 'meta': {'total': 0}}
+RATE_LIMITED = {
+    'status_code': 429, 'error_code': 'too_many_requests',
+    'message': 'Too many requests'
+}
+
+
+def flaky(failures: int, calls: list[httpx.Request]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) <= failures:
+            return httpx.Response(
+                429, json=RATE_LIMITED, headers={'Retry-After': '0'}
+            )
+        return httpx.Response(200, json=KEYS)
+    return handler
+
+
+def make_tw(handler) -> Timeweb:
+    client = httpx.Client(
+        base_url=Transport.BASE_URL,
+        transport=httpx.MockTransport(handler)
+    )
+    tw = Timeweb('token', client)
+    tw.transport.retry = FAST
+    return tw
+
+
+def test_retry_get():
+    calls: list[httpx.Request] = []
+    tw = make_tw(flaky(2, calls))
+    tw.ssh_keys.get_keys()
+    assert len(calls) == 3
+
+
+def test_retry_exhausted():
+    calls: list[httpx.Request] = []
+    tw = make_tw(flaky(5, calls))
+    with pytest.raises(exc.TooManyRequestsError):
+        tw.ssh_keys.get_keys()
+    assert len(calls) == FAST.max_attempts
+
+
+def test_no_retry_post():
+    calls: list[httpx.Request] = []
+    tw = make_tw(flaky(1, calls))
+    with pytest.raises(exc.TooManyRequestsError):
+        tw.ssh_keys.create('name', 'body', False)
+    assert len(calls) == 1
+
+
+def test_per_call_override():
+    calls: list[httpx.Request] = []
+    tw = make_tw(flaky(1, calls))
+    with request_options(retry=RetryPolicy.disabled()):
+        with pytest.raises(exc.TooManyRequestsError):
+            tw.ssh_keys.get_keys()
+    assert len(calls) == 1
+    tw.ssh_keys.get_keys()
+    assert len(calls) == 2
+
+
+def test_connect_error_retry():
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError('refused', request=request)
+        return httpx.Response(200, json=KEYS)
+
+    async def run():
+        client = httpx.AsyncClient(
+            base_url=Transport.BASE_URL,
+            transport=httpx.MockTransport(handler)
+        )
+        async with AsyncTimeweb('token', client) as tw:
+            tw.transport.retry = FAST
+            await tw.ssh_keys.get_keys()
+        await client.aclose()
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_retry_after():
+    policy = RetryPolicy(max_retry_after=10)
+    request = httpx.Request('GET', 'https://api.timeweb.cloud/api/v1/servers')
+    response = httpx.Response(429, headers={'Retry-After': '3'}, request=request)
+    assert policy.get_delay(1, response) == 3
+    assert policy.should_retry_response('GET', response, 1)
+    response = httpx.Response(429, headers={'Retry-After': '120'}, request=request)
+    assert not policy.should_retry_response('GET', response, 1)
+    response = httpx.Response(503, request=request)
+    assert 0 <= policy.get_delay(3, response) <= policy.backoff_factor * 4
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+import time
+import asyncio
+import threading
+
+import httpx
+
+from timeweb import (
+    Timeweb, AsyncTimeweb, Transport, AsyncTransport, SingleFlight,
+    AsyncSingleFlight
+)
+
+
+def test_async_coalescing():
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={'ssh_keys': []})
+
+    async def run() -> list:
+        client = httpx.AsyncClient(
+            base_url=AsyncTransport.BASE_URL,
+            transport=httpx.MockTransport(handler)
+        )
+        transport = AsyncTransport(
+            'token', client, singleflight=AsyncSingleFlight()
+        )
+        async with AsyncTimeweb('token', transport=transport) as tw:
+            results = await asyncio.gather(
+                *(tw.ssh_keys.get_keys() for _ in range(200))
+            )
+            await tw.ssh_keys.get_keys()
+        await client.aclose()
+        return results
+
+    results = asyncio.run(run())
+    assert calls == 2
+    assert all(result is results[0] for result in results)
+
+
+def test_async_tokens_not_shared():
+    seen = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers['Authorization'])
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={'ssh_keys': []})
+
+    async def run() -> None:
+        flight = AsyncSingleFlight()
+        clients = [
+            AsyncTimeweb(token, transport=AsyncTransport(token, httpx.AsyncClient(
+                base_url=AsyncTransport.BASE_URL, transport=httpx.MockTransport(handler),
+                headers={'Authorization': f'Bearer {token}'}
+            ), singleflight=flight))
+            for token in ('A', 'B')
+        ]
+        await asyncio.gather(*(tw.ssh_keys.get_keys() for tw in clients for _ in range(3)))
+        assert flight.stats() == {'calls': 2, 'shared': 4}
+        for tw in clients:
+            await tw.transport.client.aclose()
+
+    asyncio.run(run())
+    assert sorted(seen) == ['Bearer A', 'Bearer B']
+
+
+def test_async_cancelled_waiter_does_not_cancel_request():
+    flight = AsyncSingleFlight()
+
+    async def fetch() -> int:
+        await asyncio.sleep(0.01)
+        return 42
+
+    async def run() -> int:
+        first = asyncio.ensure_future(flight.do('key', fetch))
+        second = asyncio.ensure_future(flight.do('key', fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run()) == 42
+    assert flight.stats() == {'calls': 1, 'shared': 1}
+
+
+def test_sync_coalescing():
+    calls = 0
+    started = threading.Event()
+    release = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        started.set()
+        release.wait(1)
+        return httpx.Response(200, json={'ssh_keys': []})
+
+    client = httpx.Client(
+        base_url=Transport.BASE_URL, transport=httpx.MockTransport(handler)
+    )
+    flight = SingleFlight()
+    tw = Timeweb('token', transport=Transport('token', client, singleflight=flight))
+    results = []
+    leader = threading.Thread(target=lambda: results.append(tw.ssh_keys.get_keys()))
+    leader.start()
+    started.wait(1)
+    followers = [
+        threading.Thread(target=lambda: results.append(tw.ssh_keys.get_keys()))
+        for _ in range(8)
+    ]
+    for thread in followers:
+        thread.start()
+    while flight.shared < 8:
+        time.sleep(0.001)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join()
+    assert calls == 1
+    assert len(results) == 9
+    assert all(result is results[0] for result in results)
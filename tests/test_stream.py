@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+import json
+import asyncio
+
+import httpx
+import pytest
+
+from timeweb import Timeweb, AsyncTimeweb, Transport, request_options
+from timeweb.errors import exc
+from timeweb.utils.stream import JSONArrayStream
+from timeweb.schemas.servers.cloud import VDS
+
+
+RATE_LIMITED = {
+    'status_code': 429, 'error_code': 'too_many_requests',
+    'message': 'Too many requests'
+}
+
+
+@pytest.fixture()
+def body(vds):
+    def make(count: int) -> bytes:
+        servers = [vds(i) for i in range(count)]
+        servers[0]['comment'] = 'кавычка " и скобки [{ \\ ]}'
+        return json.dumps(
+            {'meta': {'total': count, 'servers': []}, 'servers': servers, 'response_id': None},
+            ensure_ascii=False
+        ).encode()
+    return make
+
+
+def chunked(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+@pytest.mark.parametrize('size', [1, 5, 64, 1 << 16])
+def test_parser_chunks(size, body):
+    data = body(20)
+    stream = JSONArrayStream('servers')
+    items = [item for chunk in chunked(data, size) for item in stream.feed(chunk)]
+    assert [json.loads(item) for item in items] == json.loads(data)['servers']
+    assert stream.done
+
+
+def test_items_before_body_is_complete(mock_client, body):
+    received: list[int] = []
+
+    def content():
+        data = body(10)
+        yield data[:len(data) // 2]
+        assert received  # первые серверы отданы до получения второй половины
+        yield data[len(data) // 2:]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params['limit'] == '10'
+        return httpx.Response(200, content=content())
+
+    tw = Timeweb('token', mock_client(handler))
+    for server in tw.servers.cloud.stream_servers(limit=10):
+        assert isinstance(server, VDS)
+        received.append(server.id)
+    assert received == list(range(10))
+    with request_options(raw=True):
+        assert next(tw.servers.cloud.stream_servers(limit=10))['id'] == 0
+
+
+def test_stream_errors_and_retry(mock_client, fast_retry, body):
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(429, json=RATE_LIMITED, headers={'Retry-After': '0'})
+        if len(calls) == 2:
+            return httpx.Response(200, content=chunked(body(3), 7))
+        return httpx.Response(404, json={**RATE_LIMITED, 'status_code': 404})
+
+    tw = Timeweb('token', transport=Transport('token', mock_client(handler), retry=fast_retry))
+    assert [s.id for s in tw.servers.cloud.stream_servers()] == [0, 1, 2]
+    with pytest.raises(exc.NotFoundError):
+        list(tw.domains.stream_dns_records('example.com'))
+
+
+def test_async_stream(body):
+    async def content():
+        for chunk in chunked(body(5), 100):
+            yield chunk
+
+    async def run() -> list[int]:
+        client = httpx.AsyncClient(
+            base_url=Transport.BASE_URL,
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=content()))
+        )
+        async with AsyncTimeweb('token', client) as tw:
+            ids = [server.id async for server in tw.servers.cloud.stream_servers()]
+        await client.aclose()
+        return ids
+
+    assert asyncio.run(run()) == list(range(5))
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+
+from timeweb import Timeweb, AsyncTimeweb, Transport, AsyncTransport, RecordingTracer, request_options
+from timeweb.errors import exc
+
+from fake_api import FakeAPI
+
+
+def test_spans(fast_retry):
+    fake = FakeAPI()
+    server_id = fake.seed('/servers', 2)[0]['id']
+    tracer = RecordingTracer()
+    tw = Timeweb('token', transport=Transport('token', fake.client(), retry=fast_retry, tracer=tracer))
+    fake.fail(429)
+    server = tw.servers.cloud.get(server_id)
+
+    [call] = tracer.find('VDSAPI.get')
+    assert call.parent is None
+    assert call.attributes['timeweb.server_id'] == server_id
+    assert call.attributes['timeweb.response_id'] == str(server.response_id)
+    attempts = tracer.find('GET /servers/{id}')
+    assert [span.attributes['http.status_code'] for span in attempts] == [429, 200]
+    assert all(span.parent is call for span in attempts)
+    assert attempts[0].attributes['http.url'] == f'/servers/{server_id}'
+    assert attempts[0].attributes['timeweb.serialize_seconds'] >= 0
+    assert 'http.request_content_length' not in attempts[0].attributes
+    [parse] = tracer.find('parse VDSResponse')
+    assert parse.parent is call
+    assert parse.attributes['timeweb.parse_mode'] == 'validate'
+    assert parse.attributes['timeweb.decode_seconds'] >= 0
+    assert parse.attributes['timeweb.validate_seconds'] >= 0
+    assert call.start <= attempts[0].start and parse.end <= call.end
+
+    with request_options(raw=True):
+        tw.servers.cloud.get(server_id)
+    assert tracer.find('parse VDSResponse')[-1].attributes['timeweb.parse_mode'] == 'raw'
+    assert 'timeweb.response_id' in tracer.find('VDSAPI.get')[-1].attributes
+
+    tw.ssh_keys.create('key', 'ssh-ed25519 AAAA', True)
+    [post] = tracer.find('POST /ssh-keys')
+    assert post.attributes['http.request_content_length'] == len(fake.requests[-1].content)
+    assert post.attributes['timeweb.serialize_seconds'] >= 0
+
+
+def test_error_span():
+    fake = FakeAPI()
+    tracer = RecordingTracer()
+    tw = Timeweb('token', transport=Transport('token', fake.client(), tracer=tracer))
+    with pytest.raises(exc.NotFoundError) as info:
+        tw.servers.cloud.get(10 ** 6)
+
+    [call] = tracer.find('VDSAPI.get')
+    assert call.exception is info.value
+    assert call.attributes['http.status_code'] == 404
+    assert call.attributes['timeweb.response_id'] == str(info.value.response_id)
+    assert not tracer.find('parse VDSResponse')
+
+
+def test_no_tracer():
+    fake = FakeAPI()
+    tw = Timeweb('token', transport=Transport('token', fake.client()))
+    assert tw.transport.tracer is None
+    assert tw.ssh_keys.get_keys().ssh_keys == []
+    assert tw.ssh_keys.get_keys.__name__ == 'get_keys'
+
+
+def test_async_spans():
+    fake = FakeAPI()
+    fake.seed('/servers', 3)
+    tracer = RecordingTracer()
+
+    async def run() -> None:
+        transport = AsyncTransport('token', fake.async_client(), tracer=tracer)
+        async with AsyncTimeweb('token', transport=transport) as tw:
+            await asyncio.gather(*(tw.servers.cloud.get(i) for i in range(1, 4)))
+
+    asyncio.run(run())
+    calls = tracer.find('VDSAPI.get')
+    assert sorted(span.attributes['timeweb.server_id'] for span in calls) == [1, 2, 3]
+    for span in tracer.find('GET /servers/{id}'):
+        assert span.attributes['http.url'] == f'/servers/{span.parent.attributes["timeweb.server_id"]}'
+    assert all(span.parent in calls for span in tracer.find('parse VDSResponse'))
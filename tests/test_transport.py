@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import httpx
+
+from timeweb import Timeweb, AsyncTimeweb, Transport, AsyncTransport
+from timeweb.schemas import ssh_keys as schemas
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={'ssh_keys': [], 'meta': {'total': 0}})
+
+
+def test_shared_pool():
+    client = httpx.Client(
+        base_url=Transport.BASE_URL, transport=httpx.MockTransport(handler)
+    )
+    tw = Timeweb('token', client)
+    assert tw.account.client is client
+    assert tw.servers.cloud.transport is tw.transport
+    assert tw.servers.dedics.transport is tw.transport
+    assert isinstance(tw.ssh_keys.get_keys(), schemas.SSHKeysArray)
+    tw.close()
+    assert not client.is_closed, 'External client must not be closed!'
+
+
+def test_close_owned_pool():
+    with Timeweb('token') as tw:
+        client = tw.transport.client
+        assert tw.k8s.client is client
+    assert client.is_closed
+
+
+def test_async_lifecycle():
+    async def run():
+        async with AsyncTimeweb('token') as tw:
+            client = tw.transport.client
+            assert tw.domains.client is client
+            assert tw.servers.cloud.client is client
+        assert client.is_closed
+
+    asyncio.run(run())
+
+
+def test_async_shared_pool():
+    async def run():
+        client = httpx.AsyncClient(
+            base_url=AsyncTransport.BASE_URL,
+            transport=httpx.MockTransport(handler)
+        )
+        async with AsyncTimeweb('token', client) as tw:
+            assert tw.images.client is client
+            keys = await tw.ssh_keys.get_keys()
+            assert isinstance(keys, schemas.SSHKeysArray)
+        assert not client.is_closed
+        await client.aclose()
+
+    asyncio.run(run())
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+from timeweb import Timeweb, AsyncTimeweb, Transport, AsyncTransport
+from timeweb.schemas.servers.cloud import BackupResponse
+
+from fake_api import FakeAPI
+
+
+def test_change_server_disk_backup():
+    fake = FakeAPI()
+    backup = fake.add('/servers/1/disks/2/backups')
+    tw = Timeweb('token', transport=Transport('token', fake.client()))
+    result = tw.servers.cloud.change_server_disk_backup(1, 2, backup['id'], 'nightly')
+    assert isinstance(result, BackupResponse)
+    assert result.backup.comment == 'nightly'
+
+    async def run() -> BackupResponse:
+        async with AsyncTimeweb('token', transport=AsyncTransport('token', fake.async_client())) as atw:
+            return await atw.servers.cloud.change_server_disk_backup(1, 2, backup['id'], 'weekly')
+
+    assert asyncio.run(run()).backup.comment == 'weekly'